@@ -1,11 +1,27 @@
 """Base assessor interface for attribute evaluation."""
 
+import hashlib
+import inspect
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from ..models.finding import Finding
 from ..models.repository import Repository
 
 
+@lru_cache(maxsize=None)
+def _source_digest(cls: type) -> str:
+    """Hash of the source file defining an assessor class."""
+    try:
+        source_file = inspect.getsourcefile(cls)
+        with open(source_file, "rb") as f:
+            content = f.read()
+    except (OSError, TypeError):
+        # No source available (e.g., frozen build): fall back to the name
+        content = f"{cls.__module__}.{cls.__qualname__}".encode()
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
 class BaseAssessor(ABC):
     """Abstract base class for all attribute assessors.
 
@@ -67,6 +83,43 @@ class BaseAssessor(ABC):
         """
         return True
 
+    @property
+    def input_patterns(self) -> tuple[str, ...] | None:
+        """File patterns this assessor reads, for incremental re-assessment.
+
+        Patterns use fnmatch syntax. A pattern without "/" matches a file
+        name at any depth (e.g., "*.py", "README.md"); a pattern with "/"
+        matches the path from the repository root (e.g., ".github/workflows/*").
+        Over-matching is safe: it only causes an unnecessary re-run.
+
+        Returns:
+            Patterns whose changes invalidate a previous finding, an empty
+            tuple if the result does not depend on repository files, or None
+            (default) if inputs are unknown and the assessor must always re-run
+        """
+        return None
+
+    @property
+    def version(self) -> str:
+        """Version of this assessor's logic, part of its fingerprint.
+
+        Edits to the assessor's own module change the fingerprint
+        automatically. Bump this when findings change for another reason,
+        such as a shared helper or dependency behaving differently.
+        """
+        return "1"
+
+    @property
+    def fingerprint(self) -> str:
+        """Identity of this assessor's logic for caching its findings.
+
+        Cached findings are only reused while the fingerprint is unchanged.
+
+        Returns:
+            Short string combining the attribute, version and source hash
+        """
+        return f"{self.attribute_id}:{self.version}:{_source_digest(type(self))}"
+
     def calculate_proportional_score(
         self,
         measured_value: float,
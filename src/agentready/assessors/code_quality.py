@@ -1,7 +1,7 @@
 """Code quality assessors for complexity, file length, type annotations, and code smells."""
 
-import ast
 import logging
+import math
 import re
 
 from ..models.attribute import Attribute
@@ -24,6 +24,10 @@ class TypeAnnotationsAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "type_annotations"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("*.py", "tsconfig.json")
+
     @property
     def tier(self) -> int:
         return 1  # Essential
@@ -74,54 +78,20 @@ class TypeAnnotationsAssessor(BaseAssessor):
     def _assess_python_types(self, repository: Repository) -> Finding:
         """Assess Python type annotations using AST parsing."""
         # Use AST parsing to accurately detect type annotations
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files", "*.py"],
-                cwd=repository.path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            python_files = [f for f in result.stdout.strip().split("\n") if f]
-        except Exception:
-            python_files = [
-                str(f.relative_to(repository.path))
-                for f in repository.path.rglob("*.py")
-            ]
+        python_files = repository.get_file_index().paths(extensions={".py"})
 
         total_functions = 0
         typed_functions = 0
 
-        for file_path in python_files:
-            full_path = repository.path / file_path
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Parse the file with AST
-                tree = ast.parse(content, filename=str(file_path))
-
-                # Walk the AST and count functions with type annotations
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        total_functions += 1
-                        # Check if function has type annotations
-                        # Return type annotation: node.returns is not None
-                        # Parameter annotations: any arg has annotation
-                        has_return_annotation = node.returns is not None
-                        has_param_annotations = any(
-                            arg.annotation is not None for arg in node.args.args
-                        )
-
-                        # Consider function typed if it has either return or param annotations
-                        if has_return_annotation or has_param_annotations:
-                            typed_functions += 1
-
-            except (OSError, UnicodeDecodeError, SyntaxError):
-                # Skip files that can't be read or parsed
-                continue
+        # Shared AST cache skips files that can't be read or parsed
+        for module in repository.get_ast_cache().summaries(python_files):
+            for function in module.functions:
+                if function.is_async:
+                    continue
+                total_functions += 1
+                # Consider function typed if it has either return or param annotations
+                if function.has_return_annotation or function.has_param_annotations:
+                    typed_functions += 1
 
         if total_functions == 0:
             return Finding.not_applicable(
@@ -153,7 +123,7 @@ class TypeAnnotationsAssessor(BaseAssessor):
 
     def _assess_typescript_types(self, repository: Repository) -> Finding:
         """Assess TypeScript type configuration."""
-        tsconfig_path = repository.path / "tsconfig.json"
+        tsconfig_path = repository.root / "tsconfig.json"
 
         if not tsconfig_path.exists():
             return Finding(
@@ -170,7 +140,7 @@ class TypeAnnotationsAssessor(BaseAssessor):
         try:
             import json
 
-            with open(tsconfig_path, "r") as f:
+            with tsconfig_path.open("r") as f:
                 tsconfig = json.load(f)
 
             strict = tsconfig.get("compilerOptions", {}).get("strict", False)
@@ -267,6 +237,21 @@ class CyclomaticComplexityAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "cyclomatic_complexity"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "*.py",
+            "*.js",
+            "*.jsx",
+            "*.ts",
+            "*.tsx",
+            "*.c",
+            "*.h",
+            "*.cpp",
+            "*.hpp",
+            "*.java",
+        )
+
     @property
     def tier(self) -> int:
         return 3  # Important
@@ -284,79 +269,82 @@ class CyclomaticComplexityAssessor(BaseAssessor):
         )
 
     def is_applicable(self, repository: Repository) -> bool:
-        """Applicable to languages supported by radon or lizard."""
+        """Applicable to Python and languages supported by lizard."""
         supported = {"Python", "JavaScript", "TypeScript", "C", "C++", "Java"}
         return bool(set(repository.languages.keys()) & supported)
 
     def assess(self, repository: Repository) -> Finding:
-        """Check cyclomatic complexity using radon or lizard."""
+        """Check cyclomatic complexity from the AST cache or with lizard."""
         if "Python" in repository.languages:
             return self._assess_python_complexity(repository)
-        else:
-            # Use lizard for other languages
-            return self._assess_with_lizard(repository)
 
-    def _assess_python_complexity(self, repository: Repository) -> Finding:
-        """Assess Python complexity using radon."""
-        try:
-            # Check if radon is available
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["radon", "cc", str(repository.path), "-s", "-a"],
-                capture_output=True,
-                text=True,
-                timeout=60,
+        if not repository.has_working_tree:
+            return Finding.skipped(
+                self.attribute,
+                reason="lizard needs a working tree; not available for --rev",
             )
 
-            if result.returncode != 0:
-                raise MissingToolError("radon", install_command="pip install radon")
-
-            # Parse radon output for average complexity
-            # Output format: "Average complexity: A (5.2)"
-            output = result.stdout
-
-            if "Average complexity:" in output:
-                # Extract average value
-                avg_line = [
-                    line for line in output.split("\n") if "Average complexity:" in line
-                ][0]
-                avg_value = float(avg_line.split("(")[1].split(")")[0])
-
-                score = self.calculate_proportional_score(
-                    measured_value=avg_value,
-                    threshold=10.0,
-                    higher_is_better=False,
-                )
+        # Use lizard for other languages
+        return self._assess_with_lizard(repository)
 
-                status = "pass" if score >= 75 else "fail"
+    def _assess_python_complexity(self, repository: Repository) -> Finding:
+        """Assess Python complexity from the shared AST cache.
 
-                return Finding(
-                    attribute=self.attribute,
-                    status=status,
-                    score=score,
-                    measured_value=f"{avg_value:.1f}",
-                    threshold="<10.0",
-                    evidence=[f"Average cyclomatic complexity: {avg_value:.1f}"],
-                    remediation=(
-                        self._create_remediation() if status == "fail" else None
-                    ),
-                    error_message=None,
-                )
-            else:
-                return Finding.not_applicable(
-                    self.attribute, reason="No Python code to analyze"
-                )
+        Per-function complexity is computed during the fused AST walk (and
+        cached per blob), so no file is parsed twice and vendored files
+        are excluded.
+        """
+        python_files = repository.get_file_index().paths(
+            extensions={".py"}, include_vendored=False
+        )
 
-        except FileNotFoundError:
-            # radon command not found
-            raise MissingToolError("radon", install_command="pip install radon")
-        except MissingToolError:
-            raise  # Re-raise to be caught by Scanner
-        except Exception as e:
-            return Finding.error(
-                self.attribute, reason=f"Complexity analysis failed: {str(e)}"
+        functions = [
+            (function.complexity, module.path, function.name)
+            for module in repository.get_ast_cache().summaries(python_files)
+            for function in module.functions
+        ]
+        if not functions:
+            return Finding.not_applicable(
+                self.attribute, reason="No Python code to analyze"
             )
 
+        complexities = sorted(c for c, _, _ in functions)
+        avg_value = sum(complexities) / len(complexities)
+        max_value, max_path, max_name = max(functions)
+        over_limit = sum(1 for c in complexities if c > 15)
+
+        score = self.calculate_proportional_score(
+            measured_value=avg_value,
+            threshold=10.0,
+            higher_is_better=False,
+        )
+
+        status = "pass" if score >= 75 else "fail"
+
+        return Finding(
+            attribute=self.attribute,
+            status=status,
+            score=score,
+            measured_value=f"{avg_value:.1f}",
+            threshold="<10.0",
+            evidence=[
+                f"Average cyclomatic complexity: {avg_value:.1f} "
+                f"across {len(complexities)} functions",
+                f"Distribution: p50={self._percentile(complexities, 50)}, "
+                f"p95={self._percentile(complexities, 95)}, max={max_value} "
+                f"({max_path}:{max_name})",
+                f"Functions with complexity >15: {over_limit}",
+            ],
+            remediation=(self._create_remediation() if status == "fail" else None),
+            error_message=None,
+        )
+
+    @staticmethod
+    def _percentile(sorted_values: list[int], percent: int) -> int:
+        """Nearest-rank percentile of a non-empty sorted list."""
+        rank = math.ceil(percent / 100 * len(sorted_values))
+        return sorted_values[max(rank, 1) - 1]
+
     def _assess_with_lizard(self, repository: Repository) -> Finding:
         """Assess complexity using lizard (multi-language)."""
         try:
@@ -432,6 +420,10 @@ class SemanticNamingAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "semantic_naming"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("*.py",)
+
     @property
     def tier(self) -> int:
         return 3  # Important
@@ -465,21 +457,7 @@ class SemanticNamingAssessor(BaseAssessor):
     def _assess_python_naming(self, repository: Repository) -> Finding:
         """Assess Python naming conventions using AST parsing."""
         # Get list of Python files
-        try:
-            result = safe_subprocess_run(
-                ["git", "ls-files", "*.py"],
-                cwd=repository.path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            python_files = [f for f in result.stdout.strip().split("\n") if f]
-        except Exception:
-            python_files = [
-                str(f.relative_to(repository.path))
-                for f in repository.path.rglob("*.py")
-            ]
+        python_files = repository.get_file_index().paths(extensions={".py"})
 
         # Sample files for large repositories (max 50 files)
         if len(python_files) > 50:
@@ -498,41 +476,30 @@ class SemanticNamingAssessor(BaseAssessor):
         pascal_case_pattern = re.compile(r"^[A-Z][a-zA-Z0-9]*$")
         generic_names = {"temp", "data", "info", "obj", "var", "tmp", "x", "y", "z"}
 
-        for file_path in python_files:
-            full_path = repository.path / file_path
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                tree = ast.parse(content, filename=str(file_path))
+        for module in repository.get_ast_cache().summaries(python_files):
+            # Check function names
+            for function in module.functions:
+                # Skip async and private/magic methods
+                if function.is_async or function.name.startswith("_"):
+                    continue
 
-                for node in ast.walk(tree):
-                    # Check function names
-                    if isinstance(node, ast.FunctionDef):
-                        # Skip private/magic methods
-                        if node.name.startswith("_"):
-                            continue
+                total_functions += 1
+                if snake_case_pattern.match(function.name):
+                    compliant_functions += 1
 
-                        total_functions += 1
-                        if snake_case_pattern.match(node.name):
-                            compliant_functions += 1
+                # Check for generic names
+                if function.name.lower() in generic_names:
+                    generic_names_count += 1
 
-                        # Check for generic names
-                        if node.name.lower() in generic_names:
-                            generic_names_count += 1
+            # Check class names
+            for cls in module.classes:
+                # Skip private classes
+                if cls.name.startswith("_"):
+                    continue
 
-                    # Check class names
-                    elif isinstance(node, ast.ClassDef):
-                        # Skip private classes
-                        if node.name.startswith("_"):
-                            continue
-
-                        total_classes += 1
-                        if pascal_case_pattern.match(node.name):
-                            compliant_classes += 1
-
-            except (OSError, UnicodeDecodeError, SyntaxError):
-                continue
+                total_classes += 1
+                if pascal_case_pattern.match(cls.name):
+                    compliant_classes += 1
 
         if total_functions == 0 and total_classes == 0:
             return Finding.not_applicable(
@@ -646,6 +613,10 @@ class StructuredLoggingAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "structured_logging"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("pyproject.toml", "requirements.txt", "setup.py")
+
     @property
     def tier(self) -> int:
         return 3  # Important
@@ -684,9 +655,9 @@ class StructuredLoggingAssessor(BaseAssessor):
 
         # Check dependency files
         dep_files = [
-            repository.path / "pyproject.toml",
-            repository.path / "requirements.txt",
-            repository.path / "setup.py",
+            repository.root / "pyproject.toml",
+            repository.root / "requirements.txt",
+            repository.root / "setup.py",
         ]
 
         found_libs = []
@@ -811,6 +782,23 @@ class CodeSmellsAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "code_smells"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "pyproject.toml",
+            ".pylintrc",
+            "pylintrc",
+            "ruff.toml",
+            ".ruff.toml",
+            ".eslintrc*",
+            "eslint.config.*",
+            ".rubocop.y*ml",
+            ".golangci.y*ml",
+            ".pre-commit-config.yaml",
+            ".markdownlint*",
+            ".github/workflows/*",
+        )
+
     @property
     def tier(self) -> int:
         return 4  # Advanced
@@ -830,47 +818,47 @@ class CodeSmellsAssessor(BaseAssessor):
     def _has_pylint(self, repository: Repository) -> bool:
         """Check for pylint configuration."""
         return (
-            (repository.path / ".pylintrc").exists()
-            or (repository.path / "pylintrc").exists()
+            (repository.root / ".pylintrc").exists()
+            or (repository.root / "pylintrc").exists()
             or (
-                repository.path / "pyproject.toml"
+                repository.root / "pyproject.toml"
             ).exists()  # Can contain [tool.pylint]
         )
 
     def _has_ruff(self, repository: Repository) -> bool:
         """Check for ruff configuration."""
         return (
-            (repository.path / "ruff.toml").exists()
-            or (repository.path / ".ruff.toml").exists()
-            or (repository.path / "pyproject.toml").exists()  # Can contain [tool.ruff]
+            (repository.root / "ruff.toml").exists()
+            or (repository.root / ".ruff.toml").exists()
+            or (repository.root / "pyproject.toml").exists()  # Can contain [tool.ruff]
         )
 
     def _has_eslint(self, repository: Repository) -> bool:
         """Check for ESLint configuration."""
         return (
-            (repository.path / ".eslintrc.js").exists()
-            or (repository.path / ".eslintrc.json").exists()
-            or (repository.path / ".eslintrc.yml").exists()
-            or (repository.path / ".eslintrc.yaml").exists()
-            or (repository.path / "eslint.config.js").exists()
-            or (repository.path / "eslint.config.mjs").exists()
+            (repository.root / ".eslintrc.js").exists()
+            or (repository.root / ".eslintrc.json").exists()
+            or (repository.root / ".eslintrc.yml").exists()
+            or (repository.root / ".eslintrc.yaml").exists()
+            or (repository.root / "eslint.config.js").exists()
+            or (repository.root / "eslint.config.mjs").exists()
         )
 
     def _has_rubocop(self, repository: Repository) -> bool:
         """Check for RuboCop configuration."""
-        return (repository.path / ".rubocop.yml").exists() or (
-            repository.path / ".rubocop.yaml"
+        return (repository.root / ".rubocop.yml").exists() or (
+            repository.root / ".rubocop.yaml"
         ).exists()
 
     def _has_golangci_lint(self, repository: Repository) -> bool:
         """Check for golangci-lint configuration."""
-        return (repository.path / ".golangci.yml").exists() or (
-            repository.path / ".golangci.yaml"
+        return (repository.root / ".golangci.yml").exists() or (
+            repository.root / ".golangci.yaml"
         ).exists()
 
     def _has_actionlint(self, repository: Repository) -> bool:
         """Check for actionlint in pre-commit or GitHub Actions."""
-        precommit_config = repository.path / ".pre-commit-config.yaml"
+        precommit_config = repository.root / ".pre-commit-config.yaml"
         if precommit_config.exists():
             try:
                 content = precommit_config.read_text()
@@ -880,7 +868,7 @@ class CodeSmellsAssessor(BaseAssessor):
                 pass
 
         # Check if actionlint is in GitHub Actions workflows
-        workflows_dir = repository.path / ".github" / "workflows"
+        workflows_dir = repository.root / ".github" / "workflows"
         if workflows_dir.exists():
             try:
                 for workflow_file in workflows_dir.glob("*.yml") + workflows_dir.glob(
@@ -897,10 +885,10 @@ class CodeSmellsAssessor(BaseAssessor):
     def _has_markdownlint(self, repository: Repository) -> bool:
         """Check for markdownlint configuration."""
         return (
-            (repository.path / ".markdownlint.json").exists()
-            or (repository.path / ".markdownlintrc").exists()
-            or (repository.path / ".markdownlint.yaml").exists()
-            or (repository.path / ".markdownlint.yml").exists()
+            (repository.root / ".markdownlint.json").exists()
+            or (repository.root / ".markdownlintrc").exists()
+            or (repository.root / ".markdownlint.yaml").exists()
+            or (repository.root / ".markdownlint.yml").exists()
         )
 
     def assess(self, repository: Repository) -> Finding:
@@ -946,7 +934,7 @@ class CodeSmellsAssessor(BaseAssessor):
                 linters_found.append("RuboCop")
 
         # GitHub Actions linter (10 points if .github/workflows exists)
-        if (repository.path / ".github" / "workflows").exists():
+        if (repository.root / ".github" / "workflows").exists():
             max_possible_score += 10
 
             if self._has_actionlint(repository):
@@ -1020,7 +1008,7 @@ class CodeSmellsAssessor(BaseAssessor):
                 commands.append("gem install rubocop && rubocop --auto-gen-config")
 
             if (
-                repository.path / ".github" / "workflows"
+                repository.root / ".github" / "workflows"
             ).exists() and not self._has_actionlint(repository):
                 missing_linters.append("actionlint (GitHub Actions)")
                 steps.append("Add actionlint for GitHub Actions workflow validation")
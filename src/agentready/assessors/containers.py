@@ -17,6 +17,16 @@ class ContainerSetupAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "container_setup"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "Dockerfile",
+            "Containerfile",
+            "docker-compose.y*ml",
+            "compose.y*ml",
+            ".dockerignore",
+        )
+
     @property
     def tier(self) -> int:
         return 4
@@ -39,7 +49,7 @@ class ContainerSetupAssessor(BaseAssessor):
         This ensures the assessor doesn't penalize repositories that don't use containers.
         """
         container_files = ["Dockerfile", "Containerfile"]
-        return any((repository.path / f).exists() for f in container_files)
+        return any((repository.root / f).exists() for f in container_files)
 
     def assess(self, repository: Repository) -> Finding:
         """Check for container setup best practices."""
@@ -54,12 +64,12 @@ class ContainerSetupAssessor(BaseAssessor):
 
         # 1. Dockerfile or Containerfile exists (40 points)
         dockerfile = None
-        if (repository.path / "Dockerfile").exists():
-            dockerfile = repository.path / "Dockerfile"
+        if (repository.root / "Dockerfile").exists():
+            dockerfile = repository.root / "Dockerfile"
             score += 40
             evidence.append("✓ Dockerfile present")
-        elif (repository.path / "Containerfile").exists():
-            dockerfile = repository.path / "Containerfile"
+        elif (repository.root / "Containerfile").exists():
+            dockerfile = repository.root / "Containerfile"
             score += 40
             evidence.append("✓ Containerfile present (Podman)")
 
@@ -88,14 +98,14 @@ class ContainerSetupAssessor(BaseAssessor):
             "compose.yml",
             "compose.yaml",
         ]
-        found_compose = [f for f in compose_files if (repository.path / f).exists()]
+        found_compose = [f for f in compose_files if (repository.root / f).exists()]
 
         if found_compose:
             score += 30
             evidence.append(f"✓ Docker Compose configured ({', '.join(found_compose)})")
 
         # 4. .dockerignore file (20 points)
-        dockerignore = repository.path / ".dockerignore"
+        dockerignore = repository.root / ".dockerignore"
         if dockerignore.exists():
             try:
                 size = dockerignore.stat().st_size
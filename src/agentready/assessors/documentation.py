@@ -1,6 +1,5 @@
 """Documentation assessor for CLAUDE.md, README, docstrings, and ADRs."""
 
-import ast
 import json
 import re
 
@@ -9,7 +8,6 @@ import yaml
 from ..models.attribute import Attribute
 from ..models.finding import Citation, Finding, Remediation
 from ..models.repository import Repository
-from ..utils.subprocess_utils import safe_subprocess_run
 from .base import BaseAssessor
 
 
@@ -24,6 +22,10 @@ class CLAUDEmdAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "claude_md_file"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("CLAUDE.md",)
+
     @property
     def tier(self) -> int:
         return 1  # Essential
@@ -46,11 +48,11 @@ class CLAUDEmdAssessor(BaseAssessor):
         Pass criteria: CLAUDE.md exists
         Scoring: Binary (100 if exists, 0 if not)
         """
-        claude_md_path = repository.path / "CLAUDE.md"
+        claude_md_path = repository.root / "CLAUDE.md"
 
         # Fix TOCTOU: Use try-except around file read instead of existence check
         try:
-            with open(claude_md_path, "r", encoding="utf-8") as f:
+            with claude_md_path.open("r", encoding="utf-8") as f:
                 content = f.read()
 
             size = len(content)
@@ -156,6 +158,10 @@ class READMEAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "readme_structure"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("README.md",)
+
     @property
     def tier(self) -> int:
         return 1  # Essential
@@ -178,11 +184,11 @@ class READMEAssessor(BaseAssessor):
         Pass criteria: README.md exists with essential sections
         Scoring: Proportional based on section count
         """
-        readme_path = repository.path / "README.md"
+        readme_path = repository.root / "README.md"
 
         # Fix TOCTOU: Use try-except around file read instead of existence check
         try:
-            with open(readme_path, "r", encoding="utf-8") as f:
+            with readme_path.open("r", encoding="utf-8") as f:
                 content = f.read().lower()
 
             required_sections = {
@@ -305,6 +311,10 @@ class ArchitectureDecisionsAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "architecture_decisions"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("docs/adr/*", ".adr/*", "adr/*", "docs/decisions/*")
+
     @property
     def tier(self) -> int:
         return 3  # Important
@@ -331,10 +341,10 @@ class ArchitectureDecisionsAssessor(BaseAssessor):
         """
         # Check for ADR directory in common locations
         adr_paths = [
-            repository.path / "docs" / "adr",
-            repository.path / ".adr",
-            repository.path / "adr",
-            repository.path / "docs" / "decisions",
+            repository.root / "docs" / "adr",
+            repository.root / ".adr",
+            repository.root / "adr",
+            repository.root / "docs" / "decisions",
         ]
 
         adr_dir = None
@@ -375,7 +385,7 @@ class ArchitectureDecisionsAssessor(BaseAssessor):
                 measured_value="0 ADRs",
                 threshold="≥3 ADRs",
                 evidence=[
-                    f"ADR directory found: {adr_dir.relative_to(repository.path)}",
+                    f"ADR directory found: {adr_dir.relative_to(repository.root)}",
                     "No ADR files (.md) found in directory",
                 ],
                 remediation=self._create_remediation(),
@@ -396,7 +406,7 @@ class ArchitectureDecisionsAssessor(BaseAssessor):
         status = "pass" if total_score >= 75 else "fail"
 
         evidence = [
-            f"ADR directory found: {adr_dir.relative_to(repository.path)}",
+            f"ADR directory found: {adr_dir.relative_to(repository.root)}",
             f"{adr_count} architecture decision records",
         ]
 
@@ -562,6 +572,10 @@ class ConciseDocumentationAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "concise_documentation"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("README.md",)
+
     @property
     def tier(self) -> int:
         return 2  # Critical
@@ -586,7 +600,7 @@ class ConciseDocumentationAssessor(BaseAssessor):
         - Markdown structure (40%): Heading density (target 3-5 per 100 lines)
         - Concise formatting (30%): Bullet points, code blocks, no walls of text
         """
-        readme_path = repository.path / "README.md"
+        readme_path = repository.root / "README.md"
 
         if not readme_path.exists():
             return Finding.not_applicable(
@@ -838,6 +852,10 @@ class InlineDocumentationAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "inline_documentation"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("*.py",)
+
     @property
     def tier(self) -> int:
         return 2  # Critical
@@ -875,55 +893,30 @@ class InlineDocumentationAssessor(BaseAssessor):
     def _assess_python_docstrings(self, repository: Repository) -> Finding:
         """Assess Python docstring coverage using AST parsing."""
         # Get list of Python files
-        try:
-            result = safe_subprocess_run(
-                ["git", "ls-files", "*.py"],
-                cwd=repository.path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            python_files = [f for f in result.stdout.strip().split("\n") if f]
-        except Exception:
-            python_files = [
-                str(f.relative_to(repository.path))
-                for f in repository.path.rglob("*.py")
-            ]
+        python_files = repository.get_file_index().paths(extensions={".py"})
 
         total_public_items = 0
         documented_items = 0
 
-        for file_path in python_files:
-            full_path = repository.path / file_path
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+        # Shared AST cache skips files that can't be read or parsed
+        for module in repository.get_ast_cache().summaries(python_files):
+            # Check module-level docstring
+            if module.has_module_docstring:
+                documented_items += 1
+            total_public_items += 1
 
-                # Parse the file with AST
-                tree = ast.parse(content, filename=str(file_path))
+            # Count public functions/classes with docstrings
+            items = [f for f in module.functions if not f.is_async] + list(
+                module.classes
+            )
+            for item in items:
+                # Skip private functions/classes (starting with _)
+                if item.name.startswith("_"):
+                    continue
 
-                # Check module-level docstring
-                module_doc = ast.get_docstring(tree)
-                if module_doc:
-                    documented_items += 1
                 total_public_items += 1
-
-                # Walk the AST and count functions/classes with docstrings
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                        # Skip private functions/classes (starting with _)
-                        if node.name.startswith("_"):
-                            continue
-
-                        total_public_items += 1
-                        docstring = ast.get_docstring(node)
-                        if docstring:
-                            documented_items += 1
-
-            except (OSError, UnicodeDecodeError, SyntaxError):
-                # Skip files that can't be read or parsed
-                continue
+                if item.has_docstring:
+                    documented_items += 1
 
         if total_public_items == 0:
             return Finding.not_applicable(
@@ -1059,6 +1052,24 @@ class OpenAPISpecsAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "openapi_specs"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "openapi.*",
+            "swagger.*",
+            "app.py",
+            "server.py",
+            "main.py",
+            "api.py",
+            "routes.py",
+            "pyproject.toml",
+            "requirements.txt",
+            "package.json",
+            "pom.xml",
+            "go.mod",
+            "Gemfile",
+        )
+
     @property
     def tier(self) -> int:
         return 3  # Important
@@ -1091,11 +1102,11 @@ class OpenAPISpecsAssessor(BaseAssessor):
 
         # Check for API-related files
         api_files = [
-            repository.path / "app.py",
-            repository.path / "server.py",
-            repository.path / "main.py",
-            repository.path / "api.py",
-            repository.path / "routes.py",
+            repository.root / "app.py",
+            repository.root / "server.py",
+            repository.root / "main.py",
+            repository.root / "api.py",
+            repository.root / "routes.py",
         ]
 
         # If any API files exist, consider it applicable
@@ -1104,12 +1115,12 @@ class OpenAPISpecsAssessor(BaseAssessor):
 
         # Check dependencies for web frameworks
         dep_files = [
-            repository.path / "pyproject.toml",
-            repository.path / "requirements.txt",
-            repository.path / "package.json",
-            repository.path / "pom.xml",
-            repository.path / "go.mod",
-            repository.path / "Gemfile",
+            repository.root / "pyproject.toml",
+            repository.root / "requirements.txt",
+            repository.root / "package.json",
+            repository.root / "pom.xml",
+            repository.root / "go.mod",
+            repository.root / "Gemfile",
         ]
 
         for dep_file in dep_files:
@@ -1138,31 +1149,15 @@ class OpenAPISpecsAssessor(BaseAssessor):
             "swagger.json",
         ]
 
-        # Recursively search for spec files
+        # Search tracked files recursively (skips vendored dirs like node_modules)
+        file_index = repository.get_file_index()
         found_specs = []
-        excluded_dirs = {
-            ".git",
-            "node_modules",
-            ".venv",
-            "venv",
-            "__pycache__",
-            ".pytest_cache",
-        }
 
         for spec_name in spec_files:
-            try:
-                # Use rglob to search recursively
-                matches = list(repository.path.rglob(spec_name))
-                # Filter out files in excluded directories
-                matches = [
-                    m
-                    for m in matches
-                    if not any(part in m.parts for part in excluded_dirs)
-                ]
-                found_specs.extend(matches)
-            except OSError:
-                # If rglob fails, continue to next pattern
-                continue
+            found_specs.extend(
+                repository.root / f.path
+                for f in file_index.find(spec_name, include_vendored=False)
+            )
 
         # Remove duplicates while preserving order
         seen = set()
@@ -1176,7 +1171,7 @@ class OpenAPISpecsAssessor(BaseAssessor):
         found_spec = None
         if unique_specs:
             # Prefer root-level specs, otherwise use first found
-            root_specs = [s for s in unique_specs if s.parent == repository.path]
+            root_specs = [s for s in unique_specs if s.parent == repository.root]
             found_spec = root_specs[0] if root_specs else unique_specs[0]
 
         if not found_spec:
@@ -1205,7 +1200,7 @@ class OpenAPISpecsAssessor(BaseAssessor):
                 try:
                     spec_data = json.loads(content)
                 except json.JSONDecodeError as e:
-                    spec_relative_path = found_spec.relative_to(repository.path)
+                    spec_relative_path = found_spec.relative_to(repository.root)
                     return Finding.error(
                         self.attribute,
                         reason=f"Could not parse {spec_relative_path}: {str(e)}",
@@ -1242,13 +1237,13 @@ class OpenAPISpecsAssessor(BaseAssessor):
             status = "pass" if total_score >= 75 else "fail"
 
             # Build evidence
-            spec_relative_path = found_spec.relative_to(repository.path)
+            spec_relative_path = found_spec.relative_to(repository.root)
             evidence = [f"{spec_relative_path} found in repository"]
 
             # Indicate if multiple OpenAPI files were found
             if len(unique_specs) > 1:
                 other_specs = [
-                    s.relative_to(repository.path)
+                    s.relative_to(repository.root)
                     for s in unique_specs
                     if s != found_spec
                 ]
@@ -1286,7 +1281,7 @@ class OpenAPISpecsAssessor(BaseAssessor):
             )
 
         except (OSError, UnicodeDecodeError) as e:
-            spec_relative_path = found_spec.relative_to(repository.path)
+            spec_relative_path = found_spec.relative_to(repository.root)
             return Finding.error(
                 self.attribute, reason=f"Could not read {spec_relative_path}: {str(e)}"
             )
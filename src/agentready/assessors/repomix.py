@@ -47,6 +47,13 @@ class RepomixConfigAssessor(BaseAssessor):
         Returns:
             Finding with assessment results
         """
+        if not repository.has_working_tree:
+            # Repomix output is generated into, and dated by, the checkout
+            return Finding.skipped(
+                self.attribute,
+                reason="Repomix output freshness needs a working tree",
+            )
+
         service = RepomixService(repository.path)
 
         # Check if Repomix is configured
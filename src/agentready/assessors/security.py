@@ -19,6 +19,18 @@ class DependencySecurityAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "dependency_security"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            ".github/dependabot.yml",
+            ".github/workflows/*",
+            "pyproject.toml",
+            "package.json",
+            ".pre-commit-config.yaml",
+            ".semgrep.yml",
+            "SECURITY.md",
+        )
+
     @property
     def tier(self) -> int:
         return 1  # Tier 1 per user request
@@ -42,7 +54,7 @@ class DependencySecurityAssessor(BaseAssessor):
         tools_found = []
 
         # 1. Dependabot configuration (30 points)
-        dependabot_config = repository.path / ".github" / "dependabot.yml"
+        dependabot_config = repository.root / ".github" / "dependabot.yml"
         if dependabot_config.exists():
             score += 30
             tools_found.append("Dependabot")
@@ -60,7 +72,7 @@ class DependencySecurityAssessor(BaseAssessor):
                 pass
 
         # 2. CodeQL / GitHub Security Scanning (25 points)
-        codeql_workflow = repository.path / ".github" / "workflows"
+        codeql_workflow = repository.root / ".github" / "workflows"
         if codeql_workflow.exists():
             codeql_files = list(codeql_workflow.glob("*codeql*.yml")) + list(
                 codeql_workflow.glob("*codeql*.yaml")
@@ -73,7 +85,7 @@ class DependencySecurityAssessor(BaseAssessor):
         # 3. Python dependency scanners (20 points)
         if "Python" in repository.languages:
             # Check for pip-audit, safety, or bandit
-            pyproject = repository.path / "pyproject.toml"
+            pyproject = repository.root / "pyproject.toml"
             if pyproject.exists():
                 try:
                     content = pyproject.read_text()
@@ -99,7 +111,7 @@ class DependencySecurityAssessor(BaseAssessor):
 
         # 4. JavaScript/TypeScript dependency scanners (20 points)
         if "JavaScript" in repository.languages or "TypeScript" in repository.languages:
-            package_json = repository.path / "package.json"
+            package_json = repository.root / "package.json"
             if package_json.exists():
                 try:
                     import json
@@ -126,7 +138,7 @@ class DependencySecurityAssessor(BaseAssessor):
                     pass
 
         # 5. Secret detection in pre-commit (20 points)
-        precommit_config = repository.path / ".pre-commit-config.yaml"
+        precommit_config = repository.root / ".pre-commit-config.yaml"
         if precommit_config.exists():
             try:
                 content = precommit_config.read_text()
@@ -143,8 +155,8 @@ class DependencySecurityAssessor(BaseAssessor):
                 pass
 
         # 6. Semgrep (multi-language SAST) (15 points)
-        semgrep_config = repository.path / ".semgrep.yml"
-        semgrep_workflow = repository.path / ".github" / "workflows"
+        semgrep_config = repository.root / ".semgrep.yml"
+        semgrep_workflow = repository.root / ".github" / "workflows"
         if semgrep_config.exists():
             score += 15
             tools_found.append("Semgrep")
@@ -159,7 +171,7 @@ class DependencySecurityAssessor(BaseAssessor):
                 evidence.append("✓ Semgrep SAST in GitHub Actions")
 
         # 7. Security policy (5 points bonus)
-        security_md = repository.path / "SECURITY.md"
+        security_md = repository.root / "SECURITY.md"
         if security_md.exists():
             score += 5
             evidence.append("✓ SECURITY.md present (vulnerability disclosure policy)")
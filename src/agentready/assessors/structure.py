@@ -18,6 +18,10 @@ class StandardLayoutAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "standard_layout"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ("src/*", "tests/*", "test/*")
+
     @property
     def tier(self) -> int:
         return 1  # Essential
@@ -44,13 +48,13 @@ class StandardLayoutAssessor(BaseAssessor):
         """
         # Check for common standard directories
         standard_dirs = {
-            "src": repository.path / "src",
+            "src": repository.root / "src",
         }
 
         # Check for tests directory (either tests/ or test/)
-        tests_path = repository.path / "tests"
+        tests_path = repository.root / "tests"
         if not tests_path.exists():
-            tests_path = repository.path / "test"
+            tests_path = repository.root / "test"
         standard_dirs["tests"] = tests_path
 
         found_dirs = sum(1 for d in standard_dirs.values() if d.exists())
@@ -66,8 +70,8 @@ class StandardLayoutAssessor(BaseAssessor):
 
         evidence = [
             f"Found {found_dirs}/{required_dirs} standard directories",
-            f"src/: {'✓' if (repository.path / 'src').exists() else '✗'}",
-            f"tests/: {'✓' if (repository.path / 'tests').exists() or (repository.path / 'test').exists() else '✗'}",
+            f"src/: {'✓' if (repository.root / 'src').exists() else '✗'}",
+            f"tests/: {'✓' if (repository.root / 'tests').exists() or (repository.root / 'test').exists() else '✗'}",
         ]
 
         return Finding(
@@ -121,6 +125,18 @@ class OneCommandSetupAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "one_command_setup"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "README.md",
+            "Makefile",
+            "setup.sh",
+            "bootstrap.sh",
+            "package.json",
+            "pyproject.toml",
+            "setup.py",
+        )
+
     @property
     def tier(self) -> int:
         return 2  # Critical
@@ -146,7 +162,7 @@ class OneCommandSetupAssessor(BaseAssessor):
         - Setup in prominent location (30%)
         """
         # Check if README exists
-        readme_path = repository.path / "README.md"
+        readme_path = repository.root / "README.md"
         if not readme_path.exists():
             return Finding.not_applicable(
                 self.attribute,
@@ -240,7 +256,7 @@ class OneCommandSetupAssessor(BaseAssessor):
         }
 
         for filename, description in files_to_check.items():
-            if (repository.path / filename).exists():
+            if (repository.root / filename).exists():
                 setup_files.append(filename)
 
         return setup_files
@@ -320,6 +336,14 @@ class IssuePRTemplatesAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "issue_pr_templates"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "PULL_REQUEST_TEMPLATE.md",
+            "pull_request_template.md",
+            ".github/ISSUE_TEMPLATE/*",
+        )
+
     @property
     def tier(self) -> int:
         return 3  # Important
@@ -348,9 +372,9 @@ class IssuePRTemplatesAssessor(BaseAssessor):
 
         # Check for PR template (50%)
         pr_template_paths = [
-            repository.path / ".github" / "PULL_REQUEST_TEMPLATE.md",
-            repository.path / "PULL_REQUEST_TEMPLATE.md",
-            repository.path / ".github" / "pull_request_template.md",
+            repository.root / ".github" / "PULL_REQUEST_TEMPLATE.md",
+            repository.root / "PULL_REQUEST_TEMPLATE.md",
+            repository.root / ".github" / "pull_request_template.md",
         ]
 
         pr_template_found = any(p.exists() for p in pr_template_paths)
@@ -362,7 +386,7 @@ class IssuePRTemplatesAssessor(BaseAssessor):
             evidence.append("No PR template found")
 
         # Check for issue templates (50%)
-        issue_template_dir = repository.path / ".github" / "ISSUE_TEMPLATE"
+        issue_template_dir = repository.root / ".github" / "ISSUE_TEMPLATE"
 
         if issue_template_dir.exists() and issue_template_dir.is_dir():
             try:
@@ -489,6 +513,19 @@ class SeparationOfConcernsAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "separation_of_concerns"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        # Layer directories count whatever they contain, and any file under
+        # src/ decides whether layers are looked for there or at the root
+        return (
+            "*.py",
+            "src/*",
+            "models/*",
+            "views/*",
+            "controllers/*",
+            "services/*",
+        )
+
     @property
     def tier(self) -> int:
         return 2  # Critical
@@ -558,9 +595,9 @@ class SeparationOfConcernsAssessor(BaseAssessor):
         layer_dirs = ["models", "views", "controllers", "services"]
 
         # Check src directory if it exists
-        check_path = repository.path / "src"
+        check_path = repository.root / "src"
         if not check_path.exists():
-            check_path = repository.path
+            check_path = repository.root
 
         found_layers = []
         for layer in layer_dirs:
@@ -580,28 +617,19 @@ class SeparationOfConcernsAssessor(BaseAssessor):
         total_files = 0
         oversized_files = 0
 
-        # Check Python files
-        try:
-            py_files = list(repository.path.rglob("*.py"))
-            for py_file in py_files:
-                # Skip venv, node_modules, etc.
-                if any(
-                    part in py_file.parts
-                    for part in [".venv", "venv", "node_modules", ".git"]
-                ):
-                    continue
-
-                try:
-                    with open(py_file, "r", encoding="utf-8") as f:
-                        lines = len(f.readlines())
-                    total_files += 1
-                    if lines > threshold:
-                        oversized_files += 1
-                except (OSError, UnicodeDecodeError):
-                    continue
-
-        except OSError:
-            pass
+        # Check tracked Python files (skip venv, node_modules, etc.)
+        py_files = repository.get_file_index().paths(
+            extensions={".py"}, include_vendored=False
+        )
+        for rel_path in py_files:
+            try:
+                with (repository.root / rel_path).open("r", encoding="utf-8") as f:
+                    lines = len(f.readlines())
+                total_files += 1
+                if lines > threshold:
+                    oversized_files += 1
+            except (OSError, UnicodeDecodeError):
+                continue
 
         if total_files == 0:
             return 100.0, {"total": 0, "oversized": 0}
@@ -616,24 +644,12 @@ class SeparationOfConcernsAssessor(BaseAssessor):
         """Check for catch-all module anti-patterns."""
         antipattern_names = ["utils.py", "helpers.py", "common.py", "misc.py"]
 
+        file_index = repository.get_file_index()
         found = []
-        try:
-            for pattern in antipattern_names:
-                matches = list(repository.path.rglob(pattern))
-                # Filter out venv/node_modules
-                matches = [
-                    m
-                    for m in matches
-                    if not any(
-                        part in m.parts
-                        for part in [".venv", "venv", "node_modules", ".git"]
-                    )
-                ]
-                if matches:
-                    found.extend([m.name for m in matches])
-
-        except OSError:
-            pass
+        for pattern in antipattern_names:
+            # Filter out venv/node_modules
+            matches = file_index.find(pattern, include_vendored=False)
+            found.extend(m.name for m in matches)
 
         # Score: 100 if none found, -20 per antipattern file
         naming_score = max(0, 100.0 - (len(found) * 20))
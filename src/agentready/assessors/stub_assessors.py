@@ -9,7 +9,7 @@ from pathlib import Path
 from ..models.attribute import Attribute
 from ..models.finding import Citation, Finding, Remediation
 from ..models.repository import Repository
-from ..utils.subprocess_utils import safe_subprocess_run
+from ..services.file_metrics_cache import LINE_METRICS
 from .base import BaseAssessor
 
 
@@ -24,6 +24,21 @@ class DependencyPinningAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "lock_files"  # Keep same ID for backwards compatibility
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "package-lock.json",
+            "yarn.lock",
+            "pnpm-lock.yaml",
+            "poetry.lock",
+            "Pipfile.lock",
+            "uv.lock",
+            "Cargo.lock",
+            "Gemfile.lock",
+            "go.sum",
+            "requirements.txt",
+        )
+
     @property
     def tier(self) -> int:
         return 1
@@ -58,8 +73,8 @@ class DependencyPinningAssessor(BaseAssessor):
         # Manual lock files (need validation)
         manual_lock_files = ["requirements.txt"]  # Python pip
 
-        found_strict = [f for f in strict_lock_files if (repository.path / f).exists()]
-        found_manual = [f for f in manual_lock_files if (repository.path / f).exists()]
+        found_strict = [f for f in strict_lock_files if (repository.root / f).exists()]
+        found_manual = [f for f in manual_lock_files if (repository.root / f).exists()]
 
         if not found_strict and not found_manual:
             return Finding(
@@ -100,7 +115,7 @@ class DependencyPinningAssessor(BaseAssessor):
             import time
 
             for lock_file in found_strict:
-                lock_path = repository.path / lock_file
+                lock_path = repository.root / lock_file
                 try:
                     age_days = (time.time() - lock_path.stat().st_mtime) / 86400
                     age_months = age_days / 30
@@ -116,7 +131,7 @@ class DependencyPinningAssessor(BaseAssessor):
         # Check manual lock files (requirements.txt) for version pinning
         if found_manual and not found_strict:
             for lock_file in found_manual:
-                lock_path = repository.path / lock_file
+                lock_path = repository.root / lock_file
                 try:
                     content = lock_path.read_text()
                     lines = [
@@ -219,6 +234,10 @@ class ConventionalCommitsAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "conventional_commits"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (".commitlintrc.json", ".husky/*")
+
     @property
     def tier(self) -> int:
         return 2
@@ -237,8 +256,8 @@ class ConventionalCommitsAssessor(BaseAssessor):
 
     def assess(self, repository: Repository) -> Finding:
         # Simplified: Check if commitlint or husky is configured
-        has_commitlint = (repository.path / ".commitlintrc.json").exists()
-        has_husky = (repository.path / ".husky").exists()
+        has_commitlint = (repository.root / ".commitlintrc.json").exists()
+        has_husky = (repository.root / ".husky").exists()
 
         if has_commitlint or has_husky:
             return Finding(
@@ -284,6 +303,10 @@ class GitignoreAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "gitignore_completeness"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (".gitignore",)
+
     @property
     def tier(self) -> int:
         return 2
@@ -373,7 +396,7 @@ class GitignoreAssessor(BaseAssessor):
         return list(set(expected))  # Remove duplicates
 
     def assess(self, repository: Repository) -> Finding:
-        gitignore = repository.path / ".gitignore"
+        gitignore = repository.root / ".gitignore"
 
         if not gitignore.exists():
             return Finding(
@@ -519,6 +542,23 @@ class FileSizeLimitsAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "file_size_limits"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "*.py",
+            "*.js",
+            "*.ts",
+            "*.jsx",
+            "*.tsx",
+            "*.go",
+            "*.java",
+            "*.rb",
+            "*.rs",
+            "*.cpp",
+            "*.c",
+            "*.h",
+        )
+
     @property
     def tier(self) -> int:
         return 2
@@ -543,7 +583,8 @@ class FileSizeLimitsAssessor(BaseAssessor):
         - 75-99: Some files 500-1000 lines
         - 0-74: Files >1000 lines exist
 
-        Note: Uses git ls-files to respect .gitignore (fixes issue #245).
+        Note: Uses the git-tracked file index to respect .gitignore
+        (fixes issue #245).
         """
         # Count files by size
         large_files: list[tuple[Path, int]] = []  # 500-1000 lines
@@ -568,42 +609,25 @@ class FileSizeLimitsAssessor(BaseAssessor):
 
         # Get git-tracked files (respects .gitignore)
         # This fixes issue #245 where .venv files were incorrectly scanned
-        try:
-            patterns = [f"*.{ext}" for ext in extensions]
-            result = safe_subprocess_run(
-                ["git", "ls-files"] + patterns,
-                cwd=repository.path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            tracked_files = [f for f in result.stdout.strip().split("\n") if f]
-        except Exception:
-            # Fallback for non-git repos: use glob (less accurate)
-            tracked_files = []
-            for ext in extensions:
-                tracked_files.extend(
-                    str(f.relative_to(repository.path))
-                    for f in repository.path.rglob(f"*.{ext}")
-                    if f.is_file()
-                )
+        tracked_files = repository.get_file_index().files(
+            extensions={f".{ext}" for ext in extensions}
+        )
 
-        # Count lines in tracked files
-        for rel_path in tracked_files:
-            file_path = repository.path / rel_path
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    lines = len(f.readlines())
-                    total_files += 1
-
-                    if lines > 1000:
-                        huge_files.append((Path(rel_path), lines))
-                    elif lines > 500:
-                        large_files.append((Path(rel_path), lines))
-            except (OSError, UnicodeDecodeError):
-                # Skip files we can't read
-                pass
+        # Count lines in tracked files (unchanged blobs come from the cache)
+        metrics_cache = repository.get_metrics_cache()
+        metrics_cache.prefetch(LINE_METRICS, (f.blob_sha for f in tracked_files))
+        for indexed_file in tracked_files:
+            metrics = metrics_cache.line_metrics(repository.root, indexed_file)
+            if metrics is None or metrics.lines is None:
+                # Skip files we can't read or decode
+                continue
+
+            lines = metrics.lines
+            total_files += 1
+            if lines > 1000:
+                huge_files.append((Path(indexed_file.path), lines))
+            elif lines > 500:
+                large_files.append((Path(indexed_file.path), lines))
 
         if total_files == 0:
             return Finding.not_applicable(
@@ -690,6 +714,10 @@ class StubAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return self._attr_id
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ()
+
     @property
     def tier(self) -> int:
         return self._tier
@@ -19,6 +19,19 @@ class TestCoverageAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "test_coverage"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            "tests/*",
+            "test/*",
+            "spec/*",
+            "__tests__/*",
+            ".coveragerc",
+            "pyproject.toml",
+            "setup.cfg",
+            "package.json",
+        )
+
     @property
     def tier(self) -> int:
         return 2  # Critical
@@ -38,7 +51,7 @@ class TestCoverageAssessor(BaseAssessor):
     def is_applicable(self, repository: Repository) -> bool:
         """Applicable if tests directory exists."""
         test_dirs = ["tests", "test", "spec", "__tests__"]
-        return any((repository.path / d).exists() for d in test_dirs)
+        return any((repository.root / d).exists() for d in test_dirs)
 
     def assess(self, repository: Repository) -> Finding:
         """Check for test coverage configuration and actual coverage.
@@ -61,19 +74,19 @@ class TestCoverageAssessor(BaseAssessor):
         """Assess Python test coverage configuration."""
         # Check for coverage configuration files
         coverage_configs = [
-            repository.path / ".coveragerc",
-            repository.path / "pyproject.toml",
-            repository.path / "setup.cfg",
+            repository.root / ".coveragerc",
+            repository.root / "pyproject.toml",
+            repository.root / "setup.cfg",
         ]
 
         has_coverage_config = any(f.exists() for f in coverage_configs)
 
         # Check for pytest-cov in dependencies
         has_pytest_cov = False
-        pyproject = repository.path / "pyproject.toml"
+        pyproject = repository.root / "pyproject.toml"
         if pyproject.exists():
             try:
-                with open(pyproject, "r", encoding="utf-8") as f:
+                with pyproject.open("r", encoding="utf-8") as f:
                     content = f.read()
                     has_pytest_cov = "pytest-cov" in content
             except OSError:
@@ -112,7 +125,7 @@ class TestCoverageAssessor(BaseAssessor):
 
     def _assess_javascript_coverage(self, repository: Repository) -> Finding:
         """Assess JavaScript/TypeScript test coverage configuration."""
-        package_json = repository.path / "package.json"
+        package_json = repository.root / "package.json"
 
         if not package_json.exists():
             return Finding(
@@ -129,7 +142,7 @@ class TestCoverageAssessor(BaseAssessor):
         try:
             import json
 
-            with open(package_json, "r") as f:
+            with package_json.open("r") as f:
                 pkg = json.load(f)
 
             # Check for jest or vitest with coverage
@@ -226,6 +239,10 @@ class PreCommitHooksAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "precommit_hooks"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (".pre-commit-config.yaml",)
+
     @property
     def tier(self) -> int:
         return 2  # Critical
@@ -244,7 +261,7 @@ class PreCommitHooksAssessor(BaseAssessor):
 
     def assess(self, repository: Repository) -> Finding:
         """Check for pre-commit configuration."""
-        precommit_config = repository.path / ".pre-commit-config.yaml"
+        precommit_config = repository.root / ".pre-commit-config.yaml"
 
         if precommit_config.exists():
             return Finding(
@@ -330,6 +347,16 @@ class CICDPipelineVisibilityAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "cicd_pipeline_visibility"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return (
+            ".github/workflows/*",
+            ".gitlab-ci.yml",
+            ".circleci/*",
+            ".travis.yml",
+            "Jenkinsfile",
+        )
+
     @property
     def tier(self) -> int:
         return 3  # Important
@@ -375,7 +402,7 @@ class CICDPipelineVisibilityAssessor(BaseAssessor):
         # Score: CI exists (50%)
         score = 50
         evidence = [
-            f"CI config found: {', '.join(str(c.relative_to(repository.path)) for c in ci_configs)}"
+            f"CI config found: {', '.join(str(c.relative_to(repository.root)) for c in ci_configs)}"
         ]
 
         # Analyze first CI config for quality
@@ -402,11 +429,11 @@ class CICDPipelineVisibilityAssessor(BaseAssessor):
     def _detect_ci_configs(self, repository: Repository) -> list:
         """Detect CI/CD configuration files."""
         ci_config_checks = [
-            repository.path / ".github" / "workflows",  # GitHub Actions (directory)
-            repository.path / ".gitlab-ci.yml",  # GitLab CI
-            repository.path / ".circleci" / "config.yml",  # CircleCI
-            repository.path / ".travis.yml",  # Travis CI
-            repository.path / "Jenkinsfile",  # Jenkins
+            repository.root / ".github" / "workflows",  # GitHub Actions (directory)
+            repository.root / ".gitlab-ci.yml",  # GitLab CI
+            repository.root / ".circleci" / "config.yml",  # CircleCI
+            repository.root / ".travis.yml",  # Travis CI
+            repository.root / "Jenkinsfile",  # Jenkins
         ]
 
         configs = []
@@ -656,6 +683,10 @@ class BranchProtectionAssessor(BaseAssessor):
     def attribute_id(self) -> str:
         return "branch_protection"
 
+    @property
+    def input_patterns(self) -> tuple[str, ...]:
+        return ()
+
     @property
     def tier(self) -> int:
         return 4  # Advanced
@@ -1,9 +1,19 @@
 """CLI command for batch repository assessment."""
 
 import json
+import multiprocessing
+import sqlite3
 import sys
+import time
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import click
 from pydantic import ValidationError
@@ -11,8 +21,21 @@ from pydantic import ValidationError
 from ..assessors import create_all_assessors
 from ..models.config import Config
 from ..reporters.html import HTMLReporter
+from ..reporters.json_reporter import JSONReporter
 from ..reporters.markdown import MarkdownReporter
-from ..services.batch_scanner import BatchScanner
+from ..services.batch_journal import JOURNAL_FILENAME, BatchJournal
+from ..services.batch_scanner import (
+    DEFAULT_MAX_RETRIES,
+    BatchScanner,
+    default_worker_counts,
+    shard_repositories,
+)
+from ..services.batch_telemetry import BatchTelemetry
+from ..services.results_store import RESULTS_DB_FILENAME, ResultsStore
+
+# Below this many individual reports, starting report workers costs more
+# than rendering in this process
+MIN_PARALLEL_REPORTS = 8
 
 
 def _get_agentready_version() -> str:
@@ -69,14 +92,173 @@ def _load_config(config_path: Path) -> Config:
         sys.exit(1)
 
 
-def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool) -> None:
+def _parse_size(ctx, param, value: Optional[str]) -> Optional[int]:
+    """Parse a size such as 500M or 20G into bytes (click callback)."""
+    if value is None:
+        return None
+
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    text = value.strip().upper().removesuffix("B")
+    multiplier = 1
+    if text and text[-1] in units:
+        multiplier = units[text[-1]]
+        text = text[:-1]
+    try:
+        size = float(text)
+    except ValueError:
+        raise click.BadParameter(f"Invalid size: {value} (e.g., 500M, 20G)")
+    if size <= 0:
+        raise click.BadParameter(f"Size must be positive: {value}")
+    return int(size * multiplier)
+
+
+def _parse_shard(ctx, param, value: Optional[str]) -> Optional[tuple[int, int]]:
+    """Parse a shard such as 2/8 into (shard, shard_count) (click callback)."""
+    if value is None:
+        return None
+
+    try:
+        shard, shard_count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise click.BadParameter(f"Invalid shard: {value} (e.g., 2/8)")
+    if shard_count < 1 or not 1 <= shard <= shard_count:
+        raise click.BadParameter(
+            f"Shard must be between 1 and the shard count: {value}"
+        )
+    return shard, shard_count
+
+
+def _write_individual_reports(
+    assessment, reports_dir: Path, base_name: str, html_options: dict
+) -> float:
+    """Write the HTML, JSON and Markdown reports of one assessment.
+
+    Runs in report worker processes, which share one compiled template
+    environment per process (see reporters.html.template_environment).
+
+    Args:
+        assessment: Assessment to report on
+        reports_dir: Directory to write the reports in
+        base_name: File name of the reports, without extension
+        html_options: HTMLReporter keyword arguments
+
+    Returns:
+        Seconds spent writing the reports
+    """
+    start = time.perf_counter()
+    HTMLReporter(**html_options).generate(assessment, reports_dir / f"{base_name}.html")
+    JSONReporter().generate(assessment, reports_dir / f"{base_name}.json")
+    MarkdownReporter().generate(assessment, reports_dir / f"{base_name}.md")
+    return time.perf_counter() - start
+
+
+def _generate_individual_reports(
+    batch_assessment,
+    reports_dir: Path,
+    verbose: bool,
+    workers: int,
+    telemetry: Optional[BatchTelemetry] = None,
+    html_options: Optional[dict] = None,
+) -> None:
+    """Write HTML/JSON/MD reports for each successful assessment.
+
+    Reports are rendered by a pool of worker processes. Results are read
+    one at a time and at most 2 * workers of them are in flight, so memory
+    stays flat when the results are streamed from disk.
+
+    Args:
+        batch_assessment: Complete batch assessment with results
+        reports_dir: Directory to write the reports in
+        verbose: Whether to show verbose progress
+        workers: Report worker processes (1 to render in this process)
+        telemetry: Telemetry to record time spent reporting in
+        html_options: HTMLReporter keyword arguments (e.g., compact=True)
+    """
+    html_options = html_options or {}
+
+    def written(base_name: str, elapsed: float) -> None:
+        if telemetry is not None:
+            telemetry.record_stage("reporting", elapsed)
+        if verbose:
+            click.echo(f"  ✓ {base_name}.{{html,json,md}}")
+
+    def failed(base_name: str, error: Exception) -> None:
+        click.echo(f"  ✗ Individual reports failed for {base_name}: {error}", err=True)
+
+    def report_jobs() -> Iterator[tuple]:
+        for result in batch_assessment.results:
+            if result.is_success():
+                assessment = result.assessment
+                base_name = f"{assessment.repository.name}-{assessment.timestamp.strftime('%Y%m%d-%H%M%S')}"
+                yield assessment, base_name
+
+    successful = batch_assessment.summary.successful_assessments
+    if successful < MIN_PARALLEL_REPORTS:
+        workers = 1
+
+    if workers <= 1:
+        for assessment, base_name in report_jobs():
+            try:
+                elapsed = _write_individual_reports(
+                    assessment, reports_dir, base_name, html_options
+                )
+            except Exception as e:
+                failed(base_name, e)
+            else:
+                written(base_name, elapsed)
+        return
+
+    pending: dict[Future, str] = {}
+
+    def collect(return_when: str) -> None:
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            base_name = pending.pop(future)
+            try:
+                elapsed = future.result()
+            except Exception as e:
+                failed(base_name, e)
+            else:
+                written(base_name, elapsed)
+
+    # Spawned workers start clean, like the batch scanner's assessment pool
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(workers, successful), mp_context=context
+    ) as pool:
+        for assessment, base_name in report_jobs():
+            if len(pending) >= 2 * workers:
+                collect(FIRST_COMPLETED)
+            future = pool.submit(
+                _write_individual_reports,
+                assessment,
+                reports_dir,
+                base_name,
+                html_options,
+            )
+            pending[future] = base_name
+        collect(ALL_COMPLETED)
+
+
+def _generate_multi_reports(
+    batch_assessment,
+    output_path: Path,
+    verbose: bool,
+    report_workers: Optional[int] = None,
+    telemetry: Optional[BatchTelemetry] = None,
+    html_options: Optional[dict] = None,
+    paged_index: bool = False,
+    results_db: Optional[Path] = None,
+) -> None:
     """Generate all report formats in dated folder structure.
 
     Phase 2 Reporting:
     - Creates dated reports folder (reports-YYYYMMDD-HHMMSS/)
-    - Generates SQLite database (all assessments queryable)
+    - Adds the batch to a SQLite results database (see 'agentready query')
     - Generates CSV/TSV summaries (one row per repo)
     - Generates aggregated JSON (all assessments in one file)
+    - Generates findings.parquet (one row per repository and attribute;
+      needs pyarrow)
     - Generates individual reports (HTML/JSON/MD per repo)
     - Generates summary HTML (index.html with comparison table)
 
@@ -84,11 +266,24 @@ def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool)
         batch_assessment: Complete batch assessment with results
         output_path: Base output directory
         verbose: Whether to show verbose progress
+        report_workers: Processes rendering individual reports (default:
+            one per CPU)
+        telemetry: Telemetry to record time spent reporting in
+        html_options: HTMLReporter keyword arguments for individual reports
+        paged_index: Write index.html's results table as data files that
+            the page loads on demand (for very large batches)
+        results_db: SQLite results database to add the batch to (default:
+            assessments.db in output_path, shared by every batch run there)
     """
     from ..reporters.aggregated_json import AggregatedJSONReporter
     from ..reporters.csv_reporter import CSVReporter
-    from ..reporters.json_reporter import JSONReporter
-    from ..reporters.multi_html import MultiRepoHTMLReporter
+    from ..reporters.multi_html import INDEX_DATA_DIR, MultiRepoHTMLReporter
+    from ..services.findings_table import (
+        FINDINGS_TABLE_FILENAME,
+        PYARROW_AVAILABLE,
+        findings_frame,
+        write_findings_table,
+    )
 
     # Create dated reports folder
     timestamp = batch_assessment.timestamp.strftime("%Y%m%d-%H%M%S")
@@ -122,43 +317,53 @@ def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool)
     except Exception as e:
         click.echo(f"  ✗ Aggregated JSON generation failed: {e}", err=True)
 
-    # 3. Individual reports for each successful assessment
-    individual_json = JSONReporter()
-    for result in batch_assessment.results:
-        if result.is_success():
-            assessment = result.assessment
-            base_name = f"{assessment.repository.name}-{assessment.timestamp.strftime('%Y%m%d-%H%M%S')}"
-
-            try:
-                # HTML report
-                html_reporter = HTMLReporter()
-                html_reporter.generate(assessment, reports_dir / f"{base_name}.html")
-
-                # JSON report
-                individual_json.generate(assessment, reports_dir / f"{base_name}.json")
-
-                # Markdown report
-                markdown_reporter = MarkdownReporter()
-                markdown_reporter.generate(assessment, reports_dir / f"{base_name}.md")
+    # 3. Columnar findings table
+    if PYARROW_AVAILABLE:
+        try:
+            write_findings_table(
+                findings_frame(batch_assessment.result_dicts()),
+                reports_dir / FINDINGS_TABLE_FILENAME,
+            )
+            if verbose:
+                click.echo(f"  ✓ {FINDINGS_TABLE_FILENAME}")
+        except Exception as e:
+            click.echo(f"  ✗ Findings table generation failed: {e}", err=True)
+    elif verbose:
+        click.echo(f"  - {FINDINGS_TABLE_FILENAME} skipped (pyarrow not installed)")
 
-                if verbose:
-                    click.echo(f"  ✓ {base_name}.{{html,json,md}}")
-            except Exception as e:
-                click.echo(
-                    f"  ✗ Individual reports failed for {base_name}: {e}", err=True
-                )
+    # 4. SQLite results database
+    db_path = results_db or output_path / RESULTS_DB_FILENAME
+    try:
+        with ResultsStore(db_path) as store:
+            store.add_batch(batch_assessment)
+        if verbose:
+            click.echo(f"  ✓ {db_path}")
+    except (OSError, sqlite3.Error) as e:
+        click.echo(f"  ✗ Results database failed: {e}", err=True)
+
+    # 5. Individual reports for each successful assessment
+    _generate_individual_reports(
+        batch_assessment,
+        reports_dir,
+        verbose,
+        report_workers or default_worker_counts()[1],
+        telemetry,
+        html_options,
+    )
 
-    # 4. Multi-repo summary HTML (index)
+    # 6. Multi-repo summary HTML (index)
     try:
         template_dir = Path(__file__).parent.parent / "templates"
-        multi_html = MultiRepoHTMLReporter(template_dir)
+        multi_html = MultiRepoHTMLReporter(template_dir, paged=paged_index)
         multi_html.generate(batch_assessment, reports_dir / "index.html")
         if verbose:
             click.echo("  ✓ index.html")
+            if paged_index:
+                click.echo(f"  ✓ {INDEX_DATA_DIR}/")
     except Exception as e:
         click.echo(f"  ✗ Multi-repo HTML generation failed: {e}", err=True)
 
-    # 5. Failures JSON
+    # 7. Failures JSON
     failed_results = [r for r in batch_assessment.results if not r.is_success()]
     if failed_results:
         try:
@@ -261,6 +466,109 @@ def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool)
     default=None,
     help="Custom path for heatmap HTML (default: reports-*/heatmap.html)",
 )
+@click.option(
+    "--heatmap-max-rows",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Above this many repositories, the heatmap shows clusters of similar "
+    "repositories instead of one row per repository (default: 200)",
+)
+@click.option(
+    "--clone-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Repositories cloned concurrently (default: 2 per CPU, at most 8)",
+)
+@click.option(
+    "--assess-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Assessment worker processes (default: one per CPU)",
+)
+@click.option(
+    "--refresh-clones",
+    is_flag=True,
+    default=False,
+    help="Fetch the latest commit into cached clones instead of reusing them as-is",
+)
+@click.option(
+    "--clone-cache-quota",
+    callback=_parse_size,
+    default=None,
+    help="Disk quota for cached clones, e.g. 20G; least recently used "
+    "clones are evicted beyond it",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Continue an interrupted batch, skipping repositories recorded in "
+    f"the output directory's {JOURNAL_FILENAME}",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Keep results on disk instead of in memory and build reports "
+    "from them one repository at a time (for very large batches)",
+)
+@click.option(
+    "--repo-timeout",
+    type=click.FloatRange(min=1),
+    default=None,
+    help="Seconds allowed per repository (clone, retries and assessment); "
+    "slower repositories are recorded as timeouts (default: no limit)",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MAX_RETRIES,
+    show_default=True,
+    help="Retries for clones failing with network errors, timeouts or rate "
+    "limits, with exponential backoff",
+)
+@click.option(
+    "--shard",
+    callback=_parse_shard,
+    default=None,
+    help="Assess only shard I of N of the repository list, e.g. 2/8; "
+    "combine the shards' output directories with 'agentready merge'",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Keep batch metrics (throughput, ETA, time per stage, peak memory) "
+    "in this file in Prometheus text format, e.g. for node_exporter's "
+    "textfile collector",
+)
+@click.option(
+    "--compact-html",
+    is_flag=True,
+    default=False,
+    help="Embed each HTML report's data once and render findings in the "
+    "browser (about half the size)",
+)
+@click.option(
+    "--gzip-html",
+    is_flag=True,
+    default=False,
+    help="Also write a gzip-compressed copy of each HTML report for static hosting",
+)
+@click.option(
+    "--paged-index",
+    is_flag=True,
+    default=False,
+    help="Keep index.html small by loading its results table from data files "
+    "as it is scrolled (for very large batches; serve the reports over HTTP)",
+)
+@click.option(
+    "--results-db",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="SQLite database to add the batch's results to, for 'agentready query' "
+    f"(default: {RESULTS_DB_FILENAME} in the output directory)",
+)
 def assess_batch(
     repos_file: Optional[str],
     repos: tuple,
@@ -274,6 +582,21 @@ def assess_batch(
     cache_dir: Optional[str],
     generate_heatmap: bool,
     heatmap_output: Optional[str],
+    heatmap_max_rows: Optional[int],
+    clone_workers: Optional[int],
+    assess_workers: Optional[int],
+    refresh_clones: bool,
+    clone_cache_quota: Optional[int],
+    resume: bool,
+    stream: bool,
+    repo_timeout: Optional[float],
+    max_retries: int,
+    shard: Optional[tuple[int, int]],
+    metrics_file: Optional[str],
+    compact_html: bool,
+    gzip_html: bool,
+    paged_index: bool,
+    results_db: Optional[str],
 ):
     """Assess multiple repositories in a batch operation.
 
@@ -289,6 +612,21 @@ def assess_batch(
         agentready assess-batch --github-org anthropics
         agentready assess-batch --github-org myorg --include-private --max-repos 50
 
+    Cloning and assessment run in a pipeline: clone workers fetch the next
+    repositories while assessment workers score the ones already cloned.
+    Use --clone-workers 1 --assess-workers 1 to process one at a time.
+
+    Each finished repository is appended to a journal in the output
+    directory. If a run is interrupted, re-run the same command with
+    --resume to assess only the remaining repositories. With --stream,
+    results are only kept in that journal and reports are generated from
+    it, so memory use stays flat on batches of thousands of repositories.
+
+    To split a batch across machines, run the same command on each with
+    --shard 1/N ... --shard N/N, then combine the output directories:
+
+        agentready merge shard-1/ shard-2/ --output-dir merged/
+
     Output files are saved to .agentready/batch/ by default.
     """
     # Collect repository URLs
@@ -358,6 +696,16 @@ def assess_batch(
         )
         sys.exit(1)
 
+    if shard:
+        total_repos = len(repository_urls)
+        repository_urls = shard_repositories(repository_urls, *shard)
+        click.echo(
+            f"Shard {shard[0]}/{shard[1]}: {len(repository_urls)} of "
+            f"{total_repos} repositories"
+        )
+        if not repository_urls:
+            return
+
     if verbose:
         click.echo("AgentReady Batch Assessment")
         click.echo(f"{'=' * 50}")
@@ -393,19 +741,38 @@ def assess_batch(
         cache_dir=cache_path,
         version=version,
         command="assess-batch",
+        refresh_clones=refresh_clones,
+        clone_cache_quota=clone_cache_quota,
+        repo_timeout=repo_timeout,
+        max_retries=max_retries,
     )
 
     # Create assessors
     assessors = create_all_assessors()
 
+    default_clone_workers, default_assess_workers = default_worker_counts()
+    clone_workers = clone_workers or default_clone_workers
+    assess_workers = assess_workers or default_assess_workers
+
     if verbose:
         click.echo(f"Assessors: {len(assessors)}")
         click.echo(f"Cache: {cache_path}")
+        click.echo(f"Workers: {clone_workers} clone, {assess_workers} assess")
         click.echo()
 
+    journal = BatchJournal(output_path / JOURNAL_FILENAME)
+    if resume:
+        click.echo(f"Resuming batch recorded in {journal.path}")
+
+    telemetry = BatchTelemetry(Path(metrics_file) if metrics_file else None)
+
     # Progress callback
     def show_progress(current: int, total: int):
-        click.echo(f"Assessing repository {current + 1}/{total}...")
+        rate = telemetry.progress()
+        click.echo(
+            f"Repository {current + 1}/{total}: {repository_urls[current]}"
+            + (f" [{rate}]" if rate else "")
+        )
 
     # Run batch assessment
     try:
@@ -416,8 +783,15 @@ def assess_batch(
             use_cache=use_cache,
             verbose=verbose,
             progress_callback=show_progress if verbose else None,
+            clone_workers=clone_workers,
+            assess_workers=assess_workers,
+            journal=journal,
+            resume=resume,
+            keep_results=not stream,
+            telemetry=telemetry,
         )
     except Exception as e:
+        telemetry.finish()
         click.echo(f"Error during batch assessment: {e}", err=True)
         if verbose:
             import traceback
@@ -426,11 +800,23 @@ def assess_batch(
         sys.exit(1)
 
     # Generate comprehensive Phase 2 reports
-    _generate_multi_reports(batch_assessment, output_path, verbose)
+    _generate_multi_reports(
+        batch_assessment,
+        output_path,
+        verbose,
+        assess_workers,
+        telemetry,
+        {"compact": compact_html, "precompress": gzip_html},
+        paged_index,
+        Path(results_db) if results_db else None,
+    )
 
     # Generate heatmap if requested
     if generate_heatmap:
-        from ..services.attribute_analyzer import AttributeAnalyzer
+        from ..services.attribute_analyzer import HEATMAP_MAX_ROWS, AttributeAnalyzer
+        from ..services.findings_table import FINDINGS_TABLE_FILENAME
+
+        max_rows = heatmap_max_rows or HEATMAP_MAX_ROWS
 
         timestamp = batch_assessment.timestamp.strftime("%Y%m%d-%H%M%S")
         reports_dir = output_path / f"reports-{timestamp}"
@@ -443,7 +829,13 @@ def assess_batch(
 
         try:
             analyzer = AttributeAnalyzer()
-            analyzer.analyze_batch(batch_assessment, heatmap_path)
+            findings_table = reports_dir / FINDINGS_TABLE_FILENAME
+            if findings_table.exists():
+                analyzer.analyze_batch_from_table(
+                    findings_table, heatmap_path, max_rows
+                )
+            else:
+                analyzer.analyze_batch(batch_assessment, heatmap_path, max_rows)
             click.echo("  ✓ heatmap.html")
         except Exception as e:
             click.echo(f"⚠ Warning: Failed to generate heatmap: {e}", err=True)
@@ -452,6 +844,8 @@ def assess_batch(
 
                 traceback.print_exc()
 
+    telemetry.finish()
+
     # Print summary
     click.echo("\n" + "=" * 50)
     click.echo("Batch Assessment Summary")
@@ -462,8 +856,21 @@ def assess_batch(
     click.echo(f"Success rate: {batch_assessment.get_success_rate():.1f}%")
     click.echo(f"Average score: {batch_assessment.summary.average_score:.1f}/100")
     click.echo(f"Total duration: {batch_assessment.total_duration_seconds:.1f}s")
+    if telemetry.completed:
+        click.echo(f"Throughput: {telemetry.throughput():.1f} repos/min")
+    if telemetry.peak_rss_bytes:
+        click.echo(
+            f"Peak memory per repository: {telemetry.peak_rss_bytes / 2**20:.0f} MiB"
+        )
     click.echo()
 
+    if verbose and telemetry.completed:
+        click.echo("Time by Stage (summed over repositories):")
+        for stage, seconds in telemetry.stage_seconds.items():
+            if seconds > 0:
+                click.echo(f"  {stage}: {seconds:.1f}s")
+        click.echo()
+
     if batch_assessment.summary.score_distribution:
         click.echo("Score Distribution:")
         for level, count in batch_assessment.summary.score_distribution.items():
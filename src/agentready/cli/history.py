@@ -0,0 +1,159 @@
+"""CLI command for scoring a repository across its commit history."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from ..assessors import create_all_assessors
+from ..models.config import Config
+from ..reporters.history import HistoryReporter
+from ..services.file_metrics_cache import FileMetricsCache
+from ..services.history import HistoryScanner
+from .main import get_agentready_version, load_config
+
+
+@click.command()
+@click.argument("repository", type=click.Path(exists=True), required=False, default=".")
+@click.option(
+    "--commits",
+    "-n",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of most recent commits to assess (default: 50 unless --since)",
+)
+@click.option(
+    "--since",
+    default=None,
+    help="Only assess commits after this date (e.g., 2025-01-01, '3 months ago')",
+)
+@click.option(
+    "--rev",
+    default="HEAD",
+    show_default=True,
+    help="Newest commit of the series",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["csv", "json"]),
+    default="csv",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Output file (default: .agentready/history.<format>)",
+)
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True),
+    default=None,
+    help="Path to configuration file",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of assessors to run concurrently",
+)
+@click.option(
+    "--metrics-cache",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory for per-file metrics cache shared across runs",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Print each commit's score")
+def history(
+    repository,
+    commits,
+    since,
+    rev,
+    output_format,
+    output,
+    config,
+    jobs,
+    metrics_cache,
+    verbose,
+):
+    """Score a repository across its history, oldest commit first.
+
+    Commits along the first-parent chain are read from the git object
+    database (no checkouts). Each one only re-runs assessors whose input
+    files changed since the previous commit.
+
+    REPOSITORY: Path to git repository (default: current directory)
+
+    Examples:
+
+        \b
+        # Score the last 50 commits
+        agentready history . --commits 50
+
+        \b
+        # Score everything since a date, as JSON
+        agentready history . --since 2025-01-01 --format json
+    """
+    repo_path = Path(repository).resolve()
+    if commits is None and since is None:
+        commits = 50
+
+    scanner = HistoryScanner(
+        repo_path,
+        load_config(Path(config)) if config else Config.load_default(),
+        metrics_cache=FileMetricsCache(Path(metrics_cache)) if metrics_cache else None,
+    )
+
+    try:
+        series = scanner.list_commits(max_commits=commits, since=since, rev=rev)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    if not series:
+        click.echo("No commits to assess.", err=True)
+        sys.exit(1)
+
+    def report_point(index, point):
+        if verbose:
+            click.echo(
+                f"[{index + 1}/{len(series)}] {point.commit_hash[:8]} "
+                f"{point.committed_at:%Y-%m-%d} {point.overall_score:5.1f} "
+                f"({point.reassessed} re-assessed)"
+            )
+
+    try:
+        result = scanner.run(
+            create_all_assessors(),
+            series,
+            version=get_agentready_version(),
+            jobs=jobs,
+            on_point=report_point,
+        )
+    except Exception as e:
+        click.echo(f"Error during history assessment: {e}", err=True)
+        sys.exit(1)
+
+    if output:
+        output_path = Path(output)
+    else:
+        output_path = repo_path / ".agentready" / f"history.{output_format}"
+
+    reporter = HistoryReporter()
+    if output_format == "json":
+        reporter.generate_json(result, output_path)
+    else:
+        reporter.generate_csv(result, output_path)
+
+    first, last = result.points[0], result.points[-1]
+    click.echo(
+        f"Assessed {len(result.points)} commit(s): "
+        f"{first.overall_score:.1f} -> {last.overall_score:.1f}"
+    )
+    click.echo(f"Series written to {output_path}")
@@ -18,6 +18,8 @@ from ..assessors import create_all_assessors
 from ..models.config import Config
 from ..reporters.html import HTMLReporter
 from ..reporters.markdown import MarkdownReporter
+from ..services.file_metrics_cache import FileMetricsCache
+from ..services.git_tree import is_bare_repository
 from ..services.research_loader import ResearchLoader
 from ..services.scanner import Scanner
 from ..utils.security import (
@@ -37,7 +39,8 @@ from .research import research
 from .schema import migrate_report, validate_report
 
 # Heavy commands - lazy loaded via LazyGroup
-# (assess_batch, experiment, extract_skills, harbor, learn, submit)
+# (assess_batch, experiment, extract_skills, harbor, history, learn, merge,
+#  query, submit)
 
 
 def get_agentready_version() -> str:
@@ -98,7 +101,10 @@ class LazyGroup(click.Group):
         "experiment": ("experiment", "experiment"),
         "extract-skills": ("extract_skills", "extract_skills"),
         "harbor": ("harbor", "harbor_cli"),
+        "history": ("history", "history"),
         "learn": ("learn", "learn"),
+        "merge": ("merge", "merge"),
+        "query": ("query", "query"),
         "submit": ("submit", "submit"),
     },
 )
@@ -159,15 +165,70 @@ def cli(ctx, version):
     multiple=True,
     help="Attribute ID(s) to exclude (can be specified multiple times)",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of assessors to run concurrently",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print per-assessor timing and I/O summary",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Re-run every assessor instead of reusing unchanged findings",
+)
+@click.option(
+    "--metrics-cache",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory for per-file metrics cache shared across scans",
+)
+@click.option(
+    "--rev",
+    default=None,
+    help="Assess this commit from the git object database without a checkout "
+    "(default for bare repositories: HEAD)",
+)
+@click.option(
+    "--compact-html",
+    is_flag=True,
+    help="Embed report data once and render findings in the browser "
+    "(about half the size)",
+)
+@click.option(
+    "--gzip-html",
+    is_flag=True,
+    help="Also write a gzip-compressed copy of the HTML report for static hosting",
+)
 def assess(
     repository,
     verbose,
     output_dir,
     config,
     exclude,
+    jobs,
+    profile,
+    full,
+    metrics_cache,
+    rev,
+    compact_html,
+    gzip_html,
 ):
     """Assess a repository against agent-ready criteria.
 
+    If a previous report exists in the output directory, only assessors
+    whose input files changed since its commit are re-run (use --full to
+    re-run everything).
+
+    With --rev (or for a bare repository), files are read straight from
+    git objects and the working tree is never touched.
+
     REPOSITORY: Path to git repository (default: current directory)
     """
     run_assessment(
@@ -176,6 +237,13 @@ def assess(
         output_dir,
         config,
         exclude,
+        jobs,
+        profile,
+        full,
+        metrics_cache,
+        rev,
+        compact_html,
+        gzip_html,
     )
 
 
@@ -185,10 +253,20 @@ def run_assessment(
     output_dir,
     config_path,
     exclude=None,
+    jobs=1,
+    profile=False,
+    full=False,
+    metrics_cache=None,
+    rev=None,
+    compact_html=False,
+    gzip_html=False,
 ):
     """Execute repository assessment."""
     repo_path = Path(repository_path).resolve()
 
+    if rev is not None and rev.startswith("-"):
+        raise click.BadParameter(f"Invalid revision: {rev}", param_hint="--rev")
+
     # Security: Warn when scanning sensitive directories
     # Use centralized constants and proper boundary checking
     is_sensitive = any(
@@ -211,9 +289,13 @@ def run_assessment(
     # Performance: Warn for large repositories
     try:
         # Quick file count using git ls-files (if it's a git repo) or fallback
+        if rev is not None or is_bare_repository(repo_path):
+            count_cmd = ["git", "ls-tree", "-r", "--name-only", rev or "HEAD"]
+        else:
+            count_cmd = ["git", "ls-files"]
         # Security: Use safe_subprocess_run for validation and limits
         result = safe_subprocess_run(
-            ["git", "ls-files"],
+            count_cmd,
             cwd=repo_path,
             capture_output=True,
             text=True,
@@ -259,7 +341,14 @@ def run_assessment(
 
     # Create scanner
     try:
-        scanner = Scanner(repo_path, config)
+        scanner = Scanner(
+            repo_path,
+            config,
+            metrics_cache=(
+                FileMetricsCache(Path(metrics_cache)) if metrics_cache else None
+            ),
+            rev=rev,
+        )
     except ValueError as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -293,7 +382,15 @@ def run_assessment(
     # Run scan
     try:
         version = get_agentready_version()
-        assessment = scanner.scan(assessors, verbose=verbose, version=version)
+        # Reuse unchanged findings from the previous report when present
+        baseline = output_path / "assessment-latest.json"
+        assessment = scanner.scan(
+            assessors,
+            verbose=verbose,
+            version=version,
+            jobs=jobs,
+            baseline=None if full or not baseline.exists() else baseline,
+        )
     except Exception as e:
         click.echo(f"Error during assessment: {str(e)}", err=True)
         if verbose:
@@ -311,7 +408,7 @@ def run_assessment(
         json.dump(assessment.to_dict(), f, indent=2)
 
     # Generate HTML report
-    html_reporter = HTMLReporter()
+    html_reporter = HTMLReporter(compact=compact_html, precompress=gzip_html)
     html_file = output_path / f"report-{timestamp}.html"
     html_reporter.generate(assessment, html_file)
 
@@ -395,12 +492,47 @@ def run_assessment(
 
     click.echo("-" * 100)
 
+    if profile:
+        _print_profile_table(assessment)
+
     click.echo("\nReports generated:")
     click.echo(f"  JSON: {json_file}")
     click.echo(f"  HTML: {html_file}")
     click.echo(f"  Markdown: {markdown_file}")
 
 
+def _print_profile_table(assessment) -> None:
+    """Print per-assessor resource usage, slowest first."""
+    profiled = [f for f in assessment.findings if f.profile]
+    profiled.sort(key=lambda f: f.profile.wall_time_seconds, reverse=True)
+
+    click.echo("\nAssessor Profile:")
+    click.echo("-" * 100)
+    click.echo(
+        f"{'Attribute':<35} {'Wall (s)':>9} {'CPU (s)':>9} {'Files':>8} "
+        f"{'Bytes':>12} {'Subprocs':>9}"
+    )
+    click.echo("-" * 100)
+
+    for finding in profiled:
+        p = finding.profile
+        click.echo(
+            f"{finding.attribute.id:<35} {p.wall_time_seconds:>9.3f} "
+            f"{p.cpu_time_seconds:>9.3f} {p.files_read:>8} {p.bytes_read:>12} "
+            f"{p.subprocesses:>9}"
+        )
+
+    click.echo("-" * 100)
+    click.echo(
+        f"{'Total':<35} "
+        f"{sum(f.profile.wall_time_seconds for f in profiled):>9.3f} "
+        f"{sum(f.profile.cpu_time_seconds for f in profiled):>9.3f} "
+        f"{sum(f.profile.files_read for f in profiled):>8} "
+        f"{sum(f.profile.bytes_read for f in profiled):>12} "
+        f"{sum(f.profile.subprocesses for f in profiled):>9}"
+    )
+
+
 def load_config(config_path: Path) -> Config:
     """Load configuration from YAML file with Pydantic validation.
 
@@ -0,0 +1,98 @@
+"""CLI command for combining the output of a sharded batch assessment."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from ..services.batch_journal import JOURNAL_FILENAME, merge_journals
+from .assess_batch import _generate_multi_reports, _get_agentready_version
+
+
+@click.command()
+@click.argument(
+    "shards",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True),
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False),
+    default=".agentready/batch",
+    show_default=True,
+    help="Output directory for the merged reports",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+@click.option(
+    "--compact-html",
+    is_flag=True,
+    help="Embed each HTML report's data once and render findings in the browser",
+)
+@click.option(
+    "--gzip-html",
+    is_flag=True,
+    help="Also write a gzip-compressed copy of each HTML report",
+)
+@click.option(
+    "--paged-index",
+    is_flag=True,
+    help="Load index.html's results table from data files as it is scrolled",
+)
+@click.option(
+    "--results-db",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="SQLite database to add the merged batch to "
+    "(default: assessments.db in the output directory)",
+)
+def merge(
+    shards, output_dir, verbose, compact_html, gzip_html, paged_index, results_db
+):
+    """Combine sharded assess-batch runs into one batch report.
+
+    SHARDS are the output directories of 'assess-batch --shard I/N' runs
+    (or their batch-journal.jsonl files). The merged batch gets one
+    summary and the usual reports, as if it had been assessed in one run.
+
+    Examples:
+
+        \b
+        agentready merge shard-1/ shard-2/ shard-3/ --output-dir merged/
+    """
+    journal_paths = []
+    for shard in shards:
+        path = Path(shard)
+        if path.is_dir():
+            path = path / JOURNAL_FILENAME
+        if not path.is_file():
+            click.echo(f"Error: No batch journal at {path}", err=True)
+            sys.exit(1)
+        journal_paths.append(path)
+
+    output_path = Path(output_dir)
+    try:
+        batch_assessment = merge_journals(
+            journal_paths,
+            output_path / JOURNAL_FILENAME,
+            version=_get_agentready_version(),
+        )
+    except (OSError, ValueError) as e:
+        click.echo(f"Error merging shards: {e}", err=True)
+        sys.exit(1)
+
+    summary = batch_assessment.summary
+    click.echo(
+        f"Merged {len(journal_paths)} shard(s): "
+        f"{summary.total_repositories} repositories, "
+        f"{summary.successful_assessments} successful"
+    )
+    _generate_multi_reports(
+        batch_assessment,
+        output_path,
+        verbose,
+        html_options={"compact": compact_html, "precompress": gzip_html},
+        paged_index=paged_index,
+        results_db=Path(results_db) if results_db else None,
+    )
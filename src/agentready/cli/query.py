@@ -0,0 +1,141 @@
+"""CLI commands for querying the batch results database."""
+
+import csv
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import click
+
+from ..services.results_store import RESULTS_DB_FILENAME, ResultsStore
+
+
+def _echo_rows(rows: list[dict], output_format: str) -> None:
+    """Print query results as an aligned table, CSV or JSON."""
+    if output_format == "json":
+        click.echo(json.dumps(rows, indent=2))
+        return
+    if not rows:
+        if output_format == "table":
+            click.echo("No results.")
+        return
+
+    columns = list(rows[0])
+    if output_format == "csv":
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows([row[c] for c in columns] for row in rows)
+        return
+
+    cells = [columns] + [
+        ["" if row[c] is None else str(row[c]) for c in columns] for row in rows
+    ]
+    widths = [max(len(line[i]) for line in cells) for i in range(len(columns))]
+    for n, line in enumerate(cells):
+        click.echo("  ".join(cell.ljust(w) for cell, w in zip(line, widths)).rstrip())
+        if n == 0:
+            click.echo("  ".join("-" * w for w in widths))
+
+
+def _open_store(ctx: click.Context) -> ResultsStore:
+    """Open the database given to the query group, read-only."""
+    try:
+        store = ResultsStore(ctx.obj["db"], read_only=True)
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    ctx.call_on_close(store.close)
+    return store
+
+
+def _run(ctx: click.Context, query) -> None:
+    """Run a store query and print its rows, exiting on errors."""
+    store = _open_store(ctx)
+    try:
+        rows = query(store)
+    except (ValueError, sqlite3.Error) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    _echo_rows(rows, ctx.obj["format"])
+
+
+@click.group()
+@click.option(
+    "--db",
+    type=click.Path(dir_okay=False),
+    default=f".agentready/batch/{RESULTS_DB_FILENAME}",
+    show_default=True,
+    help="Results database written by assess-batch or merge",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "csv", "json"]),
+    default="table",
+    show_default=True,
+    help="Output format",
+)
+@click.pass_context
+def query(ctx, db, output_format):
+    """Query batch assessment results without loading report files.
+
+    assess-batch and merge add every batch to a SQLite database in their
+    output directory. Batches can be named by a unique prefix of their ID.
+
+    Examples:
+
+        \b
+        # Repositories failing an attribute in the newest batch
+        agentready query failing claude_md_file --language Python
+
+        \b
+        # Score change per repository between the two newest batches
+        agentready query delta
+
+        \b
+        # Anything else, in SQL
+        agentready query sql "SELECT attribute_id, COUNT(*) FROM findings
+            WHERE status = 'fail' GROUP BY attribute_id"
+    """
+    ctx.obj = {"db": Path(db), "format": output_format}
+
+
+@query.command()
+@click.pass_context
+def batches(ctx):
+    """List stored batches, newest first."""
+    _run(ctx, lambda store: store.batches())
+
+
+@query.command()
+@click.argument("attribute_id")
+@click.option("--batch", default=None, help="Batch ID or prefix (default: newest)")
+@click.option("--language", default=None, help="Only this primary language")
+@click.pass_context
+def failing(ctx, attribute_id, batch, language):
+    """List repositories failing ATTRIBUTE_ID."""
+    _run(ctx, lambda store: store.failing(attribute_id, batch, language))
+
+
+@query.command()
+@click.argument("old_batch", required=False)
+@click.argument("new_batch", required=False)
+@click.pass_context
+def delta(ctx, old_batch, new_batch):
+    """Show each repository's score change from OLD_BATCH to NEW_BATCH.
+
+    Defaults to the two newest batches.
+    """
+    _run(ctx, lambda store: store.score_delta(old_batch, new_batch))
+
+
+@query.command()
+@click.argument("statement")
+@click.pass_context
+def sql(ctx, statement):
+    """Run a read-only SQL STATEMENT against the database.
+
+    Tables: batches, repositories, assessments, attributes, findings.
+    """
+    _run(ctx, lambda store: store.query(statement))
@@ -4,7 +4,9 @@ from agentready.models.assessment import Assessment
 from agentready.models.attribute import Attribute
 from agentready.models.batch_assessment import (
     BatchAssessment,
+    BatchResultStream,
     BatchSummary,
+    BatchSummaryBuilder,
     FailureTracker,
     RepositoryResult,
 )
@@ -28,7 +30,9 @@ __all__ = [
     "AssessmentMetadata",
     "Attribute",
     "BatchAssessment",
+    "BatchResultStream",
     "BatchSummary",
+    "BatchSummaryBuilder",
     "Citation",
     "CommandFix",
     "Config",
@@ -96,6 +96,39 @@ class Assessment:
             "discovered_skills": [s.to_dict() for s in self.discovered_skills],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict, verify_path: bool = True) -> "Assessment":
+        """Create assessment from dictionary (inverse of to_dict).
+
+        Args:
+            data: Dictionary from to_dict()
+            verify_path: Require the repository path to still exist
+
+        Raises:
+            KeyError: If a required field is missing
+            ValueError: If a field fails validation (including a repository
+                path that no longer exists)
+        """
+        metadata = data.get("metadata")
+        config = data.get("config")
+        return cls(
+            repository=Repository.from_dict(data["repository"], verify_path),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            overall_score=data["overall_score"],
+            certification_level=data["certification_level"],
+            attributes_assessed=data["attributes_assessed"],
+            attributes_not_assessed=data["attributes_not_assessed"],
+            attributes_total=data["attributes_total"],
+            findings=[Finding.from_dict(f) for f in data["findings"]],
+            config=Config(**config) if config else None,
+            duration_seconds=data["duration_seconds"],
+            discovered_skills=[
+                DiscoveredSkill.from_dict(s) for s in data.get("discovered_skills", [])
+            ],
+            metadata=AssessmentMetadata.from_dict(metadata) if metadata else None,
+            schema_version=data.get("schema_version", cls.CURRENT_SCHEMA_VERSION),
+        )
+
     @staticmethod
     def determine_certification_level(score: float) -> str:
         """Determine certification level based on overall score.
@@ -49,3 +49,16 @@ class Attribute:
             "criteria": self.criteria,
             "default_weight": self.default_weight,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Attribute":
+        """Create attribute from dictionary."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            category=data["category"],
+            tier=data["tier"],
+            description=data["description"],
+            criteria=data["criteria"],
+            default_weight=data["default_weight"],
+        )
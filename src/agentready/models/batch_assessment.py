@@ -1,10 +1,16 @@
 """Batch assessment models for multi-repository evaluation."""
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
 
 from .assessment import Assessment
 
+# Certification levels in the order they are reported
+CERTIFICATION_LEVELS = ("Platinum", "Gold", "Silver", "Bronze", "Needs Improvement")
+
 
 @dataclass
 class RepositoryResult:
@@ -17,6 +23,10 @@ class RepositoryResult:
         error_type: Type of error (e.g., "clone_error", "assessment_error", "validation_error")
         duration_seconds: Time taken to complete
         cached: Whether this result came from cache
+        stage_timings: Seconds spent per stage (e.g., "clone", "queue",
+            "language_detection", "assessors")
+        peak_rss_bytes: Peak resident memory of the process that assessed
+            the repository (None if not assessed or not measurable)
     """
 
     repository_url: str
@@ -25,6 +35,8 @@ class RepositoryResult:
     error_type: str | None = None
     duration_seconds: float = 0.0
     cached: bool = False
+    stage_timings: dict[str, float] = field(default_factory=dict)
+    peak_rss_bytes: int | None = None
 
     def __post_init__(self):
         """Validate result data."""
@@ -50,8 +62,37 @@ class RepositoryResult:
             "error_type": self.error_type,
             "duration_seconds": self.duration_seconds,
             "cached": self.cached,
+            "stage_timings": self.stage_timings,
+            "peak_rss_bytes": self.peak_rss_bytes,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict, verify_path: bool = True) -> "RepositoryResult":
+        """Create result from dictionary (inverse of to_dict).
+
+        Args:
+            data: Dictionary from to_dict()
+            verify_path: Require the assessed repository path to still exist
+
+        Raises:
+            KeyError: If a required field is missing
+            ValueError: If a field fails validation (including an assessed
+                repository path that no longer exists)
+        """
+        assessment = data.get("assessment")
+        return cls(
+            repository_url=data["repository_url"],
+            assessment=(
+                Assessment.from_dict(assessment, verify_path) if assessment else None
+            ),
+            error=data.get("error"),
+            error_type=data.get("error_type"),
+            duration_seconds=data.get("duration_seconds", 0.0),
+            cached=data.get("cached", False),
+            stage_timings=data.get("stage_timings") or {},
+            peak_rss_bytes=data.get("peak_rss_bytes"),
+        )
+
 
 @dataclass
 class BatchSummary:
@@ -88,6 +129,170 @@ class BatchSummary:
         }
 
 
+class BatchSummaryBuilder:
+    """Compute a BatchSummary one result at a time.
+
+    Only counters are kept, so summarizing a batch needs constant memory
+    however many repositories it has. Results can be added as models or
+    as the dictionaries RepositoryResult.to_dict() returns (e.g., read
+    back from a result stream without rebuilding the models).
+    """
+
+    def __init__(self):
+        """Initialize empty summary."""
+        self.total = 0
+        self.successful = 0
+        self.score_total = 0.0
+        self.score_distribution = dict.fromkeys(CERTIFICATION_LEVELS, 0)
+        self.language_breakdown: dict[str, int] = {}
+        self.failing_attributes: dict[str, int] = {}
+
+    def add(self, result: RepositoryResult) -> None:
+        """Count one result.
+
+        Args:
+            result: Repository result
+        """
+        assessment = result.assessment
+        if assessment is None:
+            self.total += 1
+            return
+        self._add_success(
+            assessment.overall_score,
+            assessment.certification_level,
+            assessment.repository.languages,
+            (f.attribute.id for f in assessment.findings if f.status == "fail"),
+        )
+
+    def add_record(self, data: dict) -> None:
+        """Count one result given as a RepositoryResult.to_dict() dictionary.
+
+        Args:
+            data: Serialized repository result
+        """
+        assessment = data.get("assessment")
+        if not assessment:
+            self.total += 1
+            return
+        self._add_success(
+            assessment["overall_score"],
+            assessment["certification_level"],
+            assessment["repository"]["languages"],
+            (
+                f["attribute"]["id"]
+                for f in assessment["findings"]
+                if f["status"] == "fail"
+            ),
+        )
+
+    def _add_success(
+        self,
+        score: float,
+        level: str,
+        languages: dict[str, int],
+        failing_attribute_ids: Iterable[str],
+    ) -> None:
+        """Count one successful assessment."""
+        self.total += 1
+        self.successful += 1
+        self.score_total += score
+        if level in self.score_distribution:
+            self.score_distribution[level] += 1
+        for lang, count in languages.items():
+            self.language_breakdown[lang] = self.language_breakdown.get(lang, 0) + count
+        for attr_id in failing_attribute_ids:
+            self.failing_attributes[attr_id] = (
+                self.failing_attributes.get(attr_id, 0) + 1
+            )
+
+    def build(self) -> BatchSummary:
+        """Summary of everything added so far."""
+        top_failing = sorted(
+            self.failing_attributes.items(),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:10]
+
+        return BatchSummary(
+            total_repositories=self.total,
+            successful_assessments=self.successful,
+            failed_assessments=self.total - self.successful,
+            average_score=(
+                self.score_total / self.successful if self.successful else 0.0
+            ),
+            score_distribution=dict(self.score_distribution),
+            language_breakdown=dict(self.language_breakdown),
+            top_failing_attributes=[
+                {"attribute_id": attr_id, "failure_count": count}
+                for attr_id, count in top_failing
+            ],
+        )
+
+
+class BatchResultStream:
+    """Repository results kept on disk, read back one at a time.
+
+    Wraps an NDJSON file with one {"result": RepositoryResult.to_dict()}
+    record per line (the batch journal). Opening it only indexes where
+    each repository's record starts; iterating reads and rebuilds one
+    result at a time, so large batches can be reported on without
+    holding every assessment in memory. It can be iterated any number
+    of times.
+
+    Results come out in the order of repository_urls. If a repository
+    was recorded more than once, its last record wins. Results are
+    rebuilt without checking that assessed clones still exist.
+    """
+
+    def __init__(self, path: Path, repository_urls: Iterable[str] | None = None):
+        """Index the stream.
+
+        Args:
+            path: NDJSON file of result records
+            repository_urls: Repositories to include, in order (None for
+                every recorded repository, in first-recorded order)
+        """
+        self.path = Path(path)
+        wanted = None if repository_urls is None else list(repository_urls)
+        wanted_set = None if wanted is None else set(wanted)
+
+        # URL -> (byte offset of its last record, whether it succeeded)
+        index: dict[str, tuple[int, bool]] = {}
+        with open(self.path, "rb") as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                try:
+                    data = json.loads(line)["result"]
+                    url = data["repository_url"]
+                except (ValueError, KeyError, TypeError):
+                    # Batch header, or a torn last line
+                    continue
+                if wanted_set is None or url in wanted_set:
+                    index[url] = (offset, bool(data.get("assessment")))
+
+        # Repositories with a result, in iteration order
+        self.urls = list(index) if wanted is None else [u for u in wanted if u in index]
+        self._offsets = [index[url][0] for url in self.urls]
+        self.successful = sum(1 for url in self.urls if index[url][1])
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[RepositoryResult]:
+        for data in self.records():
+            yield RepositoryResult.from_dict(data, verify_path=False)
+
+    def records(self) -> Iterator[dict]:
+        """Iterate results as RepositoryResult.to_dict() dictionaries."""
+        with open(self.path, "rb") as f:
+            for offset in self._offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())["result"]
+
+
 @dataclass
 class BatchAssessment:
     """Complete batch assessment of multiple repositories.
@@ -95,7 +300,8 @@ class BatchAssessment:
     Attributes:
         batch_id: Unique identifier for this batch
         timestamp: When batch started
-        results: Individual repository results
+        results: Individual repository results (a list, or a
+            BatchResultStream for batches kept on disk)
         summary: Aggregated statistics
         total_duration_seconds: Total time for entire batch
         agentready_version: AgentReady version used
@@ -104,7 +310,7 @@ class BatchAssessment:
 
     batch_id: str
     timestamp: datetime
-    results: list[RepositoryResult]
+    results: list[RepositoryResult] | BatchResultStream
     summary: BatchSummary
     total_duration_seconds: float
     agentready_version: str = "unknown"
@@ -118,7 +324,10 @@ class BatchAssessment:
         if not self.results:
             raise ValueError("Batch must have at least one result")
 
-        successful = sum(1 for r in self.results if r.is_success())
+        if isinstance(self.results, BatchResultStream):
+            successful = self.results.successful
+        else:
+            successful = sum(1 for r in self.results if r.is_success())
         if successful != self.summary.successful_assessments:
             raise ValueError(
                 f"Summary successful_assessments ({self.summary.successful_assessments}) "
@@ -138,13 +347,30 @@ class BatchAssessment:
             return 0.0
         return (self.summary.successful_assessments / len(self.results)) * 100
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+    def result_dicts(self) -> Iterator[dict]:
+        """Iterate results as dictionaries, one at a time.
+
+        Streamed results are read straight from disk without rebuilding
+        the models.
+        """
+        if isinstance(self.results, BatchResultStream):
+            yield from self.results.records()
+        else:
+            for result in self.results:
+                yield result.to_dict()
+
+    def to_dict(self, include_results: bool = True) -> dict:
+        """Convert to dictionary for JSON serialization.
+
+        Args:
+            include_results: Include every result (otherwise "results" is
+                an empty list; see result_dicts() to stream them)
+        """
         return {
             "schema_version": self.schema_version,
             "batch_id": self.batch_id,
             "timestamp": self.timestamp.isoformat(),
-            "results": [r.to_dict() for r in self.results],
+            "results": list(self.result_dicts()) if include_results else [],
             "summary": self.summary.to_dict(),
             "total_duration_seconds": self.total_duration_seconds,
             "success_rate": self.get_success_rate(),
@@ -38,3 +38,13 @@ class Citation:
             "url": self.url,
             "relevance": self.relevance,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Citation":
+        """Create citation from dictionary."""
+        return cls(
+            source=data["source"],
+            title=data["title"],
+            url=data.get("url"),
+            relevance=data["relevance"],
+        )
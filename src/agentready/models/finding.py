@@ -45,6 +45,58 @@ class Remediation:
             "citations": [c.to_dict() for c in self.citations],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Remediation":
+        """Create remediation from dictionary."""
+        return cls(
+            summary=data["summary"],
+            steps=data["steps"],
+            tools=data.get("tools", []),
+            commands=data.get("commands", []),
+            examples=data.get("examples", []),
+            citations=[Citation.from_dict(c) for c in data.get("citations", [])],
+        )
+
+
+@dataclass
+class AssessorProfile:
+    """Resource usage of a single assessor run.
+
+    Attributes:
+        wall_time_seconds: Elapsed wall-clock time
+        cpu_time_seconds: CPU time of the executing thread (excludes subprocesses)
+        files_read: Number of files opened for reading
+        bytes_read: Total size of files opened for reading
+        subprocesses: Number of subprocesses spawned
+    """
+
+    wall_time_seconds: float
+    cpu_time_seconds: float
+    files_read: int = 0
+    bytes_read: int = 0
+    subprocesses: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "wall_time_seconds": round(self.wall_time_seconds, 6),
+            "cpu_time_seconds": round(self.cpu_time_seconds, 6),
+            "files_read": self.files_read,
+            "bytes_read": self.bytes_read,
+            "subprocesses": self.subprocesses,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AssessorProfile":
+        """Create profile from dictionary."""
+        return cls(
+            wall_time_seconds=data["wall_time_seconds"],
+            cpu_time_seconds=data["cpu_time_seconds"],
+            files_read=data.get("files_read", 0),
+            bytes_read=data.get("bytes_read", 0),
+            subprocesses=data.get("subprocesses", 0),
+        )
+
 
 @dataclass
 class Finding:
@@ -59,6 +111,7 @@ class Finding:
         evidence: Specific files/metrics supporting the finding
         remediation: How to fix if failing (None if passing)
         error_message: Error details if status="error"
+        profile: Resource usage of the assessor run (set by Scanner)
     """
 
     attribute: Attribute
@@ -69,6 +122,7 @@ class Finding:
     evidence: list[str]
     remediation: Remediation | None
     error_message: str | None
+    profile: AssessorProfile | None = None
 
     VALID_STATUSES = {"pass", "fail", "skipped", "error", "not_applicable"}
 
@@ -99,8 +153,26 @@ class Finding:
             "evidence": self.evidence,
             "remediation": self.remediation.to_dict() if self.remediation else None,
             "error_message": self.error_message,
+            "profile": self.profile.to_dict() if self.profile else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Finding":
+        """Create finding from dictionary (inverse of to_dict)."""
+        remediation = data.get("remediation")
+        profile = data.get("profile")
+        return cls(
+            attribute=Attribute.from_dict(data["attribute"]),
+            status=data["status"],
+            score=data.get("score"),
+            measured_value=data.get("measured_value"),
+            threshold=data.get("threshold"),
+            evidence=data.get("evidence", []),
+            remediation=Remediation.from_dict(remediation) if remediation else None,
+            error_message=data.get("error_message"),
+            profile=AssessorProfile.from_dict(profile) if profile else None,
+        )
+
     @classmethod
     def not_applicable(cls, attribute: Attribute, reason: str = "") -> "Finding":
         """Create a not_applicable finding for language-specific attributes."""
@@ -0,0 +1,90 @@
+"""Score history model: one repository's readiness score over its commits."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from .assessment import Assessment
+
+
+@dataclass
+class HistoryPoint:
+    """Assessment summary for one commit.
+
+    Attributes:
+        commit_hash: Full commit SHA
+        committed_at: Commit timestamp (UTC)
+        overall_score: Weighted score (0-100)
+        certification_level: Certification level for the score
+        attribute_scores: Score per attribute ID (None if not assessed)
+        reassessed: Assessors actually run for this commit (the rest reused
+            the previous commit's finding)
+    """
+
+    commit_hash: str
+    committed_at: datetime
+    overall_score: float
+    certification_level: str
+    attribute_scores: dict[str, float | None]
+    reassessed: int
+
+    @classmethod
+    def from_assessment(
+        cls, assessment: Assessment, committed_at: datetime
+    ) -> "HistoryPoint":
+        """Summarize an assessment of one commit.
+
+        Args:
+            assessment: Assessment of the commit
+            committed_at: Commit timestamp
+
+        Returns:
+            HistoryPoint for the commit
+        """
+        return cls(
+            commit_hash=assessment.repository.commit_hash,
+            committed_at=committed_at,
+            overall_score=assessment.overall_score,
+            certification_level=assessment.certification_level,
+            attribute_scores={f.attribute.id: f.score for f in assessment.findings},
+            # Reused findings carry no profile; executed ones always do
+            reassessed=sum(1 for f in assessment.findings if f.profile is not None),
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "commit_hash": self.commit_hash,
+            "committed_at": self.committed_at.isoformat(),
+            "overall_score": self.overall_score,
+            "certification_level": self.certification_level,
+            "attribute_scores": self.attribute_scores,
+            "reassessed": self.reassessed,
+        }
+
+
+@dataclass
+class ScoreHistory:
+    """Readiness score time series for one repository, oldest commit first.
+
+    Attributes:
+        repository_name: Repository name
+        points: One entry per assessed commit, oldest first
+    """
+
+    repository_name: str
+    points: list[HistoryPoint] = field(default_factory=list)
+
+    @property
+    def attribute_ids(self) -> list[str]:
+        """All attribute IDs seen across points, in first-seen order."""
+        ids: dict[str, None] = {}
+        for point in self.points:
+            ids.update(dict.fromkeys(point.attribute_scores))
+        return list(ids)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "repository": self.repository_name,
+            "points": [point.to_dict() for point in self.points],
+        }
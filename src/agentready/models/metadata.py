@@ -44,6 +44,19 @@ class AssessmentMetadata:
             "working_directory": self.working_directory,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "AssessmentMetadata":
+        """Create metadata from dictionary (inverse of to_dict)."""
+        return cls(
+            agentready_version=data["agentready_version"],
+            research_version=data["research_version"],
+            assessment_timestamp=data["assessment_timestamp"],
+            assessment_timestamp_human=data["assessment_timestamp_human"],
+            executed_by=data["executed_by"],
+            command=data["command"],
+            working_directory=data["working_directory"],
+        )
+
     @classmethod
     def create(
         cls, version: str, research_version: str, timestamp: datetime, command: str
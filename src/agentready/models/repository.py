@@ -1,12 +1,16 @@
 """Repository model representing the target git repository being assessed."""
 
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..utils.privacy import sanitize_path, shorten_commit_hash
 
 if TYPE_CHECKING:
+    from ..services.file_metrics_cache import FileMetricsCache
+    from ..services.git_tree import GitTree, TreePath
+    from ..services.python_ast_cache import PythonASTCache
+    from ..services.repository_index import RepositoryIndex
     from .config import Config
 
 
@@ -24,6 +28,17 @@ class Repository:
         total_files: Total files in repository (respecting .gitignore)
         total_lines: Total lines of code
         config: Optional Config instance for eval harness parameters
+        file_index: Shared per-scan file index (not serialized)
+        ast_cache: Shared per-scan Python AST cache (not serialized)
+        metrics_cache: Content-addressed per-file metrics cache (not serialized)
+        tree: Commit tree read from the object database when assessing a
+            revision or bare repository instead of the working tree (not
+            serialized)
+        working_tree_changes: Paths that differed from commit_hash when
+            assessed (modified, staged or untracked); empty for a commit
+            tree, None if unknown
+        verify_path: Check that path is a git repository (init-only; off
+            when restoring results whose clone may since have been removed)
     """
 
     path: Path
@@ -35,18 +50,32 @@ class Repository:
     total_files: int
     total_lines: int
     config: "Config | None" = None
-
-    def __post_init__(self):
+    file_index: "RepositoryIndex | None" = field(
+        default=None, repr=False, compare=False
+    )
+    ast_cache: "PythonASTCache | None" = field(default=None, repr=False, compare=False)
+    metrics_cache: "FileMetricsCache | None" = field(
+        default=None, repr=False, compare=False
+    )
+    tree: "GitTree | None" = field(default=None, repr=False, compare=False)
+    working_tree_changes: list[str] | None = None
+    verify_path: InitVar[bool] = True
+
+    def __post_init__(self, verify_path: bool = True):
         """Validate repository data after initialization."""
         # Convert string paths to Path objects for runtime type safety
         if isinstance(self.path, str):
             object.__setattr__(self, "path", Path(self.path))
 
-        if not self.path.exists():
-            raise ValueError(f"Repository path does not exist: {self.path}")
+        if verify_path:
+            if not self.path.exists():
+                raise ValueError(f"Repository path does not exist: {self.path}")
+
+            if not (self.path / ".git").exists():
+                from ..services.git_tree import is_bare_repository
 
-        if not (self.path / ".git").exists():
-            raise ValueError(f"Not a git repository: {self.path}")
+                if not is_bare_repository(self.path):
+                    raise ValueError(f"Not a git repository: {self.path}")
 
         if self.total_files < 0:
             raise ValueError(f"Total files must be non-negative: {self.total_files}")
@@ -54,6 +83,17 @@ class Repository:
         if self.total_lines < 0:
             raise ValueError(f"Total lines must be non-negative: {self.total_lines}")
 
+    def __getstate__(self) -> dict:
+        """Pickle without the per-scan caches and commit tree.
+
+        They hold locks, database handles and git subprocesses, and are
+        rebuilt on demand; this lets assessments cross process boundaries.
+        """
+        state = self.__dict__.copy()
+        for name in ("file_index", "ast_cache", "metrics_cache", "tree"):
+            state[name] = None
+        return state
+
     def get_sanitized_path(self) -> str:
         """Get sanitized path for public display.
 
@@ -74,6 +114,74 @@ class Repository:
         """
         return shorten_commit_hash(self.commit_hash)
 
+    @property
+    def root(self) -> "Path | TreePath":
+        """Root to read repository content through.
+
+        Assessors read files via ``repository.root / "..."`` rather than
+        ``repository.path`` so that the same code works on the working tree
+        (a Path) and on a commit read from the object database (a TreePath).
+
+        Returns:
+            Working tree path, or the commit tree's root
+        """
+        return self.tree.root if self.tree is not None else self.path
+
+    @property
+    def has_working_tree(self) -> bool:
+        """Whether files are read from a checkout (False for a commit tree).
+
+        Assessors that hand the repository path to external tools need a
+        working tree and should skip themselves when this is False.
+        """
+        return self.tree is None
+
+    def get_file_index(self) -> "RepositoryIndex":
+        """Get the shared file index, building it on first use.
+
+        Scanner attaches one index per scan. Repositories constructed
+        elsewhere (e.g., in tests) build theirs lazily here.
+
+        Returns:
+            RepositoryIndex of tracked files
+        """
+        if self.file_index is None:
+            from ..services.repository_index import RepositoryIndex
+
+            if self.tree is not None:
+                self.file_index = RepositoryIndex.from_tree(self.tree)
+            else:
+                self.file_index = RepositoryIndex.build(self.path)
+        return self.file_index
+
+    def get_ast_cache(self) -> "PythonASTCache":
+        """Get the shared Python AST cache, creating it on first use.
+
+        Returns:
+            PythonASTCache so each .py file is parsed once per scan
+        """
+        if self.ast_cache is None:
+            from ..services.python_ast_cache import PythonASTCache
+
+            self.ast_cache = PythonASTCache(
+                self.root,
+                index=self.get_file_index(),
+                metrics_cache=self.get_metrics_cache(),
+            )
+        return self.ast_cache
+
+    def get_metrics_cache(self) -> "FileMetricsCache":
+        """Get the per-file metrics cache, creating an in-memory one on first use.
+
+        Returns:
+            FileMetricsCache keyed by git blob SHA
+        """
+        if self.metrics_cache is None:
+            from ..services.file_metrics_cache import FileMetricsCache
+
+            self.metrics_cache = FileMetricsCache()
+        return self.metrics_cache
+
     @property
     def primary_language(self) -> str:
         """Get the primary programming language (most files).
@@ -106,7 +214,7 @@ class Repository:
                 "total_lines": self.total_lines,
             }
         else:
-            return {
+            data = {
                 "path": str(self.path),
                 "name": self.name,
                 "url": self.url,
@@ -116,3 +224,28 @@ class Repository:
                 "total_files": self.total_files,
                 "total_lines": self.total_lines,
             }
+            if self.working_tree_changes is not None:
+                data["working_tree_changes"] = self.working_tree_changes
+            return data
+
+    @classmethod
+    def from_dict(cls, data: dict, verify_path: bool = True) -> "Repository":
+        """Create repository from dictionary (inverse of to_dict).
+
+        Args:
+            data: Dictionary from to_dict()
+            verify_path: Require the path to still exist and be a git
+                repository
+        """
+        return cls(
+            path=Path(data["path"]),
+            name=data["name"],
+            url=data.get("url"),
+            branch=data["branch"],
+            commit_hash=data["commit_hash"],
+            languages=data.get("languages", {}),
+            total_files=data["total_files"],
+            total_lines=data["total_lines"],
+            working_tree_changes=data.get("working_tree_changes"),
+            verify_path=verify_path,
+        )
@@ -1,10 +1,13 @@
 """Aggregated JSON reporter for batch assessments."""
 
 import json
+import textwrap
 from pathlib import Path
 
 from ..models.batch_assessment import BatchAssessment
 
+_RESULTS_PLACEHOLDER = "__agentready_results__"
+
 
 class AggregatedJSONReporter:
     """Generates single JSON file with all batch assessment data.
@@ -34,7 +37,24 @@ class AggregatedJSONReporter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Results are written one at a time (streamed batches never hold
+        # them all in memory); the rest of the document is rendered around
+        # a placeholder so the layout matches json.dump(indent=2)
+        data = batch_assessment.to_dict(include_results=False)
+        data["results"] = _RESULTS_PLACEHOLDER
+        head, tail = json.dumps(data, indent=2, default=str).split(
+            json.dumps(_RESULTS_PLACEHOLDER)
+        )
+
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(batch_assessment.to_dict(), f, indent=2, default=str)
+            f.write(head)
+            f.write("[")
+            for i, result in enumerate(batch_assessment.result_dicts()):
+                f.write(",\n" if i else "\n")
+                f.write(
+                    textwrap.indent(json.dumps(result, indent=2, default=str), "    ")
+                )
+            f.write("\n  ]" if batch_assessment.results else "]")
+            f.write(tail)
 
         return output_path
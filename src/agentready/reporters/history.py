@@ -0,0 +1,76 @@
+"""Reporter for score history time series (CSV and JSON)."""
+
+import csv
+import json
+from pathlib import Path
+
+from ..models.history import ScoreHistory
+from .csv_reporter import CSVReporter
+
+
+class HistoryReporter:
+    """Writes a ScoreHistory as a compact series for charting.
+
+    CSV has one row per commit: commit, time, overall score, certification,
+    number of assessors re-run, then one column per attribute score. JSON
+    carries the same data nested per point.
+    """
+
+    def generate_csv(self, history: ScoreHistory, output_path: Path) -> Path:
+        """Write the series as CSV.
+
+        Args:
+            history: Score history
+            output_path: Path where the CSV should be saved
+
+        Returns:
+            Path to generated CSV file
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        attribute_ids = history.attribute_ids
+
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "commit_hash",
+                    "committed_at",
+                    "overall_score",
+                    "certification_level",
+                    "reassessed",
+                    *attribute_ids,
+                ]
+            )
+            for point in history.points:
+                writer.writerow(
+                    [
+                        point.commit_hash,
+                        point.committed_at.isoformat(),
+                        point.overall_score,
+                        CSVReporter.sanitize_csv_field(point.certification_level),
+                        point.reassessed,
+                        *(
+                            CSVReporter.sanitize_csv_field(
+                                point.attribute_scores.get(attribute_id)
+                            )
+                            for attribute_id in attribute_ids
+                        ),
+                    ]
+                )
+
+        return output_path
+
+    def generate_json(self, history: ScoreHistory, output_path: Path) -> Path:
+        """Write the series as JSON.
+
+        Args:
+            history: Score history
+            output_path: Path where the JSON should be saved
+
+        Returns:
+            Path to generated JSON file
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(history.to_dict(), f, indent=2)
+        return output_path
@@ -1,13 +1,45 @@
 """HTML reporter for generating interactive assessment reports."""
 
+import gzip
+import logging
+from functools import lru_cache
 from pathlib import Path
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    select_autoescape,
+)
+from jinja2.utils import htmlsafe_json_dumps
 
 from ..models.assessment import Assessment
 from ..models.theme import Theme
 from .base import BaseReporter
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def template_environment() -> Environment:
+    """Jinja2 environment shared by every HTMLReporter in this process.
+
+    Templates are loaded and compiled once per process instead of once per
+    report. Compiled bytecode is also cached on disk (in a per-user temp
+    directory), so new processes such as report workers skip compiling.
+    """
+    try:
+        bytecode_cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Template bytecode cache unavailable: {e}")
+        bytecode_cache = None
+
+    return Environment(
+        loader=PackageLoader("agentready", "templates"),
+        autoescape=select_autoescape(["html", "xml", "j2"]),
+        bytecode_cache=bytecode_cache,
+    )
+
 
 class HTMLReporter(BaseReporter):
     """Generates self-contained interactive HTML reports.
@@ -20,14 +52,25 @@ class HTMLReporter(BaseReporter):
     - Color-coded scores and tiers
     - Certification ladder visualization
     - Works offline (no CDN dependencies)
+
+    Compact reports embed the assessment once, as JSON, and build the
+    findings from it in the browser instead of also rendering them as
+    HTML. Themes are embedded once, as a color table that replaces both
+    the server-rendered theme CSS and the per-theme JSON objects. This
+    roughly halves the size of each report.
     """
 
-    def __init__(self):
-        """Initialize HTML reporter with Jinja2 environment."""
-        self.env = Environment(
-            loader=PackageLoader("agentready", "templates"),
-            autoescape=select_autoescape(["html", "xml", "j2"]),
-        )
+    def __init__(self, compact: bool = False, precompress: bool = False):
+        """Initialize HTML reporter with the shared Jinja2 environment.
+
+        Args:
+            compact: Generate compact reports (see class docstring)
+            precompress: Also write a gzip-compressed copy of each report
+                next to it (report.html.gz), for static hosting
+        """
+        self.env = template_environment()
+        self.compact = compact
+        self.precompress = precompress
 
     def generate(self, assessment: Assessment, output_path: Path) -> Path:
         """Generate HTML report from assessment data.
@@ -49,10 +92,13 @@ class HTMLReporter(BaseReporter):
         theme = self._resolve_theme(assessment.config)
 
         # Get all available themes for theme switcher
-        available_themes = {
-            name: Theme.get_theme(name).to_dict()
-            for name in Theme.get_available_themes()
-        }
+        if self.compact:
+            available_themes = {}
+        else:
+            available_themes = {
+                name: Theme.get_theme(name).to_dict()
+                for name in Theme.get_available_themes()
+            }
 
         # Security: Sanitize repository path and commit hash for display
         repository_display_path = assessment.repository.get_sanitized_path()
@@ -82,13 +128,67 @@ class HTMLReporter(BaseReporter):
             "available_themes": available_themes,
             # Security: Pass dict, not pre-serialized JSON
             "available_themes_dict": available_themes,
+            "compact": self.compact,
         }
+        if self.compact:
+            template_data.update(self._compact_data(assessment, theme))
 
         # Render template
         html_content = template.render(**template_data)
 
         # Write to file using base class method
-        return self._write_file(html_content, output_path)
+        path = self._write_file(html_content, output_path)
+        if self.precompress:
+            self._write_gzip(html_content, path)
+        return path
+
+    def _compact_data(self, assessment: Assessment, theme: Theme) -> dict:
+        """Template data for compact reports.
+
+        Args:
+            assessment: Assessment being reported
+            theme: Theme the report opens with
+
+        Returns:
+            Embedded assessment JSON and theme color table
+        """
+        themes = [Theme.get_theme(name) for name in Theme.get_available_themes()]
+        if theme.name not in Theme.get_available_themes():
+            # Custom theme: there is no server-rendered CSS to fall back on
+            themes.append(theme)
+
+        return {
+            "theme_vars": list(theme.to_css_vars()),
+            # Rows, not a mapping: tojson sorts keys, rows keep switcher order
+            "theme_table": [
+                [t.name, t.display_name, *t.to_css_vars().values()] for t in themes
+            ],
+            # Security: Same escaping as the tojson filter, without whitespace
+            "assessment_json": htmlsafe_json_dumps(
+                assessment.to_dict(), separators=(",", ":")
+            ),
+        }
+
+    def _write_gzip(self, content: str, output_path: Path) -> Path:
+        """Write a gzip-compressed copy of content next to output_path.
+
+        The gzip header carries no timestamp, so unchanged reports
+        compress to identical files.
+
+        Args:
+            content: Report content
+            output_path: Path of the uncompressed report
+
+        Returns:
+            Path to the compressed copy
+        """
+        gzip_path = output_path.with_name(output_path.name + ".gz")
+        with open(gzip_path, "wb") as f:
+            with gzip.GzipFile(
+                filename=output_path.name, mode="wb", fileobj=f, mtime=0
+            ) as compressed:
+                compressed.write(content.encode("utf-8"))
+        return gzip_path
 
     def _resolve_theme(self, config) -> Theme:
         """Resolve theme from config.
@@ -7,6 +7,9 @@ SECURITY: Implements comprehensive XSS prevention through:
 """
 
 import html
+import json
+import logging
+from datetime import datetime
 from pathlib import Path
 
 import jinja2
@@ -14,6 +17,17 @@ import jinja2
 from ..models.batch_assessment import BatchAssessment
 from ..utils.security import validate_url
 
+logger = logging.getLogger(__name__)
+
+# Directory next to a paged index.html holding its data files
+INDEX_DATA_DIR = "index-data"
+
+# Rows per detail file of a paged index
+ROWS_PER_SHARD = 500
+
+# Error messages longer than this are truncated in the index
+MAX_ERROR_LENGTH = 100
+
 
 class MultiRepoHTMLReporter:
     """Generates summary HTML report for batch assessments.
@@ -29,11 +43,13 @@ class MultiRepoHTMLReporter:
     - CWE-79: Improper Neutralization of Input During Web Page Generation
     """
 
-    def __init__(self, template_dir: Path):
+    def __init__(self, template_dir: Path, paged: bool = False):
         """Initialize reporter with Jinja2 environment.
 
         Args:
             template_dir: Directory containing Jinja2 templates
+            paged: Write the results table as JSON data files next to the
+                index instead of inline (see generate())
 
         SECURITY: Autoescape is ENABLED by default for HTML/XML files.
         """
@@ -43,6 +59,8 @@ class MultiRepoHTMLReporter:
             autoescape=jinja2.select_autoescape(["html", "xml", "j2"]),
         )
 
+        self.paged = paged
+
         # Register security filters
         self.env.filters["sanitize_url"] = self.sanitize_url
         self.env.filters["sanitize_filename"] = self.sanitize_filename
@@ -118,6 +136,16 @@ class MultiRepoHTMLReporter:
     def generate(self, batch_assessment: BatchAssessment, output_path: Path) -> Path:
         """Generate summary HTML report for batch assessment.
 
+        By default every repository is rendered into the page. A paged
+        report keeps index.html to the batch summary and writes the
+        results table to an index-data/ directory beside it: one columnar
+        file with what sorting and filtering need for every repository,
+        and detail files of ROWS_PER_SHARD rows that the page fetches only
+        for rows scrolled into view. The page renders visible rows only,
+        so it stays responsive for batches of any size. Browsers do not
+        let pages opened from file:// fetch files, so a paged report must
+        be served over HTTP.
+
         Args:
             batch_assessment: Complete batch assessment with all results
             output_path: Path where HTML file should be saved
@@ -130,15 +158,132 @@ class MultiRepoHTMLReporter:
         """
         template = self.env.get_template("multi_report.html.j2")
 
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.paged:
+            self._write_index_data(
+                batch_assessment, output_path.parent / INDEX_DATA_DIR
+            )
+
         # Render template with assessment data
         # SECURITY: Jinja2 autoescape handles all variable escaping
         html_content = template.render(
             batch_assessment=batch_assessment,
             timestamp=batch_assessment.timestamp.isoformat(),
+            paged=self.paged,
+            data_dir=INDEX_DATA_DIR,
         )
 
         # Write to file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(html_content, encoding="utf-8")
 
         return output_path
+
+    def _write_index_data(self, batch_assessment: BatchAssessment, data_dir: Path):
+        """Write the results table of a paged report.
+
+        columns.json holds one array per column, in batch order, with
+        repeated strings (certification levels, error types, languages)
+        replaced by their index into a lookup list. rows-NNNNN.json holds
+        the report file name and error message of each row in one shard.
+
+        Args:
+            batch_assessment: Batch assessment (results are read once)
+            data_dir: Directory for the data files
+        """
+        data_dir.mkdir(parents=True, exist_ok=True)
+        # Drop shards of an earlier, larger report in the same directory
+        for stale in data_dir.glob("rows-*.json"):
+            stale.unlink()
+
+        columns = {
+            "repository": [],
+            "score": [],
+            "label": [],
+            "language": [],
+            "duration": [],
+            "failed": [],
+        }
+        lookups = {"label": {}, "language": {}}
+        shard = {"report": [], "error": []}
+        shards = 0
+
+        def lookup(column: str, value: str) -> int:
+            return lookups[column].setdefault(value, len(lookups[column]))
+
+        def flush():
+            nonlocal shard, shards
+            _write_json(data_dir / f"rows-{shards:05d}.json", shard)
+            shard = {"report": [], "error": []}
+            shards += 1
+
+        for data in batch_assessment.result_dicts():
+            assessment = data.get("assessment")
+            url = data.get("repository_url") or ""
+            if assessment is not None:
+                repository = assessment["repository"]
+                timestamp = datetime.fromisoformat(assessment["timestamp"])
+                name = self.sanitize_filename(repository["name"])
+                languages = repository.get("languages") or {}
+                columns["repository"].append(self._display_url(url, name))
+                columns["score"].append(round(assessment["overall_score"], 1))
+                columns["label"].append(
+                    lookup("label", assessment["certification_level"])
+                )
+                columns["language"].append(
+                    lookup(
+                        "language",
+                        (max(languages, key=languages.get) if languages else "Unknown"),
+                    )
+                )
+                columns["failed"].append(0)
+                shard["report"].append(f"{name}-{timestamp:%Y%m%d-%H%M%S}")
+                shard["error"].append(None)
+            else:
+                error = data.get("error") or ""
+                if len(error) > MAX_ERROR_LENGTH:
+                    error = error[:MAX_ERROR_LENGTH] + "..."
+                columns["repository"].append(self._display_url(url, url))
+                columns["score"].append(None)
+                columns["label"].append(
+                    lookup("label", data.get("error_type") or "unknown")
+                )
+                columns["language"].append(-1)
+                columns["failed"].append(1)
+                shard["report"].append(None)
+                shard["error"].append(error)
+            columns["duration"].append(round(data.get("duration_seconds", 0.0), 1))
+
+            if len(shard["report"]) == ROWS_PER_SHARD:
+                flush()
+        if shard["report"]:
+            flush()
+
+        _write_json(
+            data_dir / "columns.json",
+            {
+                "rows": len(columns["repository"]),
+                "shard_size": ROWS_PER_SHARD,
+                "labels": list(lookups["label"]),
+                "languages": list(lookups["language"]),
+                "columns": columns,
+            },
+        )
+        logger.debug(
+            f"Wrote paged index data for {len(columns['repository'])} "
+            f"repositories to {data_dir}"
+        )
+
+    @staticmethod
+    def _display_url(url: str, fallback: str) -> str:
+        """Repository URL, or fallback if the URL fails validation."""
+        try:
+            return validate_url(url, allowed_schemes=["http", "https"])
+        except ValueError:
+            return fallback
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write compact JSON (the page inserts every value as text, not HTML)."""
+    path.write_text(
+        json.dumps(data, separators=(",", ":"), ensure_ascii=False), encoding="utf-8"
+    )
@@ -1,18 +1,104 @@
 """SQLite-based cache for assessment results."""
 
+import hashlib
 import json
+import os
 import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
-from ..models import Assessment
+from ..models import Assessment, Config, Finding
+
+# Bump when the assessments table changes; older databases are migrated
+SCHEMA_VERSION = 2
+
+# How long a writer waits for another process's transaction before failing
+BUSY_TIMEOUT_SECONDS = 30.0
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class AssessmentFingerprint:
+    """What a cached assessment depends on besides the commit.
+
+    Attributes:
+        config_hash: Hash of the effective configuration
+        attributes: Fingerprint of each assessor run, by attribute ID
+    """
+
+    config_hash: str = ""
+    attributes: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def compute(
+        cls, assessors: list, config: Config | None = None
+    ) -> "AssessmentFingerprint":
+        """Fingerprint an assessor set and configuration.
+
+        Args:
+            assessors: Assessor instances about to run
+            config: Effective configuration (None for defaults)
+
+        Returns:
+            AssessmentFingerprint for cache lookups
+        """
+        return cls(
+            config_hash=config_fingerprint(config),
+            attributes={a.attribute_id: a.fingerprint for a in assessors},
+        )
+
+    @property
+    def assessors_hash(self) -> str:
+        """Hash of the whole assessor set (IDs and their fingerprints)."""
+        if not self.attributes:
+            return ""
+        data = json.dumps(self.attributes, sort_keys=True)
+        return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def config_fingerprint(config: Config | None) -> str:
+    """Hash of a configuration, stable across runs and field order.
+
+    Args:
+        config: Configuration (None for defaults)
+
+    Returns:
+        Short hex digest
+    """
+    if config is None:
+        config = Config.load_default()
+    data = json.dumps(config.to_dict(), sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
 
 
 class AssessmentCache:
     """SQLite-backed cache for assessment results with TTL support.
 
-    Schema: assessments(repository_url, commit_hash, overall_score,
+    Entries are keyed by repository, commit and an AssessmentFingerprint,
+    so upgrading assessors or changing the configuration never serves a
+    stale result. The fingerprint of every assessor is stored with the
+    entry: when only some assessors changed, get_reusable_findings()
+    returns the findings that are still valid so only the rest re-run.
+
+    Assessments are stored as zlib-compressed JSON (a BLOB in the
+    assessment_json column); plain-text rows written by older versions
+    are still read.
+
+    Each process keeps one connection (shared by its threads under a
+    lock) to a database in WAL mode with a busy timeout, so several
+    batch workers can read and write concurrently. Use get_many() and
+    set_many() to look up or store many repositories in one query or
+    transaction.
+
+    Schema: assessments(repository_url, commit_hash, config_hash,
+            assessor_fingerprint, attribute_fingerprints, overall_score,
             assessment_json, cached_at, expires_at)
     """
 
@@ -27,27 +113,92 @@ class AssessmentCache:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.cache_dir / "assessments.db"
         self.ttl_days = ttl_days
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._lock = threading.Lock()
         self._initialize_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        """This process's connection, opened on first use (and after fork)."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=BUSY_TIMEOUT_SECONDS,
+                check_same_thread=False,
+            )
+            # WAL lets readers proceed while another process writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one transaction on the shared connection.
+
+        Commits on success and rolls back on error.
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                yield conn
+
+    def close(self) -> None:
+        """Close this process's connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
     def _initialize_db(self) -> None:
-        """Initialize database schema."""
+        """Initialize database schema, migrating older databases."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+                    "AND name = 'assessments'"
+                ).fetchone()
+                if exists and version < SCHEMA_VERSION:
+                    # Rebuild to widen the unique key; dropping the old
+                    # table also drops its indexes
+                    conn.execute("ALTER TABLE assessments RENAME TO assessments_old")
+
                 conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS assessments (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         repository_url TEXT NOT NULL,
                         commit_hash TEXT NOT NULL,
+                        config_hash TEXT NOT NULL DEFAULT '',
+                        assessor_fingerprint TEXT NOT NULL DEFAULT '',
+                        attribute_fingerprints TEXT NOT NULL DEFAULT '{}',
                         overall_score REAL,
                         assessment_json TEXT NOT NULL,
                         cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         expires_at TIMESTAMP,
-                        UNIQUE(repository_url, commit_hash)
+                        UNIQUE(repository_url, commit_hash, config_hash,
+                               assessor_fingerprint)
                     )
                     """
                 )
 
+                if exists and version < SCHEMA_VERSION:
+                    # Old rows have no fingerprint, so they never match a
+                    # lookup; they are kept until they expire
+                    conn.execute(
+                        """
+                        INSERT INTO assessments
+                        (repository_url, commit_hash, overall_score,
+                         assessment_json, cached_at, expires_at)
+                        SELECT repository_url, commit_hash, overall_score,
+                               assessment_json, cached_at, expires_at
+                        FROM assessments_old
+                        """
+                    )
+                    conn.execute("DROP TABLE assessments_old")
+
                 # Create index for faster queries
                 conn.execute(
                     """
@@ -63,11 +214,16 @@ class AssessmentCache:
                     """
                 )
 
-                conn.commit()
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to initialize cache database: {e}")
 
-    def get(self, repository_url: str, commit_hash: str) -> Optional[Assessment]:
+    def get(
+        self,
+        repository_url: str,
+        commit_hash: str,
+        fingerprint: AssessmentFingerprint | None = None,
+    ) -> Optional[Assessment]:
         """Get cached assessment if available and not expired.
 
         Security: Uses parameterized queries to prevent SQL injection.
@@ -75,18 +231,27 @@ class AssessmentCache:
         Args:
             repository_url: Repository URL
             commit_hash: Git commit hash
+            fingerprint: Assessor set and configuration the result must
+                match (None only matches entries stored without one)
 
         Returns:
             Assessment if found and valid, None otherwise
         """
+        fingerprint = fingerprint or AssessmentFingerprint()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.execute(
                     """
                     SELECT assessment_json, expires_at FROM assessments
                     WHERE repository_url = ? AND commit_hash = ?
+                    AND config_hash = ? AND assessor_fingerprint = ?
                     """,
-                    (repository_url, commit_hash),
+                    (
+                        repository_url,
+                        commit_hash,
+                        fingerprint.config_hash,
+                        fingerprint.assessors_hash,
+                    ),
                 )
                 row = cursor.fetchone()
 
@@ -104,24 +269,151 @@ class AssessmentCache:
                             """
                             DELETE FROM assessments
                             WHERE repository_url = ? AND commit_hash = ?
+                            AND config_hash = ? AND assessor_fingerprint = ?
                             """,
-                            (repository_url, commit_hash),
+                            (
+                                repository_url,
+                                commit_hash,
+                                fingerprint.config_hash,
+                                fingerprint.assessors_hash,
+                            ),
                         )
-                        conn.commit()
                         return None
 
                 # Parse and return assessment
-                assessment_data = json.loads(assessment_json)
+                assessment_data = self._decode(assessment_json)
                 return self._deserialize_assessment(assessment_data)
 
-        except (sqlite3.Error, json.JSONDecodeError, ValueError):
+        except (sqlite3.Error, zlib.error, ValueError, KeyError, TypeError):
             return None
 
+    def get_reusable_findings(
+        self,
+        repository_url: str,
+        commit_hash: str,
+        fingerprint: AssessmentFingerprint,
+    ) -> dict[str, Finding]:
+        """Findings from earlier assessments of this commit that are still valid.
+
+        Looks at the newest unexpired entry for the commit with the same
+        configuration and returns the findings whose assessor fingerprint
+        is unchanged (e.g., after an upgrade that touched a few assessors).
+
+        Args:
+            repository_url: Repository URL
+            commit_hash: Git commit hash
+            fingerprint: Assessor set and configuration about to run
+
+        Returns:
+            Reusable findings by attribute ID (empty if none)
+        """
+        try:
+            with self._transaction() as conn:
+                row = conn.execute(
+                    """
+                    SELECT attribute_fingerprints, assessment_json
+                    FROM assessments
+                    WHERE repository_url = ? AND commit_hash = ?
+                    AND config_hash = ? AND attribute_fingerprints != '{}'
+                    AND (expires_at IS NULL OR expires_at > ?)
+                    ORDER BY id DESC LIMIT 1
+                    """,
+                    (
+                        repository_url,
+                        commit_hash,
+                        fingerprint.config_hash,
+                        datetime.now().isoformat(),
+                    ),
+                ).fetchone()
+                if not row:
+                    return {}
+
+                previous = json.loads(row[0])
+                reusable = {
+                    attribute_id
+                    for attribute_id, current in fingerprint.attributes.items()
+                    if previous.get(attribute_id) == current
+                }
+                if not reusable:
+                    return {}
+
+                data = self._decode(row[1])
+                findings = {}
+                for finding_data in data["findings"]:
+                    finding = Finding.from_dict(finding_data)
+                    if finding.attribute.id in reusable and finding.status != "error":
+                        # No work is done for it this run
+                        findings[finding.attribute.id] = replace(finding, profile=None)
+                return findings
+
+        except (sqlite3.Error, zlib.error, ValueError, KeyError, TypeError):
+            return {}
+
+    def get_many(
+        self,
+        repository_urls: Iterable[str],
+        fingerprint: AssessmentFingerprint | None = None,
+    ) -> dict[str, tuple[str, Assessment]]:
+        """Newest unexpired cached assessment for each of many repositories.
+
+        Lets a batch look up every repository in a handful of queries
+        instead of one per repository. The caller still has to compare
+        the commit hash with the repository's current HEAD.
+
+        Args:
+            repository_urls: Repository URLs
+            fingerprint: Assessor set and configuration results must match
+
+        Returns:
+            (commit hash, assessment) by repository URL, for URLs with a
+            usable entry
+        """
+        fingerprint = fingerprint or AssessmentFingerprint()
+        urls = list(dict.fromkeys(repository_urls))
+        now = datetime.now().isoformat()
+        results = {}
+        try:
+            with self._transaction() as conn:
+                for i in range(0, len(urls), _QUERY_CHUNK):
+                    chunk = urls[i : i + _QUERY_CHUNK]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"""
+                        SELECT repository_url, commit_hash, assessment_json
+                        FROM assessments
+                        WHERE id IN (
+                            SELECT MAX(id) FROM assessments
+                            WHERE repository_url IN ({placeholders})
+                            AND config_hash = ? AND assessor_fingerprint = ?
+                            AND (expires_at IS NULL OR expires_at > ?)
+                            GROUP BY repository_url
+                        )
+                        """,
+                        (
+                            *chunk,
+                            fingerprint.config_hash,
+                            fingerprint.assessors_hash,
+                            now,
+                        ),
+                    ).fetchall()
+                    for url, commit_hash, payload in rows:
+                        try:
+                            assessment = self._deserialize_assessment(
+                                self._decode(payload)
+                            )
+                        except (zlib.error, ValueError, KeyError, TypeError):
+                            continue
+                        results[url] = (commit_hash, assessment)
+        except sqlite3.Error:
+            return {}
+        return results
+
     def set(
         self,
         repository_url: str,
         commit_hash: str,
         assessment: Assessment,
+        fingerprint: AssessmentFingerprint | None = None,
     ) -> bool:
         """Cache an assessment.
 
@@ -131,30 +423,57 @@ class AssessmentCache:
             repository_url: Repository URL
             commit_hash: Git commit hash
             assessment: Assessment to cache
+            fingerprint: Assessor set and configuration that produced it
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            assessment_json = json.dumps(assessment.to_dict())
-            expires_at = datetime.now() + timedelta(days=self.ttl_days)
+        return self.set_many([(repository_url, commit_hash, assessment, fingerprint)])
 
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO assessments
-                    (repository_url, commit_hash, overall_score, assessment_json, expires_at)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
+    def set_many(
+        self,
+        entries: Iterable[tuple[str, str, Assessment, AssessmentFingerprint | None]],
+    ) -> bool:
+        """Cache several assessments in one transaction.
+
+        Args:
+            entries: (repository URL, commit hash, assessment, fingerprint)
+                tuples
+
+        Returns:
+            True if all were stored, False otherwise (none are stored)
+        """
+        try:
+            expires_at = (datetime.now() + timedelta(days=self.ttl_days)).isoformat()
+            rows = []
+            for repository_url, commit_hash, assessment, fingerprint in entries:
+                fingerprint = fingerprint or AssessmentFingerprint()
+                rows.append(
                     (
                         repository_url,
                         commit_hash,
+                        fingerprint.config_hash,
+                        fingerprint.assessors_hash,
+                        json.dumps(fingerprint.attributes, sort_keys=True),
                         assessment.overall_score,
-                        assessment_json,
-                        expires_at.isoformat(),
-                    ),
+                        self._encode(assessment.to_dict()),
+                        expires_at,
+                    )
+                )
+            if not rows:
+                return True
+
+            with self._transaction() as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO assessments
+                    (repository_url, commit_hash, config_hash,
+                     assessor_fingerprint, attribute_fingerprints,
+                     overall_score, assessment_json, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
                 )
-                conn.commit()
             return True
 
         except (sqlite3.Error, TypeError):
@@ -171,7 +490,7 @@ class AssessmentCache:
             Number of entries deleted
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 if commit_hash:
                     cursor = conn.execute(
                         """
@@ -188,7 +507,6 @@ class AssessmentCache:
                         """,
                         (repository_url,),
                     )
-                conn.commit()
                 return cursor.rowcount
         except sqlite3.Error:
             return 0
@@ -200,7 +518,7 @@ class AssessmentCache:
             Number of entries deleted
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.execute(
                     """
                     DELETE FROM assessments
@@ -208,7 +526,6 @@ class AssessmentCache:
                     """,
                     (datetime.now().isoformat(),),
                 )
-                conn.commit()
                 return cursor.rowcount
         except sqlite3.Error:
             return 0
@@ -220,7 +537,7 @@ class AssessmentCache:
             Dictionary with cache statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.execute("SELECT COUNT(*) FROM assessments")
                 total = cursor.fetchone()[0]
 
@@ -246,6 +563,18 @@ class AssessmentCache:
         except sqlite3.Error:
             return {}
 
+    @staticmethod
+    def _encode(data: dict) -> bytes:
+        """Serialize an assessment dictionary to compressed JSON."""
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def _decode(payload: bytes | str) -> dict:
+        """Deserialize a stored payload (compressed, or legacy plain JSON)."""
+        if isinstance(payload, bytes):
+            payload = zlib.decompress(payload)
+        return json.loads(payload)
+
     @staticmethod
     def _deserialize_assessment(data: dict) -> Assessment:
         """Deserialize assessment from JSON data.
@@ -255,16 +584,9 @@ class AssessmentCache:
 
         Returns:
             Assessment object
+
+        Raises:
+            KeyError: If a required field is missing
+            ValueError: If the data fails model validation
         """
-        # This is a simplified deserialization
-        # In practice, you'd need full deserialization logic
-        # For now, we'll use a placeholder that assumes the cached JSON
-        # has the correct structure
-
-        # Note: This is a simplified approach. In production, you'd need
-        # proper deserialization that reconstructs all nested objects
-        raise NotImplementedError(
-            "Full assessment deserialization not yet implemented. "
-            "Consider caching assessment JSON directly and providing "
-            "a proper deserializer factory."
-        )
+        return Assessment.from_dict(data)
@@ -0,0 +1,112 @@
+"""Per-assessor timing and I/O instrumentation."""
+
+import os
+import sys
+import threading
+import time
+
+from ..models.finding import AssessorProfile
+
+# Counters for the profiler active on the current thread (None when idle)
+_state = threading.local()
+_hook_lock = threading.Lock()
+_hook_installed = False
+
+# FileIO mode characters that mean the file is opened for writing
+_WRITE_MODE_CHARS = frozenset("wax+")
+
+
+def _is_read_open(mode, flags) -> bool:
+    """Whether an 'open' audit event opens a file for reading only."""
+    if isinstance(mode, str):
+        return not _WRITE_MODE_CHARS.intersection(mode)
+    if isinstance(flags, int):
+        return flags & os.O_ACCMODE == os.O_RDONLY
+    return False
+
+
+def _audit_hook(event: str, args: tuple) -> None:
+    """Count file reads and subprocess launches for the active profiler.
+
+    Audit hooks are process-wide and cannot be removed, so this returns
+    immediately on threads without an active profiler.
+    """
+    counters = getattr(_state, "counters", None)
+    if counters is None:
+        return
+
+    if event == "open":
+        path, mode, flags = args
+        if isinstance(path, int) or not _is_read_open(mode, flags):
+            return
+        try:
+            size = os.stat(path).st_size
+        except (OSError, TypeError, ValueError):
+            return
+        counters[0] += 1
+        counters[1] += size
+    elif event in ("subprocess.Popen", "os.system", "os.posix_spawn"):
+        counters[2] += 1
+
+
+def _install_hook() -> None:
+    """Install the audit hook once per process."""
+    global _hook_installed
+    if _hook_installed:
+        return
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit_hook)
+            _hook_installed = True
+
+
+class AssessorProfiler:
+    """Context manager measuring resource usage of code run on this thread.
+
+    Wall time uses a monotonic clock and CPU time is per-thread, so
+    assessors running concurrently on a thread pool are measured
+    independently. File reads and subprocess launches are counted via
+    Python audit events; bytes read is the size of each file opened for
+    reading, which matches actual reads for the whole-file reads
+    assessors perform.
+
+    Example:
+        with AssessorProfiler() as profiler:
+            finding = assessor.assess(repository)
+        finding.profile = profiler.profile
+    """
+
+    def __init__(self):
+        """Initialize profiler."""
+        self.profile: AssessorProfile | None = None
+        self._counters = [0, 0, 0]
+        self._previous = None
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+    def __enter__(self) -> "AssessorProfiler":
+        _install_hook()
+        self._previous = getattr(_state, "counters", None)
+        _state.counters = self._counters
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        wall = time.perf_counter() - self._wall_start
+        cpu = time.thread_time() - self._cpu_start
+        _state.counters = self._previous
+
+        files_read, bytes_read, subprocesses = self._counters
+        if self._previous is not None:
+            # Nested profilers also count toward the enclosing one
+            for i, value in enumerate(self._counters):
+                self._previous[i] += value
+
+        self.profile = AssessorProfile(
+            wall_time_seconds=wall,
+            cpu_time_seconds=cpu,
+            files_read=files_read,
+            bytes_read=bytes_read,
+            subprocesses=subprocesses,
+        )
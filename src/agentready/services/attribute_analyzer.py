@@ -1,13 +1,99 @@
 """Attribute correlation analysis with Plotly Express heatmap."""
 
 import json
+import warnings
 from pathlib import Path
 from typing import List
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+from scipy.cluster.vq import kmeans2
 from scipy.stats import pearsonr
 
+from .findings_table import findings_frame, read_findings_table
+
+# Findings table columns the batch heatmap reads
+HEATMAP_COLUMNS = [
+    "repository",
+    "overall_score",
+    "certification_level",
+    "attribute_id",
+    "attribute_name",
+    "tier",
+    "status",
+    "score",
+    "measured_value",
+]
+
+# Batches with more repositories than this get a clustered heatmap
+HEATMAP_MAX_ROWS = 200
+
+# Maximum number of rows (clusters) of a clustered heatmap
+HEATMAP_CLUSTERS = 50
+
+CERT_BADGES = {
+    "Platinum": "💎",
+    "Gold": "🥇",
+    "Silver": "🥈",
+    "Bronze": "🥉",
+    "Needs Improvement": "⚠️",
+}
+
+# Runs after a clustered heatmap is drawn: clicking a row fetches that
+# cluster's repositories and lists them under the chart. {files} is the
+# JSON list of cluster data files, {plot_id} is filled in by Plotly.
+CLUSTER_DRILLDOWN_SCRIPT = """
+const files = {files};
+const plot = document.getElementById('{plot_id}');
+const panel = document.createElement('div');
+panel.style.cssText = 'font: 12px sans-serif; margin: 16px;';
+plot.parentNode.appendChild(panel);
+
+function cell(row, text, tag) {
+    const element = document.createElement(tag || 'td');
+    element.textContent = text;
+    element.style.cssText = 'border: 1px solid #ddd; padding: 2px 6px;';
+    row.appendChild(element);
+    return element;
+}
+
+function showCluster(index, data) {
+    const table = document.createElement('table');
+    table.style.borderCollapse = 'collapse';
+    const header = table.insertRow();
+    ['Repository', 'Overall', 'Certification'].concat(data.attributes)
+        .forEach(name => cell(header, name, 'th'));
+    data.repositories.forEach((name, i) => {
+        const row = table.insertRow();
+        cell(row, name);
+        cell(row, data.overall_score[i].toFixed(1));
+        cell(row, data.certification_level[i]);
+        data.scores[i].forEach(score => cell(row, score === null ? 'N/A' : score));
+    });
+    const title = document.createElement('h3');
+    title.textContent = `Cluster ${index}: ${data.repositories.length} repositories`;
+    panel.replaceChildren(title, table);
+}
+
+plot.on('plotly_click', event => {
+    const point = event.points[0];
+    const index = Array.isArray(point.pointNumber) ? point.pointNumber[0] : point.pointNumber;
+    panel.textContent = 'Loading…';
+    fetch(files[index])
+        .then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        })
+        .then(data => showCluster(index, data))
+        .catch(error => {
+            panel.textContent = `Could not load ${files[index]} (${error.message}). ` +
+                'Browsers block data files for pages opened from disk; serve this ' +
+                'directory over HTTP (e.g., python -m http.server) to list repositories.';
+        });
+});
+"""
+
 
 class AttributeAnalyzer:
     """Analyze correlation between AgentReady attributes and SWE-bench performance."""
@@ -163,219 +249,166 @@ class AttributeAnalyzer:
         ranked.sort(key=lambda x: x["avg_improvement"], reverse=True)
         return ranked[:5]
 
-    def analyze_batch(self, batch_assessment, heatmap_file: Path):
+    def analyze_batch(
+        self,
+        batch_assessment,
+        heatmap_file: Path,
+        max_rows: int = HEATMAP_MAX_ROWS,
+    ):
         """
         Generate heatmap visualization for batch assessment.
 
         Args:
             batch_assessment: BatchAssessment object with repository results
             heatmap_file: Where to save heatmap.html
+            max_rows: Cluster repositories when there are more than this
 
         Creates interactive heatmap showing repos × attributes with scores.
         """
-        # Prepare DataFrame
-        df, hover_data, overall_scores = self._prepare_batch_dataframe(batch_assessment)
-
-        # Generate heatmap
-        self._create_batch_heatmap(df, hover_data, overall_scores, heatmap_file)
+        findings = findings_frame(batch_assessment.result_dicts())
+        self.analyze_findings(findings, heatmap_file, max_rows)
 
-    def analyze_batch_from_json(self, batch_data: dict, heatmap_file: Path):
+    def analyze_batch_from_json(
+        self,
+        batch_data: dict,
+        heatmap_file: Path,
+        max_rows: int = HEATMAP_MAX_ROWS,
+    ):
         """
         Generate heatmap visualization from batch assessment JSON data.
 
         Args:
             batch_data: Batch assessment as dictionary (from all-assessments.json)
             heatmap_file: Where to save heatmap.html
+            max_rows: Cluster repositories when there are more than this
 
         Creates interactive heatmap showing repos × attributes with scores.
         Works directly with JSON data, bypassing deserialization.
         """
-        # Prepare DataFrame from dict data
-        df, hover_data, overall_scores = self._prepare_batch_dataframe_from_json(
-            batch_data
-        )
-
-        # Generate heatmap
-        self._create_batch_heatmap(df, hover_data, overall_scores, heatmap_file)
-
-    def _prepare_batch_dataframe(self, batch_assessment):
-        """
-        Transform BatchAssessment into DataFrame for heatmap.
+        findings = findings_frame(batch_data["results"])
+        self.analyze_findings(findings, heatmap_file, max_rows)
 
-        Returns:
-            tuple: (DataFrame, hover_data dict, overall_scores dict)
-                - DataFrame: repos (rows) × attributes (cols), values = scores or NaN
-                - hover_data: Nested dict with tooltip info per repo/attribute
-                - overall_scores: Dict mapping repo name → (overall_score, certification)
+    def analyze_batch_from_table(
+        self,
+        table_path: Path,
+        heatmap_file: Path,
+        max_rows: int = HEATMAP_MAX_ROWS,
+    ):
         """
-        # Collect successful assessments
-        assessments = [r.assessment for r in batch_assessment.results if r.is_success()]
-
-        if not assessments:
-            raise ValueError("No successful assessments to visualize")
+        Generate heatmap visualization from a columnar findings table.
 
-        # Build matrix and hover data
-        matrix_data = {}
-        hover_data = {}
-        overall_scores = {}
-
-        for assessment in assessments:
-            repo_name = assessment.repository.name
-
-            # Store overall score and certification
-            overall_scores[repo_name] = (
-                assessment.overall_score,
-                assessment.certification_level,
-            )
-
-            matrix_data[repo_name] = {}
-            hover_data[repo_name] = {}
-
-            # Track seen attributes to handle duplicates (take first occurrence only)
-            seen_attrs = set()
-
-            for finding in assessment.findings:
-                attr_id = finding.attribute.id
-
-                # Skip duplicate attributes (assessor bug workaround)
-                if attr_id in seen_attrs:
-                    continue
-                seen_attrs.add(attr_id)
-
-                # Map status to score
-                if finding.status in ("pass", "fail"):
-                    score = finding.score
-                elif finding.status == "not_applicable":
-                    score = None  # Will become NaN in DataFrame (shown as gray)
-                else:  # skipped, error
-                    score = 0.0  # Show as red
-
-                matrix_data[repo_name][attr_id] = score
-
-                # Store hover metadata
-                hover_data[repo_name][attr_id] = {
-                    "attribute_name": finding.attribute.name,
-                    "tier": finding.attribute.tier,
-                    "status": finding.status,
-                    "measured_value": finding.measured_value or "N/A",
-                    "threshold": finding.threshold or "N/A",
-                }
-
-        # Convert to DataFrame (repos as rows, attributes as columns)
-        df = pd.DataFrame(matrix_data).T
-
-        # Sort repos by overall score (descending)
-        df["_sort_score"] = df.index.map(lambda x: overall_scores[x][0])
-        df = df.sort_values("_sort_score", ascending=False)
-        df = df.drop("_sort_score", axis=1)
+        Args:
+            table_path: findings.parquet (or .arrow) written with the batch reports
+            heatmap_file: Where to save heatmap.html
+            max_rows: Cluster repositories when there are more than this
 
-        # Sort attributes by tier, then alphabetically
-        # Get tier mapping from first assessment
-        attr_tiers = {
-            finding.attribute.id: finding.attribute.tier
-            for finding in assessments[0].findings
-        }
+        Fastest way to rebuild a heatmap: only the columns it needs are read.
+        """
+        findings = read_findings_table(table_path, columns=HEATMAP_COLUMNS)
+        self.analyze_findings(findings, heatmap_file, max_rows)
 
-        sorted_cols = sorted(df.columns, key=lambda x: (attr_tiers.get(x, 99), x))
-        df = df[sorted_cols]
+    def analyze_findings(
+        self,
+        findings: pd.DataFrame,
+        heatmap_file: Path,
+        max_rows: int = HEATMAP_MAX_ROWS,
+    ):
+        """
+        Generate heatmap visualization from a findings table.
 
-        return df, hover_data, overall_scores
+        Up to max_rows repositories get one row each. Larger batches get
+        an aggregated heatmap instead (see _create_clustered_heatmap()).
 
-    def _prepare_batch_dataframe_from_json(self, batch_data: dict):
+        Args:
+            findings: One row per (repository, attribute), see findings_frame()
+            heatmap_file: Where to save heatmap.html
+            max_rows: Cluster repositories when there are more than this
         """
-        Transform batch assessment JSON into DataFrame for heatmap.
+        df, hover_text, overall = self._prepare_batch_dataframe(findings)
+        if len(df) > max_rows:
+            self._create_clustered_heatmap(df, overall, heatmap_file)
+        else:
+            self._create_batch_heatmap(df, hover_text, overall, heatmap_file)
 
-        Args:
-            batch_data: Batch assessment dictionary (from all-assessments.json)
+    def _prepare_batch_dataframe(self, findings: pd.DataFrame):
+        """
+        Pivot a findings table into the heatmap matrix.
 
         Returns:
-            tuple: (DataFrame, hover_data dict, overall_scores dict)
+            tuple: (DataFrame, hover text DataFrame, overall DataFrame)
                 - DataFrame: repos (rows) × attributes (cols), values = scores or NaN
-                - hover_data: Nested dict with tooltip info per repo/attribute
-                - overall_scores: Dict mapping repo name → (overall_score, certification)
+                - hover text: Tooltip per repo/attribute, same shape
+                - overall: overall_score and certification_level per repo, in
+                  row order
         """
-        # Collect successful assessments
-        assessments = [
-            r["assessment"]
-            for r in batch_data["results"]
-            if r.get("assessment") is not None
-        ]
-
-        if not assessments:
+        if findings.empty:
             raise ValueError("No successful assessments to visualize")
 
-        # Build matrix and hover data
-        matrix_data = {}
-        hover_data = {}
-        overall_scores = {}
-
-        for assessment in assessments:
-            repo_name = assessment["repository"]["name"]
-
-            # Store overall score and certification
-            overall_scores[repo_name] = (
-                assessment["overall_score"],
-                assessment["certification_level"],
-            )
-
-            matrix_data[repo_name] = {}
-            hover_data[repo_name] = {}
-
-            # Track seen attributes to handle duplicates (take first occurrence only)
-            seen_attrs = set()
-
-            for finding in assessment["findings"]:
-                attr_id = finding["attribute"]["id"]
-
-                # Skip duplicate attributes (assessor bug workaround)
-                if attr_id in seen_attrs:
-                    continue
-                seen_attrs.add(attr_id)
-
-                # Map status to score
-                if finding["status"] in ("pass", "fail"):
-                    score = finding["score"]
-                elif finding["status"] == "not_applicable":
-                    score = None  # Will become NaN in DataFrame (shown as gray)
-                else:  # skipped, error
-                    score = 0.0  # Show as red
-
-                matrix_data[repo_name][attr_id] = score
-
-                # Store hover metadata
-                hover_data[repo_name][attr_id] = {
-                    "attribute_name": finding["attribute"]["name"],
-                    "tier": finding["attribute"]["tier"],
-                    "status": finding["status"],
-                    "measured_value": finding.get("measured_value") or "N/A",
-                    "threshold": finding.get("threshold") or "N/A",
-                }
-
-        # Convert to DataFrame (repos as rows, attributes as columns)
-        df = pd.DataFrame(matrix_data).T
+        findings = findings.astype({"repository": str, "attribute_id": str})
+        # Skip duplicate attributes (assessor bug workaround): first one wins
+        findings = findings.drop_duplicates(["repository", "attribute_id"])
+
+        # Map status to score: N/A becomes NaN (shown as gray), skipped and
+        # error become 0 (shown as red)
+        status = findings["status"].astype(str)
+        score = (
+            findings["score"]
+            .where(status.isin(["pass", "fail"]), 0.0)
+            .mask(status == "not_applicable")
+        )
 
         # Sort repos by overall score (descending)
-        df["_sort_score"] = df.index.map(lambda x: overall_scores[x][0])
-        df = df.sort_values("_sort_score", ascending=False)
-        df = df.drop("_sort_score", axis=1)
+        overall = (
+            findings.drop_duplicates("repository")
+            .set_index("repository")[["overall_score", "certification_level"]]
+            .sort_values("overall_score", ascending=False, kind="stable")
+        )
 
         # Sort attributes by tier, then alphabetically
-        # Get tier mapping from first assessment
-        attr_tiers = {
-            finding["attribute"]["id"]: finding["attribute"]["tier"]
-            for finding in assessments[0]["findings"]
-        }
+        attributes = (
+            findings.drop_duplicates("attribute_id")
+            .sort_values(["tier", "attribute_id"])["attribute_id"]
+            .tolist()
+        )
 
-        sorted_cols = sorted(df.columns, key=lambda x: (attr_tiers.get(x, 99), x))
-        df = df[sorted_cols]
+        measured = findings["measured_value"].fillna("").astype(str)
+        hover = (
+            "<b>Repository:</b> "
+            + findings["repository"]
+            + "<br><b>Attribute:</b> "
+            + findings["attribute_name"].astype(str)
+            + "<br><b>Tier:</b> "
+            + findings["tier"].astype(str)
+            + "<br><b>Score:</b> "
+            + score.map("{:.1f}".format).where(score.notna(), "N/A")
+            + "/100<br><b>Status:</b> "
+            + status
+            + "<br><b>Measured:</b> "
+            + measured.where(measured != "", "N/A")
+            + "<br><b>Overall:</b> "
+            + findings["overall_score"].map("{:.1f}".format)
+            + "/100 ("
+            + findings["certification_level"].astype(str)
+            + ")<br>"
+        )
+
+        cells = findings[["repository", "attribute_id"]].assign(
+            score=score, hover=hover
+        )
+        df = cells.pivot(index="repository", columns="attribute_id", values="score")
+        df = df.reindex(index=overall.index, columns=attributes)
+        hover_text = cells.pivot(
+            index="repository", columns="attribute_id", values="hover"
+        )
+        hover_text = hover_text.reindex(index=df.index, columns=df.columns).fillna("")
 
-        return df, hover_data, overall_scores
+        return df, hover_text, overall
 
     def _create_batch_heatmap(
         self,
         df: pd.DataFrame,
-        hover_data: dict,
-        overall_scores: dict,
+        hover_text: pd.DataFrame,
+        overall: pd.DataFrame,
         output_path: Path,
     ):
         """
@@ -384,13 +417,202 @@ class AttributeAnalyzer:
         Features:
         - Color: RdYlGn gradient (0-100), gray for NaN (N/A attributes)
         - X-axis: Attributes (sorted by tier)
-        - Y-axis: Repositories (sorted by overall score, descending)
+        - Y-axis: Repositories (sorted by overall score, descending), labeled
+          with their certification badge and overall score
         - Hover: Repo, attribute, tier, score, status, measured value, overall score
-        - Annotations: Certification badges on left margin
         """
+        row_labels = (
+            df.index.to_series()
+            + "  "
+            + overall["certification_level"].astype(str).map(CERT_BADGES).fillna("")
+            + " "
+            + overall["overall_score"].map("{:.1f}".format)
+        )
+        fig = self._batch_heatmap_figure(
+            df,
+            hover_text,
+            row_labels,
+            title=(
+                f"AgentReady Batch Assessment: {len(df)} Repositories × "
+                f"{len(df.columns)} Attributes"
+            ),
+            yaxis_title="Repositories (sorted by overall score, high → low)",
+        )
+
+        # Save standalone HTML
+        fig.write_html(output_path)
+        print(f"✓ Interactive batch heatmap saved to: {output_path}")
+
+    def _create_clustered_heatmap(
+        self,
+        df: pd.DataFrame,
+        overall: pd.DataFrame,
+        output_path: Path,
+        clusters: int = HEATMAP_CLUSTERS,
+    ):
+        """
+        Generate an aggregated heatmap for batches too large to show per repo.
+
+        Repositories are clustered by their attribute scores (k-means), and
+        each row shows a cluster's mean score per attribute, highest mean
+        overall score first. The repositories of each cluster are written
+        to <heatmap name>-data/cluster-NNN.json next to the HTML file;
+        clicking a row fetches that file and lists its repositories below
+        the chart. Like the paged batch index, the drill-down needs the
+        files served over HTTP, since browsers block fetch() on file://.
+
+        Args:
+            df: Repos (rows) × attributes (cols), from _prepare_batch_dataframe()
+            overall: overall_score and certification_level per repo
+            output_path: Where to save heatmap.html
+            clusters: Maximum number of clusters (rows)
+        """
+        labels = self._cluster_repositories(df, clusters)
+        overall_score = overall["overall_score"].to_numpy()
+        groups = pd.Series(labels, index=df.index)
+
+        # Number clusters by mean overall score, best first
+        mean_overall = pd.Series(overall_score).groupby(labels).mean()
+        rank = mean_overall.sort_values(ascending=False, kind="stable").index
+        renumber = pd.Series(range(len(rank)), index=rank)
+        groups = groups.map(renumber)
+
+        grouped = df.groupby(groups.to_numpy())
+        means = grouped.mean()
+        scored = grouped.count()
+        sizes = groups.value_counts().sort_index()
+        cluster_overall = pd.Series(overall_score).groupby(groups.to_numpy()).mean()
+
+        row_labels = (
+            "Cluster "
+            + sizes.index.astype(str)
+            + " · "
+            + sizes.astype(str)
+            + " repos · avg "
+            + cluster_overall.map("{:.1f}".format)
+        )
+        row_labels.index = means.index
+
+        # One row per (cluster, attribute) cell
+        cells = means.melt(
+            ignore_index=False, var_name="attribute", value_name="mean"
+        ).reset_index(names="cluster")
+        cells["scored"] = scored.melt()["value"].to_numpy()
+        cells["size"] = sizes.reindex(cells["cluster"]).to_numpy()
+        cells["overall"] = cluster_overall.reindex(cells["cluster"]).to_numpy()
+        cells["hover"] = (
+            "<b>Cluster:</b> "
+            + cells["cluster"].astype(str)
+            + " ("
+            + cells["size"].astype(str)
+            + " repositories)<br><b>Attribute:</b> "
+            + cells["attribute"].astype(str)
+            + "<br><b>Mean score:</b> "
+            + cells["mean"].map("{:.1f}".format).where(cells["mean"].notna(), "N/A")
+            + "/100<br><b>Scored in:</b> "
+            + cells["scored"].astype(str)
+            + " repositories<br><b>Mean overall:</b> "
+            + cells["overall"].map("{:.1f}".format)
+            + "/100<br><i>Click to list repositories</i>"
+        )
+        hover_text = cells.pivot(
+            index="cluster", columns="attribute", values="hover"
+        ).reindex(index=means.index, columns=means.columns)
+
+        data_dir = output_path.with_name(f"{output_path.stem}-data")
+        files = self._write_cluster_data(df, overall, groups, data_dir)
+
+        fig = self._batch_heatmap_figure(
+            means,
+            hover_text,
+            row_labels,
+            title=(
+                f"AgentReady Batch Assessment: {len(df)} Repositories in "
+                f"{len(means)} Clusters × {len(df.columns)} Attributes "
+                "(click a row to list its repositories)"
+            ),
+            yaxis_title="Clusters of similar repositories (by mean overall score)",
+        )
+
+        files_json = json.dumps([f"{data_dir.name}/{name}" for name in files])
+        fig.write_html(
+            output_path,
+            post_script=CLUSTER_DRILLDOWN_SCRIPT.replace(
+                "{files}", files_json.replace("</", "<\\/")
+            ),
+        )
+        print(f"✓ Interactive batch heatmap saved to: {output_path}")
+
+    @staticmethod
+    def _cluster_repositories(df: pd.DataFrame, clusters: int):
+        """
+        Cluster repositories by their attribute scores with k-means.
+
+        N/A scores are replaced by the attribute's mean so they do not set
+        repositories apart. Initial centroids are repositories spread evenly
+        over the overall-score order of df, which makes the result
+        deterministic.
+
+        Returns:
+            numpy array with a cluster label per row of df
+        """
+        features = df.fillna(df.mean()).fillna(0.0).to_numpy(dtype=float)
+        seeds = features[np.linspace(0, len(features) - 1, clusters).astype(int)]
+        seeds = np.unique(seeds, axis=0)
+        if len(seeds) == 1:
+            return np.zeros(len(features), dtype=int)
+
+        with warnings.catch_warnings():
+            # Clusters that end up empty are simply not shown
+            warnings.simplefilter("ignore", UserWarning)
+            _, labels = kmeans2(features, seeds, iter=20, minit="matrix")
+        return labels
+
+    @staticmethod
+    def _write_cluster_data(
+        df: pd.DataFrame, overall: pd.DataFrame, groups: pd.Series, data_dir: Path
+    ) -> list:
+        """
+        Write the repositories of each cluster for the heatmap's drill-down.
+
+        Returns:
+            File name of each cluster, in cluster order
+        """
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for stale in data_dir.glob("cluster-*.json"):
+            stale.unlink()
+
+        scores = df.round(1).astype(object).where(df.notna(), None)
+        files = []
+        for cluster, members in groups.groupby(groups, sort=True).groups.items():
+            name = f"cluster-{cluster:03d}.json"
+            data = {
+                "attributes": df.columns.tolist(),
+                "repositories": members.tolist(),
+                "overall_score": overall.loc[members, "overall_score"].tolist(),
+                "certification_level": overall.loc[
+                    members, "certification_level"
+                ].tolist(),
+                "scores": scores.loc[members].to_numpy().tolist(),
+            }
+            (data_dir / name).write_text(
+                json.dumps(data, separators=(",", ":")), encoding="utf-8"
+            )
+            files.append(name)
+        return files
+
+    @staticmethod
+    def _batch_heatmap_figure(
+        matrix: pd.DataFrame,
+        hover_text: pd.DataFrame,
+        row_labels: pd.Series,
+        title: str,
+        yaxis_title: str,
+    ):
+        """Plotly heatmap figure shared by the per-repository and clustered views."""
         # Handle NaN values for visualization
         # Replace NaN with -1 for custom colorscale (will show as gray)
-        df_display = df.fillna(-1)
+        df_display = matrix.fillna(-1)
 
         # Custom discrete colorscale with gray for N/A (-1)
         colorscale = [
@@ -404,7 +626,8 @@ class AttributeAnalyzer:
 
         # Create heatmap
         fig = px.imshow(
-            df_display,
+            df_display.to_numpy(),
+            x=list(matrix.columns),
             color_continuous_scale=colorscale,
             zmin=-1,
             zmax=100,
@@ -414,75 +637,25 @@ class AttributeAnalyzer:
             aspect="auto",
         )
 
-        # Build custom hover tooltips
-        hover_text = []
-        for i, repo_name in enumerate(df.index):
-            row_text = []
-            overall_score, cert_level = overall_scores[repo_name]
-
-            for j, attr_id in enumerate(df.columns):
-                score_val = df.iloc[i, j]
-                attr_info = hover_data[repo_name][attr_id]
-
-                if pd.isna(score_val):
-                    score_display = "N/A"
-                else:
-                    score_display = f"{score_val:.1f}"
-
-                text = (
-                    f"<b>Repository:</b> {repo_name}<br>"
-                    f"<b>Attribute:</b> {attr_info['attribute_name']}<br>"
-                    f"<b>Tier:</b> {attr_info['tier']}<br>"
-                    f"<b>Score:</b> {score_display}/100<br>"
-                    f"<b>Status:</b> {attr_info['status']}<br>"
-                    f"<b>Measured:</b> {attr_info['measured_value']}<br>"
-                    f"<b>Overall:</b> {overall_score:.1f}/100 ({cert_level})<br>"
-                )
-                row_text.append(text)
-            hover_text.append(row_text)
-
         fig.update_traces(
-            hovertemplate="%{customdata}<extra></extra>", customdata=hover_text
+            hovertemplate="%{customdata}<extra></extra>",
+            customdata=hover_text.fillna("").to_numpy(),
         )
 
-        # Add certification badge annotations on left margin
-        cert_badges = {
-            "Platinum": "💎",
-            "Gold": "🥇",
-            "Silver": "🥈",
-            "Bronze": "🥉",
-            "Needs Improvement": "⚠️",
-        }
-
-        annotations = []
-        for i, repo_name in enumerate(df.index):
-            overall_score, cert_level = overall_scores[repo_name]
-            badge = cert_badges.get(cert_level, "")
-
-            annotations.append(
-                dict(
-                    x=-0.5,  # Left of heatmap
-                    y=i,
-                    text=f"{badge} {overall_score:.1f}",
-                    showarrow=False,
-                    xanchor="right",
-                    font=dict(size=10, color="#333"),
-                )
-            )
-
-        # Customize layout
+        # Customize layout; row labels carry the badges and overall scores
         fig.update_layout(
-            title=f"AgentReady Batch Assessment: {len(df)} Repositories × {len(df.columns)} Attributes",
+            title=title,
             xaxis_title="Attributes (sorted by tier, then alphabetically)",
-            yaxis_title="Repositories (sorted by overall score, high → low)",
-            width=max(1400, len(df.columns) * 40),  # Dynamic width
-            height=max(600, len(df) * 25),  # Dynamic height
+            yaxis_title=yaxis_title,
+            width=max(1400, len(matrix.columns) * 40),  # Dynamic width
+            height=max(600, len(matrix) * 25),  # Dynamic height
             font=dict(size=10),
             xaxis=dict(tickangle=45, side="bottom"),
-            margin=dict(l=250, r=50, t=100, b=150),  # Space for labels and badges
-            annotations=annotations,
+            yaxis=dict(
+                tickmode="array",
+                tickvals=list(range(len(matrix))),
+                ticktext=row_labels.tolist(),
+            ),
+            margin=dict(l=250, r=50, t=100, b=150),  # Space for labels
         )
-
-        # Save standalone HTML
-        fig.write_html(output_path)
-        print(f"✓ Interactive batch heatmap saved to: {output_path}")
+        return fig
@@ -0,0 +1,225 @@
+"""Append-only checkpoint journal for resumable batch assessments."""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+from ..models.batch_assessment import (
+    BatchAssessment,
+    BatchResultStream,
+    BatchSummaryBuilder,
+    RepositoryResult,
+)
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "batch-journal.jsonl"
+
+
+@dataclass
+class JournalState:
+    """What an earlier, interrupted run recorded.
+
+    Attributes:
+        batch_id: Batch identifier of the run that started the journal
+        timestamp: When that run started
+        results: Recorded results by repository URL
+    """
+
+    batch_id: str | None = None
+    timestamp: datetime | None = None
+    results: dict[str, RepositoryResult] = field(default_factory=dict)
+
+
+class BatchJournal:
+    """One JSON line per completed repository, written as results arrive.
+
+    The first line identifies the batch; every following line holds one
+    RepositoryResult. Each record is flushed and fsynced before the next
+    repository finishes, so an interrupted batch (Ctrl-C, OOM kill, a
+    preempted machine) loses at most the repositories in flight. A torn
+    last line from a crash mid-write is ignored when the journal is read.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize journal.
+
+        Args:
+            path: Journal file (created on start())
+        """
+        self.path = Path(path)
+        self._file = None
+
+    def load(self) -> JournalState:
+        """Read what earlier runs recorded.
+
+        Records that can no longer be restored (e.g., an assessed clone
+        was evicted from the clone cache) are skipped, so those
+        repositories are assessed again.
+
+        Returns:
+            JournalState (empty if there is no journal)
+        """
+        state = JournalState()
+        if not self.path.exists():
+            return state
+
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                    if "batch" in record:
+                        state.batch_id = record["batch"]["batch_id"]
+                        state.timestamp = datetime.fromisoformat(
+                            record["batch"]["timestamp"]
+                        )
+                    else:
+                        result = RepositoryResult.from_dict(record["result"])
+                        state.results[result.repository_url] = result
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(
+                        f"Skipping journal record {line_number} in {self.path}: {e}"
+                    )
+        return state
+
+    def batch_header(self) -> tuple[str, datetime] | None:
+        """Batch ID and start time recorded on the journal's first line.
+
+        Returns:
+            (batch_id, timestamp), or None if there is no readable header
+        """
+        if not self.path.exists():
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            try:
+                batch = json.loads(f.readline())["batch"]
+                return batch["batch_id"], datetime.fromisoformat(batch["timestamp"])
+            except (ValueError, KeyError, TypeError):
+                return None
+
+    def start(self, batch_id: str, timestamp: datetime, resume: bool = False) -> None:
+        """Open the journal for appending.
+
+        Args:
+            batch_id: Batch identifier
+            timestamp: When the batch started
+            resume: Keep records of an earlier run instead of starting over
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            torn = False
+            with open(self.path, "rb") as f:
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    torn = f.read(1) != b"\n"
+            self._file = open(self.path, "a", encoding="utf-8")
+            if torn:
+                # Terminate the torn last line so the next record parses
+                self._file.write("\n")
+            return
+
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write(
+            {"batch": {"batch_id": batch_id, "timestamp": timestamp.isoformat()}}
+        )
+
+    def record(self, result: RepositoryResult) -> None:
+        """Durably append one completed result.
+
+        Args:
+            result: Result of one repository
+        """
+        self.record_data(result.to_dict())
+
+    def record_data(self, data: dict) -> None:
+        """Durably append one result given as RepositoryResult.to_dict().
+
+        Args:
+            data: Serialized repository result
+        """
+        self._write({"result": data})
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, record: dict) -> None:
+        """Append a record and force it to disk."""
+        if self._file is None:
+            raise RuntimeError("Journal not started")
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def merge_journals(
+    journal_paths: list[Path],
+    output_path: Path,
+    version: str = "unknown",
+    command: str = "merge",
+) -> BatchAssessment:
+    """Combine the journals of a sharded batch into one batch.
+
+    Records are copied into a new journal at output_path one at a time,
+    and the merged batch streams its results from there. If shards
+    overlap, the last journal's result for a repository wins.
+
+    Args:
+        journal_paths: Journal of each shard
+        output_path: Journal file for the merged batch
+        version: AgentReady version
+        command: CLI command that triggered the merge
+
+    Returns:
+        BatchAssessment over all shards' results
+
+    Raises:
+        ValueError: If the journals hold no results, or output_path is one
+            of them
+    """
+    output_path = Path(output_path)
+    if output_path.resolve() in {Path(p).resolve() for p in journal_paths}:
+        raise ValueError(f"Merged journal would overwrite a shard: {output_path}")
+
+    headers = [BatchJournal(path).batch_header() for path in journal_paths]
+    batch_id = str(uuid4())
+    timestamp = min(
+        (header[1] for header in headers if header is not None),
+        default=datetime.now(),
+    )
+
+    merged = BatchJournal(output_path)
+    merged.start(batch_id, timestamp)
+    try:
+        for path in journal_paths:
+            for data in BatchResultStream(path).records():
+                merged.record_data(data)
+    finally:
+        merged.close()
+
+    results = BatchResultStream(output_path)
+    if not len(results):
+        raise ValueError("No results to merge")
+
+    builder = BatchSummaryBuilder()
+    duration = 0.0
+    for data in results.records():
+        builder.add_record(data)
+        duration += data.get("duration_seconds", 0.0)
+
+    return BatchAssessment(
+        batch_id=batch_id,
+        timestamp=timestamp,
+        results=results,
+        summary=builder.build(),
+        # Shards run concurrently; this is the summed per-repository time
+        total_duration_seconds=duration,
+        agentready_version=version,
+        command=command,
+    )
@@ -1,16 +1,205 @@
 """Batch assessment orchestrator for multiple repositories."""
 
+import hashlib
+import logging
+import multiprocessing
+import os
+import random
+import signal
+import threading
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 from uuid import uuid4
 
-from ..models import BatchAssessment, BatchSummary, RepositoryResult
-from .assessment_cache import AssessmentCache
-from .repository_manager import RepositoryManager
+from ..models import (
+    Assessment,
+    BatchAssessment,
+    BatchResultStream,
+    BatchSummary,
+    BatchSummaryBuilder,
+    FailureTracker,
+    Finding,
+    Repository,
+    RepositoryResult,
+)
+from .assessment_cache import AssessmentCache, AssessmentFingerprint
+from .batch_journal import BatchJournal
+from .batch_telemetry import BatchTelemetry, peak_rss_bytes, reset_peak_rss
+from .file_metrics_cache import FileMetricsCache
+from .repository_manager import CLONE_TIMEOUT_SECONDS, RepositoryManager
 from .scanner import Scanner
 
+logger = logging.getLogger(__name__)
+
+# Upper bound for the default number of concurrent clones
+MAX_DEFAULT_CLONE_WORKERS = 8
+
+# Finished assessments committed to the cache per transaction
+CACHE_WRITE_BATCH = 32
+
+# Retries of transient clone failures, with exponential backoff
+DEFAULT_MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 2.0
+MAX_RETRY_DELAY_SECONDS = 60.0
+
+# Metrics caches opened by this assessment worker process, by directory
+_worker_metrics_caches: dict[Path, FileMetricsCache] = {}
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def default_worker_counts() -> tuple[int, int]:
+    """Default (clone, assess) worker counts for pipelined batch scans.
+
+    Assessment is CPU bound and gets one process per CPU. Cloning mostly
+    waits on the network, so it gets twice that, capped to stay polite to
+    the git host.
+    """
+    cpus = available_cpus()
+    return min(MAX_DEFAULT_CLONE_WORKERS, 2 * cpus), cpus
+
+
+class AssessmentTimeout(BaseException):
+    """An assessment ran past its repository's time budget.
+
+    Derives from BaseException (like KeyboardInterrupt) so that it is not
+    swallowed by the broad ``except Exception`` handlers around assessors.
+    """
+
+
+@contextmanager
+def time_limit(seconds: Optional[float]) -> Iterator[None]:
+    """Raise AssessmentTimeout in this block once seconds have passed.
+
+    Uses SIGALRM, so it only takes effect in the main thread on POSIX
+    systems (elsewhere the block runs unbounded). Blocking system calls
+    such as waiting on a subprocess are interrupted; a long-running C
+    function is interrupted when it returns.
+
+    Args:
+        seconds: Time budget (None for no limit)
+
+    Raises:
+        AssessmentTimeout: If the budget is exhausted
+    """
+    if seconds is None:
+        yield
+        return
+    if seconds <= 0:
+        raise AssessmentTimeout("No time left in the budget")
+    if (
+        not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        logger.debug("Time limits need SIGALRM in the main thread; not enforced")
+        yield
+        return
+
+    def expire(signum, frame):
+        raise AssessmentTimeout(f"Assessment exceeded {seconds:.0f}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def shard_repositories(
+    repository_urls: list[str], shard: int, shard_count: int
+) -> list[str]:
+    """Repositories assigned to one shard of a batch split across machines.
+
+    Assignment hashes each URL, so every host running the same list gets
+    a disjoint share, and a repository keeps its shard when others are
+    added to or removed from the list.
+
+    Args:
+        repository_urls: Full repository list
+        shard: Shard number, from 1 to shard_count
+        shard_count: Number of shards
+
+    Returns:
+        This shard's repositories, in list order
+
+    Raises:
+        ValueError: If shard is out of range
+    """
+    if not 1 <= shard <= shard_count:
+        raise ValueError(f"Shard must be between 1 and {shard_count}: {shard}")
+    return [
+        url
+        for url in repository_urls
+        if int.from_bytes(hashlib.sha256(url.encode("utf-8")).digest()[:8])
+        % shard_count
+        == shard - 1
+    ]
+
+
+def _scan_in_worker(
+    repo_path: Path,
+    assessors: list,
+    config,
+    metrics_cache_dir: Optional[Path],
+    version: str,
+    command: str,
+    reuse: dict[str, Finding],
+    time_budget: Optional[float] = None,
+    queued_at: Optional[float] = None,
+) -> tuple[Assessment, dict[str, float], Optional[int]]:
+    """Assess one prepared repository in an assessment worker process.
+
+    Args:
+        repo_path: Path to the cloned repository
+        assessors: List of assessor instances
+        config: Custom configuration
+        metrics_cache_dir: Per-file metrics cache directory (None to disable)
+        version: AgentReady version
+        command: CLI command that triggered the batch
+        reuse: Cached findings still valid for this commit, by attribute ID
+        time_budget: Seconds the assessment may take (None for no limit)
+        queued_at: When the repository was handed to the worker pool
+
+    Returns:
+        Tuple of (assessment, seconds per stage, peak resident memory in
+        bytes while assessing)
+
+    Raises:
+        AssessmentTimeout: If the assessment exceeds time_budget
+    """
+    metrics_cache = None
+    if metrics_cache_dir is not None:
+        # One cache per worker, reused for every repository it assesses
+        metrics_cache = _worker_metrics_caches.get(metrics_cache_dir)
+        if metrics_cache is None:
+            metrics_cache = FileMetricsCache(metrics_cache_dir)
+            _worker_metrics_caches[metrics_cache_dir] = metrics_cache
+
+    timings = {} if queued_at is None else {"queue": time.time() - queued_at}
+    reset_peak_rss()
+    scanner = Scanner(repo_path, config, metrics_cache=metrics_cache)
+    with time_limit(time_budget):
+        assessment = scanner.scan(assessors, False, version, command, reuse=reuse)
+    return assessment, {**timings, **scanner.stage_timings}, peak_rss_bytes()
+
 
 class BatchScanner:
     """Orchestrates batch assessment of multiple repositories.
@@ -29,6 +218,10 @@ class BatchScanner:
         batch_id: Optional[str] = None,
         version: str = "unknown",
         command: str = "",
+        refresh_clones: bool = False,
+        clone_cache_quota: Optional[int] = None,
+        repo_timeout: Optional[float] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ):
         """Initialize batch scanner.
 
@@ -37,6 +230,14 @@ class BatchScanner:
             batch_id: Unique batch identifier (auto-generated if not provided)
             version: AgentReady version
             command: CLI command that triggered the batch
+            refresh_clones: Fetch the latest commit into cached clones
+            clone_cache_quota: Disk quota in bytes for cached clones; least
+                recently used clones are evicted beyond it (None for no limit)
+            repo_timeout: Wall-clock budget in seconds for each repository,
+                covering cloning, retries and assessment; repositories that
+                exceed it fail with a "timeout" error (None for no limit)
+            max_retries: Retries for transient clone failures (network
+                errors, timeouts, rate limits), with exponential backoff
         """
         if cache_dir is None:
             cache_dir = Path(".agentready/cache")
@@ -45,9 +246,19 @@ class BatchScanner:
         self.batch_id = batch_id or str(uuid4())
         self.version = version
         self.command = command
+        self.repo_timeout = repo_timeout
+        self.max_retries = max_retries
 
-        self.repo_manager = RepositoryManager(self.cache_dir / "repositories")
+        self.repo_manager = RepositoryManager(
+            self.cache_dir / "repositories",
+            refresh=refresh_clones,
+            max_cache_bytes=clone_cache_quota,
+        )
         self.cache = AssessmentCache(self.cache_dir / "assessments")
+        # Batch-start lookup of cached assessments: URL -> (commit, assessment)
+        self._prefetched: dict[str, tuple[str, Assessment]] = {}
+        # Shared across repositories: forks and re-runs mostly contain known blobs
+        self.metrics_cache = FileMetricsCache(self.cache_dir / "file-metrics")
 
     def scan_batch(
         self,
@@ -57,43 +268,149 @@ class BatchScanner:
         use_cache: bool = True,
         verbose: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        clone_workers: int = 1,
+        assess_workers: int = 1,
+        journal: Optional[BatchJournal] = None,
+        resume: bool = False,
+        keep_results: bool = True,
+        telemetry: Optional[BatchTelemetry] = None,
     ) -> BatchAssessment:
         """Scan multiple repositories and generate batch assessment.
 
+        With one clone worker and one assessment worker, repositories are
+        cloned and assessed one after another in this process. Otherwise
+        the batch is pipelined (see _scan_pipelined).
+
+        With a journal, every result is appended to it as soon as the
+        repository is done. Resuming reads an interrupted run's journal,
+        skips the repositories it recorded and continues that batch (same
+        batch ID and timestamp), so the summary covers all repositories.
+
+        Without keep_results, results are only written to the journal: the
+        returned batch reads them back from it one at a time (a
+        BatchResultStream), so memory use does not grow with the batch.
+
         Args:
             repository_urls: List of repository URLs or local paths
             assessors: List of assessor instances
             config: Custom configuration
             use_cache: Whether to use cached results
             verbose: Verbose output
-            progress_callback: Callback function(current, total) for progress tracking
+            progress_callback: Callback function(current, total) for progress
+                tracking, always called in input order
+            clone_workers: Number of repositories cloned concurrently
+            assess_workers: Number of assessment worker processes
+            journal: Checkpoint journal to record results in
+            resume: Continue the batch recorded in journal
+            keep_results: Keep results in memory (requires a journal when
+                False)
+            telemetry: Throughput and stage timing telemetry to record each
+                result in
 
         Returns:
             BatchAssessment with results and summary
-        """
-        start_time = time.time()
-        results = []
 
-        for i, url in enumerate(repository_urls):
-            if progress_callback:
-                progress_callback(i, len(repository_urls))
+        Raises:
+            ValueError: If keep_results is False without a journal
+        """
+        if not keep_results and journal is None:
+            raise ValueError("Streaming results requires a journal")
 
-            result = self._assess_single_repository(
-                url,
-                assessors,
-                config,
-                use_cache,
-                verbose,
+        start_time = time.time()
+        batch_id, timestamp = self.batch_id, datetime.fromtimestamp(start_time)
+        recorded: dict[str, RepositoryResult] = {}
+        streamed: set[str] = set()
+        if journal is not None:
+            if resume and keep_results:
+                state = journal.load()
+                recorded = state.results
+            elif resume and journal.path.exists():
+                # Recorded results are read back from the stream later
+                streamed = set(BatchResultStream(journal.path, repository_urls).urls)
+            if resume:
+                batch_id, timestamp = journal.batch_header() or (batch_id, timestamp)
+            journal.start(batch_id, timestamp, resume=resume)
+
+        pending = [
+            (i, url)
+            for i, url in enumerate(repository_urls)
+            if url not in recorded and url not in streamed
+        ]
+        total = len(repository_urls)
+        on_result = None
+        if journal is not None or telemetry is not None:
+
+            def on_result(result: RepositoryResult) -> None:
+                if journal is not None:
+                    journal.record(result)
+                if telemetry is not None:
+                    telemetry.record(result)
+
+        if telemetry is not None:
+            telemetry.start(len(pending), batch_id)
+
+        if use_cache and pending:
+            # One query for the whole batch instead of one per repository
+            self._prefetched = self.cache.get_many(
+                [url for _, url in pending],
+                AssessmentFingerprint.compute(assessors, config),
             )
-            results.append(result)
+
+        try:
+            if clone_workers <= 1 and assess_workers <= 1:
+                scanned = []
+                for i, url in pending:
+                    if progress_callback:
+                        progress_callback(i, total)
+
+                    result = self._assess_single_repository(
+                        url,
+                        assessors,
+                        config,
+                        use_cache,
+                        verbose,
+                    )
+                    if on_result:
+                        on_result(result)
+                    if keep_results:
+                        scanned.append(result)
+            else:
+                scanned = self._scan_pipelined(
+                    [url for _, url in pending],
+                    assessors,
+                    config,
+                    use_cache,
+                    (
+                        (lambda n, _: progress_callback(pending[n][0], total))
+                        if progress_callback
+                        else None
+                    ),
+                    max(1, clone_workers),
+                    max(1, assess_workers),
+                    on_result,
+                    keep_results,
+                )
+        finally:
+            self._prefetched = {}
+            if journal is not None:
+                journal.close()
+
+        if keep_results:
+            by_url = dict(zip((url for _, url in pending), scanned))
+            results = [
+                recorded[url] if url in recorded else by_url[url]
+                for url in repository_urls
+            ]
+        else:
+            results = BatchResultStream(journal.path, repository_urls)
 
         # Calculate summary statistics
         summary = self._calculate_summary(results)
 
         # Create batch assessment
         batch = BatchAssessment(
-            batch_id=self.batch_id,
-            timestamp=datetime.fromtimestamp(start_time),
+            batch_id=batch_id,
+            timestamp=timestamp,
             results=results,
             summary=summary,
             total_duration_seconds=time.time() - start_time,
@@ -103,6 +420,436 @@ class BatchScanner:
 
         return batch
 
+    def _scan_pipelined(
+        self,
+        repository_urls: list[str],
+        assessors: list,
+        config,
+        use_cache: bool,
+        progress_callback: Optional[Callable[[int, int], None]],
+        clone_workers: int,
+        assess_workers: int,
+        on_result: Optional[Callable[[RepositoryResult], None]] = None,
+        keep_results: bool = True,
+    ) -> list[RepositoryResult]:
+        """Clone and assess repositories concurrently in two stages.
+
+        A thread pool clones (network/disk bound) and hands each prepared
+        repository to a process pool that assesses it (CPU bound), so
+        cloning the next repositories overlaps with assessing earlier ones.
+        At most clone_workers + 2 * assess_workers repositories are in
+        flight, which bounds disk use on large batches. Cache lookups and
+        writes stay in this process; writes are committed in batches of
+        CACHE_WRITE_BATCH. Time a cloned repository spends waiting for a
+        free assessment worker does not count against its time budget.
+
+        Results are returned in input order, and progress_callback(i, total)
+        is called for repository i once it and all repositories before it
+        are finished.
+
+        Args:
+            repository_urls: List of repository URLs or local paths
+            assessors: List of assessor instances
+            config: Custom configuration
+            use_cache: Whether to use cached results
+            progress_callback: Callback function(current, total)
+            clone_workers: Number of repositories cloned concurrently
+            assess_workers: Number of assessment worker processes
+            on_result: Called with each result as soon as it is complete
+            keep_results: Return the results (otherwise each is dropped once
+                on_result has seen it and an empty list is returned)
+
+        Returns:
+            RepositoryResult per URL, in input order
+        """
+        total = len(repository_urls)
+        results: list[Optional[RepositoryResult]] = [None] * total
+        finished = [False] * total
+        max_in_flight = clone_workers + 2 * assess_workers
+        metrics_cache_dir = self.metrics_cache.db_path.parent if use_cache else None
+        fingerprint = (
+            AssessmentFingerprint.compute(assessors, config) if use_cache else None
+        )
+
+        queued = iter(enumerate(repository_urls))
+        cloning: dict[Future, int] = {}
+        assessing: dict[Future, tuple[int, Repository, float, dict]] = {}
+        cache_writes: list[tuple] = []
+        reported = 0
+
+        # Spawned workers start clean: no inherited threads, locks or handles
+        context = multiprocessing.get_context("spawn")
+        assess_pool = ProcessPoolExecutor(
+            max_workers=assess_workers, mp_context=context
+        )
+        with (
+            self._flushing(cache_writes),
+            ThreadPoolExecutor(
+                max_workers=clone_workers, thread_name_prefix="agentready-clone"
+            ) as clone_pool,
+            ExitStack() as cleanup,
+        ):
+            # Shuts down whichever pool is current, after restarts too
+            cleanup.callback(lambda: assess_pool.shutdown(wait=True))
+
+            def complete(index: int, result: RepositoryResult) -> None:
+                finished[index] = True
+                if keep_results:
+                    results[index] = result
+                if on_result:
+                    on_result(result)
+
+            def fill() -> None:
+                while len(cloning) + len(assessing) < max_in_flight:
+                    item = next(queued, None)
+                    if item is None:
+                        return
+                    index, url = item
+                    future = clone_pool.submit(
+                        self._prepare_repository, url, fingerprint, time.time()
+                    )
+                    cloning[future] = index
+
+            def submit_scan(
+                index: int, repository: Repository, started: float
+            ) -> Future:
+                nonlocal assess_pool
+                args = (
+                    _scan_in_worker,
+                    repository.path,
+                    assessors,
+                    config,
+                    metrics_cache_dir,
+                    self.version,
+                    self.command,
+                    self._reusable_findings(
+                        repository_urls[index], repository, fingerprint
+                    ),
+                    self._remaining(started),
+                    time.time(),
+                )
+                try:
+                    return assess_pool.submit(*args)
+                except BrokenProcessPool:
+                    # A worker died (e.g., out of memory); the scans it took
+                    # down fail on their own, later ones go to a new pool
+                    logger.warning("Assessment worker died; restarting the pool")
+                    assess_pool.shutdown(wait=True)
+                    assess_pool = ProcessPoolExecutor(
+                        max_workers=assess_workers, mp_context=context
+                    )
+                    return assess_pool.submit(*args)
+
+            fill()
+            while cloning or assessing:
+                done, _ = wait([*cloning, *assessing], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in cloning:
+                        index = cloning.pop(future)
+                        repository, result, started, timings = future.result()
+                        if result is not None:
+                            complete(index, result)
+                            continue
+                        try:
+                            scan = submit_scan(index, repository, started)
+                        except BrokenProcessPool as e:
+                            # Even a fresh pool could not take the scan
+                            self.repo_manager.release(repository.path)
+                            complete(
+                                index,
+                                RepositoryResult(
+                                    repository_url=repository_urls[index],
+                                    assessment=None,
+                                    error=f"Could not start assessment: {e}",
+                                    error_type="assessment_error",
+                                    duration_seconds=time.time() - started,
+                                    stage_timings=timings,
+                                ),
+                            )
+                            continue
+                        assessing[scan] = (index, repository, started, timings)
+                    else:
+                        index, repository, started, timings = assessing.pop(future)
+                        complete(
+                            index,
+                            self._finish_assessment(
+                                repository_urls[index],
+                                repository,
+                                future,
+                                fingerprint,
+                                started,
+                                cache_writes,
+                                timings,
+                            ),
+                        )
+                        if len(cache_writes) >= CACHE_WRITE_BATCH:
+                            self._flush_cache_writes(cache_writes)
+
+                while reported < total and finished[reported]:
+                    if progress_callback:
+                        progress_callback(reported, total)
+                    reported += 1
+                fill()
+
+        return results if keep_results else []
+
+    @contextmanager
+    def _flushing(self, cache_writes: list[tuple]) -> Iterator[None]:
+        """Write buffered cache entries on exit, even after an error."""
+        try:
+            yield
+        finally:
+            self._flush_cache_writes(cache_writes)
+
+    def _flush_cache_writes(self, cache_writes: list[tuple]) -> None:
+        """Store buffered (url, commit, assessment, fingerprint) entries."""
+        if cache_writes:
+            if not self.cache.set_many(cache_writes):
+                logger.warning("Failed to cache %d assessment(s)", len(cache_writes))
+            cache_writes.clear()
+
+    def _cached_assessment(
+        self, url: str, commit_hash: str, fingerprint: AssessmentFingerprint
+    ) -> Optional[Assessment]:
+        """Cached assessment of this commit, checking the prefetch first."""
+        prefetched = self._prefetched.get(url)
+        if prefetched is not None and prefetched[0] == commit_hash:
+            return prefetched[1]
+        return self.cache.get(url, commit_hash, fingerprint)
+
+    def _prepare_repository(
+        self,
+        url: str,
+        fingerprint: Optional[AssessmentFingerprint],
+        start_time: float,
+    ) -> tuple[
+        Optional[Repository], Optional[RepositoryResult], float, dict[str, float]
+    ]:
+        """Clone stage: prepare a repository or settle it without assessing.
+
+        Args:
+            url: Repository URL or path
+            fingerprint: Assessment cache key for this batch (None to bypass
+                the cache)
+            start_time: When work on this repository started
+
+        Returns:
+            Tuple of (repository to assess, final result, start_time, seconds
+            per stage so far); exactly one of the first two is set
+        """
+        timings: dict[str, float] = {}
+        pinned = None
+        try:
+            success, repository, failure = self._clone_with_retries(url, start_time)
+            if success:
+                pinned = repository.path
+            timings["clone"] = time.time() - start_time
+            if not success:
+                return (
+                    None,
+                    RepositoryResult(
+                        repository_url=url,
+                        assessment=None,
+                        error=failure.error_message,
+                        error_type=failure.error_type,
+                        duration_seconds=time.time() - start_time,
+                        stage_timings=timings,
+                    ),
+                    start_time,
+                    timings,
+                )
+
+            if fingerprint is not None:
+                cached = self._cached_assessment(
+                    url, repository.commit_hash, fingerprint
+                )
+                if cached:
+                    pinned = None
+                    self.repo_manager.release(repository.path)
+                    return (
+                        None,
+                        RepositoryResult(
+                            repository_url=url,
+                            assessment=cached,
+                            duration_seconds=time.time() - start_time,
+                            cached=True,
+                            stage_timings=timings,
+                        ),
+                        start_time,
+                        timings,
+                    )
+
+            return repository, None, start_time, timings
+
+        except Exception as e:
+            # The clone will not be assessed; let it be evicted again
+            if pinned is not None:
+                self.repo_manager.release(pinned)
+            return (
+                None,
+                RepositoryResult(
+                    repository_url=url,
+                    assessment=None,
+                    error=f"Unexpected error: {str(e)}",
+                    error_type="assessment_error",
+                    duration_seconds=time.time() - start_time,
+                    stage_timings=timings,
+                ),
+                start_time,
+                timings,
+            )
+
+    def _clone_with_retries(
+        self, url: str, start_time: float
+    ) -> tuple[bool, Optional[Repository], Optional[FailureTracker]]:
+        """Prepare a repository, retrying transient failures with backoff.
+
+        Retries stop after max_retries, or earlier if the next attempt
+        would not fit in the repository's time budget.
+
+        Args:
+            url: Repository URL or path
+            start_time: When work on this repository started
+
+        Returns:
+            Tuple of (success, repository, failure) as from
+            RepositoryManager.prepare_repository()
+        """
+        retries = 0
+        while True:
+            remaining = self._remaining(start_time)
+            success, repository, failure = self.repo_manager.prepare_repository(
+                url,
+                timeout=(
+                    CLONE_TIMEOUT_SECONDS
+                    if remaining is None
+                    else max(min(remaining, CLONE_TIMEOUT_SECONDS), 1.0)
+                ),
+            )
+            if success or not failure.can_retry or retries >= self.max_retries:
+                break
+
+            delay = min(RETRY_BACKOFF_SECONDS * 2**retries, MAX_RETRY_DELAY_SECONDS)
+            # Jitter keeps shards hitting the same host from retrying in step
+            delay *= random.uniform(0.5, 1.0)
+            remaining = self._remaining(start_time)
+            if remaining is not None and remaining <= delay:
+                break
+
+            logger.info(
+                f"Retrying {url} in {delay:.1f}s after {failure.error_type}: "
+                f"{failure.error_message}"
+            )
+            time.sleep(delay)
+            retries += 1
+
+        if failure is not None and retries:
+            failure.retry_count = retries
+            failure.error_message += f" (after {retries} retries)"
+        return success, repository, failure
+
+    def _remaining(self, start_time: float) -> Optional[float]:
+        """Seconds left in a repository's time budget (None if unlimited)."""
+        if self.repo_timeout is None:
+            return None
+        return self.repo_timeout - (time.time() - start_time)
+
+    def _timeout_result(
+        self, url: str, start_time: float, stage_timings: dict[str, float]
+    ) -> RepositoryResult:
+        """Result for a repository that ran out of time."""
+        return RepositoryResult(
+            repository_url=url,
+            assessment=None,
+            error=f"Exceeded the {self.repo_timeout:g}s time budget",
+            error_type="timeout",
+            duration_seconds=time.time() - start_time,
+            stage_timings=stage_timings,
+        )
+
+    def _reusable_findings(
+        self,
+        url: str,
+        repository: Repository,
+        fingerprint: Optional[AssessmentFingerprint],
+    ) -> dict[str, Finding]:
+        """Cached findings for this commit whose assessors are unchanged.
+
+        Args:
+            url: Repository URL or path
+            repository: Prepared repository
+            fingerprint: Assessment cache key (None to bypass the cache)
+
+        Returns:
+            Reusable findings by attribute ID
+        """
+        if fingerprint is None:
+            return {}
+        return self.cache.get_reusable_findings(
+            url, repository.commit_hash, fingerprint
+        )
+
+    def _finish_assessment(
+        self,
+        url: str,
+        repository: Repository,
+        future: Future,
+        fingerprint: Optional[AssessmentFingerprint],
+        start_time: float,
+        cache_writes: list[tuple],
+        stage_timings: dict[str, float],
+    ) -> RepositoryResult:
+        """Assess stage done: queue the assessment for caching, build the result.
+
+        Args:
+            url: Repository URL or path
+            repository: Prepared repository
+            future: Finished _scan_in_worker future
+            fingerprint: Assessment cache key (None to bypass the cache)
+            start_time: When work on this repository started
+            cache_writes: Buffer of entries to store with cache.set_many()
+            stage_timings: Seconds per stage before assessment (clone)
+
+        Returns:
+            RepositoryResult with assessment or error
+        """
+        # The worker is done with the clone; it may be evicted from now on
+        self.repo_manager.release(repository.path)
+        try:
+            assessment, worker_timings, peak_rss = future.result()
+            if fingerprint is not None:
+                cache_writes.append(
+                    (url, repository.commit_hash, assessment, fingerprint)
+                )
+        except AssessmentTimeout:
+            return self._timeout_result(url, start_time, stage_timings)
+        except BrokenProcessPool:
+            return RepositoryResult(
+                repository_url=url,
+                assessment=None,
+                error="Assessment worker process died (out of memory or crashed)",
+                error_type="assessment_error",
+                duration_seconds=time.time() - start_time,
+                stage_timings=stage_timings,
+            )
+        except Exception as e:
+            return RepositoryResult(
+                repository_url=url,
+                assessment=None,
+                error=f"Unexpected error: {str(e)}",
+                error_type="assessment_error",
+                duration_seconds=time.time() - start_time,
+                stage_timings=stage_timings,
+            )
+
+        return RepositoryResult(
+            repository_url=url,
+            assessment=assessment,
+            duration_seconds=time.time() - start_time,
+            stage_timings={**stage_timings, **worker_timings},
+            peak_rss_bytes=peak_rss,
+        )
+
     def _assess_single_repository(
         self,
         url: str,
@@ -124,44 +871,48 @@ class BatchScanner:
             RepositoryResult with assessment or error
         """
         start_time = time.time()
+        fingerprint = (
+            AssessmentFingerprint.compute(assessors, config) if use_cache else None
+        )
+        repository, result, _, timings = self._prepare_repository(
+            url, fingerprint, start_time
+        )
+        if result is not None:
+            return result
 
         try:
-            # Prepare repository (clone if needed)
-            success, repository, failure = self.repo_manager.prepare_repository(url)
-            if not success:
-                return RepositoryResult(
-                    repository_url=url,
-                    assessment=None,
-                    error=failure.error_message,
-                    error_type=failure.error_type,
-                    duration_seconds=time.time() - start_time,
-                )
-
-            # Check cache
-            if use_cache:
-                cached = self.cache.get(url, repository.commit_hash)
-                if cached:
-                    return RepositoryResult(
-                        repository_url=url,
-                        assessment=cached,
-                        duration_seconds=time.time() - start_time,
-                        cached=True,
-                    )
-
             # Perform assessment
-            scanner = Scanner(repository.path, config)
-            assessment = scanner.scan(assessors, verbose, self.version, self.command)
+            reset_peak_rss()
+            scanner = Scanner(
+                repository.path,
+                config,
+                metrics_cache=self.metrics_cache if use_cache else None,
+            )
+            with time_limit(self._remaining(start_time)):
+                assessment = scanner.scan(
+                    assessors,
+                    verbose,
+                    self.version,
+                    self.command,
+                    reuse=self._reusable_findings(url, repository, fingerprint),
+                )
+            timings.update(scanner.stage_timings)
 
             # Cache result
-            if use_cache:
-                self.cache.set(url, repository.commit_hash, assessment)
+            if fingerprint is not None:
+                self.cache.set(url, repository.commit_hash, assessment, fingerprint)
 
             return RepositoryResult(
                 repository_url=url,
                 assessment=assessment,
                 duration_seconds=time.time() - start_time,
+                stage_timings=timings,
+                peak_rss_bytes=peak_rss_bytes(),
             )
 
+        except AssessmentTimeout:
+            return self._timeout_result(url, start_time, timings)
+
         except Exception as e:
             return RepositoryResult(
                 repository_url=url,
@@ -169,75 +920,29 @@ class BatchScanner:
                 error=f"Unexpected error: {str(e)}",
                 error_type="assessment_error",
                 duration_seconds=time.time() - start_time,
+                stage_timings=timings,
             )
 
-    def _calculate_summary(self, results: list[RepositoryResult]) -> BatchSummary:
+        finally:
+            self.repo_manager.release(repository.path)
+
+    def _calculate_summary(
+        self, results: list[RepositoryResult] | BatchResultStream
+    ) -> BatchSummary:
         """Calculate summary statistics from results.
 
         Args:
-            results: List of RepositoryResult objects
+            results: RepositoryResult objects, or a stream of them (read
+                back as dictionaries without rebuilding the models)
 
         Returns:
             BatchSummary with aggregated statistics
         """
-        successful = [r for r in results if r.is_success()]
-        failed = [r for r in results if not r.is_success()]
-
-        # Calculate average score
-        if successful:
-            average_score = sum(r.assessment.overall_score for r in successful) / len(
-                successful
-            )
+        builder = BatchSummaryBuilder()
+        if isinstance(results, BatchResultStream):
+            for data in results.records():
+                builder.add_record(data)
         else:
-            average_score = 0.0
-
-        # Score distribution
-        score_distribution = {
-            "Platinum": 0,
-            "Gold": 0,
-            "Silver": 0,
-            "Bronze": 0,
-            "Needs Improvement": 0,
-        }
-        for result in successful:
-            level = result.assessment.certification_level
-            if level in score_distribution:
-                score_distribution[level] += 1
-
-        # Language breakdown
-        language_breakdown = {}
-        for result in successful:
-            for lang, count in result.assessment.repository.languages.items():
-                language_breakdown[lang] = language_breakdown.get(lang, 0) + count
-
-        # Top failing attributes
-        failing_attributes = {}
-        for result in successful:
-            for finding in result.assessment.findings:
-                if finding.status == "fail":
-                    attr_id = finding.attribute.id
-                    failing_attributes[attr_id] = failing_attributes.get(attr_id, 0) + 1
-
-        top_failing = sorted(
-            failing_attributes.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:10]
-
-        top_failing_attributes = [
-            {
-                "attribute_id": attr_id,
-                "failure_count": count,
-            }
-            for attr_id, count in top_failing
-        ]
-
-        return BatchSummary(
-            total_repositories=len(results),
-            successful_assessments=len(successful),
-            failed_assessments=len(failed),
-            average_score=average_score,
-            score_distribution=score_distribution,
-            language_breakdown=language_breakdown,
-            top_failing_attributes=top_failing_attributes,
-        )
+            for result in results:
+                builder.add(result)
+        return builder.build()
@@ -0,0 +1,299 @@
+"""Throughput, stage timing and memory telemetry for batch assessments."""
+
+import logging
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..models.batch_assessment import RepositoryResult
+
+logger = logging.getLogger(__name__)
+
+# Stages of work on one repository, in the order they happen
+STAGES = ("clone", "queue", "language_detection", "assessors", "reporting")
+
+# Minimum seconds between rewrites of the metrics file while a batch runs
+METRICS_WRITE_INTERVAL_SECONDS = 15.0
+
+_PROC_STATUS = Path("/proc/self/status")
+_PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def reset_peak_rss() -> bool:
+    """Restart peak resident memory tracking for this process.
+
+    Only supported on Linux, where the kernel's high-water mark can be
+    reset; elsewhere peak_rss_bytes() keeps reporting the peak since the
+    process started.
+
+    Returns:
+        True if the peak was reset
+    """
+    try:
+        # "5" resets VmHWM to the current resident set size
+        _PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident memory of this process since the last reset_peak_rss().
+
+    Returns:
+        Peak resident set size in bytes (None if it cannot be measured)
+    """
+    try:
+        match = re.search(r"^VmHWM:\s+(\d+) kB", _PROC_STATUS.read_text(), re.M)
+        if match:
+            return int(match.group(1)) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def format_duration(seconds: float) -> str:
+    """Short human-readable duration, e.g. "45s", "3m10s" or "2h05m"."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class BatchTelemetry:
+    """Live metrics of a running batch assessment.
+
+    Counts finished repositories for throughput and ETA, and sums the
+    per-stage timings and peak memory recorded in each RepositoryResult.
+    Time spent writing reports is added with record_stage(), since
+    reports are generated after the batch.
+
+    With a metrics_path, the metrics are written there in the Prometheus
+    text exposition format (for node_exporter's textfile collector) as
+    results arrive, at most every write_interval seconds, and once more
+    on finish(). The file is replaced atomically, so a scrape never sees
+    a partial write.
+    """
+
+    def __init__(
+        self,
+        metrics_path: Optional[Path] = None,
+        write_interval: float = METRICS_WRITE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize telemetry.
+
+        Args:
+            metrics_path: Prometheus text file to keep up to date (optional)
+            write_interval: Minimum seconds between metrics file rewrites
+            clock: Monotonic time source
+        """
+        self.metrics_path = Path(metrics_path) if metrics_path else None
+        self.write_interval = write_interval
+        self._clock = clock
+
+        self.batch_id = ""
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.cached = 0
+        self.stage_seconds = dict.fromkeys(STAGES, 0.0)
+        self.peak_rss_bytes = 0
+        self.running = False
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        self._last_write: Optional[float] = None
+
+    def start(self, total: int, batch_id: str = "") -> None:
+        """Start timing a batch.
+
+        Args:
+            total: Repositories to be assessed in this run (excluding any
+                recorded by an earlier, resumed run)
+            batch_id: Batch identifier, used as a metric label
+        """
+        self.total = total
+        self.batch_id = batch_id
+        self.running = True
+        self._started = self._clock()
+        self._finished = None
+        self.write_metrics()
+
+    def record(self, result: RepositoryResult) -> None:
+        """Count one finished repository.
+
+        Args:
+            result: Repository result
+        """
+        self.completed += 1
+        if not result.is_success():
+            self.failed += 1
+        if result.cached:
+            self.cached += 1
+        for stage, seconds in result.stage_timings.items():
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        if result.peak_rss_bytes:
+            self.peak_rss_bytes = max(self.peak_rss_bytes, result.peak_rss_bytes)
+
+        if self.metrics_path is not None and (
+            self._last_write is None
+            or self._clock() - self._last_write >= self.write_interval
+        ):
+            self.write_metrics()
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Add time spent on a stage outside of assessment (e.g., reporting).
+
+        Args:
+            stage: Stage name
+            seconds: Time spent
+        """
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def finish(self) -> None:
+        """Stop the clock and write final metrics."""
+        if self.running:
+            self.running = False
+            self._finished = self._clock()
+        self.write_metrics()
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds since start() (up to finish(), once finished)."""
+        if self._started is None:
+            return 0.0
+        return (self._finished or self._clock()) - self._started
+
+    def throughput(self) -> float:
+        """Repositories finished per minute so far."""
+        elapsed = self.elapsed_seconds
+        return self.completed * 60 / elapsed if elapsed > 0 else 0.0
+
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until every repository is finished.
+
+        Returns:
+            ETA at the throughput so far (None before the first result)
+        """
+        rate = self.throughput()
+        if not rate:
+            return None
+        return max(self.total - self.completed, 0) * 60 / rate
+
+    def progress(self) -> str:
+        """Throughput and ETA for progress output (empty before any result)."""
+        eta = self.eta_seconds()
+        if eta is None:
+            return ""
+        return f"{self.throughput():.1f} repos/min, ETA {format_duration(eta)}"
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        batch = f'batch_id="{_label(self.batch_id)}"'
+        eta = self.eta_seconds()
+        metrics = [
+            (
+                "agentready_batch_running",
+                "gauge",
+                "Whether the batch is still running.",
+                [(batch, int(self.running))],
+            ),
+            (
+                "agentready_batch_repositories",
+                "gauge",
+                "Repositories to assess in this run.",
+                [(batch, self.total)],
+            ),
+            (
+                "agentready_batch_repositories_completed_total",
+                "counter",
+                "Repositories finished, by outcome.",
+                [
+                    (f'{batch},outcome="success"', self.completed - self.failed),
+                    (f'{batch},outcome="failure"', self.failed),
+                ],
+            ),
+            (
+                "agentready_batch_repositories_cached_total",
+                "counter",
+                "Repositories whose assessment came from the cache.",
+                [(batch, self.cached)],
+            ),
+            (
+                "agentready_batch_elapsed_seconds",
+                "gauge",
+                "Seconds since the batch started.",
+                [(batch, round(self.elapsed_seconds, 3))],
+            ),
+            (
+                "agentready_batch_throughput_repositories_per_minute",
+                "gauge",
+                "Repositories finished per minute.",
+                [(batch, round(self.throughput(), 3))],
+            ),
+            (
+                "agentready_batch_eta_seconds",
+                "gauge",
+                "Estimated seconds until the batch is finished.",
+                [(batch, "NaN" if eta is None else round(eta, 3))],
+            ),
+            (
+                "agentready_batch_stage_seconds_total",
+                "counter",
+                "Time spent per stage, summed over repositories.",
+                [
+                    (f'{batch},stage="{_label(stage)}"', round(seconds, 3))
+                    for stage, seconds in self.stage_seconds.items()
+                ],
+            ),
+            (
+                "agentready_batch_repository_peak_rss_bytes",
+                "gauge",
+                "Largest peak resident memory used to assess one repository.",
+                [(batch, self.peak_rss_bytes)],
+            ),
+            (
+                "agentready_batch_last_update_timestamp_seconds",
+                "gauge",
+                "Unix time these metrics were written.",
+                [(batch, round(time.time(), 3))],
+            ),
+        ]
+
+        lines = []
+        for name, kind, description, samples in metrics:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_metrics(self) -> None:
+        """Atomically replace the metrics file (no-op without metrics_path)."""
+        if self.metrics_path is None:
+            return
+        self._last_write = self._clock()
+        temp_path = self.metrics_path.with_name(f".{self.metrics_path.name}.tmp")
+        try:
+            self.metrics_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(self.to_prometheus(), encoding="utf-8")
+            os.replace(temp_path, self.metrics_path)
+        except OSError as e:
+            logger.warning(f"Failed to write batch metrics to {self.metrics_path}: {e}")
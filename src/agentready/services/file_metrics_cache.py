@@ -0,0 +1,430 @@
+"""Content-addressed cache of per-file metrics keyed by git blob SHA."""
+
+import codecs
+import io
+import json
+import logging
+import re
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Bump when the way a metric kind is computed changes, so stale rows are ignored
+METRICS_VERSION = 3
+
+# Metric kinds stored in the cache
+LINE_METRICS = "lines"
+PYTHON_SUMMARY = "python_summary"
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK = 500
+
+# How long a writer waits for another process's transaction before failing
+BUSY_TIMEOUT_SECONDS = 30.0
+
+# Files larger than this are treated as assets and not line-counted
+MAX_LINE_COUNT_BYTES = 64 * 1024 * 1024
+
+# Leading bytes checked for NUL to detect binary content (same heuristic as git)
+BINARY_SNIFF_BYTES = 8000
+
+# Extensions that are never text, skipped without opening the file
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".bmp",
+        ".ico",
+        ".webp",
+        ".pdf",
+        ".zip",
+        ".gz",
+        ".tgz",
+        ".bz2",
+        ".xz",
+        ".7z",
+        ".tar",
+        ".jar",
+        ".whl",
+        ".so",
+        ".dylib",
+        ".dll",
+        ".exe",
+        ".pyc",
+        ".class",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".mp3",
+        ".mp4",
+        ".mov",
+        ".wav",
+        ".sqlite",
+        ".db",
+        ".parquet",
+    }
+)
+
+# Uncounted bytes needed before line counting fans out to a process pool
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+_READ_CHUNK = 1024 * 1024
+
+# Line with only ASCII whitespace (the characters str.strip() removes)
+_BLANK_LINE = re.compile(rb"^[ \t\r\x0b\x0c\x1c-\x1f]*\n", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class LineMetrics:
+    """Line counts of a single file.
+
+    Attributes:
+        lines: Line count as read in strict UTF-8 text mode, or None if the
+            file is binary or not valid UTF-8
+        non_blank_lines: Lines containing non-whitespace bytes (0 for binary)
+    """
+
+    lines: int | None
+    non_blank_lines: int
+
+    @classmethod
+    def binary(cls) -> "LineMetrics":
+        """Metrics for binary or oversized files, which have no lines."""
+        return cls(lines=None, non_blank_lines=0)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LineMetrics":
+        """Compute line metrics from raw file content."""
+        return cls.from_stream(io.BytesIO(data))
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO) -> "LineMetrics":
+        """Count lines from a binary stream in fixed-size chunks.
+
+        Newlines and blank lines are counted on bytes (universal newlines,
+        ASCII whitespace); UTF-8 validity is checked with an incremental
+        decoder without building strings. Content with a NUL byte near the
+        start is treated as binary.
+        """
+        chunk = stream.read(_READ_CHUNK)
+        if b"\0" in chunk[:BINARY_SNIFF_BYTES]:
+            return cls.binary()
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        strict = True
+        lines = blank = 0
+        carry = b""
+
+        while chunk:
+            if strict:
+                try:
+                    decoder.decode(chunk)
+                except UnicodeDecodeError:
+                    strict = False
+
+            buf = carry + chunk
+            carry = b""
+            if buf.endswith(b"\r"):
+                # May be the first half of a CRLF split across chunks
+                buf, carry = buf[:-1], b"\r"
+            if b"\r" in buf:
+                buf = buf.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+            # Count complete lines; keep the partial last line for the next chunk
+            cut = buf.rfind(b"\n") + 1
+            lines += buf.count(b"\n", 0, cut)
+            blank += len(_BLANK_LINE.findall(buf, 0, cut))
+            carry = buf[cut:] + carry
+            chunk = stream.read(_READ_CHUNK)
+
+        if strict:
+            try:
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                strict = False
+
+        if carry:
+            tail = carry.replace(b"\r", b"\n")
+            if not tail.endswith(b"\n"):
+                tail += b"\n"
+            lines += tail.count(b"\n")
+            blank += len(_BLANK_LINE.findall(tail))
+
+        return cls(lines=lines if strict else None, non_blank_lines=lines - blank)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {"lines": self.lines, "non_blank_lines": self.non_blank_lines}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LineMetrics":
+        """Create line metrics from dictionary."""
+        return cls(lines=data["lines"], non_blank_lines=data["non_blank_lines"])
+
+
+class FileMetricsCache:
+    """Per-file facts cached by git blob SHA, shared across commits and repos.
+
+    Facts derived purely from file content (line counts, Python AST
+    summaries) are stored under the blob SHA from ``git ls-files -s``, so
+    unchanged files are never re-read or re-parsed on later scans of the
+    same repository, other branches, or forks.
+
+    Lookups are served from memory after ``prefetch()``; new entries are
+    buffered and written in a single transaction by ``flush()``. Without a
+    ``cache_dir`` the cache only lives for the current process.
+
+    Schema: file_metrics(blob_sha, kind, version, data)
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize file metrics cache.
+
+        Args:
+            cache_dir: Directory for cache database (None for in-memory only)
+        """
+        self.db_path = None
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self.db_path = cache_dir / "file_metrics.db"
+            self._initialize_db()
+
+        self._entries: dict[tuple[str, str], dict] = {}
+        self._pending: dict[tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, waiting out other processes' writes."""
+        return sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS)
+
+    def _initialize_db(self) -> None:
+        """Initialize database schema."""
+        try:
+            with self._connect() as conn:
+                # Batch worker processes flush to the same database
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS file_metrics (
+                        blob_sha TEXT NOT NULL,
+                        kind TEXT NOT NULL,
+                        version INTEGER NOT NULL,
+                        data TEXT NOT NULL,
+                        PRIMARY KEY (blob_sha, kind)
+                    )
+                    """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to initialize file metrics database: {e}")
+
+    def prefetch(self, kind: str, blob_shas: Iterable[str]) -> None:
+        """Load cached entries for many blobs with batched queries.
+
+        Args:
+            kind: Metric kind (e.g., LINE_METRICS)
+            blob_shas: Blob SHAs about to be looked up
+        """
+        if self.db_path is None:
+            return
+
+        with self._lock:
+            wanted = [
+                sha
+                for sha in set(blob_shas)
+                if sha and (sha, kind) not in self._entries
+            ]
+        if not wanted:
+            return
+
+        loaded = {}
+        try:
+            with self._connect() as conn:
+                for start in range(0, len(wanted), _QUERY_CHUNK):
+                    chunk = wanted[start : start + _QUERY_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        f"""
+                        SELECT blob_sha, data FROM file_metrics
+                        WHERE kind = ? AND version = ?
+                        AND blob_sha IN ({placeholders})
+                        """,
+                        (kind, METRICS_VERSION, *chunk),
+                    )
+                    for blob_sha, data in cursor:
+                        loaded[(blob_sha, kind)] = json.loads(data)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"File metrics cache read failed: {e}")
+            return
+
+        with self._lock:
+            self._entries.update(loaded)
+
+    def get(self, kind: str, blob_sha: str | None) -> dict | None:
+        """Get cached metrics for a blob.
+
+        Args:
+            kind: Metric kind
+            blob_sha: Git blob SHA (None for files with unknown content hash)
+
+        Returns:
+            Cached data, or None if not cached
+        """
+        if not blob_sha:
+            return None
+
+        with self._lock:
+            data = self._entries.get((blob_sha, kind))
+            if data is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return data
+
+    def put(self, kind: str, blob_sha: str | None, data: dict) -> None:
+        """Record metrics for a blob (written to disk on flush()).
+
+        Args:
+            kind: Metric kind
+            blob_sha: Git blob SHA (ignored if None)
+            data: JSON-serializable metrics
+        """
+        if not blob_sha:
+            return
+
+        with self._lock:
+            self._entries[(blob_sha, kind)] = data
+            if self.db_path is not None:
+                self._pending[(blob_sha, kind)] = data
+
+    def flush(self) -> None:
+        """Write buffered entries to the database in one transaction."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending or self.db_path is None:
+            return
+
+        rows = [
+            (blob_sha, kind, METRICS_VERSION, json.dumps(data, separators=(",", ":")))
+            for (blob_sha, kind), data in pending.items()
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO file_metrics
+                    (blob_sha, kind, version, data)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"File metrics cache write failed: {e}")
+
+    def line_metrics(self, root: Path, entry) -> LineMetrics | None:
+        """Get line metrics for an indexed file, reading it only on a miss.
+
+        Args:
+            root: Repository root (Path, or TreePath for a commit tree)
+            entry: IndexedFile from the repository index
+
+        Returns:
+            LineMetrics, or None if the file can't be read
+        """
+        cached = self.get(LINE_METRICS, entry.blob_sha)
+        if cached is not None:
+            return LineMetrics.from_dict(cached)
+
+        if _is_binary_entry(entry):
+            metrics = LineMetrics.binary()
+        else:
+            metrics = count_file_lines(root / entry.path)
+            if metrics is None:
+                return None
+
+        self.put(LINE_METRICS, entry.blob_sha, metrics.to_dict())
+        return metrics
+
+    def line_metrics_many(
+        self, root: Path, entries: list, workers: int = 1
+    ) -> dict[str, LineMetrics | None]:
+        """Get line metrics for many indexed files in one pass.
+
+        Cached blobs are answered from the store; binary extensions and
+        oversized files are skipped without I/O; the remaining files are
+        counted serially, or on a process pool when ``workers > 1``, the
+        files are on disk, and enough bytes need counting to amortize worker
+        start-up.
+
+        Args:
+            root: Repository root (Path, or TreePath for a commit tree)
+            entries: IndexedFile entries from the repository index
+            workers: Maximum worker processes for uncached files
+
+        Returns:
+            Mapping of relative path to LineMetrics (None if unreadable)
+        """
+        self.prefetch(LINE_METRICS, (e.blob_sha for e in entries if e.blob_sha))
+
+        results: dict[str, LineMetrics | None] = {}
+        to_count = []
+        for entry in entries:
+            cached = self.get(LINE_METRICS, entry.blob_sha)
+            if cached is not None:
+                results[entry.path] = LineMetrics.from_dict(cached)
+            elif _is_binary_entry(entry):
+                results[entry.path] = LineMetrics.binary()
+                self.put(LINE_METRICS, entry.blob_sha, results[entry.path].to_dict())
+            else:
+                to_count.append(entry)
+
+        paths = [root / entry.path for entry in to_count]
+        if (
+            workers > 1
+            and isinstance(root, Path)
+            and sum(e.size for e in to_count) >= PARALLEL_MIN_BYTES
+        ):
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                counted = list(executor.map(count_file_lines, paths, chunksize=64))
+        else:
+            counted = [count_file_lines(path) for path in paths]
+
+        for entry, metrics in zip(to_count, counted):
+            results[entry.path] = metrics
+            if metrics is not None:
+                self.put(LINE_METRICS, entry.blob_sha, metrics.to_dict())
+
+        return results
+
+
+def count_file_lines(path: Path) -> LineMetrics | None:
+    """Count lines of a file (module-level so worker processes can run it).
+
+    Args:
+        path: File path (Path, or TreePath for a commit tree)
+
+    Returns:
+        LineMetrics, or None if the file can't be read
+    """
+    try:
+        with path.open("rb") as f:
+            return LineMetrics.from_stream(f)
+    except OSError:
+        return None
+
+
+def _is_binary_entry(entry) -> bool:
+    """Whether an indexed file can be skipped as binary without reading it."""
+    return entry.extension in BINARY_EXTENSIONS or entry.size > MAX_LINE_COUNT_BYTES
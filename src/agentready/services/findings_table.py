@@ -0,0 +1,149 @@
+"""Columnar table of batch findings: one row per (repository, attribute)."""
+
+import logging
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FINDINGS_TABLE_FILENAME = "findings.parquet"
+
+# Column types; low-cardinality strings are stored as dictionary-encoded
+# categoricals
+FINDINGS_COLUMNS = {
+    "repository": "category",
+    "repository_url": "category",
+    "commit_hash": "category",
+    "primary_language": "category",
+    "overall_score": "float64",
+    "certification_level": "category",
+    "attribute_id": "category",
+    "attribute_name": "category",
+    "category": "category",
+    "tier": "int8",
+    "status": "category",
+    "score": "float64",
+    "measured_value": "string",
+    "threshold": "string",
+}
+
+# Columns taken from the repository rather than the finding
+_REPOSITORY_COLUMNS = (
+    "repository",
+    "repository_url",
+    "commit_hash",
+    "primary_language",
+    "overall_score",
+    "certification_level",
+)
+
+_INSTALL_HINT = "Columnar export needs pyarrow: pip install 'agentready[analytics]'"
+
+
+def findings_frame(records: Iterable[dict]) -> pd.DataFrame:
+    """Build the findings table from repository results.
+
+    Failed repositories have no findings and are left out.
+
+    Args:
+        records: Results as RepositoryResult.to_dict() dictionaries (e.g.,
+            BatchAssessment.result_dicts(), or the "results" list of
+            all-assessments.json)
+
+    Returns:
+        DataFrame with FINDINGS_COLUMNS, in result and finding order
+    """
+    columns = {name: [] for name in FINDINGS_COLUMNS}
+    for data in records:
+        assessment = data.get("assessment")
+        if assessment is None:
+            continue
+        repository = assessment["repository"]
+        languages = repository.get("languages") or {}
+        repo_values = (
+            repository["name"],
+            data.get("repository_url") or repository.get("url") or "",
+            repository.get("commit_hash") or "",
+            max(languages, key=languages.get) if languages else "Unknown",
+            assessment["overall_score"],
+            assessment["certification_level"],
+        )
+
+        for finding in assessment["findings"]:
+            attribute = finding["attribute"]
+            for name, value in zip(_REPOSITORY_COLUMNS, repo_values):
+                columns[name].append(value)
+            columns["attribute_id"].append(attribute["id"])
+            columns["attribute_name"].append(attribute["name"])
+            columns["category"].append(attribute.get("category"))
+            columns["tier"].append(attribute["tier"])
+            columns["status"].append(finding["status"])
+            columns["score"].append(finding.get("score"))
+            columns["measured_value"].append(_text(finding.get("measured_value")))
+            columns["threshold"].append(_text(finding.get("threshold")))
+
+    frame = pd.DataFrame(columns)
+    # None scores become NaN with the float64 cast
+    return frame.astype(FINDINGS_COLUMNS)
+
+
+def write_findings_table(frame: pd.DataFrame, output_path: Path) -> Path:
+    """Write the findings table as Parquet, or Arrow IPC for .arrow/.feather.
+
+    Args:
+        frame: Table from findings_frame()
+        output_path: Output file
+
+    Returns:
+        Path to the written file
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError(_INSTALL_HINT)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_path.suffix in (".arrow", ".feather"):
+        frame.to_feather(output_path)
+    else:
+        frame.to_parquet(output_path, index=False)
+    logger.debug(f"Wrote {len(frame)} findings to {output_path}")
+    return output_path
+
+
+def read_findings_table(
+    path: Path, columns: Optional[list[str]] = None
+) -> pd.DataFrame:
+    """Read a table written by write_findings_table().
+
+    Args:
+        path: Parquet or Arrow IPC file
+        columns: Only read these columns (default: all)
+
+    Returns:
+        Findings DataFrame
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError(_INSTALL_HINT)
+    path = Path(path)
+    if path.suffix in (".arrow", ".feather"):
+        return pd.read_feather(path, columns=columns)
+    return pd.read_parquet(path, columns=columns)
+
+
+def _text(value) -> Optional[str]:
+    """Measured values and thresholds as text (None stays missing)."""
+    return None if value is None else str(value)
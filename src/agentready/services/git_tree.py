@@ -0,0 +1,481 @@
+"""Read-only access to a commit's files straight from the git object database."""
+
+import io
+import logging
+import os
+import posixpath
+import stat
+import subprocess
+import threading
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePosixPath
+from typing import Iterator, NamedTuple
+
+from ..utils.subprocess_utils import safe_subprocess_run
+
+logger = logging.getLogger(__name__)
+
+SYMLINK_MODE = b"120000"
+
+
+def is_bare_repository(path: Path) -> bool:
+    """Check whether a directory looks like a bare git repository.
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        True if path has the HEAD, objects and refs of a git directory
+    """
+    path = Path(path)
+    return (
+        (path / "HEAD").is_file()
+        and (path / "objects").is_dir()
+        and (path / "refs").is_dir()
+    )
+
+
+class TreeEntry(NamedTuple):
+    """A blob in a commit tree.
+
+    Attributes:
+        sha: Git blob SHA
+        size: Blob size in bytes
+    """
+
+    sha: str
+    size: int
+
+
+class GitObjectReader:
+    """Read blobs through one long-lived ``git cat-file --batch`` process.
+
+    Each read is a pipe round trip rather than a process spawn, so reading
+    thousands of files costs one git process per scan. Reads are serialized
+    with a lock so concurrent assessors can share the reader.
+    """
+
+    def __init__(self, repository_path: Path):
+        """Initialize reader (the git process starts on first read).
+
+        Args:
+            repository_path: Path to a git repository (bare or not)
+        """
+        self.repository_path = Path(repository_path)
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def read(self, sha: str) -> bytes:
+        """Read a blob's content.
+
+        Args:
+            sha: Full object SHA
+
+        Returns:
+            Raw blob bytes
+
+        Raises:
+            FileNotFoundError: If the object does not exist
+            OSError: If the git process exits unexpectedly
+        """
+        with self._lock:
+            process = self._ensure_started()
+            try:
+                process.stdin.write(sha.encode("ascii") + b"\n")
+                process.stdin.flush()
+                header = process.stdout.readline()
+            except (BrokenPipeError, ValueError) as e:
+                self._close_locked()
+                raise OSError(f"git cat-file failed reading {sha}: {e}")
+
+            if not header:
+                self._close_locked()
+                raise OSError(f"git cat-file exited reading {sha}")
+
+            # Format: "<sha> <type> <size>\n" or "<sha> missing\n"
+            parts = header.split()
+            if len(parts) != 3:
+                raise FileNotFoundError(f"Git object not found: {sha}")
+
+            size = int(parts[2])
+            data = process.stdout.read(size)
+            process.stdout.read(1)  # Trailing newline
+            return data
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the cat-file process if it isn't running; caller holds lock."""
+        if self._process is None or self._process.poll() is not None:
+            # Security: list-form argv without a shell; the process lives for
+            # the whole scan, so safe_subprocess_run's one-shot model doesn't fit
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repository_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    def close(self) -> None:
+        """Stop the cat-file process (a later read restarts it)."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        """Implementation of close(); caller must hold the lock."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            # cat-file exits cleanly at EOF on stdin
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            process.stdout.close()
+
+
+class GitTree:
+    """Files of one commit, listed with ``git ls-tree`` and read on demand.
+
+    Used instead of a working tree when assessing a specific revision or a
+    bare repository: nothing is checked out and nothing outside the git
+    directory is read. Symlinks to files in the same commit are resolved;
+    other symlinks and submodule contents are treated as absent.
+    """
+
+    def __init__(self, repository_path: Path, rev: str = "HEAD"):
+        """Resolve a revision and list its files.
+
+        Args:
+            repository_path: Path to a git repository (bare or not)
+            rev: Commit-ish to read (branch, tag, SHA, ...)
+
+        Raises:
+            ValueError: If rev is not a commit in the repository
+        """
+        self.repository_path = Path(repository_path)
+        self.rev = rev
+        self.commit, self.commit_time = self._resolve_commit(rev)
+        self._entries: dict[str, TreeEntry] = {}
+        self._children: dict[str, set[str]] = {"": set()}
+        self._load()
+        self.reader = GitObjectReader(self.repository_path)
+
+    @property
+    def root(self) -> "TreePath":
+        """Path-like view of the top of the tree."""
+        return TreePath(self, "")
+
+    def _resolve_commit(self, rev: str) -> tuple[str, int]:
+        """Resolve rev to a commit SHA and its commit timestamp."""
+        if not rev or rev.startswith("-"):
+            raise ValueError(f"Invalid revision: {rev!r}")
+
+        # Security: Use safe_subprocess_run for validation and limits
+        result = safe_subprocess_run(
+            ["git", "show", "-s", "--format=%H %ct", f"{rev}^{{commit}}", "--"],
+            cwd=self.repository_path,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            raise ValueError(f"Unknown revision: {rev}")
+
+        sha, _, timestamp = result.stdout.strip().partition(" ")
+        return sha, int(timestamp)
+
+    def _load(self) -> None:
+        """List blobs and directories via git ls-tree -r -l -z."""
+        # Security: Use safe_subprocess_run for validation and limits
+        result = safe_subprocess_run(
+            ["git", "ls-tree", "-r", "-l", "-z", "--full-tree", self.commit],
+            cwd=self.repository_path,
+            capture_output=True,
+            timeout=60,
+            check=True,
+        )
+
+        symlinks = {}
+        for record in result.stdout.split(b"\0"):
+            if not record:
+                continue
+            # Format: "<mode> <type> <sha> <size>\t<path>"
+            meta, _, raw_path = record.partition(b"\t")
+            mode, obj_type, sha, size = meta.split()
+            path = os.fsdecode(raw_path)
+            if obj_type == b"commit":
+                # Submodule: a directory with no readable contents
+                self._add_dir(path)
+            elif obj_type != b"blob":
+                continue
+            elif mode == SYMLINK_MODE:
+                symlinks[path] = sha.decode("ascii")
+            else:
+                self._add_file(path, TreeEntry(sha.decode("ascii"), int(size)))
+
+        if symlinks:
+            self._resolve_symlinks(symlinks)
+
+    def _resolve_symlinks(self, symlinks: dict[str, str]) -> None:
+        """Alias symlinks that point at regular files in the same commit."""
+        reader = GitObjectReader(self.repository_path)
+        try:
+            for path, sha in symlinks.items():
+                target = os.fsdecode(reader.read(sha))
+                resolved = posixpath.normpath(
+                    posixpath.join(posixpath.dirname(path), target)
+                )
+                entry = self._entries.get(resolved)
+                if entry is not None:
+                    self._add_file(path, entry)
+        finally:
+            reader.close()
+
+    def _add_file(self, path: str, entry: TreeEntry) -> None:
+        """Record a file and its parent directories."""
+        self._entries[path] = entry
+        parent, _, name = path.rpartition("/")
+        self._add_dir(parent)
+        self._children[parent].add(name)
+
+    def _add_dir(self, path: str) -> None:
+        """Record a directory and its ancestors."""
+        if path in self._children:
+            return
+        self._children[path] = set()
+        parent, _, name = path.rpartition("/")
+        self._add_dir(parent)
+        self._children[parent].add(name)
+
+    def entries(self) -> list[tuple[str, TreeEntry]]:
+        """List (path, entry) for every file, sorted by path."""
+        return sorted(self._entries.items())
+
+    def get(self, path: str) -> TreeEntry | None:
+        """Get the entry for a file path, or None."""
+        return self._entries.get(path)
+
+    def is_file(self, path: str) -> bool:
+        """Check whether path is a file in the tree."""
+        return path in self._entries
+
+    def is_dir(self, path: str) -> bool:
+        """Check whether path is a directory in the tree."""
+        return path in self._children
+
+    def listdir(self, path: str) -> list[str]:
+        """List names directly inside a directory, sorted.
+
+        Raises:
+            NotADirectoryError: If path is not a directory in the tree
+        """
+        if path not in self._children:
+            raise NotADirectoryError(f"Not a directory in {self.rev}: {path}")
+        return sorted(self._children[path])
+
+    def read_bytes(self, path: str) -> bytes:
+        """Read a file's content from the object database.
+
+        Raises:
+            IsADirectoryError: If path is a directory
+            FileNotFoundError: If path is not in the tree
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            if path in self._children:
+                raise IsADirectoryError(f"Is a directory in {self.rev}: {path}")
+            raise FileNotFoundError(f"No such file in {self.rev}: {path}")
+        return self.reader.read(entry.sha)
+
+    def close(self) -> None:
+        """Stop the blob reader process."""
+        self.reader.close()
+
+    def __enter__(self) -> "GitTree":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class TreePath:
+    """Read-only, pathlib-style path inside a GitTree.
+
+    Supports the subset of ``pathlib.Path`` assessors use to read a
+    repository (``/``, exists, is_file, is_dir, open, read_text, read_bytes,
+    glob, rglob, iterdir, stat, relative_to), so the same assessor code runs
+    against a working tree or a commit. It deliberately has no
+    ``__fspath__``: passing one to ``open()`` or a subprocess fails instead
+    of silently reading the working tree.
+    """
+
+    __slots__ = ("_tree", "_path")
+
+    def __init__(self, tree: GitTree, path: str = ""):
+        """Initialize path.
+
+        Args:
+            tree: Tree the path belongs to
+            path: Normalized POSIX path relative to the tree root ("" = root)
+        """
+        self._tree = tree
+        self._path = path
+
+    def __truediv__(self, other) -> "TreePath":
+        return self.joinpath(other)
+
+    def joinpath(self, *others) -> "TreePath":
+        """Join path components (".." past the root yields a missing path)."""
+        path = posixpath.join(
+            self._path, *(PurePosixPath(o).as_posix() for o in others)
+        )
+        path = posixpath.normpath(path) if path else ""
+        return TreePath(self._tree, "" if path == "." else path)
+
+    @property
+    def name(self) -> str:
+        return PurePosixPath(self._path).name
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self._path).suffix
+
+    @property
+    def stem(self) -> str:
+        return PurePosixPath(self._path).stem
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        return PurePosixPath(self._path).parts
+
+    @property
+    def parent(self) -> "TreePath":
+        return TreePath(self._tree, self._path.rpartition("/")[0])
+
+    def as_posix(self) -> str:
+        """Path relative to the tree root."""
+        return self._path
+
+    def exists(self) -> bool:
+        return self._tree.is_file(self._path) or self._tree.is_dir(self._path)
+
+    def is_file(self) -> bool:
+        return self._tree.is_file(self._path)
+
+    def is_dir(self) -> bool:
+        return self._tree.is_dir(self._path)
+
+    def is_symlink(self) -> bool:
+        # Resolved symlinks appear as regular files
+        return False
+
+    def resolve(self) -> "TreePath":
+        return self
+
+    def read_bytes(self) -> bytes:
+        return self._tree.read_bytes(self._path)
+
+    def read_text(self, encoding: str | None = None, errors: str | None = None) -> str:
+        with self.open("r", encoding=encoding, errors=errors) as f:
+            return f.read()
+
+    def open(
+        self,
+        mode: str = "r",
+        buffering: int = -1,
+        encoding: str | None = None,
+        errors: str | None = None,
+        newline: str | None = None,
+    ):
+        """Open for reading, like Path.open (write modes are rejected)."""
+        if set(mode) & set("wax+"):
+            raise PermissionError(f"Git tree is read-only: {self}")
+
+        data = io.BytesIO(self.read_bytes())
+        if "b" in mode:
+            return data
+        return io.TextIOWrapper(
+            data, encoding=encoding or "utf-8", errors=errors, newline=newline
+        )
+
+    def iterdir(self) -> Iterator["TreePath"]:
+        for name in self._tree.listdir(self._path):
+            yield TreePath(self._tree, posixpath.join(self._path, name))
+
+    def glob(self, pattern: str) -> Iterator["TreePath"]:
+        """Yield paths matching a relative glob pattern ("**" recurses)."""
+        if not self.is_dir():
+            return iter(())
+        return self._glob(PurePosixPath(pattern).parts)
+
+    def rglob(self, pattern: str) -> Iterator["TreePath"]:
+        return self.glob(f"**/{pattern}")
+
+    def _glob(self, parts: tuple[str, ...]) -> Iterator["TreePath"]:
+        """Match pattern parts against the subtree below this directory."""
+        if not parts:
+            yield self
+            return
+
+        head, rest = parts[0], parts[1:]
+        if head == "**":
+            yield from self._glob(rest)
+            for child in self.iterdir():
+                if child.is_dir():
+                    yield from child._glob(parts)
+            return
+
+        for child in self.iterdir():
+            if fnmatchcase(child.name, head) and (not rest or child.is_dir()):
+                yield from child._glob(rest)
+
+    def stat(self) -> os.stat_result:
+        """Stat-like result with size and the commit time as mtime.
+
+        Raises:
+            FileNotFoundError: If the path is not in the tree
+        """
+        if self.is_file():
+            mode, size = stat.S_IFREG | 0o644, self._tree.get(self._path).size
+        elif self.is_dir():
+            mode, size = stat.S_IFDIR | 0o755, 0
+        else:
+            raise FileNotFoundError(f"No such file in {self._tree.rev}: {self}")
+
+        mtime = self._tree.commit_time
+        return os.stat_result((mode, 0, 0, 1, 0, 0, size, mtime, mtime, mtime))
+
+    def relative_to(self, other) -> PurePosixPath:
+        """Path relative to another TreePath (or the repository path for root)."""
+        if isinstance(other, TreePath):
+            base = other._path
+        elif Path(other) == self._tree.repository_path:
+            base = ""
+        else:
+            raise ValueError(f"{self} is not relative to {other}")
+
+        if not base:
+            return PurePosixPath(self._path)
+        return PurePosixPath(self._path).relative_to(base)
+
+    def __str__(self) -> str:
+        root = str(self._tree.repository_path)
+        return posixpath.join(root, self._path) if self._path else root
+
+    def __repr__(self) -> str:
+        return f"TreePath({self._tree.rev!r}, {self._path!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TreePath):
+            return NotImplemented
+        return self._tree is other._tree and self._path == other._path
+
+    def __hash__(self) -> int:
+        return hash((id(self._tree), self._path))
+
+    def __lt__(self, other: "TreePath") -> bool:
+        return self._path < other._path
@@ -0,0 +1,144 @@
+"""Score a repository across its commit history."""
+
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from ..models.config import Config
+from ..models.history import HistoryPoint, ScoreHistory
+from ..utils.subprocess_utils import safe_subprocess_run
+from .file_metrics_cache import FileMetricsCache
+from .scanner import Scanner
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryScanner:
+    """Assess a series of commits, oldest first, reusing work between them.
+
+    Every commit is read from the git object database (no checkouts) and
+    scanned incrementally against the previous commit's assessment: an
+    assessor only re-runs when files matching its input patterns changed,
+    and per-file metrics for blobs seen in earlier commits come from one
+    shared metrics cache. A 50-commit history therefore costs roughly one
+    full scan plus the work for what actually changed.
+    """
+
+    def __init__(
+        self,
+        repository_path: Path,
+        config: Config | None = None,
+        metrics_cache: FileMetricsCache | None = None,
+    ):
+        """Initialize history scanner.
+
+        Args:
+            repository_path: Path to git repository (bare or not)
+            config: User configuration (optional)
+            metrics_cache: Per-file metrics cache (in-memory if omitted; it is
+                shared by all commits either way)
+        """
+        self.repository_path = Path(repository_path)
+        self.config = config
+        self.metrics_cache = metrics_cache or FileMetricsCache()
+
+    def list_commits(
+        self,
+        max_commits: int | None = None,
+        since: str | None = None,
+        rev: str = "HEAD",
+    ) -> list[tuple[str, datetime]]:
+        """List first-parent commits reachable from rev, oldest first.
+
+        Args:
+            max_commits: Most recent N commits to include (None for all)
+            since: Only commits after this date (any format git accepts)
+            rev: Newest commit of the series
+
+        Returns:
+            List of (commit SHA, commit time in UTC)
+
+        Raises:
+            ValueError: If rev is invalid or unknown
+        """
+        if not rev or rev.startswith("-"):
+            raise ValueError(f"Invalid revision: {rev!r}")
+
+        cmd = ["git", "log", "--first-parent", "--format=%H %ct"]
+        if max_commits is not None:
+            cmd.append(f"--max-count={max_commits}")
+        if since is not None:
+            cmd.append(f"--since={since}")
+        cmd += [rev, "--"]
+
+        # Security: Use safe_subprocess_run for validation and limits
+        result = safe_subprocess_run(
+            cmd,
+            cwd=self.repository_path,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        if result.returncode != 0:
+            raise ValueError(f"Unknown revision: {rev}")
+
+        commits = []
+        for line in result.stdout.splitlines():
+            sha, _, timestamp = line.partition(" ")
+            commits.append(
+                (sha, datetime.fromtimestamp(int(timestamp), tz=timezone.utc))
+            )
+
+        # git log lists newest first
+        commits.reverse()
+        return commits
+
+    def run(
+        self,
+        assessors: list,
+        commits: list[tuple[str, datetime]],
+        version: str = "unknown",
+        jobs: int = 1,
+        on_point: Callable[[int, HistoryPoint], None] | None = None,
+    ) -> ScoreHistory:
+        """Assess commits in order and collect the score series.
+
+        Args:
+            assessors: Assessor instances to run
+            commits: (SHA, commit time) pairs, oldest first (see list_commits)
+            version: AgentReady version string
+            jobs: Number of assessors to run concurrently per commit
+            on_point: Progress callback with (index, point) after each commit
+
+        Returns:
+            ScoreHistory with one point per commit
+        """
+        name = self.repository_path.name.removesuffix(".git")
+        history = ScoreHistory(repository_name=name)
+
+        previous = None
+        for index, (sha, committed_at) in enumerate(commits):
+            scanner = Scanner(
+                self.repository_path,
+                self.config,
+                metrics_cache=self.metrics_cache,
+                rev=sha,
+            )
+            assessment = scanner.scan(
+                assessors,
+                version=version,
+                command="history",
+                jobs=jobs,
+                baseline=previous,
+            )
+
+            point = HistoryPoint.from_assessment(assessment, committed_at)
+            history.points.append(point)
+            if on_point is not None:
+                on_point(index, point)
+
+            # Only the latest assessment is kept; points are all we need
+            previous = assessment
+
+        return history
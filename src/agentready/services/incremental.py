@@ -0,0 +1,265 @@
+"""Incremental re-assessment from a previous assessment report."""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field, replace
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePosixPath
+
+from ..models.assessment import Assessment
+from ..models.config import Config
+from ..models.finding import Finding
+from ..models.repository import Repository
+from ..utils.subprocess_utils import safe_subprocess_run
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IncrementalPlan:
+    """Which findings can be reused from a previous assessment.
+
+    Attributes:
+        base_commit: Commit of the previous assessment (None if unusable)
+        changed_files: Paths changed since base_commit (committed, staged,
+            unstaged and untracked)
+        reused: Reusable findings by attribute ID
+        reason: Why nothing is reused, if the previous report is unusable
+    """
+
+    base_commit: str | None = None
+    changed_files: list[str] = field(default_factory=list)
+    reused: dict[str, Finding] = field(default_factory=dict)
+    reason: str | None = None
+
+
+class IncrementalPlanner:
+    """Decide which assessors must re-run since a previous report.
+
+    An assessor's previous finding is reused verbatim when none of the
+    files matching its ``input_patterns`` changed between the previous
+    report's commit and the current working tree (or the revision being
+    assessed), and none of them had uncommitted changes when the previous
+    report was made. Assessors without
+    declared inputs always re-run. The previous report is ignored entirely
+    if it was produced by a different AgentReady version or configuration,
+    or if the set of detected languages changed (which affects
+    applicability).
+    """
+
+    def __init__(self, repository_path: Path, rev: str | None = None):
+        """Initialize planner.
+
+        Args:
+            repository_path: Path to git repository root
+            rev: Commit being assessed instead of the working tree (optional)
+        """
+        self.repository_path = Path(repository_path)
+        self.rev = rev
+
+    def plan(
+        self,
+        previous_report: Path,
+        assessors: list,
+        repository: Repository,
+        config: Config | None = None,
+        version: str = "unknown",
+    ) -> IncrementalPlan:
+        """Build incremental plan against a previous JSON report.
+
+        Args:
+            previous_report: Path to previous assessment JSON
+            assessors: Assessors about to run
+            repository: Current repository model
+            config: Current configuration
+            version: Current AgentReady version
+
+        Returns:
+            IncrementalPlan (with empty ``reused`` if a full run is needed)
+        """
+        try:
+            with open(previous_report, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+            base_commit = previous["repository"]["commit_hash"]
+            previous_languages = previous["repository"].get("languages", {})
+            previous_changes = previous["repository"].get("working_tree_changes")
+            previous_findings = {
+                f["attribute"]["id"]: f for f in previous.get("findings", [])
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            return IncrementalPlan(reason=f"Previous report unreadable: {e}")
+
+        previous_version = (previous.get("metadata") or {}).get("agentready_version")
+        if previous_version != version:
+            return IncrementalPlan(
+                reason=f"AgentReady version changed ({previous_version} -> {version})"
+            )
+
+        # Round-trip through JSON so it compares like the stored report
+        current_config = (
+            json.loads(json.dumps(config.to_dict(), default=str)) if config else None
+        )
+        if previous.get("config") != current_config:
+            return IncrementalPlan(reason="Configuration changed")
+
+        findings = {}
+        for attribute_id, data in previous_findings.items():
+            try:
+                findings[attribute_id] = Finding.from_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Cannot reuse {attribute_id}: {e}")
+
+        return self._plan_against(
+            base_commit,
+            previous_languages,
+            previous_changes,
+            findings,
+            assessors,
+            repository,
+        )
+
+    def plan_from_assessment(
+        self, previous: Assessment, assessors: list, repository: Repository
+    ) -> IncrementalPlan:
+        """Build incremental plan against an assessment from this process.
+
+        Unlike plan(), version and configuration are not compared: the
+        caller is expected to use the same ones (e.g., when walking history).
+
+        Args:
+            previous: Assessment of an earlier commit
+            assessors: Assessors about to run
+            repository: Current repository model
+
+        Returns:
+            IncrementalPlan (with empty ``reused`` if a full run is needed)
+        """
+        return self._plan_against(
+            previous.repository.commit_hash,
+            previous.repository.languages,
+            previous.repository.working_tree_changes,
+            {f.attribute.id: f for f in previous.findings},
+            assessors,
+            repository,
+        )
+
+    def _plan_against(
+        self,
+        base_commit: str,
+        previous_languages: dict[str, int],
+        previous_changes: list[str] | None,
+        previous_findings: dict[str, Finding],
+        assessors: list,
+        repository: Repository,
+    ) -> IncrementalPlan:
+        """Select reusable findings given the previous commit's results."""
+        if set(previous_languages) != set(repository.languages):
+            return IncrementalPlan(reason="Detected languages changed")
+
+        # Files that were dirty or untracked in the previous run may since
+        # have been reverted or deleted, which no diff against base_commit
+        # shows; without a record of them nothing can be trusted
+        if previous_changes is None:
+            return IncrementalPlan(
+                reason="Previous report does not record working tree changes"
+            )
+
+        try:
+            changed_files = self._changed_files(base_commit)
+        except Exception as e:
+            return IncrementalPlan(reason=f"Cannot diff against {base_commit[:8]}: {e}")
+        changed_files = sorted(set(changed_files).union(previous_changes))
+
+        reused = {}
+        for assessor in assessors:
+            finding = previous_findings.get(assessor.attribute_id)
+            if finding is None or finding.status == "error":
+                continue
+
+            patterns = assessor.input_patterns
+            if patterns is None or any(
+                matches_any(path, patterns) for path in changed_files
+            ):
+                continue
+
+            # Keep current attribute metadata; no work was done this run
+            reused[assessor.attribute_id] = replace(
+                finding, attribute=assessor.attribute, profile=None
+            )
+
+        return IncrementalPlan(
+            base_commit=base_commit,
+            changed_files=changed_files,
+            reused=reused,
+        )
+
+    def _changed_files(self, base_commit: str) -> list[str]:
+        """List files changed since base_commit.
+
+        Compares against the working tree, or against ``rev`` when assessing
+        a commit (in which case untracked files are irrelevant).
+
+        Raises:
+            subprocess.CalledProcessError: If base_commit is unknown (e.g.,
+                not present in a shallow clone)
+        """
+        target = [self.rev] if self.rev is not None else []
+        # Security: Use safe_subprocess_run for validation and limits
+        diff = safe_subprocess_run(
+            ["git", "diff", "--name-only", "--no-renames", "-z", base_commit]
+            + target
+            + ["--"],
+            cwd=self.repository_path,
+            capture_output=True,
+            timeout=60,
+            check=True,
+        )
+        if self.rev is not None:
+            return sorted(os.fsdecode(p) for p in diff.stdout.split(b"\0") if p)
+
+        untracked = safe_subprocess_run(
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+            cwd=self.repository_path,
+            capture_output=True,
+            timeout=60,
+            check=True,
+        )
+
+        paths = set()
+        for output in (diff.stdout, untracked.stdout):
+            paths.update(os.fsdecode(p) for p in output.split(b"\0") if p)
+        return sorted(paths)
+
+
+def working_tree_changes(repository_path: Path) -> list[str] | None:
+    """Paths of a working tree that differ from HEAD.
+
+    Recorded with each assessment so a later incremental run also re-checks
+    files whose uncommitted changes have since been reverted or deleted.
+
+    Args:
+        repository_path: Path to git repository root
+
+    Returns:
+        Modified, staged and untracked paths, or None if git fails
+    """
+    try:
+        return IncrementalPlanner(repository_path)._changed_files("HEAD")
+    except Exception as e:
+        logger.debug(f"Cannot list working tree changes: {e}")
+        return None
+
+
+def matches_any(path: str, patterns: tuple[str, ...]) -> bool:
+    """Check a repository-relative POSIX path against input patterns.
+
+    Patterns containing "/" match the whole path; others match the file
+    name at any depth (see BaseAssessor.input_patterns).
+    """
+    name = PurePosixPath(path).name
+    for pattern in patterns:
+        target = path if "/" in pattern else name
+        if fnmatchcase(target, pattern):
+            return True
+    return False
@@ -1,19 +1,38 @@
 """Language detection service using file extension analysis."""
 
 import logging
-from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ..utils.subprocess_utils import safe_subprocess_run
+from .file_metrics_cache import FileMetricsCache
+
+if TYPE_CHECKING:
+    from .repository_index import RepositoryIndex
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class RepositoryStats:
+    """Language and size statistics from one traversal of tracked files.
+
+    Attributes:
+        languages: Languages meeting the file threshold, with file counts
+        total_files: Total tracked files
+        total_lines: Non-blank lines across all text files
+    """
+
+    languages: dict[str, int]
+    total_files: int
+    total_lines: int
+
+
 class LanguageDetector:
     """Detects programming languages in a repository.
 
     Uses file extension mapping and respects .gitignore patterns
-    via git ls-files for accuracy.
+    via the shared RepositoryIndex (one git ls-files call per scan).
     """
 
     # Extension to language mapping
@@ -57,14 +76,32 @@ class LanguageDetector:
         ".xml": "XML",
     }
 
-    def __init__(self, repository_path: Path):
+    def __init__(
+        self,
+        repository_path: Path,
+        index: "RepositoryIndex | None" = None,
+        metrics_cache: FileMetricsCache | None = None,
+    ):
         """Initialize language detector for repository.
 
         Args:
             repository_path: Path to git repository root
+            index: Shared file index (built on first use if not provided)
+            metrics_cache: Per-file metrics cache keyed by blob SHA (optional)
         """
         self.repository_path = repository_path
         self.minimum_file_threshold = 3  # Need 3+ files to count as "using language"
+        self._index = index
+        self.metrics_cache = metrics_cache
+
+    @property
+    def index(self) -> "RepositoryIndex":
+        """File index shared by all detection methods."""
+        if self._index is None:
+            from .repository_index import RepositoryIndex
+
+            self._index = RepositoryIndex.build(self.repository_path)
+        return self._index
 
     def detect_languages(self) -> dict[str, int]:
         """Detect languages in repository with file counts.
@@ -75,44 +112,9 @@ class LanguageDetector:
 
         Only includes languages with >= minimum_file_threshold files.
         """
-        language_counts = defaultdict(int)
-
-        # Try git ls-files first (respects .gitignore)
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files"],
-                cwd=self.repository_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            files = result.stdout.strip().split("\n")
-        except Exception:
-            # Fall back to pathlib walk (less accurate)
-            files = [
-                str(f.relative_to(self.repository_path))
-                for f in self.repository_path.rglob("*")
-                if f.is_file()
-            ]
-
-        # Count files by language
-        for file_path in files:
-            if not file_path.strip():
-                continue
-
-            path = Path(file_path)
-            suffix = path.suffix.lower()
-
-            if suffix in self.EXTENSION_MAP:
-                language = self.EXTENSION_MAP[suffix]
-                language_counts[language] += 1
-
-        # Filter by minimum threshold
         return {
             lang: count
-            for lang, count in language_counts.items()
+            for lang, count in self.index.language_counts().items()
             if count >= self.minimum_file_threshold
         }
 
@@ -122,21 +124,7 @@ class LanguageDetector:
         Returns:
             Total file count
         """
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files"],
-                cwd=self.repository_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            files = result.stdout.strip().split("\n")
-            return len([f for f in files if f.strip()])
-        except Exception:
-            # Fall back to pathlib
-            return sum(1 for _ in self.repository_path.rglob("*") if _.is_file())
+        return len(self.index)
 
     def count_total_lines(self) -> int:
         """Count total lines of code in repository.
@@ -147,38 +135,31 @@ class LanguageDetector:
         Note: This is a simple implementation. For production use,
         consider using a dedicated tool like cloc or tokei.
         """
-        total_lines = 0
-
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files"],
-                cwd=self.repository_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            files = result.stdout.strip().split("\n")
-        except Exception:
-            files = [
-                str(f.relative_to(self.repository_path))
-                for f in self.repository_path.rglob("*")
-                if f.is_file()
-            ]
-
-        for file_path in files:
-            if not file_path.strip():
-                continue
-
-            full_path = self.repository_path / file_path
-
-            # Only count text files (skip binaries)
-            try:
-                with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                    total_lines += sum(1 for line in f if line.strip())
-            except (OSError, UnicodeDecodeError):
-                # Skip binary files or unreadable files
-                continue
-
-        return total_lines
+        return self.analyze().total_lines
+
+    def analyze(self, workers: int = 1) -> RepositoryStats:
+        """Compute languages, file count and line count in one pass.
+
+        Languages and file counts come from the index; lines come from a
+        single chunked, binary-aware read of each text file not already in
+        the metrics cache.
+
+        Args:
+            workers: Worker processes for line counting (1 = in-process)
+
+        Returns:
+            RepositoryStats for the repository
+        """
+        if self.metrics_cache is None:
+            self.metrics_cache = FileMetricsCache()
+
+        entries = list(self.index)
+        metrics = self.metrics_cache.line_metrics_many(
+            self.repository_path, entries, workers=workers
+        )
+
+        return RepositoryStats(
+            languages=self.detect_languages(),
+            total_files=len(entries),
+            total_lines=sum(m.non_blank_lines for m in metrics.values() if m),
+        )
@@ -0,0 +1,345 @@
+"""Parse-once AST cache shared by all Python-aware assessors."""
+
+import ast
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .file_metrics_cache import PYTHON_SUMMARY
+
+if TYPE_CHECKING:
+    from .file_metrics_cache import FileMetricsCache
+    from .repository_index import RepositoryIndex
+
+logger = logging.getLogger(__name__)
+
+# Default memory bound for cached source + AST, measured in source bytes.
+# ASTs are roughly an order of magnitude larger than their source.
+DEFAULT_MAX_SOURCE_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ParsedModule:
+    """Source text and AST of a single Python file.
+
+    Attributes:
+        path: POSIX path relative to repository root
+        source: Decoded UTF-8 source
+        tree: Parsed module AST
+    """
+
+    path: str
+    source: str
+    tree: ast.Module
+
+
+# Definitions inside a function body that are measured as their own blocks
+_NESTED_BLOCKS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def cyclomatic_complexity(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
+    """McCabe cyclomatic complexity of a function body, counted like radon.
+
+    Starts at 1 and adds one per if/elif, conditional expression, assert,
+    loop (plus its else), except handler, try-else, comprehension (plus
+    each of its ifs), match case, and extra boolean operand. Nested
+    functions and classes are excluded; they are separate blocks.
+
+    Args:
+        node: Function definition
+
+    Returns:
+        Complexity (>= 1)
+    """
+    complexity = 1
+    stack = list(node.body)
+    while stack:
+        child = stack.pop()
+        if isinstance(child, _NESTED_BLOCKS):
+            continue
+
+        if isinstance(child, ast.Assert):
+            # Like radon, an assert counts once regardless of its condition
+            complexity += 1
+            continue
+
+        if isinstance(child, (ast.If, ast.IfExp)):
+            complexity += 1
+        elif isinstance(child, (ast.For, ast.AsyncFor, ast.While)):
+            complexity += 1 + bool(child.orelse)
+        elif isinstance(child, (ast.Try, ast.TryStar)):
+            complexity += len(child.handlers) + bool(child.orelse)
+        elif isinstance(child, ast.comprehension):
+            complexity += 1 + len(child.ifs)
+        elif isinstance(child, ast.BoolOp):
+            complexity += len(child.values) - 1
+        elif isinstance(child, ast.Match):
+            complexity += len(child.cases)
+
+        stack.extend(ast.iter_child_nodes(child))
+
+    return complexity
+
+
+@dataclass(frozen=True)
+class FunctionSummary:
+    """Facts about one function definition collected by the fused walk."""
+
+    name: str
+    is_async: bool
+    has_return_annotation: bool
+    has_param_annotations: bool
+    has_docstring: bool
+    complexity: int = 1
+
+    def to_list(self) -> list:
+        """Compact positional form for the metrics cache."""
+        return [
+            self.name,
+            self.is_async,
+            self.has_return_annotation,
+            self.has_param_annotations,
+            self.has_docstring,
+            self.complexity,
+        ]
+
+
+@dataclass(frozen=True)
+class ClassSummary:
+    """Facts about one class definition collected by the fused walk."""
+
+    name: str
+    has_docstring: bool
+
+    def to_list(self) -> list:
+        """Compact positional form for the metrics cache."""
+        return [self.name, self.has_docstring]
+
+
+@dataclass(frozen=True)
+class ModuleSummary:
+    """Per-file facts shared by the type, naming and docstring assessors.
+
+    Attributes:
+        path: POSIX path relative to repository root
+        has_module_docstring: Whether the module has a docstring
+        functions: All function definitions (including nested and methods)
+        classes: All class definitions (including nested)
+    """
+
+    path: str
+    has_module_docstring: bool
+    functions: tuple[FunctionSummary, ...]
+    classes: tuple[ClassSummary, ...]
+
+    @classmethod
+    def from_tree(cls, path: str, tree: ast.Module) -> "ModuleSummary":
+        """Collect functions, classes, annotations and docstrings in one walk."""
+        functions = []
+        classes = []
+
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions.append(
+                    FunctionSummary(
+                        name=node.name,
+                        is_async=isinstance(node, ast.AsyncFunctionDef),
+                        has_return_annotation=node.returns is not None,
+                        has_param_annotations=any(
+                            arg.annotation is not None for arg in node.args.args
+                        ),
+                        has_docstring=bool(ast.get_docstring(node)),
+                        complexity=cyclomatic_complexity(node),
+                    )
+                )
+            elif isinstance(node, ast.ClassDef):
+                classes.append(
+                    ClassSummary(
+                        name=node.name,
+                        has_docstring=bool(ast.get_docstring(node)),
+                    )
+                )
+
+        return cls(
+            path=path,
+            has_module_docstring=bool(ast.get_docstring(tree)),
+            functions=tuple(functions),
+            classes=tuple(classes),
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to content-only dictionary (path excluded) for caching."""
+        return {
+            "has_module_docstring": self.has_module_docstring,
+            "functions": [f.to_list() for f in self.functions],
+            "classes": [c.to_list() for c in self.classes],
+        }
+
+    @classmethod
+    def from_dict(cls, path: str, data: dict) -> "ModuleSummary":
+        """Create summary for path from a cached dictionary."""
+        return cls(
+            path=path,
+            has_module_docstring=data["has_module_docstring"],
+            functions=tuple(FunctionSummary(*f) for f in data["functions"]),
+            classes=tuple(ClassSummary(*c) for c in data["classes"]),
+        )
+
+
+class PythonASTCache:
+    """Per-scan cache of parsed Python modules with a memory bound.
+
+    Each tracked .py file is read and parsed at most once while it stays
+    in the cache; parsed modules are evicted least-recently-used once the
+    cached source exceeds ``max_source_bytes``. Module summaries from the
+    fused walk are small and kept for the whole scan, so assessors that
+    only need counts never trigger a re-parse after eviction.
+
+    With a file index and metrics cache, summaries are also looked up by
+    git blob SHA, so files unchanged since any earlier scan are not parsed.
+    """
+
+    def __init__(
+        self,
+        repository_path: Path,
+        max_source_bytes: int = DEFAULT_MAX_SOURCE_BYTES,
+        index: "RepositoryIndex | None" = None,
+        metrics_cache: "FileMetricsCache | None" = None,
+    ):
+        """Initialize cache.
+
+        Args:
+            repository_path: Repository root (Path, or TreePath for a commit)
+            max_source_bytes: Upper bound on cached source size before eviction
+            index: File index providing blob SHAs (optional)
+            metrics_cache: Content-addressed cache for summaries (optional)
+        """
+        self.repository_path = (
+            Path(repository_path)
+            if isinstance(repository_path, str)
+            else repository_path
+        )
+        self.max_source_bytes = max_source_bytes
+        self.index = index
+        self.metrics_cache = metrics_cache
+        self._modules: OrderedDict[str, ParsedModule] = OrderedDict()
+        self._cached_bytes = 0
+        self._summaries: dict[str, ModuleSummary | None] = {}
+        self._unparseable: set[str] = set()
+        self.parse_count = 0
+        # Assessors may run concurrently (Scanner jobs > 1); a file being
+        # parsed by one thread is waited on, not parsed again, by the others
+        self._lock = threading.RLock()
+
+    def get(self, rel_path: str) -> ParsedModule | None:
+        """Get source and AST for a file, parsing it if not cached.
+
+        Args:
+            rel_path: POSIX path relative to repository root
+
+        Returns:
+            ParsedModule, or None if the file can't be read or parsed
+        """
+        with self._lock:
+            return self._get_locked(rel_path)
+
+    def _get_locked(self, rel_path: str) -> ParsedModule | None:
+        """Implementation of get(); caller must hold the lock."""
+        module = self._modules.get(rel_path)
+        if module is not None:
+            self._modules.move_to_end(rel_path)
+            return module
+
+        if self._summaries.get(rel_path, True) is None:
+            # Previously failed to read or parse
+            return None
+
+        try:
+            with (self.repository_path / rel_path).open("r", encoding="utf-8") as f:
+                source = f.read()
+            tree = ast.parse(source, filename=rel_path)
+        except OSError:
+            # Skip files that can't be read
+            self._summaries[rel_path] = None
+            return None
+        except (UnicodeDecodeError, SyntaxError, ValueError):
+            # Skip files that can't be parsed; this depends only on content
+            self._summaries[rel_path] = None
+            self._unparseable.add(rel_path)
+            return None
+
+        self.parse_count += 1
+        module = ParsedModule(path=rel_path, source=source, tree=tree)
+        self._store(module)
+        return module
+
+    def summary(self, rel_path: str) -> ModuleSummary | None:
+        """Get fused-walk summary for a file.
+
+        Args:
+            rel_path: POSIX path relative to repository root
+
+        Returns:
+            ModuleSummary, or None if the file can't be read or parsed
+        """
+        with self._lock:
+            if rel_path in self._summaries:
+                return self._summaries[rel_path]
+
+            blob_sha = self._blob_sha(rel_path)
+            if self.metrics_cache is not None:
+                cached = self.metrics_cache.get(PYTHON_SUMMARY, blob_sha)
+                if cached is not None:
+                    summary = (
+                        None
+                        if cached.get("unparseable")
+                        else ModuleSummary.from_dict(rel_path, cached)
+                    )
+                    self._summaries[rel_path] = summary
+                    return summary
+
+            module = self._get_locked(rel_path)
+            if module is None:
+                if self.metrics_cache is not None and rel_path in self._unparseable:
+                    self.metrics_cache.put(
+                        PYTHON_SUMMARY, blob_sha, {"unparseable": True}
+                    )
+                return None
+
+            summary = ModuleSummary.from_tree(rel_path, module.tree)
+            self._summaries[rel_path] = summary
+            if self.metrics_cache is not None:
+                self.metrics_cache.put(PYTHON_SUMMARY, blob_sha, summary.to_dict())
+            return summary
+
+    def summaries(self, rel_paths: list[str]) -> list[ModuleSummary]:
+        """Get summaries for all parseable files among rel_paths."""
+        if self.metrics_cache is not None:
+            self.metrics_cache.prefetch(
+                PYTHON_SUMMARY, (self._blob_sha(p) for p in rel_paths)
+            )
+        return [s for s in (self.summary(p) for p in rel_paths) if s is not None]
+
+    def _blob_sha(self, rel_path: str) -> str | None:
+        """Blob SHA for a path whose working-tree content matches git."""
+        if self.index is None:
+            return None
+        entry = self.index.get(rel_path)
+        return entry.blob_sha if entry else None
+
+    def _store(self, module: ParsedModule) -> None:
+        """Insert module and evict least-recently-used entries over the bound."""
+        size = len(module.source)
+        self._modules[module.path] = module
+        self._cached_bytes += size
+
+        while self._cached_bytes > self.max_source_bytes and len(self._modules) > 1:
+            _, evicted = self._modules.popitem(last=False)
+            self._cached_bytes -= len(evicted.source)
+            logger.debug(f"Evicted parsed module from AST cache: {evicted.path}")
+
+    def __len__(self) -> int:
+        return len(self._modules)
@@ -0,0 +1,282 @@
+"""Per-scan index of repository files shared by all assessors."""
+
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from ..utils.subprocess_utils import safe_subprocess_run
+from .language_detector import LanguageDetector
+
+if TYPE_CHECKING:
+    from .git_tree import GitTree
+
+logger = logging.getLogger(__name__)
+
+# Directories whose contents are third-party or tool-generated, even when tracked
+VENDORED_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "vendor",
+        "third_party",
+        "site-packages",
+        "__pycache__",
+        ".pytest_cache",
+    }
+)
+
+# File name suffixes produced by build tools or code generators
+GENERATED_SUFFIXES = (".min.js", ".min.css", "_pb2.py", "_pb2_grpc.py", ".pb.go")
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """A single file entry in the repository index.
+
+    Attributes:
+        path: POSIX path relative to repository root
+        size: File size in bytes (0 if missing from working tree)
+        extension: Lowercase file suffix (e.g., ".py"), empty if none
+        language: Language from LanguageDetector.EXTENSION_MAP, or None
+        blob_sha: Git blob SHA of the file content; None for untracked walks
+            and for files modified in the working tree since staging, so it
+            can safely key content-addressed caches
+        vendored: True for vendored or generated files
+    """
+
+    path: str
+    size: int
+    extension: str
+    language: str | None
+    blob_sha: str | None
+    vendored: bool
+
+    @property
+    def name(self) -> str:
+        """File name without directory components."""
+        return PurePosixPath(self.path).name
+
+
+class RepositoryIndex:
+    """Index of all tracked files in a repository, built once per scan.
+
+    Built from a single ``git ls-files -s -z`` call so that the language
+    detector and every assessor share the same file listing instead of
+    spawning their own subprocesses or walking the tree with rglob.
+    Falls back to a filesystem walk when git is unavailable.
+    """
+
+    def __init__(self, root: Path, files: list[IndexedFile]):
+        """Initialize index.
+
+        Args:
+            root: Repository root path (or TreePath for a commit tree)
+            files: Indexed files in git ls-files order
+        """
+        self.root = Path(root) if isinstance(root, str) else root
+        self._files = files
+        self._by_path = {f.path: f for f in files}
+
+    @classmethod
+    def build(cls, root: Path) -> "RepositoryIndex":
+        """Build index for repository.
+
+        Args:
+            root: Path to git repository root
+
+        Returns:
+            RepositoryIndex with one entry per tracked file
+        """
+        root = Path(root)
+        try:
+            entries = cls._list_git_entries(root)
+        except Exception as e:
+            logger.debug(f"git ls-files failed, falling back to walk: {e}")
+            entries = [(path, None) for path in cls._walk_files(root)]
+        else:
+            try:
+                modified = cls._list_modified(root)
+            except Exception as e:
+                logger.debug(f"git diff failed, not trusting blob SHAs: {e}")
+                modified = None
+            entries = [
+                (path, None if modified is None or path in modified else sha)
+                for path, sha in entries
+            ]
+
+        files = []
+        for rel_path, blob_sha in entries:
+            try:
+                size = os.stat(root / rel_path).st_size
+            except OSError:
+                # Tracked but deleted from working tree, or unreadable
+                size = 0
+            files.append(cls._make_entry(rel_path, size, blob_sha))
+
+        return cls(root, files)
+
+    @classmethod
+    def from_tree(cls, tree: "GitTree") -> "RepositoryIndex":
+        """Build index for a commit read from the object database.
+
+        Sizes and blob SHAs come straight from ``git ls-tree -l``, so no
+        working tree is touched and every entry has a trusted blob SHA.
+
+        Args:
+            tree: Commit tree
+
+        Returns:
+            RepositoryIndex with one entry per file in the commit
+        """
+        files = [
+            cls._make_entry(path, entry.size, entry.sha)
+            for path, entry in tree.entries()
+        ]
+        return cls(tree.root, files)
+
+    @staticmethod
+    def _list_git_entries(root: Path) -> list[tuple[str, str]]:
+        """List tracked files with blob SHAs via git ls-files -s -z.
+
+        Returns:
+            List of (relative_path, blob_sha) tuples
+        """
+        # Security: Use safe_subprocess_run for validation and limits
+        result = safe_subprocess_run(
+            ["git", "ls-files", "-s", "-z"],
+            cwd=root,
+            capture_output=True,
+            timeout=30,
+            check=True,
+        )
+
+        entries = []
+        seen = set()
+        for record in result.stdout.split(b"\0"):
+            if not record:
+                continue
+            # Format: "<mode> <sha> <stage>\t<path>"
+            meta, _, raw_path = record.partition(b"\t")
+            path = os.fsdecode(raw_path)
+            if path in seen:
+                # Unmerged paths appear once per stage
+                continue
+            seen.add(path)
+            parts = meta.split()
+            blob_sha = parts[1].decode("ascii") if len(parts) >= 2 else None
+            entries.append((path, blob_sha))
+
+        return entries
+
+    @staticmethod
+    def _list_modified(root: Path) -> set[str]:
+        """List tracked files whose working-tree content differs from the index."""
+        # Security: Use safe_subprocess_run for validation and limits
+        result = safe_subprocess_run(
+            ["git", "diff", "--name-only", "--no-renames", "-z"],
+            cwd=root,
+            capture_output=True,
+            timeout=30,
+            check=True,
+        )
+        return {os.fsdecode(p) for p in result.stdout.split(b"\0") if p}
+
+    @staticmethod
+    def _walk_files(root: Path) -> list[str]:
+        """Walk filesystem for non-git directories (less accurate)."""
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d != ".git")
+            for filename in sorted(filenames):
+                full_path = Path(dirpath) / filename
+                paths.append(full_path.relative_to(root).as_posix())
+        return paths
+
+    @staticmethod
+    def _make_entry(rel_path: str, size: int, blob_sha: str | None) -> IndexedFile:
+        """Create index entry with derived extension, language, vendored flag."""
+        pure = PurePosixPath(rel_path)
+        extension = pure.suffix.lower()
+        vendored = any(part in VENDORED_DIRS for part in pure.parts[:-1]) or (
+            pure.name.endswith(GENERATED_SUFFIXES)
+        )
+        return IndexedFile(
+            path=rel_path,
+            size=size,
+            extension=extension,
+            language=LanguageDetector.EXTENSION_MAP.get(extension),
+            blob_sha=blob_sha,
+            vendored=vendored,
+        )
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __iter__(self) -> Iterator[IndexedFile]:
+        return iter(self._files)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._by_path
+
+    def get(self, path: str) -> IndexedFile | None:
+        """Get entry by relative POSIX path."""
+        return self._by_path.get(path)
+
+    def files(
+        self,
+        extensions: Iterable[str] | None = None,
+        include_vendored: bool = True,
+    ) -> list[IndexedFile]:
+        """Get indexed files, optionally filtered.
+
+        Args:
+            extensions: Lowercase suffixes to include (e.g., {".py"}); None for all
+            include_vendored: Whether to include vendored/generated files
+
+        Returns:
+            Matching files in index order
+        """
+        wanted = set(extensions) if extensions is not None else None
+        return [
+            f
+            for f in self._files
+            if (wanted is None or f.extension in wanted)
+            and (include_vendored or not f.vendored)
+        ]
+
+    def paths(
+        self,
+        extensions: Iterable[str] | None = None,
+        include_vendored: bool = True,
+    ) -> list[str]:
+        """Get relative paths of indexed files (see files() for filters)."""
+        return [f.path for f in self.files(extensions, include_vendored)]
+
+    def find(self, name: str, include_vendored: bool = True) -> list[IndexedFile]:
+        """Find files by exact file name anywhere in the tree.
+
+        Args:
+            name: File name to match (e.g., "openapi.yaml")
+            include_vendored: Whether to include vendored/generated files
+
+        Returns:
+            Matching files in index order
+        """
+        return [
+            f
+            for f in self._files
+            if f.name == name and (include_vendored or not f.vendored)
+        ]
+
+    def language_counts(self) -> dict[str, int]:
+        """Count files per detected language (no minimum threshold)."""
+        counts: dict[str, int] = defaultdict(int)
+        for f in self._files:
+            if f.language:
+                counts[f.language] += 1
+        return dict(counts)
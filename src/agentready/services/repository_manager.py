@@ -1,14 +1,68 @@
 """Secure repository manager for cloning and validating repositories."""
 
+import logging
+import os
 import shutil
+import sqlite3
 import subprocess
-from pathlib import Path
+import threading
+import time
+from collections import Counter
+from pathlib import Path, PurePosixPath
 from typing import Optional
 from urllib.parse import urlparse
+from uuid import uuid4
 
 from ..models import Repository
 from ..models.batch_assessment import FailureTracker
 
+logger = logging.getLogger(__name__)
+
+# Clone bookkeeping (last use and size per clone), kept inside the cache dir
+CLONE_INDEX_DB = ".clone-index.db"
+
+# Name prefix of evicted clones renamed aside for deletion
+EVICTED_PREFIX = ".evicted-"
+
+# Default limit for one git clone or fetch
+CLONE_TIMEOUT_SECONDS = 300
+
+# git error output that points at a transient failure, by FailureTracker type
+TRANSIENT_CLONE_ERRORS = {
+    "timeout": ("timed out",),
+    "rate_limit": ("rate limit", "returned error: 429", "too many requests"),
+    "network_error": (
+        "could not resolve host",
+        "connection reset",
+        "connection refused",
+        "failed to connect",
+        "early eof",
+        "remote end hung up",
+        "rpc failed",
+        "returned error: 502",
+        "returned error: 503",
+        "returned error: 504",
+        "temporarily unavailable",
+    ),
+}
+
+
+def classify_clone_error(message: str) -> str:
+    """FailureTracker error type for a failed clone.
+
+    Args:
+        message: Error message from clone_repository()
+
+    Returns:
+        A retryable type (timeout, rate_limit, network_error) for
+        transient failures, clone_error otherwise
+    """
+    text = message.lower()
+    for error_type, markers in TRANSIENT_CLONE_ERRORS.items():
+        if any(marker in text for marker in markers):
+            return error_type
+    return "clone_error"
+
 
 class RepositoryManager:
     """Manages secure cloning and preparation of repositories for assessment.
@@ -19,19 +73,55 @@ class RepositoryManager:
     - Shallow cloning for efficiency (depth=1)
     - Disabled Git hooks during clone
     - Parameterized validation
+
+    Cached clones are reused across runs. With ``refresh`` they are updated
+    by a shallow fetch and reset instead of being re-cloned. The last use
+    and disk size of every clone are recorded, and with ``max_cache_bytes``
+    the least recently used clones are deleted once the cache outgrows the
+    quota. Clones handed out by clone_repository() are never evicted or
+    refreshed until every caller has given them back with release().
+
+    Each remote URL gets its own clone directory, laid out as
+    <cache_dir>/<host>/<owner>/<name>, so forks with the same repository
+    name do not share a clone.
     """
 
     # Allowed protocols for cloning
     ALLOWED_PROTOCOLS = {"https", "git"}
 
-    def __init__(self, cache_dir: Path):
+    def __init__(
+        self,
+        cache_dir: Path,
+        refresh: bool = False,
+        max_cache_bytes: Optional[int] = None,
+    ):
         """Initialize repository manager.
 
         Args:
             cache_dir: Directory where repositories will be cloned
+            refresh: Update existing clones to the remote HEAD before use
+            max_cache_bytes: Disk quota for cached clones (None for no limit)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh = refresh
+        self.max_cache_bytes = max_cache_bytes
+        self.db_path = self.cache_dir / CLONE_INDEX_DB
+        self._lock = threading.Lock()
+        # Clone index key -> number of callers currently using the clone
+        self._in_use: Counter[str] = Counter()
+        # One lock per clone directory, so concurrent callers for the same
+        # URL never clone into, refresh or delete it at the same time
+        self._directory_locks: dict[Path, threading.Lock] = {}
+
+        # Finish deleting clones evicted by a run that was interrupted
+        for tombstone in self.cache_dir.glob(f"{EVICTED_PREFIX}*"):
+            shutil.rmtree(tombstone, ignore_errors=True)
+
+    @staticmethod
+    def _is_remote(url: str) -> bool:
+        """Whether url names a remote repository rather than a local path."""
+        return "://" in url.strip()
 
     def validate_url(self, url: str) -> tuple[bool, Optional[str]]:
         """Validate repository URL for security.
@@ -87,7 +177,7 @@ class RepositoryManager:
         url = url.strip()
 
         # For local paths
-        if not url.startswith(("http://", "https://", "git://")):
+        if not self._is_remote(url):
             return Path(url).name
 
         # For URLs, extract from the last part of the path
@@ -96,10 +186,28 @@ class RepositoryManager:
         path = parsed.path.rstrip("/").rstrip(".git")
         return Path(path).name or "repository"
 
+    def clone_directory(self, url: str) -> Path:
+        """Cache directory for a remote repository URL.
+
+        Example: https://github.com/user/repo.git -> <cache_dir>/github.com/user/repo
+
+        Args:
+            url: Remote repository URL
+
+        Returns:
+            Clone directory; its name is get_repository_name_from_url(url)
+        """
+        parsed = urlparse(url.strip())
+        owner = PurePosixPath(parsed.path.rstrip("/")).parent.parts
+        parts = [parsed.hostname or "localhost"]
+        parts += [part for part in owner if part not in ("/", ".", "..")]
+        return self.cache_dir.joinpath(*parts, self.get_repository_name_from_url(url))
+
     def clone_repository(
         self,
         url: str,
         target_dir: Optional[Path] = None,
+        timeout: float = CLONE_TIMEOUT_SECONDS,
     ) -> tuple[bool, Path, Optional[str]]:
         """Clone repository securely.
 
@@ -108,6 +216,7 @@ class RepositoryManager:
         Args:
             url: Repository URL or local path
             target_dir: Target directory (if None, uses cache_dir)
+            timeout: Seconds allowed for the clone (or refresh)
 
         Returns:
             Tuple of (success, repo_path, error_message)
@@ -118,13 +227,12 @@ class RepositoryManager:
             return False, Path(), error
 
         # For local paths, just return the path
-        if not url.startswith(("http://", "https://", "git://")):
+        if not self._is_remote(url):
             return True, Path(url).resolve(), None
 
         # Determine target directory
         if target_dir is None:
-            repo_name = self.get_repository_name_from_url(url)
-            target_dir = self.cache_dir / repo_name
+            target_dir = self.clone_directory(url)
         else:
             target_dir = Path(target_dir).resolve()
 
@@ -138,9 +246,38 @@ class RepositoryManager:
                 f"Target directory is outside cache directory: {target_dir}",
             )
 
-        # Skip if already cloned
+        with self._directory_lock(target_dir):
+            return self._clone_or_reuse(url, target_dir, timeout)
+
+    def _directory_lock(self, target_dir: Path) -> threading.Lock:
+        """Lock serializing clone_repository() calls for one directory."""
+        with self._lock:
+            return self._directory_locks.setdefault(
+                target_dir.resolve(), threading.Lock()
+            )
+
+    def _clone_or_reuse(
+        self, url: str, target_dir: Path, timeout: float
+    ) -> tuple[bool, Path, Optional[str]]:
+        """Clone into target_dir, or reuse (and refresh) the clone there.
+
+        Must be called with the directory's lock held.
+        """
+        # Reuse an existing clone, updating it first in refresh mode unless
+        # another caller is still reading it
         if (target_dir / ".git").exists():
-            return True, target_dir, None
+            if not self.refresh or self._is_in_use(target_dir):
+                self._record_use(url, target_dir)
+                return True, target_dir, None
+
+            error = self._refresh_clone(target_dir, timeout)
+            if error is None:
+                self._record_use(url, target_dir, measure=True)
+                self.enforce_quota()
+                return True, target_dir, None
+
+            logger.warning(f"{error}; cloning {url} again")
+            shutil.rmtree(target_dir)
 
         # Create parent directories
         target_dir.parent.mkdir(parents=True, exist_ok=True)
@@ -160,7 +297,7 @@ class RepositoryManager:
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=300,  # 5-minute timeout
+                timeout=timeout,
             )
 
             if result.returncode != 0:
@@ -169,6 +306,8 @@ class RepositoryManager:
                     shutil.rmtree(target_dir)
                 return False, Path(), f"Clone failed: {result.stderr}"
 
+            self._record_use(url, target_dir, measure=True)
+            self.enforce_quota()
             return True, target_dir, None
 
         except subprocess.TimeoutExpired:
@@ -182,26 +321,248 @@ class RepositoryManager:
                 shutil.rmtree(target_dir)
             return False, Path(), f"Clone error: {str(e)}"
 
+    def _refresh_clone(
+        self, repo_path: Path, timeout: float = CLONE_TIMEOUT_SECONDS
+    ) -> Optional[str]:
+        """Update a shallow clone to the remote HEAD in place.
+
+        A depth-1 fetch only transfers the new tip, which is far cheaper
+        than cloning again.
+
+        Args:
+            repo_path: Path to an existing clone
+            timeout: Seconds allowed for the whole refresh
+
+        Returns:
+            Error message, or None if the clone is now up to date
+        """
+        git = ["git", "-C", str(repo_path)]
+        commands = [
+            [*git, "fetch", "--depth=1", "--quiet", "origin", "HEAD"],
+            [*git, "reset", "--hard", "--quiet", "FETCH_HEAD"],
+            # Leave exactly what a fresh clone would contain
+            [*git, "clean", "-ffdxq"],
+        ]
+        deadline = time.monotonic() + timeout
+        try:
+            for cmd in commands:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=max(deadline - time.monotonic(), 0.001),
+                )
+                if result.returncode != 0:
+                    return f"Refresh failed: {result.stderr.strip()}"
+        except subprocess.TimeoutExpired:
+            return "Refresh operation timed out"
+        except Exception as e:
+            return f"Refresh error: {str(e)}"
+        return None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the clone index, creating its table if needed."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS clones (
+                name TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                last_used REAL NOT NULL,
+                size_bytes INTEGER NOT NULL
+            )
+            """
+        )
+        return conn
+
+    def _clone_key(self, repo_path: Path) -> Optional[str]:
+        """Clone index key: path relative to the cache dir (None if outside)."""
+        try:
+            return (
+                Path(repo_path)
+                .resolve()
+                .relative_to(self.cache_dir.resolve())
+                .as_posix()
+            )
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _directory_size(path: Path) -> int:
+        """Total size of regular files under path, without following links."""
+        total = 0
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, filename)).st_size
+                except OSError:
+                    continue
+        return total
+
+    def _record_use(self, url: str, repo_path: Path, measure: bool = False) -> None:
+        """Mark a cached clone as used now and as in use until released.
+
+        Args:
+            url: Repository URL
+            repo_path: Clone directory inside the cache
+            measure: Re-measure the clone's size (after cloning or refreshing)
+        """
+        name = self._clone_key(repo_path)
+        if name is None:
+            return
+        with self._lock:
+            self._in_use[name] += 1
+            try:
+                with self._connect() as conn:
+                    row = conn.execute(
+                        "SELECT size_bytes FROM clones WHERE name = ?", (name,)
+                    ).fetchone()
+                    if measure or row is None:
+                        size = self._directory_size(repo_path)
+                    else:
+                        size = row[0]
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO clones
+                        (name, url, last_used, size_bytes)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (name, url, time.time(), size),
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Clone index update failed: {e}")
+
+    def release(self, repo_path: Path) -> None:
+        """Give back a clone from clone_repository().
+
+        The clone may be evicted or refreshed again once every caller that
+        received it has released it.
+
+        Args:
+            repo_path: Path returned by clone_repository()
+        """
+        name = self._clone_key(repo_path)
+        if name is None:
+            return
+        with self._lock:
+            self._in_use[name] -= 1
+            if self._in_use[name] <= 0:
+                del self._in_use[name]
+        self.enforce_quota()
+
+    def _is_in_use(self, repo_path: Path) -> bool:
+        """Whether a clone has been handed out and not released yet."""
+        name = self._clone_key(repo_path)
+        with self._lock:
+            return name is not None and self._in_use[name] > 0
+
+    def cache_size(self) -> int:
+        """Recorded disk usage of all cached clones, in bytes."""
+        try:
+            with self._lock, self._connect() as conn:
+                return conn.execute(
+                    "SELECT COALESCE(SUM(size_bytes), 0) FROM clones"
+                ).fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def enforce_quota(self) -> list[Path]:
+        """Delete least recently used clones until the cache fits its quota.
+
+        Clones currently in use, or being cloned or refreshed, are skipped.
+        Each victim's directory lock is held until it has been renamed out
+        of the way, and the deletion itself happens without holding any
+        lock.
+
+        Returns:
+            Paths of evicted clones
+        """
+        if self.max_cache_bytes is None:
+            return []
+
+        victims: list[tuple[Path, threading.Lock]] = []
+        with self._lock:
+            try:
+                with self._connect() as conn:
+                    rows = conn.execute(
+                        "SELECT name, size_bytes FROM clones ORDER BY last_used"
+                    ).fetchall()
+                    total = sum(size for _, size in rows)
+                    for name, size in rows:
+                        if total <= self.max_cache_bytes:
+                            break
+                        if self._in_use[name] > 0:
+                            continue
+                        repo_path = self.cache_dir / name
+                        lock = self._directory_locks.setdefault(
+                            repo_path.resolve(), threading.Lock()
+                        )
+                        # Busy means a clone or refresh is under way
+                        if not lock.acquire(blocking=False):
+                            continue
+                        victims.append((repo_path, lock))
+                        conn.execute("DELETE FROM clones WHERE name = ?", (name,))
+                        total -= size
+                    conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Clone cache eviction failed: {e}")
+                for _, lock in victims:
+                    lock.release()
+                return []
+
+        evicted = []
+        for repo_path, lock in victims:
+            tombstone = self.cache_dir / f"{EVICTED_PREFIX}{uuid4().hex}"
+            try:
+                if repo_path.exists():
+                    repo_path.rename(tombstone)
+            except OSError as e:
+                # Left in place without an index row; the next use re-adds it
+                logger.warning(f"Could not evict cached clone {repo_path}: {e}")
+                continue
+            finally:
+                lock.release()
+            shutil.rmtree(tombstone, ignore_errors=True)
+            self._remove_empty_parents(repo_path)
+            logger.info(f"Evicted cached clone {repo_path.name}")
+            evicted.append(repo_path)
+        return evicted
+
+    def _remove_empty_parents(self, repo_path: Path) -> None:
+        """Remove host and owner directories left empty by an eviction."""
+        parent = repo_path.parent
+        while parent != self.cache_dir and parent.is_relative_to(self.cache_dir):
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+
     def prepare_repository(
         self,
         url: str,
+        timeout: float = CLONE_TIMEOUT_SECONDS,
     ) -> tuple[bool, Repository, Optional[FailureTracker]]:
         """Clone and prepare repository for assessment.
 
         Args:
             url: Repository URL or local path
+            timeout: Seconds allowed for cloning
 
         Returns:
-            Tuple of (success, Repository_model, failure_tracker)
+            Tuple of (success, Repository_model, failure_tracker); transient
+            clone failures get a retryable error type (see
+            classify_clone_error)
         """
         # Clone repository
-        success, repo_path, error = self.clone_repository(url)
+        success, repo_path, error = self.clone_repository(url, timeout=timeout)
         if not success:
+            error = error or "Unknown error during cloning"
             failure = FailureTracker(
                 repository_url=url,
-                error_type="clone_error",
-                error_message=error or "Unknown error during cloning",
-                can_retry=True,
+                error_type=classify_clone_error(error),
+                error_message=error,
             )
             return False, None, failure
 
@@ -249,6 +610,8 @@ class RepositoryManager:
             return True, repository, None
 
         except Exception as e:
+            # Nobody will use the clone, so do not keep it pinned
+            self.release(repo_path)
             failure = FailureTracker(
                 repository_url=url,
                 error_type="validation_error",
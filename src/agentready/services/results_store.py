@@ -0,0 +1,434 @@
+"""Normalized SQLite store of batch assessment results."""
+
+import logging
+import sqlite3
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..models.batch_assessment import BatchAssessment
+
+logger = logging.getLogger(__name__)
+
+# Default database file, kept in the batch output directory so that
+# every batch run there is added to the same store
+RESULTS_DB_FILENAME = "assessments.db"
+
+# Bump when the schema changes
+SCHEMA_VERSION = 1
+
+# How long a writer waits for another process's transaction before failing
+BUSY_TIMEOUT_SECONDS = 30.0
+
+# Results written per executemany() round
+_WRITE_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    agentready_version TEXT,
+    command TEXT,
+    total_repositories INTEGER NOT NULL,
+    successful_assessments INTEGER NOT NULL,
+    average_score REAL
+);
+
+CREATE TABLE IF NOT EXISTS repositories (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    name TEXT
+);
+
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY,
+    batch_id TEXT NOT NULL REFERENCES batches(batch_id) ON DELETE CASCADE,
+    repository_id INTEGER NOT NULL REFERENCES repositories(id),
+    status TEXT NOT NULL,
+    commit_hash TEXT,
+    branch TEXT,
+    primary_language TEXT,
+    overall_score REAL,
+    certification_level TEXT,
+    assessed_at TEXT,
+    duration_seconds REAL,
+    error_type TEXT,
+    error TEXT,
+    UNIQUE(batch_id, repository_id)
+);
+
+CREATE TABLE IF NOT EXISTS attributes (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    category TEXT,
+    tier INTEGER,
+    default_weight REAL
+);
+
+CREATE TABLE IF NOT EXISTS findings (
+    assessment_id INTEGER NOT NULL
+        REFERENCES assessments(id) ON DELETE CASCADE,
+    attribute_id TEXT NOT NULL REFERENCES attributes(id),
+    status TEXT NOT NULL,
+    score REAL,
+    measured_value TEXT,
+    threshold TEXT,
+    PRIMARY KEY (assessment_id, attribute_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_assessments_repository
+    ON assessments(repository_id);
+CREATE INDEX IF NOT EXISTS idx_assessments_score ON assessments(overall_score);
+CREATE INDEX IF NOT EXISTS idx_assessments_language
+    ON assessments(primary_language);
+CREATE INDEX IF NOT EXISTS idx_assessments_commit ON assessments(commit_hash);
+CREATE INDEX IF NOT EXISTS idx_findings_attribute
+    ON findings(attribute_id, status);
+CREATE INDEX IF NOT EXISTS idx_findings_status ON findings(status);
+"""
+
+
+def _primary_language(languages: Optional[dict]) -> str:
+    """Language with the most files (as Repository.primary_language)."""
+    if not languages:
+        return "Unknown"
+    return max(languages, key=languages.get)
+
+
+class ResultsStore:
+    """Batch results in normalized, indexed SQLite tables.
+
+    Each batch added with add_batch() becomes one row in batches, one row
+    per repository in assessments (failed repositories included, with
+    status "failed"), and one row per attribute in findings. Repositories
+    and attributes are shared across batches, so the same repository can
+    be compared between runs.
+
+    Results are read from the batch one at a time and written in chunks
+    with executemany(), so adding a streamed batch of thousands of
+    repositories never holds more than a chunk in memory.
+
+    Schema: batches(batch_id, timestamp, ...), repositories(id, url, name),
+            assessments(id, batch_id, repository_id, status, commit_hash,
+            primary_language, overall_score, ...),
+            attributes(id, name, category, tier, default_weight),
+            findings(assessment_id, attribute_id, status, score, ...)
+    """
+
+    def __init__(self, db_path: Path, read_only: bool = False):
+        """Open (and create, unless read_only) a results database.
+
+        Args:
+            db_path: SQLite database file
+            read_only: Open an existing database without write access
+
+        Raises:
+            FileNotFoundError: If read_only and the database does not exist
+        """
+        self.db_path = Path(db_path)
+        self.read_only = read_only
+        if read_only:
+            if not self.db_path.is_file():
+                raise FileNotFoundError(f"No results database at {self.db_path}")
+            self._conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                timeout=BUSY_TIMEOUT_SECONDS,
+            )
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def add_batch(self, batch_assessment: BatchAssessment) -> int:
+        """Store a batch, replacing an earlier copy of the same batch.
+
+        Args:
+            batch_assessment: Batch to store (results are read once)
+
+        Returns:
+            Number of repository results stored
+        """
+        summary = batch_assessment.summary
+        conn = self._conn
+        count = 0
+        with conn:
+            # Take the write lock up front: assessment IDs are assigned here
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM batches WHERE batch_id = ?",
+                (batch_assessment.batch_id,),
+            )
+            conn.execute(
+                """
+                INSERT INTO batches (batch_id, timestamp, agentready_version,
+                    command, total_repositories, successful_assessments,
+                    average_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    batch_assessment.batch_id,
+                    batch_assessment.timestamp.isoformat(),
+                    batch_assessment.agentready_version,
+                    batch_assessment.command,
+                    summary.total_repositories,
+                    summary.successful_assessments,
+                    summary.average_score,
+                ),
+            )
+            next_id = conn.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM assessments"
+            ).fetchone()[0]
+
+            results = batch_assessment.result_dicts()
+            while chunk := list(islice(results, _WRITE_CHUNK)):
+                self._write_chunk(batch_assessment.batch_id, chunk, next_id)
+                next_id += len(chunk)
+                count += len(chunk)
+
+        logger.debug(f"Stored {count} results of batch {batch_assessment.batch_id}")
+        return count
+
+    def _write_chunk(self, batch_id: str, chunk: list[dict], first_id: int) -> None:
+        """Insert one chunk of RepositoryResult.to_dict() records."""
+        repositories = []
+        assessments = []
+        attributes = {}
+        findings = []
+
+        for assessment_id, data in enumerate(chunk, first_id):
+            url = data["repository_url"]
+            assessment = data.get("assessment")
+            if assessment is None:
+                repositories.append((url, None))
+                assessments.append(
+                    (assessment_id, batch_id, url, "failed")
+                    + (None,) * 6
+                    + (
+                        data.get("duration_seconds"),
+                        data.get("error_type"),
+                        data.get("error"),
+                    )
+                )
+                continue
+
+            repository = assessment["repository"]
+            repositories.append((url, repository.get("name")))
+            assessments.append(
+                (
+                    assessment_id,
+                    batch_id,
+                    url,
+                    "success",
+                    repository.get("commit_hash"),
+                    repository.get("branch"),
+                    _primary_language(repository.get("languages")),
+                    assessment.get("overall_score"),
+                    assessment.get("certification_level"),
+                    assessment.get("timestamp"),
+                    data.get("duration_seconds"),
+                    None,
+                    None,
+                )
+            )
+            for finding in assessment.get("findings", []):
+                attribute = finding["attribute"]
+                attributes[attribute["id"]] = (
+                    attribute["id"],
+                    attribute.get("name"),
+                    attribute.get("category"),
+                    attribute.get("tier"),
+                    attribute.get("default_weight"),
+                )
+                findings.append(
+                    (
+                        assessment_id,
+                        attribute["id"],
+                        finding["status"],
+                        finding.get("score"),
+                        _text(finding.get("measured_value")),
+                        _text(finding.get("threshold")),
+                    )
+                )
+
+        conn = self._conn
+        conn.executemany(
+            """
+            INSERT INTO repositories (url, name) VALUES (?, ?)
+            ON CONFLICT(url) DO UPDATE SET name = COALESCE(excluded.name, name)
+            """,
+            repositories,
+        )
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO assessments (id, batch_id, repository_id,
+                status, commit_hash, branch, primary_language, overall_score,
+                certification_level, assessed_at, duration_seconds,
+                error_type, error)
+            VALUES (?, ?, (SELECT id FROM repositories WHERE url = ?),
+                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            assessments,
+        )
+        conn.executemany(
+            """
+            INSERT INTO attributes (id, name, category, tier, default_weight)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET name = excluded.name,
+                category = excluded.category, tier = excluded.tier,
+                default_weight = excluded.default_weight
+            """,
+            attributes.values(),
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?, ?)", findings
+        )
+
+    def batches(self) -> list[dict]:
+        """Stored batches, newest first."""
+        return self.query(
+            """
+            SELECT batch_id, timestamp, total_repositories,
+                   successful_assessments, average_score
+            FROM batches ORDER BY timestamp DESC
+            """
+        )
+
+    def resolve_batch(self, batch: Optional[str] = None, offset: int = 0) -> str:
+        """Find a batch by ID or ID prefix.
+
+        Args:
+            batch: Batch ID or unique prefix (None for the newest batches)
+            offset: Without batch, 0 for the newest batch, 1 for the one
+                before it, and so on
+
+        Returns:
+            Full batch ID
+
+        Raises:
+            ValueError: If no batch, or more than one, matches
+        """
+        if batch is None:
+            rows = self._conn.execute(
+                "SELECT batch_id FROM batches ORDER BY timestamp DESC "
+                "LIMIT 1 OFFSET ?",
+                (offset,),
+            ).fetchall()
+            if not rows:
+                raise ValueError(f"Database holds fewer than {offset + 1} batch(es)")
+            return rows[0][0]
+
+        rows = self._conn.execute(
+            "SELECT batch_id FROM batches WHERE batch_id = ? "
+            "OR substr(batch_id, 1, length(?)) = ?",
+            (batch, batch, batch),
+        ).fetchall()
+        ids = {row[0] for row in rows}
+        if batch in ids:
+            return batch
+        if len(ids) != 1:
+            raise ValueError(
+                f"No batch matches {batch!r}"
+                if not ids
+                else f"Batch ID {batch!r} is ambiguous"
+            )
+        return ids.pop()
+
+    def failing(
+        self,
+        attribute_id: str,
+        batch: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> list[dict]:
+        """Repositories failing an attribute in one batch.
+
+        Args:
+            attribute_id: Attribute ID (e.g., "claude_md_file")
+            batch: Batch ID or prefix (default: newest batch)
+            language: Only repositories with this primary language
+
+        Returns:
+            Rows with repository, language, finding score and overall score,
+            lowest finding score first
+        """
+        sql = """
+            SELECT r.url AS repository, a.primary_language AS language,
+                   f.score AS attribute_score, a.overall_score,
+                   a.commit_hash
+            FROM findings f
+            JOIN assessments a ON a.id = f.assessment_id
+            JOIN repositories r ON r.id = a.repository_id
+            WHERE f.attribute_id = ? AND f.status = 'fail' AND a.batch_id = ?
+        """
+        params = [attribute_id, self.resolve_batch(batch)]
+        if language is not None:
+            sql += " AND a.primary_language = ? COLLATE NOCASE"
+            params.append(language)
+        return self.query(sql + " ORDER BY f.score, r.url", params)
+
+    def score_delta(
+        self, old_batch: Optional[str] = None, new_batch: Optional[str] = None
+    ) -> list[dict]:
+        """Score change of each repository assessed in both batches.
+
+        Args:
+            old_batch: Batch ID or prefix (default: second-newest batch)
+            new_batch: Batch ID or prefix (default: newest batch)
+
+        Returns:
+            Rows with repository, both scores and the delta, largest drop
+            first
+        """
+        old_id = self.resolve_batch(old_batch, offset=1)
+        new_id = self.resolve_batch(new_batch, offset=0)
+        return self.query(
+            """
+            SELECT r.url AS repository, o.overall_score AS old_score,
+                   n.overall_score AS new_score,
+                   ROUND(n.overall_score - o.overall_score, 1) AS delta
+            FROM assessments o
+            JOIN assessments n ON n.repository_id = o.repository_id
+            JOIN repositories r ON r.id = o.repository_id
+            WHERE o.batch_id = ? AND n.batch_id = ?
+              AND o.status = 'success' AND n.status = 'success'
+            ORDER BY delta, r.url
+            """,
+            (old_id, new_id),
+        )
+
+    def query(self, sql: str, params: Iterable = ()) -> list[dict]:
+        """Run a query and return its rows as dictionaries.
+
+        Args:
+            sql: SQL statement
+            params: Bound parameters
+
+        Returns:
+            One dictionary per row, keyed by column name
+        """
+        with closing(self._conn.execute(sql, tuple(params))) as cursor:
+            if cursor.description is None:
+                return []
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _text(value) -> Optional[str]:
+    """Store measured values and thresholds as text."""
+    return None if value is None else str(value)
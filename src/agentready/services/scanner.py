@@ -2,6 +2,7 @@
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -12,7 +13,13 @@ from ..models.config import Config
 from ..models.finding import Finding
 from ..models.metadata import AssessmentMetadata
 from ..models.repository import Repository
+from .assessor_profiler import AssessorProfiler
+from .file_metrics_cache import FileMetricsCache
+from .git_tree import GitTree, is_bare_repository
+from .incremental import IncrementalPlanner, working_tree_changes
 from .language_detector import LanguageDetector
+from .python_ast_cache import PythonASTCache
+from .repository_index import RepositoryIndex
 from .research_loader import ResearchLoader
 from .scorer import Scorer
 
@@ -37,25 +44,43 @@ class Scanner:
     - Track progress
     """
 
-    def __init__(self, repository_path: Path, config: Config | None = None):
+    def __init__(
+        self,
+        repository_path: Path,
+        config: Config | None = None,
+        metrics_cache: FileMetricsCache | None = None,
+        rev: str | None = None,
+    ):
         """Initialize scanner for repository.
 
         Args:
-            repository_path: Path to git repository root
+            repository_path: Path to git repository root (or bare repository)
             config: User configuration (optional)
+            metrics_cache: Persistent per-file metrics cache shared across
+                scans (optional; in-memory for this scan if omitted)
+            rev: Commit to assess from the object database instead of the
+                working tree (defaults to HEAD for bare repositories)
 
         Raises:
             ValueError: If repository is invalid
         """
         self.repository_path = repository_path
         self.config = config
+        self.metrics_cache = metrics_cache
+        self.rev = rev
         self.scorer = Scorer()
+        # Seconds spent per stage by the last scan()
+        self.stage_timings: dict[str, float] = {}
 
         # Validate repository
         self._validate_repository()
 
+        if self.rev is None and not (self.repository_path / ".git").exists():
+            # Bare repository: there is no working tree to read
+            self.rev = "HEAD"
+
     def _validate_repository(self):
-        """Validate repository has .git directory per FR-017.
+        """Validate repository has .git directory (or is bare) per FR-017.
 
         Raises:
             ValueError: If not a valid git repository
@@ -63,7 +88,9 @@ class Scanner:
         if not self.repository_path.exists():
             raise ValueError(f"Repository path does not exist: {self.repository_path}")
 
-        if not (self.repository_path / ".git").exists():
+        if not (self.repository_path / ".git").exists() and not is_bare_repository(
+            self.repository_path
+        ):
             raise ValueError(f"Not a git repository: {self.repository_path}")
 
     def scan(
@@ -72,6 +99,9 @@ class Scanner:
         verbose: bool = False,
         version: str = "unknown",
         command: str | None = None,
+        jobs: int = 1,
+        baseline: Path | Assessment | None = None,
+        reuse: dict[str, Finding] | None = None,
     ) -> Assessment:
         """Execute full assessment workflow.
 
@@ -80,6 +110,13 @@ class Scanner:
             verbose: Enable detailed progress logging
             version: AgentReady version string
             command: CLI command executed (reconstructed from sys.argv if None)
+            jobs: Number of assessors to run concurrently (1 = sequential)
+            baseline: Previous assessment JSON (or an Assessment from this
+                process); findings whose input files are unchanged since its
+                commit are reused instead of re-assessed
+            reuse: Findings already known to be valid for this exact commit
+                and assessor version (e.g., from the assessment cache), by
+                attribute ID; their assessors are not run
 
         Returns:
             Complete Assessment with findings and scores
@@ -98,17 +135,38 @@ class Scanner:
             print(f"Scanning repository: {self.repository_path.name}")
 
         # Build Repository model
-        repository = self._build_repository_model(verbose)
+        repository = self._build_repository_model(verbose, jobs)
+        self.stage_timings = {"language_detection": time.time() - start_time}
 
         if verbose:
             print(f"Languages detected: {', '.join(repository.languages.keys())}")
             print(f"\nEvaluating {len(assessors)} attributes...")
 
+        reused = dict(reuse or {})
+        if baseline is not None:
+            reused.update(
+                self._plan_incremental(
+                    baseline, assessors, repository, version, verbose
+                )
+            )
+
         # Execute assessors with graceful degradation
-        findings = []
-        for assessor in assessors:
-            finding = self._execute_assessor(assessor, repository, verbose)
-            findings.append(finding)
+        assessors_start = time.time()
+        pending = [a for a in assessors if a.attribute_id not in reused]
+        try:
+            executed = iter(self._execute_assessors(pending, repository, verbose, jobs))
+        finally:
+            # Stop the blob reader; nothing reads the commit after assessors
+            if repository.tree is not None:
+                repository.tree.close()
+        findings = [
+            reused[a.attribute_id] if a.attribute_id in reused else next(executed)
+            for a in assessors
+        ]
+        self.stage_timings["assessors"] = time.time() - assessors_start
+
+        # Persist per-file metrics computed during this scan
+        repository.get_metrics_cache().flush()
 
         # Calculate scores
         overall_score = self.scorer.calculate_overall_score(findings, self.config)
@@ -160,11 +218,14 @@ class Scanner:
             metadata=metadata,
         )
 
-    def _build_repository_model(self, verbose: bool = False) -> Repository:
+    def _build_repository_model(
+        self, verbose: bool = False, jobs: int = 1
+    ) -> Repository:
         """Build Repository model with metadata and language detection.
 
         Args:
             verbose: Enable progress logging
+            jobs: Worker processes for line counting (1 = in-process)
 
         Returns:
             Repository model
@@ -175,6 +236,8 @@ class Scanner:
         # Git metadata
         repo = git.Repo(self.repository_path)
         name = self.repository_path.name
+        if repo.bare:
+            name = name.removesuffix(".git")
 
         # Handle detached HEAD state (e.g., in CI/CD)
         try:
@@ -183,7 +246,15 @@ class Scanner:
             # Detached HEAD - use commit hash or "HEAD"
             branch = "HEAD"
 
-        commit_hash = repo.head.commit.hexsha
+        tree = None
+        if self.rev is not None:
+            # Read the commit from the object database; never the working tree
+            tree = GitTree(self.repository_path, self.rev)
+            commit_hash = tree.commit
+            if self.rev != "HEAD":
+                branch = self.rev
+        else:
+            commit_hash = repo.head.commit.hexsha
 
         # Get remote URL (if available)
         try:
@@ -191,11 +262,19 @@ class Scanner:
         except Exception:
             url = None
 
+        # One file index per scan, shared by language detection and assessors
+        if tree is not None:
+            root = tree.root
+            file_index = RepositoryIndex.from_tree(tree)
+        else:
+            root = self.repository_path
+            file_index = RepositoryIndex.build(self.repository_path)
+
+        metrics_cache = self.metrics_cache or FileMetricsCache()
+
         # Language detection
-        detector = LanguageDetector(self.repository_path)
-        languages = detector.detect_languages()
-        total_files = detector.count_total_files()
-        total_lines = detector.count_total_lines()
+        detector = LanguageDetector(root, index=file_index, metrics_cache=metrics_cache)
+        stats = detector.analyze(workers=jobs)
 
         return Repository(
             path=self.repository_path,
@@ -203,16 +282,131 @@ class Scanner:
             url=url,
             branch=branch,
             commit_hash=commit_hash,
-            languages=languages,
-            total_files=total_files,
-            total_lines=total_lines,
+            languages=stats.languages,
+            total_files=stats.total_files,
+            total_lines=stats.total_lines,
             config=self.config,
+            file_index=file_index,
+            ast_cache=PythonASTCache(
+                root, index=file_index, metrics_cache=metrics_cache
+            ),
+            metrics_cache=metrics_cache,
+            tree=tree,
+            working_tree_changes=(
+                [] if tree is not None else working_tree_changes(self.repository_path)
+            ),
         )
 
+    def _plan_incremental(
+        self,
+        baseline: Path | Assessment,
+        assessors: list,
+        repository: Repository,
+        version: str,
+        verbose: bool = False,
+    ) -> dict[str, Finding]:
+        """Find previous findings that can be reused for this scan.
+
+        Args:
+            baseline: Previous assessment JSON report or Assessment
+            assessors: Assessors about to run
+            repository: Repository model
+            version: AgentReady version string
+            verbose: Enable progress logging
+
+        Returns:
+            Reusable findings by attribute ID (empty for a full run)
+        """
+        planner = IncrementalPlanner(self.repository_path, rev=self.rev)
+        if isinstance(baseline, Assessment):
+            plan = planner.plan_from_assessment(baseline, assessors, repository)
+        else:
+            plan = planner.plan(baseline, assessors, repository, self.config, version)
+
+        if verbose:
+            if plan.reason:
+                print(f"Full assessment: {plan.reason}")
+            else:
+                print(
+                    f"Incremental assessment: {len(plan.changed_files)} file(s) "
+                    f"changed since {plan.base_commit[:8]}, reusing "
+                    f"{len(plan.reused)}/{len(assessors)} finding(s)"
+                )
+
+        return plan.reused
+
+    def _execute_assessors(
+        self,
+        assessors: list,
+        repository: Repository,
+        verbose: bool = False,
+        jobs: int = 1,
+    ) -> list[Finding]:
+        """Execute all assessors, optionally on a thread pool.
+
+        Threads (rather than processes) let subprocess-bound assessors
+        (git, radon) overlap with AST work while still sharing the per-scan
+        file index and AST cache. Findings are always returned in assessor
+        order, regardless of completion order.
+
+        Args:
+            assessors: Assessor instances to run
+            repository: Repository model
+            verbose: Enable progress logging
+            jobs: Maximum concurrent assessors (1 = sequential)
+
+        Returns:
+            Findings in the same order as assessors
+        """
+        if jobs <= 1 or len(assessors) <= 1:
+            return [
+                self._execute_assessor(assessor, repository, verbose)
+                for assessor in assessors
+            ]
+
+        findings = []
+        with ThreadPoolExecutor(
+            max_workers=jobs, thread_name_prefix="assessor"
+        ) as executor:
+            # Progress lines would interleave across threads, so report in
+            # order as results are collected instead
+            futures = [
+                executor.submit(self._execute_assessor, assessor, repository, False)
+                for assessor in assessors
+            ]
+            for assessor, future in zip(assessors, futures):
+                finding = future.result()
+                if verbose:
+                    print(f"  [{assessor.attribute_id}] {_describe_status(finding)}")
+                findings.append(finding)
+
+        return findings
+
     def _execute_assessor(
         self, assessor, repository: Repository, verbose: bool = False
     ) -> Finding:
-        """Execute single assessor with error handling.
+        """Execute single assessor with error handling and profiling.
+
+        Records wall time, CPU time, files read, bytes read and subprocesses
+        spawned on the returned finding's ``profile``.
+
+        Args:
+            assessor: Assessor instance
+            repository: Repository model
+            verbose: Enable progress logging
+
+        Returns:
+            Finding (pass/fail/skipped/error/not_applicable)
+        """
+        with AssessorProfiler() as profiler:
+            finding = self._run_assessor(assessor, repository, verbose)
+        finding.profile = profiler.profile
+        return finding
+
+    def _run_assessor(
+        self, assessor, repository: Repository, verbose: bool = False
+    ) -> Finding:
+        """Run single assessor with error handling.
 
         Implements try-assess-skip pattern per research.md:
         - Check if applicable
@@ -290,3 +484,10 @@ class Scanner:
                 print(f"error ({type(e).__name__})")
 
             return Finding.error(assessor.attribute, reason=str(e))
+
+
+def _describe_status(finding: Finding) -> str:
+    """Short status description for verbose progress output."""
+    if finding.status in ("pass", "fail"):
+        return f"{finding.status} ({finding.score:.0f})"
+    return finding.status.replace("_", " ")
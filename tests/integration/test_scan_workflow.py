@@ -237,3 +237,95 @@ class TestScanWorkflow:
             content = f.read()
             for theme_name in Theme.get_available_themes():
                 assert theme_name in content
+
+
+class TestCompactHTMLReport:
+    """Test compact HTML reports."""
+
+    @staticmethod
+    def _assessment(config=None):
+        repo_path = Path(__file__).parent.parent.parent
+        scanner = Scanner(repo_path, config=config)
+        return scanner.scan([CLAUDEmdAssessor(), READMEAssessor()], verbose=False)
+
+    def test_data_embedded_once(self, tmp_path):
+        """Findings are only embedded as JSON, not also rendered as HTML."""
+        assessment = self._assessment()
+        full = HTMLReporter().generate(assessment, tmp_path / "full.html")
+        compact = HTMLReporter(compact=True).generate(
+            assessment, tmp_path / "compact.html"
+        )
+
+        content = compact.read_text()
+        assert content.count("const ASSESSMENT = ") == 1
+        assert '<div class="finding"' not in content
+        assert '<div class="findings" id="findings-container"></div>' in content
+        assert "renderFinding" in content
+        assert compact.stat().st_size < full.stat().st_size
+
+    def test_themes_embedded_once(self, tmp_path):
+        """Each theme's colors appear once, in the theme table."""
+        compact = HTMLReporter(compact=True).generate(
+            self._assessment(), tmp_path / "compact.html"
+        )
+
+        content = compact.read_text()
+        assert "--background: #" not in content
+        for theme_name in Theme.get_available_themes():
+            theme = Theme.get_theme(theme_name)
+            assert content.count(f'"{theme.display_name}"') == 1
+
+    def test_custom_theme_in_table(self, tmp_path):
+        """A custom theme is added to the table, since nothing else styles it."""
+        config = Config(
+            custom_theme={
+                "background": "#1a1a2e",
+                "surface": "#16213e",
+                "surface_elevated": "#0f3460",
+                "primary": "#e94560",
+                "primary_light": "#ff6b81",
+                "primary_dark": "#c72c41",
+                "text_primary": "#eaeaea",
+                "text_secondary": "#a8a8a8",
+                "text_muted": "#6c6c6c",
+                "success": "#4caf50",
+                "warning": "#ff9800",
+                "danger": "#f44336",
+                "neutral": "#9e9e9e",
+                "border": "#2a2a3e",
+                "shadow": "rgba(0, 0, 0, 0.3)",
+            }
+        )
+        compact = HTMLReporter(compact=True).generate(
+            self._assessment(config), tmp_path / "compact.html"
+        )
+
+        content = compact.read_text()
+        assert '["custom","Custom","#1a1a2e"' in content.replace(", ", ",")
+
+    def test_payload_escaped(self, tmp_path):
+        """Embedded JSON cannot close the script element."""
+        assessment = self._assessment()
+        assessment.findings[0].evidence.append("</script><script>alert(1)</script>")
+        compact = HTMLReporter(compact=True).generate(
+            assessment, tmp_path / "compact.html"
+        )
+
+        content = compact.read_text()
+        assert "alert(1)" in content
+        assert "<script>alert(1)" not in content
+        assert "\\u003c/script\\u003e" in content
+
+    def test_precompressed_copy(self, tmp_path):
+        """A reproducible gzip copy is written next to the report."""
+        import gzip
+
+        assessment = self._assessment()
+        reporter = HTMLReporter(compact=True, precompress=True)
+        result = reporter.generate(assessment, tmp_path / "report.html")
+
+        gzip_path = tmp_path / "report.html.gz"
+        assert gzip.decompress(gzip_path.read_bytes()) == result.read_bytes()
+        first = gzip_path.read_bytes()
+        reporter.generate(assessment, tmp_path / "report.html")
+        assert gzip_path.read_bytes() == first
@@ -184,6 +184,31 @@ class TestAssessCommand:
             assert "AgentReady Repository Scorer" in result.output
             assert "Repository:" in result.output
 
+    def test_assess_with_profile(self, runner, test_repo, mock_assessment):
+        """Test assess --profile prints per-assessor timing table."""
+        from agentready.models.finding import AssessorProfile
+
+        mock_assessment.findings[3].profile = AssessorProfile(
+            wall_time_seconds=2.5,
+            cpu_time_seconds=1.25,
+            files_read=42,
+            bytes_read=4096,
+            subprocesses=3,
+        )
+
+        with patch("agentready.cli.main.Scanner") as mock_scanner_class:
+            mock_scanner = MagicMock()
+            mock_scanner.scan.return_value = mock_assessment
+            mock_scanner_class.return_value = mock_scanner
+
+            result = runner.invoke(assess, [str(test_repo), "--profile", "-j", "2"])
+
+            assert result.exit_code == 0
+            assert "Assessor Profile:" in result.output
+            assert "attr_3" in result.output.split("Assessor Profile:")[1]
+            assert "4096" in result.output
+            assert mock_scanner.scan.call_args.kwargs["jobs"] == 2
+
     def test_assess_default_output_dir(self, runner, test_repo, mock_assessment):
         """Test assess creates default .agentready directory."""
         with patch("agentready.cli.main.Scanner") as mock_scanner_class:
@@ -1,9 +1,74 @@
 """Unit tests for assessment cache."""
 
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from agentready.services.assessment_cache import AssessmentCache
+import pytest
+
+from agentready.assessors.code_quality import TypeAnnotationsAssessor
+from agentready.assessors.documentation import READMEAssessor
+from agentready.models.assessment import Assessment
+from agentready.models.attribute import Attribute
+from agentready.models.config import Config
+from agentready.models.finding import Finding
+from agentready.models.repository import Repository
+from agentready.services.assessment_cache import (
+    AssessmentCache,
+    AssessmentFingerprint,
+)
+
+URL = "https://github.com/user/repo"
+
+
+@pytest.fixture
+def assessment(tmp_path):
+    """Small assessment of a repository that exists on disk."""
+    (tmp_path / "repo" / ".git").mkdir(parents=True)
+    attr = Attribute(
+        id="readme_structure",
+        name="README Structure",
+        category="Documentation",
+        tier=1,
+        description="README has key sections",
+        criteria="Installation and usage",
+        default_weight=0.1,
+    )
+    return Assessment(
+        repository=Repository(
+            path=tmp_path / "repo",
+            name="repo",
+            url=URL,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 2},
+            total_files=2,
+            total_lines=20,
+        ),
+        timestamp=datetime(2025, 1, 1, 12, 0, 0),
+        overall_score=100.0,
+        certification_level="Platinum",
+        attributes_assessed=1,
+        attributes_not_assessed=0,
+        attributes_total=1,
+        findings=[
+            Finding(
+                attribute=attr,
+                status="pass",
+                score=100.0,
+                measured_value="2/2 sections",
+                threshold="2/2 sections",
+                evidence=["Installation", "Usage"],
+                remediation=None,
+                error_message=None,
+            )
+        ],
+        config=None,
+        duration_seconds=0.5,
+    )
 
 
 class TestAssessmentCache:
@@ -82,3 +147,216 @@ class TestAssessmentCache:
             cache2 = AssessmentCache(cache2_dir)
 
             assert cache1.db_path != cache2.db_path
+
+    def test_round_trip(self, tmp_path, assessment):
+        """Cached assessments come back intact and are stored compressed."""
+        cache = AssessmentCache(tmp_path / "cache")
+
+        assert cache.set(URL, "abc123", assessment)
+        restored = cache.get(URL, "abc123")
+
+        assert restored == assessment
+        assert cache.get(URL, "other") is None
+        with sqlite3.connect(cache.db_path) as conn:
+            (payload,) = conn.execute(
+                "SELECT assessment_json FROM assessments"
+            ).fetchone()
+        assert isinstance(payload, bytes)
+        assert len(payload) < len(json.dumps(assessment.to_dict()))
+
+    def test_reads_uncompressed_rows(self, tmp_path, assessment):
+        """Plain JSON rows from older versions are still served."""
+        cache = AssessmentCache(tmp_path / "cache")
+        cache.set(URL, "abc123", assessment)
+        with sqlite3.connect(cache.db_path) as conn:
+            conn.execute(
+                "UPDATE assessments SET assessment_json = ?",
+                (json.dumps(assessment.to_dict()),),
+            )
+
+        assert cache.get(URL, "abc123") == assessment
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, assessment):
+        """Entries that cannot be decoded are treated as cache misses."""
+        cache = AssessmentCache(tmp_path / "cache")
+        cache.set(URL, "abc123", assessment)
+        with sqlite3.connect(cache.db_path) as conn:
+            conn.execute("UPDATE assessments SET assessment_json = ?", (b"garbage",))
+
+        assert cache.get(URL, "abc123") is None
+
+
+class BumpedREADMEAssessor(READMEAssessor):
+    """README assessor whose logic version changed."""
+
+    @property
+    def version(self) -> str:
+        return "2"
+
+
+class TestAssessmentFingerprint:
+    """Test cache keys covering assessor versions and configuration."""
+
+    def test_fingerprint_tracks_assessors_and_config(self):
+        """Assessor versions and config changes produce different keys."""
+        base = AssessmentFingerprint.compute([READMEAssessor()])
+
+        assert base == AssessmentFingerprint.compute([READMEAssessor()], Config())
+        assert base.assessors_hash != (
+            AssessmentFingerprint.compute([BumpedREADMEAssessor()]).assessors_hash
+        )
+        assert base.assessors_hash != (
+            AssessmentFingerprint.compute(
+                [READMEAssessor(), TypeAnnotationsAssessor()]
+            ).assessors_hash
+        )
+        assert base.config_hash != (
+            AssessmentFingerprint.compute(
+                [READMEAssessor()], Config(weights={"readme_structure": 2.0})
+            ).config_hash
+        )
+
+    def test_changed_fingerprint_is_a_miss(self, tmp_path, assessment):
+        """Results are not served after an assessor or config change."""
+        cache = AssessmentCache(tmp_path / "cache")
+        fingerprint = AssessmentFingerprint.compute([READMEAssessor()])
+        cache.set(URL, "abc123", assessment, fingerprint)
+
+        assert cache.get(URL, "abc123", fingerprint) == assessment
+        assert cache.get(URL, "abc123") is None
+        assert (
+            cache.get(
+                URL, "abc123", AssessmentFingerprint.compute([BumpedREADMEAssessor()])
+            )
+            is None
+        )
+        assert (
+            cache.get(
+                URL,
+                "abc123",
+                AssessmentFingerprint.compute(
+                    [READMEAssessor()], Config(excluded_attributes=["x"])
+                ),
+            )
+            is None
+        )
+
+    def test_reusable_findings_only_for_unchanged_assessors(self, tmp_path, assessment):
+        """Findings are reused per attribute when their assessor is unchanged."""
+        cache = AssessmentCache(tmp_path / "cache")
+        cache.set(
+            URL,
+            "abc123",
+            assessment,
+            AssessmentFingerprint.compute([READMEAssessor()]),
+        )
+
+        unchanged = cache.get_reusable_findings(
+            URL,
+            "abc123",
+            AssessmentFingerprint.compute(
+                [READMEAssessor(), TypeAnnotationsAssessor()]
+            ),
+        )
+        bumped = cache.get_reusable_findings(
+            URL, "abc123", AssessmentFingerprint.compute([BumpedREADMEAssessor()])
+        )
+        other_config = cache.get_reusable_findings(
+            URL,
+            "abc123",
+            AssessmentFingerprint.compute(
+                [READMEAssessor()], Config(weights={"readme_structure": 2.0})
+            ),
+        )
+
+        assert list(unchanged) == ["readme_structure"]
+        assert unchanged["readme_structure"].score == 100.0
+        assert unchanged["readme_structure"].profile is None
+        assert bumped == {}
+        assert other_config == {}
+
+    def test_migrates_unversioned_database(self, tmp_path, assessment):
+        """Databases keyed only on URL and commit are upgraded in place."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        with sqlite3.connect(cache_dir / "assessments.db") as conn:
+            conn.execute(
+                """
+                CREATE TABLE assessments (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    repository_url TEXT NOT NULL,
+                    commit_hash TEXT NOT NULL,
+                    overall_score REAL,
+                    assessment_json TEXT NOT NULL,
+                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    expires_at TIMESTAMP,
+                    UNIQUE(repository_url, commit_hash)
+                )
+                """
+            )
+            conn.execute(
+                "INSERT INTO assessments (repository_url, commit_hash, "
+                "assessment_json) VALUES (?, ?, ?)",
+                (URL, "abc123", json.dumps(assessment.to_dict())),
+            )
+
+        cache = AssessmentCache(cache_dir)
+        fingerprint = AssessmentFingerprint.compute([READMEAssessor()])
+
+        # The legacy row survives but never matches a fingerprinted lookup
+        assert cache.get_stats()["total_entries"] == 1
+        assert cache.get(URL, "abc123", fingerprint) is None
+        assert cache.set(URL, "abc123", assessment, fingerprint)
+        assert cache.get(URL, "abc123", fingerprint) == assessment
+        assert cache.get_stats()["total_entries"] == 2
+
+        # Reopening an up-to-date database leaves it alone
+        assert AssessmentCache(cache_dir).get_stats()["total_entries"] == 2
+
+
+class TestBulkAccess:
+    """Test pooled connections and bulk reads and writes."""
+
+    def test_database_uses_wal(self, tmp_path):
+        """Readers are not blocked by a writer in another process."""
+        cache = AssessmentCache(tmp_path / "cache")
+
+        with sqlite3.connect(cache.db_path) as conn:
+            (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+        assert mode == "wal"
+
+    def test_get_many_returns_newest_matching_entry(self, tmp_path, assessment):
+        """One lookup serves every URL, honoring the fingerprint."""
+        cache = AssessmentCache(tmp_path / "cache")
+        fingerprint = AssessmentFingerprint.compute([READMEAssessor()])
+        other = "https://github.com/user/other"
+
+        assert cache.set_many(
+            [
+                (URL, "abc123", assessment, fingerprint),
+                (URL, "def456", assessment, fingerprint),
+                (other, "abc123", assessment, None),
+            ]
+        )
+        found = cache.get_many([URL, other, "https://example.com/none"], fingerprint)
+
+        assert set(found) == {URL}
+        commit_hash, restored = found[URL]
+        assert commit_hash == "def456"
+        assert restored == assessment
+        assert set(cache.get_many([URL, other])) == {other}
+
+    def test_concurrent_writers(self, tmp_path, assessment):
+        """Separate connections writing at once all succeed."""
+        cache_dir = tmp_path / "cache"
+        caches = [AssessmentCache(cache_dir) for _ in range(4)]
+
+        def write(index):
+            cache = caches[index % len(caches)]
+            return cache.set(f"{URL}-{index}", "abc123", assessment)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            stored = list(pool.map(write, range(40)))
+
+        assert all(stored)
+        assert AssessmentCache(cache_dir).get_stats()["total_entries"] == 40
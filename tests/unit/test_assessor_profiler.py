@@ -0,0 +1,95 @@
+"""Unit tests for per-assessor timing and I/O instrumentation."""
+
+import subprocess
+import threading
+
+from agentready.assessors.documentation import READMEAssessor
+from agentready.models.finding import AssessorProfile
+from agentready.models.repository import Repository
+from agentready.services.assessor_profiler import AssessorProfiler
+from agentready.services.scanner import Scanner
+
+
+class TestAssessorProfiler:
+    """Test AssessorProfiler counters."""
+
+    def test_counts_file_reads_and_bytes(self, tmp_path):
+        """Files opened for reading are counted with their size."""
+        (tmp_path / "a.txt").write_text("x" * 100)
+        (tmp_path / "b.txt").write_bytes(b"y" * 50)
+
+        with AssessorProfiler() as profiler:
+            (tmp_path / "a.txt").read_text()
+            with open(tmp_path / "b.txt", "rb") as f:
+                f.read()
+            (tmp_path / "c.txt").write_text("written, not read")
+
+        assert profiler.profile.files_read == 2
+        assert profiler.profile.bytes_read == 150
+        assert profiler.profile.wall_time_seconds >= 0
+        assert profiler.profile.cpu_time_seconds >= 0
+
+    def test_counts_subprocesses(self):
+        """Subprocess launches are counted."""
+        with AssessorProfiler() as profiler:
+            subprocess.run(["git", "--version"], capture_output=True)
+            subprocess.run(["git", "--version"], capture_output=True)
+
+        assert profiler.profile.subprocesses == 2
+
+    def test_other_threads_not_counted(self, tmp_path):
+        """Work on threads without an active profiler is not attributed."""
+        (tmp_path / "a.txt").write_text("data")
+
+        def read_file():
+            (tmp_path / "a.txt").read_text()
+
+        with AssessorProfiler() as profiler:
+            thread = threading.Thread(target=read_file)
+            thread.start()
+            thread.join()
+
+        assert profiler.profile.files_read == 0
+
+    def test_profile_to_dict(self):
+        """Profile serializes all counters."""
+        profile = AssessorProfile(
+            wall_time_seconds=1.5,
+            cpu_time_seconds=0.25,
+            files_read=3,
+            bytes_read=1024,
+            subprocesses=1,
+        )
+
+        assert profile.to_dict() == {
+            "wall_time_seconds": 1.5,
+            "cpu_time_seconds": 0.25,
+            "files_read": 3,
+            "bytes_read": 1024,
+            "subprocesses": 1,
+        }
+
+
+class TestScannerProfiling:
+    """Test that Scanner attaches profiles to findings."""
+
+    def test_execute_assessor_records_profile(self, tmp_path):
+        """Each finding carries the resource usage of its assessor."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "README.md").write_text("# Title\n\n## Installation\n")
+        repo = Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 1},
+            total_files=1,
+            total_lines=3,
+        )
+
+        finding = Scanner(tmp_path)._execute_assessor(READMEAssessor(), repo)
+
+        assert finding.profile is not None
+        assert finding.profile.files_read >= 1
+        assert finding.to_dict()["profile"]["files_read"] >= 1
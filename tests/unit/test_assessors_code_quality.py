@@ -2,7 +2,10 @@
 
 import subprocess
 
-from agentready.assessors.code_quality import CodeSmellsAssessor
+from agentready.assessors.code_quality import (
+    CodeSmellsAssessor,
+    CyclomaticComplexityAssessor,
+)
 from agentready.models.repository import Repository
 
 
@@ -451,3 +454,54 @@ Style/StringLiterals:
         assert finding.score < 60  # Below passing threshold
         assert finding.remediation is not None
         assert any("ruff" in s.lower() for s in finding.remediation.steps)
+
+
+class TestCyclomaticComplexityAssessor:
+    """Test in-process Python complexity from the AST cache."""
+
+    def _make_repo(self, tmp_path, files: dict[str, str]) -> Repository:
+        """Create a git repository with staged files."""
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+        for rel_path, content in files.items():
+            (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel_path).write_text(content)
+        subprocess.run(
+            ["git", "add", "."], cwd=tmp_path, capture_output=True, check=True
+        )
+        return Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": len(files)},
+            total_files=len(files),
+            total_lines=100,
+        )
+
+    def test_distribution_excludes_vendored_code(self, tmp_path):
+        """Average and p50/p95/max come from tracked, non-vendored functions."""
+        branches = "".join(f"    if x == {i}:\n        return {i}\n" for i in range(20))
+        repo = self._make_repo(
+            tmp_path,
+            {
+                "app.py": "def a(x):\n    return x\n\n"
+                "def b(x):\n    if x:\n        return 1\n    return 0\n",
+                "venv/lib/huge.py": f"def huge(x):\n{branches}    return x\n",
+            },
+        )
+
+        finding = CyclomaticComplexityAssessor().assess(repo)
+
+        assert finding.status == "pass"
+        assert finding.measured_value == "1.5"
+        assert "p50=1, p95=2, max=2 (app.py:b)" in finding.evidence[1]
+        assert finding.evidence[2] == "Functions with complexity >15: 0"
+
+    def test_no_python_functions(self, tmp_path):
+        """Repositories without Python functions are not applicable."""
+        repo = self._make_repo(tmp_path, {"constants.py": "X = 1\n"})
+
+        finding = CyclomaticComplexityAssessor().assess(repo)
+
+        assert finding.status == "not_applicable"
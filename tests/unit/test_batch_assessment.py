@@ -1,5 +1,6 @@
 """Unit tests for batch assessment models."""
 
+import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -8,7 +9,9 @@ import pytest
 
 from agentready.models import (
     BatchAssessment,
+    BatchResultStream,
     BatchSummary,
+    BatchSummaryBuilder,
     FailureTracker,
     RepositoryResult,
 )
@@ -133,6 +136,26 @@ class TestRepositoryResult:
         assert data["cached"] is True
         assert data["duration_seconds"] == 5.2
 
+    def test_telemetry_round_trip(self):
+        """Stage timings and peak memory survive serialization."""
+        result = RepositoryResult(
+            repository_url="https://github.com/user/repo",
+            assessment=None,
+            error="Clone failed",
+            error_type="clone_error",
+            stage_timings={"clone": 1.25},
+            peak_rss_bytes=1024,
+        )
+        restored = RepositoryResult.from_dict(result.to_dict())
+        assert restored.stage_timings == {"clone": 1.25}
+        assert restored.peak_rss_bytes == 1024
+
+        older_data = result.to_dict()
+        del older_data["stage_timings"], older_data["peak_rss_bytes"]
+        older = RepositoryResult.from_dict(older_data)
+        assert older.stage_timings == {}
+        assert older.peak_rss_bytes is None
+
 
 class TestBatchSummary:
     """Test BatchSummary model."""
@@ -334,3 +357,101 @@ class TestBatchAssessment:
         assert data["batch_id"] == "test-batch"
         assert len(data["results"]) == 1
         assert "summary" in data
+
+
+def _failure(url: str) -> RepositoryResult:
+    return RepositoryResult(
+        repository_url=url,
+        assessment=None,
+        error="Clone failed",
+        error_type="clone_error",
+    )
+
+
+class TestBatchSummaryBuilder:
+    """Test online summary aggregation."""
+
+    def test_models_and_records_agree(self, sample_assessment):
+        """Adding results or their dictionaries gives the same summary."""
+        results = [
+            RepositoryResult(repository_url="a", assessment=sample_assessment),
+            _failure("b"),
+            RepositoryResult(repository_url="c", assessment=sample_assessment),
+        ]
+        from_models = BatchSummaryBuilder()
+        from_records = BatchSummaryBuilder()
+
+        for result in results:
+            from_models.add(result)
+            from_records.add_record(result.to_dict())
+
+        summary = from_models.build()
+        assert summary == from_records.build()
+        assert summary.total_repositories == 3
+        assert summary.successful_assessments == 2
+        assert summary.average_score == 85.0
+        assert summary.score_distribution["Gold"] == 2
+        assert summary.language_breakdown == {"Python": 200}
+
+    def test_empty(self):
+        """No results gives a zero summary."""
+        summary = BatchSummaryBuilder().build()
+
+        assert summary.total_repositories == 0
+        assert summary.average_score == 0.0
+
+
+class TestBatchResultStream:
+    """Test results read back from an NDJSON file."""
+
+    def _write(self, path, records):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"batch": {"batch_id": "b"}}) + "\n")
+            for result in records:
+                f.write(json.dumps({"result": result}) + "\n")
+
+    def test_iterates_in_requested_order(self, sample_assessment, tmp_path):
+        """Last record per repository wins; order follows the URL list."""
+        success = RepositoryResult(
+            repository_url="a", assessment=sample_assessment
+        ).to_dict()
+        # The assessed clone has since been removed
+        success["assessment"]["repository"]["path"] = str(tmp_path / "gone")
+        path = tmp_path / "results.jsonl"
+        self._write(
+            path,
+            [_failure("a").to_dict(), _failure("b").to_dict(), success],
+        )
+
+        stream = BatchResultStream(path, ["b", "a", "missing"])
+
+        assert len(stream) == 2
+        assert stream.urls == ["b", "a"]
+        assert stream.successful == 1
+        assert [r.repository_url for r in stream] == ["b", "a"]
+        assert [r.is_success() for r in stream] == [False, True]
+        assert [d["repository_url"] for d in stream.records()] == ["b", "a"]
+
+    def test_batch_assessment_over_stream(self, sample_assessment, tmp_path):
+        """A streamed batch validates and serializes without a result list."""
+        results = [
+            RepositoryResult(repository_url="a", assessment=sample_assessment),
+            _failure("b"),
+        ]
+        path = tmp_path / "results.jsonl"
+        self._write(path, [r.to_dict() for r in results])
+        builder = BatchSummaryBuilder()
+        for result in results:
+            builder.add(result)
+
+        batch = BatchAssessment(
+            batch_id="b",
+            timestamp=datetime.now(),
+            results=BatchResultStream(path),
+            summary=builder.build(),
+            total_duration_seconds=1.0,
+        )
+
+        assert batch.get_success_rate() == 50.0
+        assert batch.to_dict()["results"] == [r.to_dict() for r in results]
+        assert batch.to_dict(include_results=False)["results"] == []
@@ -0,0 +1,82 @@
+"""Unit tests for the batch checkpoint journal."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from agentready.models.batch_assessment import RepositoryResult
+from agentready.services.batch_journal import BatchJournal
+
+STARTED = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _failure(url: str) -> RepositoryResult:
+    return RepositoryResult(
+        repository_url=url,
+        assessment=None,
+        error="Repository not found",
+        error_type="clone_error",
+        duration_seconds=1.5,
+    )
+
+
+class TestBatchJournal:
+    """Test journal writing and reading."""
+
+    def test_round_trip(self, tmp_path):
+        """Header and results are read back after close."""
+        journal = BatchJournal(tmp_path / "journal.jsonl")
+        journal.start("batch-1", STARTED)
+        journal.record(_failure("https://github.com/a/one"))
+        journal.record(_failure("https://github.com/a/two"))
+        journal.close()
+
+        state = journal.load()
+
+        assert state.batch_id == "batch-1"
+        assert state.timestamp == STARTED
+        assert list(state.results) == [
+            "https://github.com/a/one",
+            "https://github.com/a/two",
+        ]
+        assert state.results["https://github.com/a/one"] == _failure(
+            "https://github.com/a/one"
+        )
+
+    def test_missing_journal_is_empty(self, tmp_path):
+        """Resuming without a journal starts from scratch."""
+        state = BatchJournal(tmp_path / "journal.jsonl").load()
+
+        assert state.batch_id is None
+        assert state.results == {}
+
+    def test_torn_and_unrestorable_records_are_skipped(self, tmp_path):
+        """A crash mid-write and evicted clones only cost those repositories."""
+        journal = BatchJournal(tmp_path / "journal.jsonl")
+        journal.start("batch-1", STARTED)
+        journal.record(_failure("https://github.com/a/one"))
+        journal.close()
+        gone = {
+            "repository_url": "https://github.com/a/gone",
+            "assessment": {"repository": {"path": str(tmp_path / "evicted")}},
+        }
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"result": gone}) + "\n")
+            f.write('{"result": {"repository_url": "https://github.com/a/tw')
+
+        journal.start("batch-2", STARTED, resume=True)
+        journal.record(_failure("https://github.com/a/three"))
+        journal.close()
+        state = journal.load()
+
+        assert state.batch_id == "batch-1"
+        assert list(state.results) == [
+            "https://github.com/a/one",
+            "https://github.com/a/three",
+        ]
+
+    def test_record_requires_start(self, tmp_path):
+        """Writing before start() is a programming error."""
+        with pytest.raises(RuntimeError):
+            BatchJournal(tmp_path / "journal.jsonl").record(_failure("x"))
@@ -0,0 +1,588 @@
+"""Unit tests for sequential and pipelined batch scanning."""
+
+import os
+import pickle
+import sqlite3
+import subprocess
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from agentready.assessors.code_quality import TypeAnnotationsAssessor
+from agentready.assessors.documentation import CLAUDEmdAssessor, READMEAssessor
+from agentready.cli import assess_batch
+from agentready.models import BatchResultStream, FailureTracker
+from agentready.services import batch_scanner
+from agentready.services.assessment_cache import AssessmentFingerprint
+from agentready.services.batch_journal import (
+    JOURNAL_FILENAME,
+    BatchJournal,
+    merge_journals,
+)
+from agentready.services.batch_scanner import (
+    AssessmentTimeout,
+    BatchScanner,
+    _scan_in_worker,
+    default_worker_counts,
+    shard_repositories,
+    time_limit,
+)
+from agentready.services.batch_telemetry import BatchTelemetry
+from agentready.services.repository_manager import RepositoryManager
+from agentready.services.scanner import Scanner
+
+GIT_IDENTITY = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+
+
+def _make_repo(path, readme: str) -> str:
+    """Create a committed git repository and return its path."""
+    path.mkdir()
+    subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
+    (path / "README.md").write_text(readme)
+    (path / "app.py").write_text("def run(x: int) -> int:\n    return x\n")
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        ["git", *GIT_IDENTITY, "commit", "-m", "initial"],
+        cwd=path,
+        capture_output=True,
+        check=True,
+    )
+    return str(path)
+
+
+def _assessors():
+    return [READMEAssessor(), TypeAnnotationsAssessor(), CLAUDEmdAssessor()]
+
+
+class BumpedREADMEAssessor(READMEAssessor):
+    """README assessor whose logic version changed."""
+
+    @property
+    def version(self) -> str:
+        return "2"
+
+
+@pytest.fixture
+def repo_urls(tmp_path):
+    """Three local repositories with a missing path in the middle."""
+    return [
+        _make_repo(tmp_path / "alpha", "# Alpha\n"),
+        _make_repo(tmp_path / "beta", "# Beta\n\n## Installation\n\npip install\n"),
+        str(tmp_path / "missing"),
+        _make_repo(tmp_path / "gamma", "# Gamma\n\n## Usage\n\nrun it\n"),
+    ]
+
+
+class TestBatchScanner:
+    """Test BatchScanner orchestration."""
+
+    def test_pipelined_matches_sequential(self, repo_urls, tmp_path):
+        """Pipelined results and progress come out in input order."""
+        sequential = BatchScanner(cache_dir=tmp_path / "seq-cache").scan_batch(
+            repo_urls, _assessors()
+        )
+        progress = []
+        pipelined = BatchScanner(cache_dir=tmp_path / "pipe-cache").scan_batch(
+            repo_urls,
+            _assessors(),
+            progress_callback=lambda current, total: progress.append(current),
+            clone_workers=2,
+            assess_workers=2,
+        )
+
+        assert progress == [0, 1, 2, 3]
+        assert [r.repository_url for r in pipelined.results] == repo_urls
+        assert [r.is_success() for r in pipelined.results] == [True, True, False, True]
+        assert pipelined.results[2].error_type == "clone_error"
+        for seq, pipe in zip(sequential.results, pipelined.results):
+            if seq.is_success():
+                assert pipe.assessment.overall_score == seq.assessment.overall_score
+        assert pipelined.summary.successful_assessments == 3
+
+    def test_pipelined_writes_caches(self, repo_urls, tmp_path):
+        """Assessments and file metrics from worker processes are persisted."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+
+        scanner.scan_batch(repo_urls, _assessors(), clone_workers=2, assess_workers=1)
+
+        assert scanner.cache.get_stats()["unique_repositories"] == 3
+        db_path = tmp_path / "cache" / "file-metrics" / "file_metrics.db"
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM file_metrics").fetchone()[0]
+        assert rows > 0
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_rerun_is_served_from_cache(self, repo_urls, tmp_path, workers):
+        """Unchanged commits are not re-assessed on the next run."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+        first = scanner.scan_batch(
+            repo_urls, _assessors(), clone_workers=workers, assess_workers=1
+        )
+
+        rerun = scanner.scan_batch(
+            repo_urls, _assessors(), clone_workers=workers, assess_workers=1
+        )
+
+        assert [r.cached for r in rerun.results] == [True, True, False, True]
+        assert [
+            r.assessment.overall_score for r in rerun.results if r.is_success()
+        ] == [r.assessment.overall_score for r in first.results if r.is_success()]
+
+    def test_rerun_after_assessor_change_reuses_other_findings(
+        self, repo_urls, tmp_path
+    ):
+        """Only the assessor whose version changed is re-run."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+        scanner.scan_batch(repo_urls[:1], _assessors())
+
+        rerun = scanner.scan_batch(
+            repo_urls[:1],
+            [BumpedREADMEAssessor(), TypeAnnotationsAssessor(), CLAUDEmdAssessor()],
+        )
+
+        (result,) = rerun.results
+        assert not result.cached
+        assert [f.profile is not None for f in result.assessment.findings] == [
+            True,
+            False,
+            False,
+        ]
+
+    def test_failure_after_clone_releases_it(self, tmp_path, monkeypatch):
+        """An error between cloning and assessing does not leak the pin."""
+        origin = _make_repo(tmp_path / "origin", "# Origin\n")
+        monkeypatch.setattr(
+            RepositoryManager, "ALLOWED_PROTOCOLS", {"https", "git", "file"}
+        )
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+
+        def broken_cache(*args):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(scanner, "_cached_assessment", broken_cache)
+        url = f"file://localhost{origin}"
+        repository, result, _, _ = scanner._prepare_repository(
+            url, AssessmentFingerprint.compute(_assessors(), None), time.time()
+        )
+
+        assert repository is None
+        assert "database is locked" in result.error
+        clone = scanner.repo_manager.clone_directory(url)
+        assert clone.exists()
+        assert not scanner.repo_manager._is_in_use(clone)
+
+    def test_default_worker_counts(self):
+        """Clone workers are bounded; assess workers follow the CPU count."""
+        clone_workers, assess_workers = default_worker_counts()
+
+        assert 1 <= clone_workers <= 8
+        assert assess_workers >= 1
+
+
+class TestRepositoryPickling:
+    """Assessments cross process boundaries without per-scan state."""
+
+    def test_pickle_drops_scan_caches(self, repo_urls):
+        """Caches and commit tree are dropped; the data survives."""
+        assessment = Scanner(Path(repo_urls[0])).scan(_assessors(), version="test")
+        assert assessment.repository.metrics_cache is not None
+
+        restored = pickle.loads(pickle.dumps(assessment))
+
+        assert restored.repository.metrics_cache is None
+        assert restored.repository.ast_cache is None
+        assert restored.repository.file_index is None
+        assert restored.repository.name == "alpha"
+        assert restored.overall_score == assessment.overall_score
+
+
+class TestResume:
+    """Resuming an interrupted batch from its journal."""
+
+    def test_resume_skips_recorded_repositories(self, repo_urls, tmp_path):
+        """Only unrecorded repositories are assessed; the batch continues."""
+        journal = BatchJournal(tmp_path / "out" / JOURNAL_FILENAME)
+        # An interrupted run that got through the first two repositories
+        first = BatchScanner(cache_dir=tmp_path / "cache").scan_batch(
+            repo_urls[:2], _assessors(), use_cache=False, journal=journal
+        )
+
+        progress = []
+        resumed = BatchScanner(cache_dir=tmp_path / "cache").scan_batch(
+            repo_urls,
+            _assessors(),
+            use_cache=False,
+            progress_callback=lambda current, total: progress.append(current),
+            journal=journal,
+            resume=True,
+        )
+
+        assert progress == [2, 3]
+        assert resumed.batch_id == first.batch_id
+        assert resumed.timestamp == first.timestamp
+        assert [r.repository_url for r in resumed.results] == repo_urls
+        assert (
+            resumed.results[0].assessment.overall_score
+            == first.results[0].assessment.overall_score
+        )
+        assert resumed.summary.total_repositories == 4
+        assert resumed.summary.successful_assessments == 3
+        assert set(journal.load().results) == set(repo_urls)
+
+    def test_without_resume_the_journal_starts_over(self, repo_urls, tmp_path):
+        """A fresh run replaces an earlier journal."""
+        journal = BatchJournal(tmp_path / JOURNAL_FILENAME)
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+        scanner.scan_batch(repo_urls[:2], _assessors(), journal=journal)
+
+        scanner.scan_batch(
+            repo_urls[3:],
+            _assessors(),
+            journal=journal,
+            clone_workers=2,
+            assess_workers=1,
+        )
+
+        assert list(journal.load().results) == repo_urls[3:]
+
+
+class TestStreaming:
+    """Batches whose results stay on disk."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_streamed_batch_matches_in_memory(self, repo_urls, tmp_path, workers):
+        """Results are read back from the journal with the same summary."""
+        in_memory = BatchScanner(cache_dir=tmp_path / "mem-cache").scan_batch(
+            repo_urls, _assessors(), use_cache=False
+        )
+
+        streamed = BatchScanner(cache_dir=tmp_path / "stream-cache").scan_batch(
+            repo_urls,
+            _assessors(),
+            use_cache=False,
+            journal=BatchJournal(tmp_path / JOURNAL_FILENAME),
+            keep_results=False,
+            clone_workers=workers,
+            assess_workers=1,
+        )
+
+        assert isinstance(streamed.results, BatchResultStream)
+        assert [r.repository_url for r in streamed.results] == repo_urls
+        assert streamed.summary == in_memory.summary
+
+    def test_streamed_resume(self, repo_urls, tmp_path):
+        """Resuming a streamed batch skips what the journal recorded."""
+        journal = BatchJournal(tmp_path / JOURNAL_FILENAME)
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+        scanner.scan_batch(repo_urls[:2], _assessors(), journal=journal)
+
+        progress = []
+        resumed = scanner.scan_batch(
+            repo_urls,
+            _assessors(),
+            progress_callback=lambda current, total: progress.append(current),
+            journal=journal,
+            resume=True,
+            keep_results=False,
+        )
+
+        assert progress == [2, 3]
+        assert len(resumed.results) == 4
+        assert resumed.summary.successful_assessments == 3
+
+    def test_streaming_requires_journal(self, repo_urls, tmp_path):
+        """Without a journal there is nowhere to keep the results."""
+        with pytest.raises(ValueError):
+            BatchScanner(cache_dir=tmp_path / "cache").scan_batch(
+                repo_urls, _assessors(), keep_results=False
+            )
+
+
+class TestSharding:
+    """Splitting one batch across machines."""
+
+    def test_shards_partition_the_list(self):
+        """Every repository lands in exactly one shard, in list order."""
+        urls = [f"https://github.com/org/repo-{i}" for i in range(200)]
+
+        shards = [shard_repositories(urls, i, 4) for i in range(1, 5)]
+
+        assert sorted(url for shard in shards for url in shard) == sorted(urls)
+        assert all(shard == [u for u in urls if u in shard] for shard in shards)
+        assert all(30 < len(shard) < 70 for shard in shards)
+
+    def test_assignment_is_stable(self):
+        """A repository keeps its shard when the list changes."""
+        urls = [f"https://github.com/org/repo-{i}" for i in range(50)]
+
+        before = shard_repositories(urls, 2, 3)
+        after = shard_repositories(["https://github.com/org/new", *urls[10:]], 2, 3)
+
+        assert [u for u in before if u in urls[10:]] == [
+            u for u in after if u != "https://github.com/org/new"
+        ]
+
+    def test_invalid_shard(self):
+        """Shards are numbered from 1."""
+        with pytest.raises(ValueError):
+            shard_repositories(["a"], 0, 2)
+
+    def test_merged_shards_match_single_run(self, repo_urls, tmp_path):
+        """Merging shard journals gives the single-run summary."""
+        single = BatchScanner(cache_dir=tmp_path / "cache").scan_batch(
+            repo_urls, _assessors(), use_cache=False
+        )
+        journals = []
+        for shard in (1, 2):
+            journal = BatchJournal(tmp_path / f"shard-{shard}" / JOURNAL_FILENAME)
+            urls = shard_repositories(repo_urls, shard, 2)
+            if urls:
+                BatchScanner(cache_dir=tmp_path / "cache").scan_batch(
+                    urls, _assessors(), use_cache=False, journal=journal
+                )
+                journals.append(journal.path)
+
+        merged = merge_journals(journals, tmp_path / "merged" / JOURNAL_FILENAME)
+
+        assert sorted(r.repository_url for r in merged.results) == sorted(repo_urls)
+        assert merged.summary.successful_assessments == 3
+        assert merged.summary.average_score == pytest.approx(
+            single.summary.average_score
+        )
+        assert merged.summary.score_distribution == single.summary.score_distribution
+
+    def test_merge_refuses_to_overwrite_a_shard(self, tmp_path):
+        """The merged journal must not replace an input."""
+        path = tmp_path / JOURNAL_FILENAME
+        path.write_text("")
+
+        with pytest.raises(ValueError):
+            merge_journals([path], path)
+
+
+class SlowREADMEAssessor(READMEAssessor):
+    """README assessor that takes far longer than any budget."""
+
+    def assess(self, repository):
+        time.sleep(30)
+        return super().assess(repository)
+
+
+class CrashingREADMEAssessor(READMEAssessor):
+    """README assessor that kills its worker process on the "crash" repository.
+
+    Other repositories wait for the crash, so exactly those submitted before
+    it are taken down with the pool.
+    """
+
+    def assess(self, repository):
+        crashed = repository.path.parent / "crashed"
+        if repository.path.name == "crash":
+            crashed.touch()
+            os._exit(1)
+        deadline = time.time() + 10
+        while not crashed.exists() and time.time() < deadline:
+            time.sleep(0.05)
+        return super().assess(repository)
+
+
+class TestTimeoutsAndRetries:
+    """Per-repository time budgets and clone retries."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record backoff delays instead of waiting."""
+        delays = []
+        monkeypatch.setattr(
+            batch_scanner, "time", SimpleNamespace(time=time.time, sleep=delays.append)
+        )
+        return delays
+
+    def _flaky(self, scanner, monkeypatch, failures: list[str]):
+        """Make the first clones fail with the given error types."""
+        prepare = scanner.repo_manager.prepare_repository
+        calls = []
+
+        def flaky_prepare(url, timeout=300):
+            calls.append(url)
+            if len(calls) <= len(failures):
+                failure = FailureTracker(
+                    repository_url=url,
+                    error_type=failures[len(calls) - 1],
+                    error_message="Clone failed",
+                )
+                return False, None, failure
+            return prepare(url, timeout=timeout)
+
+        monkeypatch.setattr(scanner.repo_manager, "prepare_repository", flaky_prepare)
+        return calls
+
+    def test_transient_failures_are_retried(
+        self, repo_urls, tmp_path, monkeypatch, sleeps
+    ):
+        """Retries back off exponentially and then succeed."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache", max_retries=2)
+        calls = self._flaky(scanner, monkeypatch, ["network_error", "timeout"])
+
+        batch = scanner.scan_batch(repo_urls[:1], _assessors(), use_cache=False)
+
+        assert batch.results[0].is_success()
+        assert len(calls) == 3
+        assert len(sleeps) == 2
+        assert 1.0 <= sleeps[0] <= 2.0 and 2.0 <= sleeps[1] <= 4.0
+
+    def test_gives_up_after_max_retries(self, repo_urls, tmp_path, monkeypatch, sleeps):
+        """The last failure is reported with the retry count."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache", max_retries=1)
+        calls = self._flaky(scanner, monkeypatch, ["rate_limit"] * 5)
+
+        batch = scanner.scan_batch(repo_urls[:1], _assessors(), use_cache=False)
+
+        (result,) = batch.results
+        assert len(calls) == 2
+        assert result.error_type == "rate_limit"
+        assert result.error.endswith("(after 1 retries)")
+
+    def test_permanent_failures_are_not_retried(
+        self, repo_urls, tmp_path, monkeypatch, sleeps
+    ):
+        """Clone errors such as a missing repository fail at once."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+        calls = self._flaky(scanner, monkeypatch, ["clone_error"])
+
+        batch = scanner.scan_batch(repo_urls[:1], _assessors(), use_cache=False)
+
+        assert len(calls) == 1
+        assert sleeps == []
+        assert batch.results[0].error_type == "clone_error"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_slow_repository_times_out(self, repo_urls, tmp_path, workers):
+        """A repository over budget fails without holding up the batch."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache", repo_timeout=1)
+        started = time.time()
+
+        batch = scanner.scan_batch(
+            repo_urls[:2],
+            [SlowREADMEAssessor()],
+            use_cache=False,
+            clone_workers=workers,
+            assess_workers=workers,
+        )
+
+        assert [r.error_type for r in batch.results] == ["timeout", "timeout"]
+        assert time.time() - started < 15
+
+    def test_dead_worker_fails_only_affected_repositories(self, tmp_path):
+        """A killed worker fails its scans; later ones run in a new pool."""
+        urls = [_make_repo(tmp_path / "crash", "# Crash\n")] + [
+            _make_repo(tmp_path / f"repo{i}", f"# Repo {i}\n") for i in range(8)
+        ]
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+
+        batch = scanner.scan_batch(
+            urls,
+            [CrashingREADMEAssessor()],
+            use_cache=False,
+            clone_workers=1,
+            assess_workers=2,
+        )
+
+        crashed = batch.results[0]
+        assert crashed.error_type == "assessment_error"
+        assert "worker process died" in crashed.error
+        assert [r.repository_url for r in batch.results] == urls
+        # At most 5 scans are in flight when the pool breaks; the rest run
+        # in its replacement
+        assert all(r.is_success() for r in batch.results[5:])
+
+    def test_worker_enforces_budget(self, repo_urls):
+        """Assessment workers stop a scan that exceeds its budget."""
+        with pytest.raises(AssessmentTimeout):
+            _scan_in_worker(
+                Path(repo_urls[0]),
+                [SlowREADMEAssessor()],
+                None,
+                None,
+                "test",
+                "",
+                {},
+                time_budget=0.5,
+            )
+
+    def test_time_limit_without_budget(self):
+        """No budget means no limit; an exhausted one fails at once."""
+        with time_limit(None):
+            pass
+        with pytest.raises(AssessmentTimeout):
+            with time_limit(0):
+                pass
+
+
+class TestTelemetry:
+    """Test per-stage timings, memory and report generation telemetry."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_record_stages_and_memory(self, repo_urls, tmp_path, workers):
+        """Each result times its stages; telemetry counts every result."""
+        telemetry = BatchTelemetry()
+        batch = BatchScanner(cache_dir=tmp_path / "cache").scan_batch(
+            repo_urls,
+            _assessors(),
+            clone_workers=workers,
+            assess_workers=workers,
+            telemetry=telemetry,
+        )
+
+        expected = {"clone", "language_detection", "assessors"}
+        if workers > 1:
+            expected.add("queue")
+        for result in batch.results:
+            if result.is_success():
+                assert set(result.stage_timings) == expected
+                assert all(t >= 0 for t in result.stage_timings.values())
+                assert result.peak_rss_bytes > 0
+            else:
+                assert set(result.stage_timings) == {"clone"}
+                assert result.peak_rss_bytes is None
+
+        assert telemetry.completed == 4
+        assert telemetry.failed == 1
+        assert telemetry.stage_seconds["clone"] > 0
+        assert telemetry.peak_rss_bytes > 0
+
+    def test_cached_results_skip_assessment_stages(self, repo_urls, tmp_path):
+        """Cached repositories are only cloned."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+        scanner.scan_batch(repo_urls, _assessors())
+        batch = scanner.scan_batch(repo_urls, _assessors())
+
+        for result in batch.results:
+            assert set(result.stage_timings) == {"clone"}
+        cached = [r for r in batch.results if r.cached]
+        assert len(cached) == 3
+
+    def test_parallel_reports_match_serial(self, repo_urls, tmp_path, monkeypatch):
+        """Report workers write the same files as rendering in-process."""
+        batch = BatchScanner(cache_dir=tmp_path / "cache").scan_batch(
+            repo_urls, _assessors()
+        )
+        monkeypatch.setattr(assess_batch, "MIN_PARALLEL_REPORTS", 1)
+        serial_dir, parallel_dir = tmp_path / "serial", tmp_path / "parallel"
+        serial_dir.mkdir()
+        parallel_dir.mkdir()
+        telemetry = BatchTelemetry()
+
+        assess_batch._generate_individual_reports(batch, serial_dir, False, 1)
+        assess_batch._generate_individual_reports(
+            batch, parallel_dir, False, 2, telemetry
+        )
+
+        names = sorted(p.name for p in serial_dir.iterdir())
+        assert len(names) == 9
+        assert sorted(p.name for p in parallel_dir.iterdir()) == names
+        for name in names:
+            assert (parallel_dir / name).read_text() == (serial_dir / name).read_text()
+        assert telemetry.stage_seconds["reporting"] > 0
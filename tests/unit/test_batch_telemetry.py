@@ -0,0 +1,187 @@
+"""Unit tests for batch throughput and stage timing telemetry."""
+
+import sys
+
+import pytest
+
+from agentready.models import RepositoryResult
+from agentready.services.batch_telemetry import (
+    BatchTelemetry,
+    format_duration,
+    peak_rss_bytes,
+    reset_peak_rss,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _failure(url: str, **kwargs) -> RepositoryResult:
+    return RepositoryResult(
+        repository_url=url,
+        assessment=None,
+        error="boom",
+        error_type="clone_error",
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestBatchTelemetry:
+    """Test throughput, ETA and metric aggregation."""
+
+    def test_throughput_and_eta(self, clock):
+        """Rate and ETA follow the results recorded so far."""
+        telemetry = BatchTelemetry(clock=clock)
+        telemetry.start(10, "batch-1")
+        assert telemetry.eta_seconds() is None
+        assert telemetry.progress() == ""
+
+        clock.now += 60
+        for i in range(4):
+            telemetry.record(_failure(f"repo-{i}"))
+
+        assert telemetry.throughput() == pytest.approx(4.0)
+        assert telemetry.eta_seconds() == pytest.approx(90.0)
+        assert telemetry.progress() == "4.0 repos/min, ETA 1m30s"
+
+    def test_finish_freezes_elapsed_time(self, clock):
+        """Elapsed time stops advancing once the batch is finished."""
+        telemetry = BatchTelemetry(clock=clock)
+        telemetry.start(1)
+        clock.now += 5
+        telemetry.finish()
+        clock.now += 100
+
+        assert telemetry.elapsed_seconds == pytest.approx(5.0)
+        assert not telemetry.running
+
+    def test_sums_stage_timings_and_peak_memory(self, clock):
+        """Stage timings are summed; peak memory is the largest seen."""
+        telemetry = BatchTelemetry(clock=clock)
+        telemetry.start(2)
+        telemetry.record(
+            _failure("a", stage_timings={"clone": 1.5}, peak_rss_bytes=100)
+        )
+        telemetry.record(_failure("b", stage_timings={"clone": 0.5, "queue": 2.0}))
+        telemetry.record_stage("reporting", 3.0)
+
+        assert telemetry.stage_seconds["clone"] == pytest.approx(2.0)
+        assert telemetry.stage_seconds["queue"] == pytest.approx(2.0)
+        assert telemetry.stage_seconds["reporting"] == pytest.approx(3.0)
+        assert telemetry.peak_rss_bytes == 100
+        assert telemetry.failed == 2
+
+    def test_prometheus_format(self, clock):
+        """Every sample belongs to a declared metric and carries the batch."""
+        telemetry = BatchTelemetry(clock=clock)
+        telemetry.start(3, 'batch "1"')
+        clock.now += 30
+        telemetry.record(_failure("a", stage_timings={"clone": 2.0}))
+
+        text = telemetry.to_prometheus()
+        declared = set()
+        for line in text.splitlines():
+            if line.startswith("# TYPE "):
+                _, _, name, kind = line.split()
+                assert kind in {"gauge", "counter"}
+                declared.add(name)
+            elif not line.startswith("#"):
+                name = line.split("{", 1)[0]
+                assert name in declared
+                assert 'batch_id="batch \\"1\\""' in line
+
+        assert (
+            'agentready_batch_stage_seconds_total{batch_id="batch \\"1\\"",'
+            'stage="clone"} 2.0' in text
+        )
+        assert (
+            'agentready_batch_repositories_completed_total{batch_id="batch \\"1\\"",'
+            'outcome="failure"} 1' in text
+        )
+        assert "agentready_batch_eta_seconds" in text
+
+    def test_eta_unknown_before_first_result(self, clock):
+        """An unknown ETA is exported as NaN."""
+        telemetry = BatchTelemetry(clock=clock)
+        telemetry.start(3, "b")
+
+        assert 'agentready_batch_eta_seconds{batch_id="b"} NaN' in (
+            telemetry.to_prometheus()
+        )
+
+    def test_metrics_file_written_at_interval(self, clock, tmp_path):
+        """The metrics file is rewritten at most once per interval."""
+        path = tmp_path / "metrics" / "agentready.prom"
+        telemetry = BatchTelemetry(path, write_interval=10, clock=clock)
+        telemetry.start(3, "b")
+        assert "agentready_batch_running" in path.read_text()
+
+        telemetry.record(_failure("a"))
+        assert 'outcome="failure"} 0' in path.read_text()
+
+        clock.now += 10
+        telemetry.record(_failure("b"))
+        assert 'outcome="failure"} 2' in path.read_text()
+
+        telemetry.finish()
+        assert 'agentready_batch_running{batch_id="b"} 0' in path.read_text()
+        assert [p.name for p in path.parent.iterdir()] == ["agentready.prom"]
+
+    def test_unwritable_metrics_file_is_not_fatal(self, clock, tmp_path):
+        """Failing to write metrics never fails the batch."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        telemetry = BatchTelemetry(blocker / "agentready.prom", clock=clock)
+
+        telemetry.start(1)
+        telemetry.finish()
+
+
+class TestPeakMemory:
+    """Test peak resident memory measurement."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX only")
+    def test_peak_rss_is_measured(self):
+        """Peak memory is at least what was just allocated."""
+        reset_peak_rss()
+        block = bytearray(32 * 2**20)
+        peak = peak_rss_bytes()
+        del block
+
+        assert peak is not None
+        assert peak >= 32 * 2**20
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="Linux only")
+    def test_reset_drops_earlier_peak(self):
+        """After a reset, memory freed before it no longer counts."""
+        block = bytearray(256 * 2**20)
+        block[:: 2**12] = b"x" * len(block[:: 2**12])
+        del block
+        before = peak_rss_bytes()
+        if not reset_peak_rss():
+            pytest.skip("Peak memory cannot be reset here")
+
+        assert peak_rss_bytes() < before
+
+
+class TestFormatDuration:
+    """Test human-readable durations."""
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [(0, "0s"), (59.4, "59s"), (190, "3m10s"), (7500, "2h05m")],
+    )
+    def test_format(self, seconds, expected):
+        assert format_duration(seconds) == expected
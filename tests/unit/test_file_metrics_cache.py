@@ -0,0 +1,161 @@
+"""Unit tests for the content-addressed per-file metrics cache."""
+
+import io
+import subprocess
+
+import pytest
+
+from agentready.assessors.code_quality import TypeAnnotationsAssessor
+from agentready.assessors.stub_assessors import FileSizeLimitsAssessor
+from agentready.services import file_metrics_cache
+from agentready.services.file_metrics_cache import (
+    LINE_METRICS,
+    FileMetricsCache,
+    LineMetrics,
+)
+from agentready.services.language_detector import LanguageDetector
+from agentready.services.repository_index import RepositoryIndex
+from agentready.services.scanner import Scanner
+
+GIT_IDENTITY = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+
+
+def _init_repo(path, files: dict[str, str]) -> None:
+    """Create a committed git repository with the given files."""
+    subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
+    for rel_path, content in files.items():
+        (path / rel_path).write_text(content)
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        ["git", *GIT_IDENTITY, "commit", "-m", "init"],
+        cwd=path,
+        capture_output=True,
+        check=True,
+    )
+
+
+class TestLineMetrics:
+    """Test LineMetrics computation."""
+
+    def test_counts_lines_like_text_mode(self):
+        """Line counts match readlines() and non-blank iteration."""
+        data = b"a\r\n\r\n  \nb\rc"
+
+        metrics = LineMetrics.from_bytes(data)
+
+        assert metrics.lines == 5
+        assert metrics.non_blank_lines == 3
+
+    def test_invalid_utf8_has_no_strict_line_count(self):
+        """Undecodable files only report non-blank lines."""
+        metrics = LineMetrics.from_bytes(b"ok\n\xff\xfe\n")
+
+        assert metrics.lines is None
+        assert metrics.non_blank_lines == 2
+
+    def test_nul_bytes_mark_binary(self):
+        """Files with NUL bytes in the first chunk count as zero lines."""
+        metrics = LineMetrics.from_bytes(b"PK\x03\x04\x00\x00line\nline\n")
+
+        assert metrics == LineMetrics.binary()
+
+    def test_crlf_split_across_chunks(self, monkeypatch):
+        """A CRLF straddling a read boundary is counted once."""
+        monkeypatch.setattr(file_metrics_cache, "_READ_CHUNK", 4)
+        data = b"abc\r\n\r\nxyz\r\n  \r\nend"
+
+        chunked = LineMetrics.from_stream(io.BytesIO(data))
+
+        assert chunked.lines == 5
+        assert chunked.non_blank_lines == 3
+
+
+class TestFileMetricsCache:
+    """Test persistence and blob-SHA keyed reuse."""
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Flushed entries are visible to a new cache after prefetch."""
+        cache = FileMetricsCache(tmp_path / "cache")
+        cache.put(LINE_METRICS, "abc123", {"lines": 3, "non_blank_lines": 2})
+        cache.flush()
+
+        reopened = FileMetricsCache(tmp_path / "cache")
+        reopened.prefetch(LINE_METRICS, ["abc123", "missing"])
+
+        assert reopened.get(LINE_METRICS, "abc123") == {
+            "lines": 3,
+            "non_blank_lines": 2,
+        }
+        assert reopened.get(LINE_METRICS, "missing") is None
+        assert reopened.get(LINE_METRICS, None) is None
+
+    def test_modified_files_have_no_blob_sha(self, tmp_path):
+        """Working-tree edits drop the blob SHA so stale metrics aren't used."""
+        _init_repo(tmp_path, {"a.py": "x = 1\n", "b.py": "y = 2\n"})
+        (tmp_path / "b.py").write_text("y = 3\nz = 4\n")
+
+        index = RepositoryIndex.build(tmp_path)
+
+        assert index.get("a.py").blob_sha is not None
+        assert index.get("b.py").blob_sha is None
+
+    def test_second_scan_skips_unchanged_blobs(self, tmp_path):
+        """A second scan with the same store reads and parses nothing new."""
+        files = {
+            f"m{i}.py": f"def f{i}(x: int) -> int:\n    return x\n" for i in range(3)
+        }
+        _init_repo(tmp_path, files)
+        assessors = [TypeAnnotationsAssessor(), FileSizeLimitsAssessor()]
+
+        first = Scanner(tmp_path, metrics_cache=FileMetricsCache(tmp_path / "c"))
+        first_assessment = first.scan(assessors)
+
+        cache = FileMetricsCache(tmp_path / "c")
+        second_assessment = Scanner(tmp_path, metrics_cache=cache).scan(assessors)
+
+        assert second_assessment.repository.get_ast_cache().parse_count == 0
+        assert cache.misses == 0
+        assert cache.hits > 0
+        assert second_assessment.repository.total_lines == (
+            first_assessment.repository.total_lines
+        )
+        assert [f.evidence for f in second_assessment.findings] == [
+            f.evidence for f in first_assessment.findings
+        ]
+
+    def test_binary_extensions_are_not_read(self, tmp_path, monkeypatch):
+        """Known binary files are skipped without opening them."""
+        _init_repo(tmp_path, {"a.py": "x = 1\n", "logo.png": "not really\n"})
+        index = RepositoryIndex.build(tmp_path)
+        opened = []
+        real_count = file_metrics_cache.count_file_lines
+        monkeypatch.setattr(
+            file_metrics_cache,
+            "count_file_lines",
+            lambda path: opened.append(path.name) or real_count(path),
+        )
+
+        metrics = FileMetricsCache().line_metrics_many(tmp_path, list(index))
+
+        assert opened == ["a.py"]
+        assert metrics["logo.png"] == LineMetrics.binary()
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_analyze_collects_stats_in_one_pass(self, tmp_path, monkeypatch, workers):
+        """analyze() returns languages, files and lines, serially or pooled."""
+        monkeypatch.setattr(file_metrics_cache, "PARALLEL_MIN_BYTES", 0)
+        _init_repo(
+            tmp_path,
+            {
+                "a.py": "x = 1\n\ny = 2\n",
+                "b.py": "z = 3\n",
+                "c.py": "",
+                "d.bin": "\0\0",
+            },
+        )
+
+        stats = LanguageDetector(tmp_path).analyze(workers=workers)
+
+        assert stats.languages == {"Python": 3}
+        assert stats.total_files == 4
+        assert stats.total_lines == 3
@@ -0,0 +1,251 @@
+"""Unit tests for the columnar findings table and the heatmap built from it."""
+
+import json
+import math
+
+import pandas as pd
+import pytest
+
+from agentready.services import findings_table
+from agentready.services.attribute_analyzer import AttributeAnalyzer
+from agentready.services.findings_table import (
+    FINDINGS_COLUMNS,
+    findings_frame,
+    read_findings_table,
+    write_findings_table,
+)
+
+
+def _finding(attr_id: str, tier: int, status: str, score=None, measured=None):
+    return {
+        "attribute": {
+            "id": attr_id,
+            "name": attr_id.replace("_", " ").title(),
+            "category": "Documentation",
+            "tier": tier,
+        },
+        "status": status,
+        "score": score,
+        "measured_value": measured,
+        "threshold": None,
+    }
+
+
+def _result(name: str, overall: float, findings: list) -> dict:
+    return {
+        "repository_url": f"https://github.com/org/{name}",
+        "assessment": {
+            "repository": {
+                "name": name,
+                "commit_hash": f"{name}-commit",
+                "languages": {"Python": 5, "Go": 2},
+            },
+            "overall_score": overall,
+            "certification_level": "Gold" if overall >= 75 else "Bronze",
+            "findings": findings,
+        },
+    }
+
+
+@pytest.fixture
+def records():
+    """Three repositories (one failed) with mixed finding statuses."""
+    return [
+        _result(
+            "low",
+            45.0,
+            [
+                _finding("readme", 1, "fail", 20.0, "missing"),
+                _finding("lock_files", 2, "not_applicable"),
+                _finding("readme", 1, "pass", 100.0),
+            ],
+        ),
+        {"repository_url": "https://github.com/org/broken", "assessment": None},
+        _result(
+            "high",
+            80.0,
+            [
+                _finding("readme", 1, "pass", 100.0, "present"),
+                _finding("lock_files", 2, "error"),
+            ],
+        ),
+    ]
+
+
+class TestFindingsFrame:
+    """Test building the findings table."""
+
+    def test_one_row_per_finding(self, records):
+        """Failed repositories are left out; columns are typed."""
+        frame = findings_frame(records)
+
+        assert list(frame.columns) == list(FINDINGS_COLUMNS)
+        assert len(frame) == 5
+        assert frame["repository"].tolist() == ["low"] * 3 + ["high"] * 2
+        assert frame["primary_language"].unique().tolist() == ["Python"]
+        assert frame["status"].dtype == "category"
+        assert frame["tier"].dtype == "int8"
+        assert math.isnan(frame["score"].iloc[1])
+        assert frame["measured_value"].isna().tolist() == [
+            False,
+            True,
+            True,
+            False,
+            True,
+        ]
+
+    def test_empty(self):
+        """No successful results give an empty, typed table."""
+        frame = findings_frame([])
+
+        assert frame.empty
+        assert frame["score"].dtype == "float64"
+
+    @pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+    def test_round_trip(self, records, tmp_path, suffix):
+        """Tables read back with their types."""
+        pytest.importorskip("pyarrow")
+        frame = findings_frame(records)
+        path = write_findings_table(frame, tmp_path / f"findings{suffix}")
+
+        pd.testing.assert_frame_equal(read_findings_table(path), frame)
+        assert read_findings_table(path, columns=["score"]).shape == (5, 1)
+
+    def test_needs_pyarrow(self, records, tmp_path, monkeypatch):
+        """Without pyarrow, writing fails with an install hint."""
+        monkeypatch.setattr(findings_table, "PYARROW_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match="agentready\\[analytics\\]"):
+            write_findings_table(findings_frame(records), tmp_path / "f.parquet")
+
+
+class TestBatchHeatmapData:
+    """Test pivoting the findings table into the heatmap matrix."""
+
+    def test_matrix(self, records):
+        """Repos sorted by score, attributes by tier; statuses mapped."""
+        df, hover_text, overall = AttributeAnalyzer()._prepare_batch_dataframe(
+            findings_frame(records)
+        )
+
+        assert df.index.tolist() == ["high", "low"]
+        assert df.columns.tolist() == ["readme", "lock_files"]
+        # Errors count as 0; not applicable is missing; first duplicate wins
+        assert df.loc["high", "lock_files"] == 0.0
+        assert math.isnan(df.loc["low", "lock_files"])
+        assert df.loc["low", "readme"] == 20.0
+        assert overall["certification_level"].tolist() == ["Gold", "Bronze"]
+        assert hover_text.shape == df.shape
+
+    def test_hover_text(self, records):
+        """Tooltips carry the finding and the repository's overall score."""
+        _, hover_text, _ = AttributeAnalyzer()._prepare_batch_dataframe(
+            findings_frame(records)
+        )
+
+        assert hover_text.loc["low", "readme"] == (
+            "<b>Repository:</b> low<br><b>Attribute:</b> Readme<br>"
+            "<b>Tier:</b> 1<br><b>Score:</b> 20.0/100<br><b>Status:</b> fail<br>"
+            "<b>Measured:</b> missing<br><b>Overall:</b> 45.0/100 (Bronze)<br>"
+        )
+        assert "<b>Score:</b> N/A/100" in hover_text.loc["low", "lock_files"]
+        assert "<b>Measured:</b> N/A" in hover_text.loc["high", "lock_files"]
+
+    def test_no_successful_assessments(self):
+        """An empty table cannot be visualized."""
+        with pytest.raises(ValueError, match="No successful assessments"):
+            AttributeAnalyzer()._prepare_batch_dataframe(findings_frame([]))
+
+
+def _large_batch(count: int) -> list:
+    """Repositories in three score profiles, spread over two attributes."""
+    results = []
+    for i in range(count):
+        profile = i % 3
+        results.append(
+            _result(
+                f"repo-{i:03d}",
+                90.0 - 30 * profile,
+                [
+                    _finding("readme", 1, "pass", 100.0 - 40 * profile),
+                    _finding("lock_files", 2, "fail", 10.0 + 40 * profile),
+                ],
+            )
+        )
+    return results
+
+
+class TestClusteredHeatmap:
+    """Test the aggregated heatmap for large batches."""
+
+    def test_small_batch_has_row_per_repository(self, records, tmp_path):
+        """Batches under the limit get no drill-down data."""
+        heatmap = tmp_path / "heatmap.html"
+        AttributeAnalyzer().analyze_findings(findings_frame(records), heatmap)
+
+        assert heatmap.exists()
+        assert not (tmp_path / "heatmap-data").exists()
+
+    def test_clusters_with_drilldown(self, tmp_path):
+        """Repositories are grouped by score profile, best cluster first."""
+        heatmap = tmp_path / "heatmap.html"
+        findings = findings_frame(_large_batch(30))
+        AttributeAnalyzer().analyze_findings(findings, heatmap, max_rows=10)
+
+        files = sorted((tmp_path / "heatmap-data").glob("cluster-*.json"))
+        clusters = [json.loads(path.read_text()) for path in files]
+        assert [len(c["repositories"]) for c in clusters] == [10, 10, 10]
+        assert [c["overall_score"][0] for c in clusters] == [90.0, 60.0, 30.0]
+        assert clusters[0]["attributes"] == ["readme", "lock_files"]
+        assert clusters[0]["scores"][0] == [100.0, 10.0]
+        html = heatmap.read_text()
+        assert "heatmap-data/cluster-000.json" in html
+        assert "plotly_click" in html
+
+    def test_clusters_from_batch_json(self, tmp_path, monkeypatch):
+        """The all-assessments.json path clusters without pyarrow."""
+        figure = AttributeAnalyzer._batch_heatmap_figure
+        drawn = {}
+
+        def capture(matrix, hover_text, row_labels, **kwargs):
+            drawn.update(matrix=matrix, hover_text=hover_text, labels=row_labels)
+            return figure(matrix, hover_text, row_labels, **kwargs)
+
+        monkeypatch.setattr(
+            AttributeAnalyzer, "_batch_heatmap_figure", staticmethod(capture)
+        )
+        heatmap = tmp_path / "heatmap.html"
+        batch_data = {"results": _large_batch(30)}
+        AttributeAnalyzer().analyze_batch_from_json(batch_data, heatmap, max_rows=10)
+
+        assert drawn["matrix"].shape == (3, 2)
+        assert drawn["labels"].tolist()[0] == "Cluster 0 · 10 repos · avg 90.0"
+        assert drawn["hover_text"].loc[2, "lock_files"] == (
+            "<b>Cluster:</b> 2 (10 repositories)<br><b>Attribute:</b> lock_files"
+            "<br><b>Mean score:</b> 90.0/100<br><b>Scored in:</b> 10 repositories"
+            "<br><b>Mean overall:</b> 30.0/100<br><i>Click to list repositories</i>"
+        )
+        assert len(list((tmp_path / "heatmap-data").iterdir())) == 3
+
+    def test_stale_cluster_files_removed(self, tmp_path):
+        """Rewriting the heatmap drops data of clusters that no longer exist."""
+        heatmap = tmp_path / "heatmap.html"
+        stale = tmp_path / "heatmap-data" / "cluster-049.json"
+        stale.parent.mkdir()
+        stale.write_text("{}")
+
+        AttributeAnalyzer().analyze_findings(
+            findings_frame(_large_batch(12)), heatmap, max_rows=5
+        )
+
+        assert not stale.exists()
+
+    def test_cluster_labels_deterministic(self):
+        """The same batch always clusters the same way."""
+        df, _, _ = AttributeAnalyzer()._prepare_batch_dataframe(
+            findings_frame(_large_batch(60))
+        )
+
+        first = AttributeAnalyzer._cluster_repositories(df, 5)
+        assert (AttributeAnalyzer._cluster_repositories(df, 5) == first).all()
+        assert len(set(first)) <= 5
@@ -0,0 +1,164 @@
+"""Unit tests for reading commits from the git object database."""
+
+import os
+import subprocess
+
+import pytest
+
+from agentready.assessors.code_quality import TypeAnnotationsAssessor
+from agentready.assessors.documentation import READMEAssessor
+from agentready.services.git_tree import GitTree, is_bare_repository
+from agentready.services.repository_index import RepositoryIndex
+from agentready.services.scanner import Scanner
+
+GIT_IDENTITY = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+
+
+def _commit(path, files: dict[str, str], message: str) -> None:
+    """Write files, stage everything and commit."""
+    for rel_path, content in files.items():
+        (path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (path / rel_path).write_text(content)
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        ["git", *GIT_IDENTITY, "commit", "-m", message],
+        cwd=path,
+        capture_output=True,
+        check=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with two commits."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
+    _commit(
+        path,
+        {
+            "README.md": "# Old\n",
+            "src/app.py": "def run(x):\n    return x\n",
+            ".github/workflows/ci.yml": "name: CI\n",
+        },
+        "first",
+    )
+    _commit(
+        path,
+        {
+            "README.md": "# Project\n\n## Installation\n\npip install x\n",
+            "src/app.py": "def run(x: int) -> int:\n    return x\n",
+        },
+        "second",
+    )
+    return path
+
+
+class TestGitTree:
+    """Test pathlib-style access to a commit."""
+
+    def test_reads_commit_not_working_tree(self, repo):
+        """Uncommitted edits and untracked files are invisible."""
+        (repo / "README.md").write_text("# Edited\n")
+        (repo / "untracked.txt").write_text("new\n")
+
+        with GitTree(repo, "HEAD") as tree:
+            root = tree.root
+
+            assert (root / "README.md").read_text().startswith("# Project")
+            assert not (root / "untracked.txt").exists()
+
+    def test_older_revision(self, repo):
+        """Any commit-ish can be read."""
+        with GitTree(repo, "HEAD~1") as tree:
+            assert (tree.root / "README.md").read_text() == "# Old\n"
+
+    def test_path_api(self, repo):
+        """Directories, globbing, stat and relative paths behave like Path."""
+        with GitTree(repo, "HEAD") as tree:
+            root = tree.root
+            workflows = root / ".github" / "workflows"
+
+            assert workflows.is_dir() and not workflows.is_file()
+            assert [p.name for p in workflows.glob("*.yml")] == ["ci.yml"]
+            assert [str(p.relative_to(root)) for p in root.rglob("*.py")] == [
+                "src/app.py"
+            ]
+            assert (root / "src" / "app.py").stat().st_size == (
+                (repo / "src" / "app.py").stat().st_size
+            )
+            assert (root / "src" / ".." / "README.md").is_file()
+            assert [p.name for p in root.iterdir()] == [
+                ".github",
+                "README.md",
+                "src",
+            ]
+
+    def test_cannot_be_opened_as_os_path(self, repo):
+        """Builtin open() refuses tree paths instead of reading the checkout."""
+        with GitTree(repo, "HEAD") as tree:
+            with pytest.raises(TypeError):
+                open(tree.root / "README.md")
+            with pytest.raises(PermissionError):
+                (tree.root / "README.md").open("w")
+
+    def test_symlinks_resolve_within_commit(self, repo):
+        """Symlinks to committed files read the target's content."""
+        os.symlink("README.md", repo / "README.rst")
+        _commit(repo, {}, "link")
+
+        with GitTree(repo, "HEAD") as tree:
+            assert (tree.root / "README.rst").read_bytes() == (
+                tree.root / "README.md"
+            ).read_bytes()
+
+    def test_invalid_revisions(self, repo):
+        """Unknown revisions and option-like strings are rejected."""
+        with pytest.raises(ValueError):
+            GitTree(repo, "no-such-branch")
+        with pytest.raises(ValueError):
+            GitTree(repo, "--output=/tmp/x")
+
+    def test_index_from_tree_has_blob_shas(self, repo):
+        """Every entry in a commit index has a size and blob SHA."""
+        with GitTree(repo, "HEAD") as tree:
+            index = RepositoryIndex.from_tree(tree)
+
+        assert index.paths() == [".github/workflows/ci.yml", "README.md", "src/app.py"]
+        assert all(f.blob_sha and f.size for f in index)
+
+
+class TestScanWithoutCheckout:
+    """Test Scanner on revisions and bare repositories."""
+
+    def test_rev_matches_checkout_of_that_commit(self, repo):
+        """Assessing --rev equals assessing a clean checkout of it."""
+        assessors = [READMEAssessor(), TypeAnnotationsAssessor()]
+        expected = Scanner(repo).scan(assessors)
+        (repo / "README.md").write_text("# Edited\n")
+
+        assessment = Scanner(repo, rev="HEAD").scan(assessors)
+
+        assert assessment.repository.commit_hash == expected.repository.commit_hash
+        assert [(f.status, f.score) for f in assessment.findings] == [
+            (f.status, f.score) for f in expected.findings
+        ]
+
+    def test_bare_repository(self, repo, tmp_path):
+        """Bare repositories are assessed at HEAD without a working tree."""
+        bare = tmp_path / "mirror.git"
+        subprocess.run(
+            ["git", "clone", "--bare", str(repo), str(bare)],
+            capture_output=True,
+            check=True,
+        )
+        assert is_bare_repository(bare)
+
+        expected = Scanner(repo).scan([READMEAssessor()])
+
+        assessment = Scanner(bare).scan([READMEAssessor()])
+
+        assert assessment.repository.name == "mirror"
+        assert assessment.repository.total_files == 3
+        assert assessment.findings[0].score == expected.findings[0].score
+        assert not assessment.repository.has_working_tree
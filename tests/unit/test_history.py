@@ -0,0 +1,126 @@
+"""Unit tests for score history across commits."""
+
+import csv
+import json
+import os
+import subprocess
+
+import pytest
+
+from agentready.assessors.code_quality import TypeAnnotationsAssessor
+from agentready.assessors.documentation import CLAUDEmdAssessor, READMEAssessor
+from agentready.reporters.history import HistoryReporter
+from agentready.services.history import HistoryScanner
+from agentready.services.scanner import Scanner
+
+GIT_IDENTITY = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+
+
+def _commit(path, files: dict[str, str], message: str, date: str) -> None:
+    """Write files and commit them with a fixed commit date."""
+    for rel_path, content in files.items():
+        (path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (path / rel_path).write_text(content)
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        ["git", *GIT_IDENTITY, "commit", "-m", message],
+        cwd=path,
+        capture_output=True,
+        check=True,
+        env={**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date},
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository whose README and code improve over three commits."""
+    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+    _commit(
+        tmp_path,
+        {"README.md": "# App\n", "src/app.py": "def run(x):\n    return x\n"},
+        "initial",
+        "2025-01-01T00:00:00Z",
+    )
+    _commit(
+        tmp_path,
+        {"README.md": "# App\n\n## Installation\n\npip install app\n"},
+        "document install",
+        "2025-02-01T00:00:00Z",
+    )
+    _commit(
+        tmp_path,
+        {"src/app.py": "def run(x: int) -> int:\n    return x\n"},
+        "add types",
+        "2025-03-01T00:00:00Z",
+    )
+    return tmp_path
+
+
+def _assessors():
+    """Assessors reading README, Python files and CLAUDE.md respectively."""
+    return [READMEAssessor(), TypeAnnotationsAssessor(), CLAUDEmdAssessor()]
+
+
+class TestHistoryScanner:
+    """Test commit listing and incremental history scans."""
+
+    def test_lists_commits_oldest_first(self, repo):
+        """Commits are returned oldest first and can be limited."""
+        scanner = HistoryScanner(repo)
+
+        commits = scanner.list_commits()
+        recent = scanner.list_commits(max_commits=2)
+        since = scanner.list_commits(since="2025-01-15")
+
+        assert [c[1].month for c in commits] == [1, 2, 3]
+        assert recent == commits[1:]
+        assert since == commits[1:]
+
+    def test_invalid_revision(self, repo):
+        """Unknown and option-like revisions are rejected."""
+        with pytest.raises(ValueError):
+            HistoryScanner(repo).list_commits(rev="--all")
+        with pytest.raises(ValueError):
+            HistoryScanner(repo).list_commits(rev="missing-branch")
+
+    def test_series_matches_full_scans(self, repo):
+        """Incremental points equal full scans, re-running only what changed."""
+        scanner = HistoryScanner(repo)
+        commits = scanner.list_commits()
+
+        history = scanner.run(_assessors(), commits)
+
+        assert [p.commit_hash for p in history.points] == [c[0] for c in commits]
+        for point in history.points:
+            full = Scanner(repo, rev=point.commit_hash).scan(_assessors())
+            assert point.overall_score == full.overall_score
+            assert point.attribute_scores == {
+                f.attribute.id: f.score for f in full.findings
+            }
+        # First commit runs everything; README-only and .py-only commits
+        # each re-run just the assessor reading those files
+        assert [p.reassessed for p in history.points] == [3, 1, 1]
+        assert history.points[-1].overall_score > history.points[0].overall_score
+
+
+class TestHistoryReporter:
+    """Test CSV and JSON series output."""
+
+    def test_csv_and_json(self, repo, tmp_path):
+        """CSV has one row per commit with a column per attribute."""
+        scanner = HistoryScanner(repo)
+        history = scanner.run(_assessors(), scanner.list_commits())
+        reporter = HistoryReporter()
+
+        csv_path = reporter.generate_csv(history, tmp_path / "out" / "history.csv")
+        json_path = reporter.generate_json(history, tmp_path / "out" / "history.json")
+
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 3
+        assert set(rows[0]) >= {"commit_hash", "overall_score", "readme_structure"}
+        assert rows[-1]["commit_hash"] == history.points[-1].commit_hash
+
+        data = json.loads(json_path.read_text())
+        assert len(data["points"]) == 3
+        assert data["points"][0]["committed_at"].startswith("2025-01-01")
@@ -0,0 +1,203 @@
+"""Unit tests for incremental re-assessment."""
+
+import json
+import subprocess
+from pathlib import Path
+
+from agentready.assessors.code_quality import TypeAnnotationsAssessor
+from agentready.assessors.documentation import CLAUDEmdAssessor, READMEAssessor
+from agentready.assessors.structure import (
+    SeparationOfConcernsAssessor,
+    StandardLayoutAssessor,
+)
+from agentready.services.incremental import IncrementalPlanner, matches_any
+from agentready.services.scanner import Scanner
+
+GIT_IDENTITY = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+
+
+def _init_repo(path) -> None:
+    """Create a committed git repository with README and Python files."""
+    subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
+    (path / ".gitignore").write_text(".agentready/\n")
+    (path / "README.md").write_text("# Test\n\n## Installation\n\npip install x\n")
+    (path / "src").mkdir()
+    (path / "src" / "app.py").write_text("def run(x: int) -> int:\n    return x\n")
+    _commit(path, "init")
+
+
+def _commit(path, message: str) -> None:
+    """Stage everything and commit."""
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        ["git", *GIT_IDENTITY, "commit", "-m", message],
+        cwd=path,
+        capture_output=True,
+        check=True,
+    )
+
+
+def _assessors():
+    """Assessors with small, distinct input patterns."""
+    return [
+        READMEAssessor(),
+        TypeAnnotationsAssessor(),
+        CLAUDEmdAssessor(),
+        StandardLayoutAssessor(),
+    ]
+
+
+def _write_report(path, assessment) -> Path:
+    """Write assessment JSON where the CLI keeps the latest report."""
+    report = path / ".agentready" / "assessment-latest.json"
+    report.parent.mkdir(exist_ok=True)
+    report.write_text(json.dumps(assessment.to_dict()))
+    return report
+
+
+class TestMatchesAny:
+    """Test input pattern matching."""
+
+    def test_name_patterns_match_any_depth(self):
+        """Patterns without a slash match the file name anywhere."""
+        assert matches_any("src/pkg/mod.py", ("*.py",))
+        assert matches_any("README.md", ("README.md",))
+        assert matches_any("docs/README.md", ("README.md",))
+        assert not matches_any("src/mod.pyc", ("*.py",))
+
+    def test_path_patterns_match_from_root(self):
+        """Patterns with a slash match the full relative path."""
+        assert matches_any(".github/workflows/ci.yml", (".github/workflows/*",))
+        assert matches_any("tests/unit/test_a.py", ("tests/*",))
+        assert not matches_any("src/tests/test_a.py", ("tests/*",))
+
+    def test_layer_directories_are_inputs(self):
+        """Non-Python files that change the layer layout invalidate findings."""
+        patterns = SeparationOfConcernsAssessor().input_patterns
+
+        assert matches_any("src/README.md", patterns)
+        assert matches_any("src/models/.gitkeep", patterns)
+        assert matches_any("views/index.html", patterns)
+        assert not matches_any("docs/guide.md", patterns)
+
+
+class TestIncrementalScan:
+    """Test Scanner reuse of unchanged findings."""
+
+    def test_reuses_findings_with_unchanged_inputs(self, tmp_path):
+        """Only assessors whose inputs changed are re-run."""
+        _init_repo(tmp_path)
+        first = Scanner(tmp_path).scan(_assessors())
+        report = _write_report(tmp_path, first)
+
+        (tmp_path / "README.md").write_text("# Changed\n")
+        _commit(tmp_path, "change readme")
+
+        second = Scanner(tmp_path).scan(_assessors(), baseline=report)
+
+        by_id = {f.attribute.id: f for f in second.findings}
+        # Re-run findings carry a profile; reused ones don't
+        assert by_id["readme_structure"].profile is not None
+        assert by_id["type_annotations"].profile is None
+        assert by_id["claude_md_file"].profile is None
+        assert by_id["standard_layout"].profile is None
+        assert [f.attribute.id for f in second.findings] == [
+            a.attribute_id for a in _assessors()
+        ]
+        previous = {f.attribute.id: f for f in first.findings}
+        assert by_id["type_annotations"].evidence == (
+            previous["type_annotations"].evidence
+        )
+        assert by_id["readme_structure"].score != previous["readme_structure"].score
+
+    def test_untracked_files_count_as_changed(self, tmp_path):
+        """New untracked files invalidate assessors reading them."""
+        _init_repo(tmp_path)
+        report = _write_report(tmp_path, Scanner(tmp_path).scan(_assessors()))
+        (tmp_path / "CLAUDE.md").write_text("# Project guide\n" * 10)
+
+        plan = IncrementalPlanner(tmp_path).plan(
+            report, _assessors(), Scanner(tmp_path)._build_repository_model()
+        )
+
+        assert "CLAUDE.md" in plan.changed_files
+        assert "claude_md_file" not in plan.reused
+        assert "readme_structure" in plan.reused
+
+    def test_deleted_untracked_file_is_rechecked(self, tmp_path):
+        """A file that was untracked in the previous run and is now gone."""
+        _init_repo(tmp_path)
+        (tmp_path / "CLAUDE.md").write_text("# Project guide\n" * 10)
+        first = Scanner(tmp_path).scan(_assessors())
+        assert first.repository.working_tree_changes == ["CLAUDE.md"]
+        report = _write_report(tmp_path, first)
+        (tmp_path / "CLAUDE.md").unlink()
+
+        second = Scanner(tmp_path).scan(_assessors(), baseline=report)
+
+        by_id = {f.attribute.id: f for f in second.findings}
+        assert by_id["claude_md_file"].profile is not None
+        assert by_id["claude_md_file"].status == "fail"
+        assert by_id["readme_structure"].profile is None
+
+    def test_reverted_modification_is_rechecked(self, tmp_path):
+        """A file that was modified in the previous run and is now reverted."""
+        _init_repo(tmp_path)
+        (tmp_path / "README.md").write_text("# Test\n")
+        report = _write_report(tmp_path, Scanner(tmp_path).scan(_assessors()))
+        subprocess.run(["git", "checkout", "--", "README.md"], cwd=tmp_path, check=True)
+
+        plan = IncrementalPlanner(tmp_path).plan(
+            report, _assessors(), Scanner(tmp_path)._build_repository_model()
+        )
+
+        assert plan.changed_files == ["README.md"]
+        assert "readme_structure" not in plan.reused
+        assert "type_annotations" in plan.reused
+
+    def test_report_without_working_tree_changes_forces_full_run(self, tmp_path):
+        """Older reports do not say whether their tree was clean."""
+        _init_repo(tmp_path)
+        data = Scanner(tmp_path).scan(_assessors()).to_dict()
+        del data["repository"]["working_tree_changes"]
+        report = tmp_path / "previous.json"
+        report.write_text(json.dumps(data))
+
+        plan = IncrementalPlanner(tmp_path).plan(
+            report, _assessors(), Scanner(tmp_path)._build_repository_model()
+        )
+
+        assert plan.reused == {}
+        assert "working tree changes" in plan.reason
+
+    def test_version_change_forces_full_run(self, tmp_path):
+        """Reports from another AgentReady version are not reused."""
+        _init_repo(tmp_path)
+        report = _write_report(
+            tmp_path, Scanner(tmp_path).scan(_assessors(), version="1.0.0")
+        )
+
+        plan = IncrementalPlanner(tmp_path).plan(
+            report,
+            _assessors(),
+            Scanner(tmp_path)._build_repository_model(),
+            version="2.0.0",
+        )
+
+        assert plan.reused == {}
+        assert "version changed" in plan.reason
+
+    def test_unknown_commit_forces_full_run(self, tmp_path):
+        """A base commit missing from the repository disables reuse."""
+        _init_repo(tmp_path)
+        data = Scanner(tmp_path).scan(_assessors()).to_dict()
+        data["repository"]["commit_hash"] = "0" * 40
+        report = tmp_path / "previous.json"
+        report.write_text(json.dumps(data))
+
+        plan = IncrementalPlanner(tmp_path).plan(
+            report, _assessors(), Scanner(tmp_path)._build_repository_model()
+        )
+
+        assert plan.reused == {}
+        assert plan.reason.startswith("Cannot diff")
@@ -313,6 +313,82 @@ class TestAssessment:
         assert assessment.overall_score == 75.0
         assert assessment.certification_level == "Gold"
 
+    def test_assessment_from_dict_round_trip(self, tmp_path):
+        """Test Assessment.from_dict() restores every nested model."""
+        (tmp_path / ".git").mkdir()
+        repo = Repository(
+            path=tmp_path,
+            name="test",
+            url="https://github.com/user/test",
+            branch="main",
+            commit_hash="abc",
+            languages={"Python": 3},
+            total_files=10,
+            total_lines=100,
+        )
+        attr = Attribute(
+            id="test",
+            name="Test",
+            category="Test",
+            tier=1,
+            description="Test",
+            criteria="Test",
+            default_weight=0.04,
+        )
+        citation = Citation(
+            source="Source", title="Title", url=None, relevance="Relevant"
+        )
+        findings = [
+            Finding(
+                attribute=attr,
+                status="fail",
+                score=40.0,
+                measured_value="2 files",
+                threshold="5 files",
+                evidence=["Only two files"],
+                remediation=Remediation(
+                    summary="Fix it",
+                    steps=["Step 1"],
+                    tools=[],
+                    commands=[],
+                    examples=[],
+                    citations=[citation],
+                ),
+                error_message=None,
+            ),
+            Finding.not_applicable(attr, reason="No Python code"),
+        ]
+        skill = DiscoveredSkill(
+            skill_id="setup-test",
+            name="Setup Test",
+            description="Set up test",
+            confidence=90.0,
+            source_attribute_id="test",
+            reusability_score=50.0,
+            impact_score=10.0,
+            pattern_summary="Add tests",
+            citations=[citation],
+        )
+        timestamp = datetime(2025, 1, 2, 3, 4, 5)
+        assessment = Assessment(
+            repository=repo,
+            timestamp=timestamp,
+            overall_score=40.0,
+            certification_level="Bronze",
+            attributes_assessed=1,
+            attributes_not_assessed=1,
+            attributes_total=2,
+            findings=findings,
+            config=Config(weights={"test": 0.5}),
+            duration_seconds=1.5,
+            discovered_skills=[skill],
+            metadata=AssessmentMetadata.create("1.0.0", "1.2.0", timestamp, "cmd"),
+        )
+
+        restored = Assessment.from_dict(assessment.to_dict())
+
+        assert restored == assessment
+
     def test_assessment_determine_certification(self):
         """Test certification level determination."""
         assert Assessment.determine_certification_level(95.0) == "Platinum"
@@ -1163,6 +1239,43 @@ class TestFindingValidation:
         assert data["score"] == 100.0
         assert data["remediation"] is None
 
+    def test_finding_from_dict_round_trip(self):
+        """Test Finding.from_dict() restores to_dict() output."""
+        attr = Attribute(
+            id="test",
+            name="Test",
+            category="Test",
+            tier=1,
+            description="Test",
+            criteria="Test",
+            default_weight=0.04,
+        )
+        citation = Citation(
+            source="Source", title="Title", url=None, relevance="Relevant"
+        )
+        remediation = Remediation(
+            summary="Fix it",
+            steps=["Step 1"],
+            tools=["tool1"],
+            commands=["cmd1"],
+            examples=["ex1"],
+            citations=[citation],
+        )
+        finding = Finding(
+            attribute=attr,
+            status="fail",
+            score=40.0,
+            measured_value="2 files",
+            threshold="5 files",
+            evidence=["Only two files"],
+            remediation=remediation,
+            error_message=None,
+        )
+
+        restored = Finding.from_dict(finding.to_dict())
+
+        assert restored == finding
+
 
 class TestRemediationValidation:
     """Test Remediation validation."""
@@ -1,5 +1,6 @@
 """Unit tests for multi-repository HTML reporter with security controls."""
 
+import json
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +13,7 @@ from src.agentready.models.batch_assessment import (
     RepositoryResult,
 )
 from src.agentready.models.repository import Repository
+from src.agentready.reporters import multi_html
 from src.agentready.reporters.multi_html import MultiRepoHTMLReporter
 
 
@@ -352,3 +354,98 @@ class TestMultiRepoHTMLReporter:
 
         # Check for media queries or responsive CSS
         assert "@media" in html_content or "max-width" in html_content
+
+
+class TestPagedIndex:
+    """Test the paged index that loads its results table from data files."""
+
+    @pytest.fixture
+    def large_batch(self, mock_batch_assessment, mock_assessment):
+        """Batch of five results, two of them failed."""
+        results = []
+        for i in range(5):
+            if i % 2:
+                results.append(
+                    RepositoryResult(
+                        repository_url=f"https://github.com/user/broken{i}",
+                        assessment=None,
+                        error="x" * 150,
+                        error_type="clone_error",
+                        duration_seconds=1.25,
+                    )
+                )
+            else:
+                results.append(
+                    RepositoryResult(
+                        repository_url=f"https://github.com/user/repo{i}",
+                        assessment=mock_assessment,
+                        duration_seconds=42.5,
+                    )
+                )
+        mock_batch_assessment.results = results
+        return mock_batch_assessment
+
+    def test_writes_columns_and_shards(
+        self, template_dir, tmp_path, large_batch, monkeypatch
+    ):
+        """Every row is in columns.json; details are split into shards."""
+        monkeypatch.setattr(multi_html, "ROWS_PER_SHARD", 2)
+        reporter = MultiRepoHTMLReporter(template_dir, paged=True)
+        reporter.generate(large_batch, tmp_path / "index.html")
+
+        data_dir = tmp_path / "index-data"
+        index = json.loads((data_dir / "columns.json").read_text())
+        assert index["rows"] == 5
+        assert index["shard_size"] == 2
+        assert index["labels"] == ["Gold", "clone_error"]
+        assert index["languages"] == ["Python"]
+        columns = index["columns"]
+        assert columns["repository"][1] == "https://github.com/user/broken1"
+        assert columns["score"] == [85.5, None, 85.5, None, 85.5]
+        assert columns["label"] == [0, 1, 0, 1, 0]
+        assert columns["language"] == [0, -1, 0, -1, 0]
+        assert columns["duration"] == [42.5, 1.2, 42.5, 1.2, 42.5]
+        assert columns["failed"] == [0, 1, 0, 1, 0]
+
+        shards = sorted(p.name for p in data_dir.glob("rows-*.json"))
+        assert shards == ["rows-00000.json", "rows-00001.json", "rows-00002.json"]
+        first = json.loads((data_dir / "rows-00000.json").read_text())
+        assert first["report"] == ["test-repo-20250122-143022", None]
+        assert first["error"][1] == "x" * 100 + "..."
+
+    def test_index_holds_summary_only(self, template_dir, tmp_path, large_batch):
+        """The page itself does not grow with the number of repositories."""
+        reporter = MultiRepoHTMLReporter(template_dir, paged=True)
+        html_content = reporter.generate(
+            large_batch, tmp_path / "index.html"
+        ).read_text()
+
+        assert "columns.json" in html_content
+        assert "Total Repositories" in html_content
+        assert "github.com/user/repo" not in html_content
+        assert "Failed Assessments</h2>" not in html_content
+        assert "Attribute Failure Heatmap" not in html_content
+
+    def test_removes_stale_shards(self, template_dir, tmp_path, large_batch):
+        """Shards left by an earlier, larger report are removed."""
+        data_dir = tmp_path / "index-data"
+        data_dir.mkdir()
+        (data_dir / "rows-00042.json").write_text("{}")
+
+        MultiRepoHTMLReporter(template_dir, paged=True).generate(
+            large_batch, tmp_path / "index.html"
+        )
+
+        assert [p.name for p in data_dir.glob("rows-*.json")] == ["rows-00000.json"]
+
+    def test_unsafe_url_replaced_by_name(
+        self, template_dir, tmp_path, mock_batch_assessment
+    ):
+        """Repositories whose URL fails validation are listed by name."""
+        mock_batch_assessment.results[0].repository_url = "javascript:alert(1)"
+        MultiRepoHTMLReporter(template_dir, paged=True).generate(
+            mock_batch_assessment, tmp_path / "index.html"
+        )
+
+        index = json.loads((tmp_path / "index-data" / "columns.json").read_text())
+        assert index["columns"]["repository"] == ["test-repo"]
@@ -0,0 +1,158 @@
+"""Unit tests for the shared parse-once Python AST cache."""
+
+import ast
+import subprocess
+
+from agentready.assessors.code_quality import (
+    SemanticNamingAssessor,
+    TypeAnnotationsAssessor,
+)
+from agentready.assessors.documentation import InlineDocumentationAssessor
+from agentready.models.repository import Repository
+from agentready.services.python_ast_cache import (
+    PythonASTCache,
+    cyclomatic_complexity,
+)
+
+SAMPLE_MODULE = '''"""Sample module."""
+
+
+class Widget:
+    """A widget."""
+
+    def render(self, size: int) -> str:
+        """Render widget."""
+        return "w" * size
+
+    def _hidden(self):
+        pass
+
+
+async def fetch(url):
+    return url
+'''
+
+BRANCHY_FUNCTION = """
+def classify(items, strict):
+    assert items and strict is not None
+    for item in items:
+        if item > 10 and strict:
+            continue
+        elif item < 0:
+            break
+    else:
+        pass
+    try:
+        total = sum(i for i in items if i)
+    except (TypeError, ValueError):
+        total = 0
+    except OverflowError:
+        total = -1
+    key = lambda x: x if x else 0
+
+    def nested():
+        if strict:
+            return 1
+
+    return total if strict else key(total)
+"""
+
+
+def _make_repo(tmp_path, files: dict[str, str]) -> Repository:
+    """Create a git repository with staged files and a Repository model."""
+    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+    for rel_path, content in files.items():
+        (tmp_path / rel_path).write_text(content)
+    subprocess.run(["git", "add", "."], cwd=tmp_path, capture_output=True, check=True)
+    return Repository(
+        path=tmp_path,
+        name="test-repo",
+        url=None,
+        branch="main",
+        commit_hash="abc123",
+        languages={"Python": len(files)},
+        total_files=len(files),
+        total_lines=10,
+    )
+
+
+class TestPythonASTCache:
+    """Test PythonASTCache parsing, summaries and eviction."""
+
+    def test_summary_collects_functions_classes_docstrings(self, tmp_path):
+        """Fused walk records annotations and docstrings for each definition."""
+        (tmp_path / "sample.py").write_text(SAMPLE_MODULE)
+        cache = PythonASTCache(tmp_path)
+
+        summary = cache.summary("sample.py")
+
+        assert summary.has_module_docstring
+        assert [c.name for c in summary.classes] == ["Widget"]
+        functions = {f.name: f for f in summary.functions}
+        assert functions["render"].has_return_annotation
+        assert functions["render"].has_param_annotations
+        assert functions["render"].has_docstring
+        assert not functions["_hidden"].has_docstring
+        assert functions["fetch"].is_async
+
+    def test_cyclomatic_complexity_counts_like_radon(self):
+        """Decision points are counted per radon; nested defs are separate."""
+        tree = ast.parse(BRANCHY_FUNCTION)
+        classify, nested = [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
+
+        # 1 + assert + for + for-else + if + and + elif + 2 handlers
+        # + comprehension + its if + lambda's IfExp + return IfExp
+        assert cyclomatic_complexity(classify) == 13
+        assert cyclomatic_complexity(nested) == 2
+
+    def test_unparseable_file_returns_none(self, tmp_path):
+        """Syntax errors are skipped and not re-attempted."""
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+        cache = PythonASTCache(tmp_path)
+
+        assert cache.get("broken.py") is None
+        assert cache.summary("broken.py") is None
+        assert cache.summaries(["broken.py", "missing.py"]) == []
+
+    def test_lru_eviction_respects_memory_bound(self, tmp_path):
+        """Least-recently-used modules are evicted once over the bound."""
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.py").write_text("x = 1\n" * 10)
+        cache = PythonASTCache(tmp_path, max_source_bytes=130)
+
+        cache.get("a.py")
+        cache.get("b.py")
+        cache.get("a.py")  # a is now most recently used
+        cache.get("c.py")
+
+        assert len(cache) == 2
+        assert cache.parse_count == 3
+        cache.get("a.py")
+        assert cache.parse_count == 3  # still cached
+        cache.get("b.py")
+        assert cache.parse_count == 4  # was evicted, parsed again
+
+    def test_summaries_survive_eviction(self, tmp_path):
+        """Summaries are kept after the parsed module is evicted."""
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.py").write_text("def f():\n    pass\n" * 5)
+        cache = PythonASTCache(tmp_path, max_source_bytes=1)
+
+        cache.summaries(["a.py", "b.py"])
+        cache.summaries(["a.py", "b.py"])
+
+        assert cache.parse_count == 2
+
+    def test_assessors_share_single_parse(self, tmp_path):
+        """Type, naming and docstring assessors parse each file once per scan."""
+        repo = _make_repo(
+            tmp_path, {"sample.py": SAMPLE_MODULE, "other.py": "def run():\n    pass\n"}
+        )
+
+        TypeAnnotationsAssessor().assess(repo)
+        SemanticNamingAssessor().assess(repo)
+        finding = InlineDocumentationAssessor().assess(repo)
+
+        assert repo.get_ast_cache().parse_count == 2
+        # module docstrings (1/2) + Widget, render documented; run undocumented
+        assert "Documented items: 3/5" in finding.evidence
@@ -0,0 +1,121 @@
+"""Unit tests for the shared per-scan repository file index."""
+
+import subprocess
+
+from agentready.models.repository import Repository
+from agentready.services.language_detector import LanguageDetector
+from agentready.services.repository_index import RepositoryIndex
+
+
+def _init_repo(path, files: dict[str, str]) -> None:
+    """Create a git repository and stage the given files."""
+    subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
+    for rel_path, content in files.items():
+        full_path = path / rel_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+
+
+class TestRepositoryIndex:
+    """Test RepositoryIndex construction and queries."""
+
+    def test_build_from_git_index(self, tmp_path):
+        """Index lists tracked files with size, language and blob SHA."""
+        _init_repo(tmp_path, {"src/app.py": "print('hi')\n", "README.md": "# T\n"})
+        (tmp_path / "untracked.py").write_text("x = 1\n")
+
+        index = RepositoryIndex.build(tmp_path)
+
+        assert len(index) == 2
+        assert "untracked.py" not in index
+        entry = index.get("src/app.py")
+        assert entry.size == len("print('hi')\n")
+        assert entry.extension == ".py"
+        assert entry.language == "Python"
+        assert entry.blob_sha and len(entry.blob_sha) == 40
+        assert entry.name == "app.py"
+
+    def test_vendored_files_flagged(self, tmp_path):
+        """Files under vendored directories or with generated names are flagged."""
+        _init_repo(
+            tmp_path,
+            {
+                "node_modules/lib/index.js": "module.exports = 1;\n",
+                "static/app.min.js": "var a=1;\n",
+                "src/app.js": "console.log(1);\n",
+            },
+        )
+
+        index = RepositoryIndex.build(tmp_path)
+
+        assert index.get("node_modules/lib/index.js").vendored
+        assert index.get("static/app.min.js").vendored
+        assert not index.get("src/app.js").vendored
+        assert index.paths(extensions={".js"}, include_vendored=False) == ["src/app.js"]
+
+    def test_find_by_name(self, tmp_path):
+        """find() matches file names anywhere in the tree."""
+        _init_repo(
+            tmp_path,
+            {
+                "utils.py": "",
+                "pkg/utils.py": "",
+                ".venv/lib/utils.py": "",
+                "pkg/other.py": "",
+            },
+        )
+
+        index = RepositoryIndex.build(tmp_path)
+
+        assert [f.path for f in index.find("utils.py", include_vendored=False)] == [
+            "pkg/utils.py",
+            "utils.py",
+        ]
+        assert len(index.find("utils.py")) == 3
+
+    def test_fallback_walk_without_git(self, tmp_path):
+        """Non-git directories fall back to a filesystem walk."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.go").write_text("package main\n")
+
+        index = RepositoryIndex.build(tmp_path)
+
+        assert sorted(index.paths()) == ["a.py", "sub/b.go"]
+        assert index.get("a.py").blob_sha is None
+
+    def test_language_detector_uses_shared_index(self, tmp_path):
+        """LanguageDetector answers all queries from the provided index."""
+        _init_repo(
+            tmp_path,
+            {f"m{i}.py": "x = 1\n\ny = 2\n" for i in range(3)} | {"a.go": "package a"},
+        )
+        index = RepositoryIndex.build(tmp_path)
+
+        detector = LanguageDetector(tmp_path, index=index)
+
+        assert detector.index is index
+        assert detector.detect_languages() == {"Python": 3}
+        assert detector.count_total_files() == 4
+        assert detector.count_total_lines() == 7
+
+    def test_repository_builds_index_lazily(self, tmp_path):
+        """Repositories without an attached index build one on first use."""
+        _init_repo(tmp_path, {"main.py": "print(1)\n"})
+        repo = Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 1},
+            total_files=1,
+            total_lines=1,
+        )
+
+        index = repo.get_file_index()
+
+        assert index.paths() == ["main.py"]
+        assert repo.get_file_index() is index
+        assert "file_index" not in repo.to_dict()
@@ -1,9 +1,17 @@
 """Unit tests for repository manager."""
 
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from agentready.services.repository_manager import RepositoryManager
+import pytest
+
+from agentready.services import repository_manager
+from agentready.services.repository_manager import (
+    RepositoryManager,
+    classify_clone_error,
+)
 
 
 class TestRepositoryManager:
@@ -119,3 +127,225 @@ class TestRepositoryManager:
 
         # Should return True even if directory doesn't exist
         assert success is True
+
+
+GIT_IDENTITY = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+
+
+def _make_origin(path: Path, content: str) -> str:
+    """Create a committed origin repository and return its file:// URL."""
+    path.mkdir()
+    subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
+    _commit(path, content)
+    return f"file://localhost{path}"
+
+
+def _commit(path: Path, content: str) -> None:
+    (path / "README.md").write_text(content)
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        ["git", *GIT_IDENTITY, "commit", "-m", "update"],
+        cwd=path,
+        capture_output=True,
+        check=True,
+    )
+
+
+@pytest.fixture
+def manager_factory(tmp_path, monkeypatch):
+    """RepositoryManager that may clone file:// URLs from tmp_path."""
+    monkeypatch.setattr(
+        RepositoryManager, "ALLOWED_PROTOCOLS", {"https", "git", "file"}
+    )
+    return lambda **kwargs: RepositoryManager(tmp_path / "cache", **kwargs)
+
+
+class TestCloneCache:
+    """Test refreshing cached clones and the LRU disk quota."""
+
+    def test_existing_clone_is_reused_without_refresh(self, tmp_path, manager_factory):
+        """Without refresh, a cached clone stays at the commit it was cloned at."""
+        url = _make_origin(tmp_path / "origin", "v1\n")
+        manager = manager_factory()
+        _, repo_path, _ = manager.clone_repository(url)
+        _commit(tmp_path / "origin", "v2\n")
+
+        success, again, error = manager.clone_repository(url)
+
+        assert success, error
+        assert again == repo_path
+        assert (repo_path / "README.md").read_text() == "v1\n"
+
+    def test_refresh_updates_clone_in_place(self, tmp_path, manager_factory):
+        """Refresh fetches the new tip and removes stray files."""
+        url = _make_origin(tmp_path / "origin", "v1\n")
+        _, repo_path, _ = manager_factory().clone_repository(url)
+        (repo_path / "stray.txt").write_text("left over")
+        _commit(tmp_path / "origin", "v2\n")
+
+        success, refreshed, error = manager_factory(refresh=True).clone_repository(url)
+
+        assert success, error
+        assert refreshed == repo_path
+        assert (repo_path / "README.md").read_text() == "v2\n"
+        assert not (repo_path / "stray.txt").exists()
+
+    def test_records_size_and_evicts_least_recently_used(
+        self, tmp_path, manager_factory
+    ):
+        """Clones beyond the quota are evicted oldest-use first, never in use."""
+        urls = [
+            _make_origin(tmp_path / name, f"{name}\n")
+            for name in ("alpha", "beta", "gamma")
+        ]
+        manager = manager_factory()
+        paths = []
+        for url in urls:
+            _, repo_path, _ = manager.clone_repository(url)
+            manager.release(repo_path)
+            paths.append(repo_path)
+        one_clone = manager.cache_size() // 3
+        assert one_clone > 0
+
+        # Use alpha again so beta becomes the least recently used
+        manager.clone_repository(urls[0])
+        manager.max_cache_bytes = int(one_clone * 2.5)
+        evicted = manager.enforce_quota()
+
+        assert evicted == [paths[1]]
+        assert not paths[1].exists()
+        assert paths[0].exists() and paths[2].exists()
+
+        # alpha is still in use, so gamma goes first even though it is newer
+        manager.max_cache_bytes = int(one_clone * 1.5)
+        assert manager.enforce_quota() == [paths[2]]
+        manager.release(paths[0])
+        assert paths[0].exists()
+        assert manager.cache_size() <= manager.max_cache_bytes
+
+    def test_forks_with_same_name_get_separate_clones(self, tmp_path, manager_factory):
+        """Clone directories are keyed by the whole URL, not the name."""
+        (tmp_path / "alice").mkdir()
+        (tmp_path / "bob").mkdir()
+        alice = _make_origin(tmp_path / "alice" / "tool", "alice\n")
+        bob = _make_origin(tmp_path / "bob" / "tool", "bob\n")
+        manager = manager_factory()
+
+        _, alice_path, _ = manager.clone_repository(alice)
+        _, bob_path, _ = manager.clone_repository(bob)
+
+        assert alice_path != bob_path
+        assert alice_path.name == bob_path.name == "tool"
+        assert alice_path.relative_to(tmp_path / "cache").parts[0] == "localhost"
+        assert (alice_path / "README.md").read_text() == "alice\n"
+        assert (bob_path / "README.md").read_text() == "bob\n"
+
+    def test_concurrent_clones_of_one_url(self, tmp_path, manager_factory):
+        """Callers cloning the same URL at once share one complete clone."""
+        url = _make_origin(tmp_path / "origin", "v1\n")
+        manager = manager_factory()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(manager.clone_repository, [url] * 4))
+
+        assert all(success for success, _, _ in results), results
+        assert len({path for _, path, _ in results}) == 1
+        assert (results[0][1] / "README.md").read_text() == "v1\n"
+
+    def test_eviction_skips_clone_being_cloned_or_refreshed(
+        self, tmp_path, manager_factory
+    ):
+        """A clone whose directory lock is held is never deleted under it."""
+        url = _make_origin(tmp_path / "origin", "v1\n")
+        manager = manager_factory()
+        _, repo_path, _ = manager.clone_repository(url)
+        manager.release(repo_path)
+        manager.max_cache_bytes = 1
+
+        with manager._directory_lock(repo_path):
+            assert manager.enforce_quota() == []
+            assert (repo_path / ".git").exists()
+
+        assert manager.enforce_quota() == [repo_path]
+        assert not repo_path.exists()
+        assert not list((tmp_path / "cache").glob(".evicted-*"))
+        # The lock is free again, so the URL can be cloned anew
+        success, again, error = manager.clone_repository(url)
+        assert success, error
+        assert (again / "README.md").read_text() == "v1\n"
+
+    def test_failed_preparation_releases_clone(
+        self, tmp_path, manager_factory, monkeypatch
+    ):
+        """A clone that cannot be turned into a Repository is not left pinned."""
+        url = _make_origin(tmp_path / "origin", "v1\n")
+        manager = manager_factory()
+
+        def broken_repository(**kwargs):
+            raise ValueError("broken")
+
+        monkeypatch.setattr(repository_manager, "Repository", broken_repository)
+        success, _, failure = manager.prepare_repository(url)
+
+        assert not success
+        assert failure.error_type == "validation_error"
+        assert not manager._is_in_use(manager.clone_directory(url))
+
+    def test_clone_stays_pinned_until_every_user_releases(
+        self, tmp_path, manager_factory
+    ):
+        """A clone handed out twice is neither evicted nor refreshed in use."""
+        url = _make_origin(tmp_path / "origin", "v1\n")
+        manager = manager_factory(refresh=True, max_cache_bytes=1)
+        _, repo_path, _ = manager.clone_repository(url)
+        _commit(tmp_path / "origin", "v2\n")
+
+        _, again, _ = manager.clone_repository(url)
+        assert again == repo_path
+        assert (repo_path / "README.md").read_text() == "v1\n"
+
+        manager.release(repo_path)
+        assert repo_path.exists()
+        manager.release(repo_path)
+        assert not repo_path.exists()
+        assert list((tmp_path / "cache").iterdir()) == [manager.db_path]
+
+
+class TestCloneErrorClassification:
+    """Transient clone failures are marked retryable."""
+
+    @pytest.mark.parametrize(
+        "message,error_type",
+        [
+            ("Clone operation timed out", "timeout"),
+            (
+                "Clone failed: fatal: unable to access 'https://github.com/a/b/': "
+                "Could not resolve host: github.com",
+                "network_error",
+            ),
+            (
+                "Clone failed: fatal: unable to access 'https://github.com/a/b/': "
+                "The requested URL returned error: 429",
+                "rate_limit",
+            ),
+            ("Clone failed: error: RPC failed; curl 18", "network_error"),
+            (
+                "Clone failed: fatal: repository 'https://github.com/a/b503/' "
+                "not found",
+                "clone_error",
+            ),
+        ],
+    )
+    def test_classify(self, message, error_type):
+        """git's error output decides the FailureTracker type."""
+        assert classify_clone_error(message) == error_type
+
+    def test_missing_local_path_is_not_retryable(self, tmp_path):
+        """Permanent failures are reported as clone errors."""
+        manager = RepositoryManager(tmp_path / "cache")
+
+        success, _, failure = manager.prepare_repository(str(tmp_path / "missing"))
+
+        assert not success
+        assert failure.error_type == "clone_error"
+        assert not failure.can_retry
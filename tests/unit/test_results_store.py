@@ -0,0 +1,248 @@
+"""Unit tests for the SQLite batch results store and query command."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from agentready.cli.query import query
+from agentready.models import BatchAssessment, BatchSummaryBuilder, RepositoryResult
+from agentready.models.assessment import Assessment
+from agentready.models.attribute import Attribute
+from agentready.models.finding import Finding
+from agentready.models.repository import Repository
+from agentready.services.results_store import ResultsStore
+
+CLAUDE_MD = Attribute(
+    id="claude_md_file",
+    name="CLAUDE.md File",
+    description="Repository has CLAUDE.md",
+    category="Documentation",
+    tier=1,
+    criteria="File exists",
+    default_weight=0.10,
+)
+
+
+def _result(repo_path: Path, name: str, score: float, language: str, passes: bool):
+    repository = Repository(
+        path=repo_path,
+        name=name,
+        url=f"https://github.com/org/{name}",
+        branch="main",
+        commit_hash=f"{name}-commit",
+        languages={language: 10},
+        total_files=10,
+        total_lines=500,
+    )
+    finding = Finding(
+        attribute=CLAUDE_MD,
+        status="pass" if passes else "fail",
+        score=100.0 if passes else 0.0,
+        measured_value="present" if passes else "missing",
+        threshold="present",
+        evidence=[],
+        remediation=None,
+        error_message=None,
+    )
+    assessment = Assessment(
+        repository=repository,
+        timestamp=datetime(2025, 1, 1),
+        overall_score=score,
+        certification_level="Gold" if score >= 75 else "Bronze",
+        attributes_assessed=1,
+        attributes_not_assessed=0,
+        attributes_total=1,
+        findings=[finding],
+        config=None,
+        duration_seconds=1.0,
+    )
+    return RepositoryResult(
+        repository_url=f"https://github.com/org/{name}",
+        assessment=assessment,
+        duration_seconds=1.0,
+    )
+
+
+def _batch(batch_id: str, day: int, results: list) -> BatchAssessment:
+    builder = BatchSummaryBuilder()
+    for result in results:
+        builder.add(result)
+    return BatchAssessment(
+        batch_id=batch_id,
+        timestamp=datetime(2025, 1, day),
+        results=results,
+        summary=builder.build(),
+        total_duration_seconds=1.0,
+        agentready_version="1.0.0",
+        command="assess-batch",
+    )
+
+
+@pytest.fixture
+def repo_path(tmp_path):
+    """Directory standing in for a cloned repository."""
+    path = tmp_path / "repo"
+    (path / ".git").mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def db_path(tmp_path, repo_path):
+    """Database holding two batches of the same three repositories."""
+    failed = RepositoryResult(
+        repository_url="https://github.com/org/broken",
+        assessment=None,
+        error="clone failed",
+        error_type="clone_error",
+    )
+    old = _batch(
+        "batch-old",
+        1,
+        [
+            _result(repo_path, "api", 80.0, "Python", passes=True),
+            _result(repo_path, "web", 50.0, "Go", passes=False),
+            _result(repo_path, "cli", 60.0, "Python", passes=False),
+        ],
+    )
+    new = _batch(
+        "batch-new",
+        2,
+        [
+            _result(repo_path, "api", 70.0, "Python", passes=False),
+            _result(repo_path, "web", 55.0, "Go", passes=False),
+            _result(repo_path, "cli", 65.0, "Python", passes=False),
+            failed,
+        ],
+    )
+    path = tmp_path / "assessments.db"
+    with ResultsStore(path) as store:
+        assert store.add_batch(old) == 3
+        assert store.add_batch(new) == 4
+    return path
+
+
+class TestResultsStore:
+    """Test storing and querying batch results."""
+
+    def test_normalized_rows(self, db_path):
+        """Repositories and attributes are shared across batches."""
+        with ResultsStore(db_path, read_only=True) as store:
+            counts = store.query(
+                "SELECT (SELECT COUNT(*) FROM repositories) AS repositories, "
+                "(SELECT COUNT(*) FROM assessments) AS assessments, "
+                "(SELECT COUNT(*) FROM attributes) AS attributes, "
+                "(SELECT COUNT(*) FROM findings) AS findings"
+            )
+            failed = store.query(
+                "SELECT status, error_type FROM assessments "
+                "WHERE overall_score IS NULL"
+            )
+
+        assert counts == [
+            {"repositories": 4, "assessments": 7, "attributes": 1, "findings": 6}
+        ]
+        assert failed == [{"status": "failed", "error_type": "clone_error"}]
+
+    def test_failing_by_language(self, db_path):
+        """Failing repositories of the newest batch, filtered by language."""
+        with ResultsStore(db_path, read_only=True) as store:
+            rows = store.failing("claude_md_file", language="python")
+            old_rows = store.failing("claude_md_file", batch="batch-o")
+
+        assert [row["repository"] for row in rows] == [
+            "https://github.com/org/api",
+            "https://github.com/org/cli",
+        ]
+        assert rows[0]["commit_hash"] == "api-commit"
+        assert {row["repository"] for row in old_rows} == {
+            "https://github.com/org/cli",
+            "https://github.com/org/web",
+        }
+
+    def test_score_delta_defaults_to_newest_batches(self, db_path):
+        """Deltas compare repositories assessed in both batches."""
+        with ResultsStore(db_path, read_only=True) as store:
+            rows = store.score_delta()
+
+        assert [(row["repository"], row["delta"]) for row in rows] == [
+            ("https://github.com/org/api", -10.0),
+            ("https://github.com/org/cli", 5.0),
+            ("https://github.com/org/web", 5.0),
+        ]
+
+    def test_resolve_batch(self, db_path):
+        """Batches are found by unique prefix; ambiguity is an error."""
+        with ResultsStore(db_path, read_only=True) as store:
+            assert store.resolve_batch("batch-n") == "batch-new"
+            assert store.resolve_batch(offset=1) == "batch-old"
+            with pytest.raises(ValueError, match="ambiguous"):
+                store.resolve_batch("batch-")
+            with pytest.raises(ValueError, match="No batch"):
+                store.resolve_batch("other")
+
+    def test_adding_batch_again_replaces_it(self, db_path, repo_path):
+        """Re-adding a batch (e.g., after --resume) does not duplicate it."""
+        batch = _batch(
+            "batch-new", 2, [_result(repo_path, "api", 90.0, "Python", passes=True)]
+        )
+        with ResultsStore(db_path) as store:
+            store.add_batch(batch)
+            rows = store.query(
+                "SELECT COUNT(*) AS n FROM assessments WHERE batch_id = 'batch-new'"
+            )
+            findings = store.query("SELECT COUNT(*) AS n FROM findings")
+
+        assert rows == [{"n": 1}]
+        assert findings == [{"n": 4}]
+
+    def test_read_only(self, db_path, tmp_path):
+        """Queries cannot modify the database; a missing one is an error."""
+        with ResultsStore(db_path, read_only=True) as store:
+            with pytest.raises(Exception, match="readonly"):
+                store.query("DELETE FROM findings")
+
+        with pytest.raises(FileNotFoundError):
+            ResultsStore(tmp_path / "missing.db", read_only=True)
+
+
+class TestQueryCommand:
+    """Test the query CLI command."""
+
+    def test_failing_table(self, db_path):
+        """Results are printed as an aligned table."""
+        result = CliRunner().invoke(
+            query,
+            ["--db", str(db_path), "failing", "claude_md_file", "--language", "Go"],
+        )
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert lines[0].split() == [
+            "repository",
+            "language",
+            "attribute_score",
+            "overall_score",
+            "commit_hash",
+        ]
+        assert lines[2].split()[:2] == ["https://github.com/org/web", "Go"]
+
+    def test_json_output(self, db_path):
+        """JSON output is a list of row objects."""
+        result = CliRunner().invoke(
+            query, ["--db", str(db_path), "--format", "json", "delta", "batch-o"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)[0]["old_score"] == 80.0
+
+    def test_unknown_batch_is_an_error(self, db_path):
+        """Query errors exit non-zero with a message."""
+        result = CliRunner().invoke(
+            query, ["--db", str(db_path), "failing", "x", "--batch", "nope"]
+        )
+
+        assert result.exit_code == 1
+        assert "No batch matches" in result.output
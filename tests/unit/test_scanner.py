@@ -0,0 +1,105 @@
+"""Unit tests for Scanner assessor execution."""
+
+import subprocess
+
+from agentready.assessors.code_quality import (
+    SemanticNamingAssessor,
+    TypeAnnotationsAssessor,
+)
+from agentready.assessors.documentation import (
+    CLAUDEmdAssessor,
+    InlineDocumentationAssessor,
+    READMEAssessor,
+)
+from agentready.assessors.stub_assessors import create_stub_assessors
+from agentready.services.scanner import Scanner
+
+
+def _init_repo(path) -> None:
+    """Create a committed git repository with a few Python files."""
+    subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
+    (path / "README.md").write_text("# Test\n\n## Installation\n\npip install x\n")
+    (path / "app.py").write_text(
+        '"""App."""\n\n\ndef run(x: int) -> int:\n    return x\n'
+    )
+    (path / "util.py").write_text("def helper(a):\n    return a\n")
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=Test",
+            "-c",
+            "user.email=test@example.com",
+            "commit",
+            "-m",
+            "init",
+        ],
+        cwd=path,
+        capture_output=True,
+        check=True,
+    )
+
+
+class _ExplodingAssessor(READMEAssessor):
+    """Assessor that raises during assess()."""
+
+    @property
+    def attribute_id(self) -> str:
+        return "exploding"
+
+    def assess(self, repository):
+        raise RuntimeError("boom")
+
+
+class TestScannerJobs:
+    """Test sequential and concurrent assessor execution."""
+
+    def _assessors(self):
+        return [
+            CLAUDEmdAssessor(),
+            READMEAssessor(),
+            TypeAnnotationsAssessor(),
+            _ExplodingAssessor(),
+            SemanticNamingAssessor(),
+            InlineDocumentationAssessor(),
+        ] + create_stub_assessors()
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Findings are identical and in assessor order for any jobs value."""
+        _init_repo(tmp_path)
+
+        serial = Scanner(tmp_path).scan(self._assessors(), jobs=1)
+        parallel = Scanner(tmp_path).scan(self._assessors(), jobs=4)
+
+        def summarize(assessment):
+            return [
+                (f.attribute.id, f.status, f.score, f.evidence)
+                for f in assessment.findings
+            ]
+
+        assert summarize(parallel) == summarize(serial)
+        assert parallel.overall_score == serial.overall_score
+
+    def test_parallel_exceptions_become_error_findings(self, tmp_path):
+        """An assessor raising on a worker thread yields an error finding."""
+        _init_repo(tmp_path)
+
+        assessment = Scanner(tmp_path).scan(
+            [_ExplodingAssessor(), READMEAssessor()], jobs=2
+        )
+
+        statuses = {f.attribute.id: f.status for f in assessment.findings}
+        assert statuses["exploding"] == "error"
+        assert statuses["readme_structure"] != "error"
+
+    def test_parallel_verbose_output_in_order(self, tmp_path, capsys):
+        """Verbose progress lines are printed in assessor order."""
+        _init_repo(tmp_path)
+        assessors = [READMEAssessor(), _ExplodingAssessor()]
+
+        Scanner(tmp_path).scan(assessors, verbose=True, jobs=2)
+
+        output = capsys.readouterr().out
+        assert output.index("[readme_structure]") < output.index("[exploding]")
+        assert "[exploding] error" in output